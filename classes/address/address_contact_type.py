@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class AddressContactType(Enum):
+class AddressContactType(IndexedEnum):
     """
     Enum representing the type of address contact for a subject.
 
@@ -58,7 +58,4 @@ class AddressContactType(Enum):
         Returns:
             Optional[AddressContactType]: The matching enum member, or None if not found.
         """
-        return next(
-            (item for item in cls if item.valid_value_id == address_contact_type_id),
-            None,
-        )
+        return cls._lookup("valid_value_id", address_contact_type_id)
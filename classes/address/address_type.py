@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class AddressType(Enum):
+class AddressType(IndexedEnum):
     """
     Enum representing the type of address for a subject.
 
@@ -56,6 +56,4 @@ class AddressType(Enum):
         Returns:
             Optional[AddressType]: The matching enum member, or None if not found.
         """
-        return next(
-            (item for item in cls if item.valid_value_id == address_type_id), None
-        )
+        return cls._lookup("valid_value_id", address_type_id)
@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class AppointmentSlotType(Enum):
+class AppointmentSlotType(IndexedEnum):
     """
     Enum representing appointment slot types, mapped to valid value IDs and descriptions.
     Provides utility methods for lookup by description (case-sensitive and insensitive) and by valid value ID.
@@ -38,10 +38,7 @@ class AppointmentSlotType(Enum):
         """
         Returns the enum member matching the given description (case-sensitive).
         """
-        for member in cls:
-            if member.description == description:
-                return member
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -50,18 +47,11 @@ class AppointmentSlotType(Enum):
         """
         Returns the enum member matching the given description (case-insensitive).
         """
-        desc_lower = description.lower()
-        for member in cls:
-            if member.description.lower() == desc_lower:
-                return member
-        return None
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(cls, valid_value_id: int) -> Optional["AppointmentSlotType"]:
         """
         Returns the enum member matching the given valid value ID.
         """
-        for member in cls:
-            if member.valid_value_id == valid_value_id:
-                return member
-        return None
+        return cls._lookup("valid_value_id", valid_value_id)
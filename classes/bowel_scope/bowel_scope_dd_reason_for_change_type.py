@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class BowelScopeDDReasonForChangeType(Enum):
+class BowelScopeDDReasonForChangeType(IndexedEnum):
     """
     Enum representing reasons for change to Bowel Scope Due Date.
 
@@ -63,36 +63,6 @@ class BowelScopeDDReasonForChangeType(Enum):
         """
         return self._description
 
-    @classmethod
-    def _descriptions(cls) -> Dict[str, "BowelScopeDDReasonForChangeType"]:
-        """
-        Returns a mapping from description to enum member.
-
-        Returns:
-            Dict[str, BowelScopeDDReasonForChangeType]: Mapping from description to enum member.
-        """
-        return {item.description: item for item in cls}
-
-    @classmethod
-    def _lowercase_descriptions(cls) -> Dict[str, "BowelScopeDDReasonForChangeType"]:
-        """
-        Returns a mapping from lowercase description to enum member.
-
-        Returns:
-            Dict[str, BowelScopeDDReasonForChangeType]: Mapping from lowercase description to enum member.
-        """
-        return {item.description.lower(): item for item in cls}
-
-    @classmethod
-    def _valid_value_ids(cls) -> Dict[int, "BowelScopeDDReasonForChangeType"]:
-        """
-        Returns a mapping from valid value ID to enum member.
-
-        Returns:
-            Dict[int, BowelScopeDDReasonForChangeType]: Mapping from valid value ID to enum member.
-        """
-        return {item.valid_value_id: item for item in cls}
-
     @classmethod
     def by_description(
         cls, description: Optional[str]
@@ -108,7 +78,7 @@ class BowelScopeDDReasonForChangeType(Enum):
         """
         if description is None:
             return None
-        return cls._lowercase_descriptions().get(description.lower())
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(
@@ -123,4 +93,4 @@ class BowelScopeDDReasonForChangeType(Enum):
         Returns:
             Optional[BowelScopeDDReasonForChangeType]: The matching enum member, or None if not found.
         """
-        return cls._valid_value_ids().get(valid_value_id)
+        return cls._lookup("valid_value_id", valid_value_id)
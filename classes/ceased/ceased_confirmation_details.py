@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class CeasedConfirmationDetails(Enum):
+class CeasedConfirmationDetails(IndexedEnum):
     """
     Enum representing ceased confirmation details for a subject.
 
@@ -25,10 +25,7 @@ class CeasedConfirmationDetails(Enum):
         Returns:
             Optional[CeasedConfirmationDetails]: The matching enum member, or None if not found.
         """
-        for item in cls:
-            if item.value == description:
-                return item
-        return None
+        return cls._lookup("value", description)
 
     def get_description(self) -> str:
         """
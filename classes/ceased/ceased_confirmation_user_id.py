@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class CeasedConfirmationUserId(Enum):
+class CeasedConfirmationUserId(IndexedEnum):
     """
     Enum representing possible user IDs for ceased confirmation actions.
 
@@ -29,10 +29,7 @@ class CeasedConfirmationUserId(Enum):
         Returns:
             Optional[CeasedConfirmationUserId]: The matching enum member, or None if not found.
         """
-        for item in cls:
-            if item.value == description:
-                return item
-        return None
+        return cls._lookup("value", description)
 
     def get_description(self) -> str:
         """
@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class ClinicalCeaseReasonType(Enum):
+class ClinicalCeaseReasonType(IndexedEnum):
     """
     Enum representing clinical reasons for ceasing a subject from screening.
 
@@ -75,22 +75,6 @@ class ClinicalCeaseReasonType(Enum):
         """
         return self._description
 
-    @classmethod
-    def _build_lookup_maps(cls):
-        """
-        Builds lookup maps for descriptions and valid value IDs.
-        """
-        cls._descriptions: Dict[str, "ClinicalCeaseReasonType"] = {}
-        cls._lowercase_descriptions: Dict[str, "ClinicalCeaseReasonType"] = {}
-        cls._valid_value_ids: Dict[int, "ClinicalCeaseReasonType"] = {}
-
-        for member in cls:
-            if member.description:
-                cls._descriptions[member.description] = member
-                cls._lowercase_descriptions[member.description.lower()] = member
-            if member.valid_value_id is not None:
-                cls._valid_value_ids[member.valid_value_id] = member
-
     @classmethod
     def by_description(cls, description: str) -> Optional["ClinicalCeaseReasonType"]:
         """
@@ -102,9 +86,7 @@ class ClinicalCeaseReasonType(Enum):
         Returns:
             Optional[ClinicalCeaseReasonType]: The matching enum member, or None if not found.
         """
-        if not hasattr(cls, "_descriptions"):
-            cls._build_lookup_maps()
-        return cls._descriptions.get(description)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -119,9 +101,7 @@ class ClinicalCeaseReasonType(Enum):
         Returns:
             Optional[ClinicalCeaseReasonType]: The matching enum member, or None if not found.
         """
-        if not hasattr(cls, "_lowercase_descriptions"):
-            cls._build_lookup_maps()
-        return cls._lowercase_descriptions.get(description.lower())
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(
@@ -136,6 +116,6 @@ class ClinicalCeaseReasonType(Enum):
         Returns:
             Optional[ClinicalCeaseReasonType]: The matching enum member, or None if not found.
         """
-        if not hasattr(cls, "_valid_value_ids"):
-            cls._build_lookup_maps()
-        return cls._valid_value_ids.get(valid_value_id)
+        if valid_value_id is None:
+            return None
+        return cls._lookup("valid_value_id", valid_value_id)
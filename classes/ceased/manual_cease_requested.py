@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class ManualCeaseRequested(Enum):
+class ManualCeaseRequested(IndexedEnum):
     """
     Enum representing the manual cease request status for a subject.
 
@@ -55,10 +55,7 @@ class ManualCeaseRequested(Enum):
         Returns:
             Optional[ManualCeaseRequested]: The matching enum member, or None if not found.
         """
-        for item in cls:
-            if item.description == description:
-                return item
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -75,7 +72,4 @@ class ManualCeaseRequested(Enum):
         """
         if description is None:
             return None
-        for item in cls:
-            if item.description.lower() == description.lower():
-                return item
-        return None
+        return cls._lookup_case_insensitive("description", description)
@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class BulkWriteResult:
+    """
+    Data class holding the outcome of a bulk (executemany) insert or update.
+    """
+
+    row_counts: list[int] = field(default_factory=list)
+    errors: dict[int, str] = field(default_factory=dict)
+    committed: bool = False
+
+    def is_success(self) -> bool:
+        """
+        Returns True if every row was written without error, otherwise False.
+        """
+        return not self.errors
+
+    def total_rows_affected(self) -> int:
+        """
+        Returns the total number of rows affected across all of the parameter sets.
+        """
+        return sum(self.row_counts)
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class TimedEventsResult:
+    """
+    Data class holding the outcome of running bcss_timed_events for a single subject.
+    """
+
+    nhs_number: str
+    subject_id: Optional[int] = None
+    success: bool = False
+    error: Optional[str] = None
@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class ASAGradeType(Enum):
+class ASAGradeType(IndexedEnum):
     """
     Enum representing ASA grades for colonoscopy assessment scenarios,
     with valid value IDs and descriptions.
@@ -31,30 +31,12 @@ class ASAGradeType(Enum):
         """Returns the description for the ASA grade."""
         return self._description
 
-    @classmethod
-    def _build_maps(cls) -> None:
-        """
-        Initializes internal lookup maps for ASAGradeType enum members.
-
-        It ensures these maps are built only once per class, using `hasattr` to prevent
-        redundant reinitialization.
-        """
-        if not hasattr(cls, "_descriptions"):
-            cls._descriptions: Dict[str, ASAGradeType] = {}
-            cls._lowercase_descriptions: Dict[str, ASAGradeType] = {}
-            cls._valid_value_ids: Dict[Optional[int], ASAGradeType] = {}
-            for item in cls:
-                cls._descriptions[item.description] = item
-                cls._lowercase_descriptions[item.description.lower()] = item
-                cls._valid_value_ids[item.valid_value_id] = item
-
     @classmethod
     def by_description(cls, description: str) -> Optional["ASAGradeType"]:
         """
         Returns the ASAGradeType matching the given description.
         """
-        cls._build_maps()
-        return cls._descriptions.get(description)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -63,8 +45,7 @@ class ASAGradeType(Enum):
         """
         Returns the ASAGradeType matching the given description (case-insensitive).
         """
-        cls._build_maps()
-        return cls._lowercase_descriptions.get(description.lower())
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(
@@ -73,8 +54,7 @@ class ASAGradeType(Enum):
         """
         Returns the ASAGradeType matching the given valid value ID.
         """
-        cls._build_maps()
-        return cls._valid_value_ids.get(valid_value_id)
+        return cls._lookup("valid_value_id", valid_value_id)
 
     def get_valid_value_id(self) -> Optional[int]:
         """
@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class CancerTreatmentIntent(Enum):
+class CancerTreatmentIntent(IndexedEnum):
     """
     Enum representing types of cancer treatment intent with associated valid value IDs and descriptions.
     Provides utility methods to retrieve enum instances by description or ID.
@@ -27,30 +27,12 @@ class CancerTreatmentIntent(Enum):
         """Returns the description for the treatment given."""
         return self._description
 
-    @classmethod
-    def _build_maps(cls) -> None:
-        """
-        Initializes internal lookup maps for CanterTreatmentIntent enum members.
-
-        It ensures these maps are built only once per class, using `hasattr` to prevent
-        redundant reinitialization.
-        """
-        if not hasattr(cls, "_descriptions"):
-            cls._descriptions: Dict[str, CancerTreatmentIntent] = {}
-            cls._lowercase_descriptions: Dict[str, CancerTreatmentIntent] = {}
-            cls._valid_value_ids: Dict[int, CancerTreatmentIntent] = {}
-            for item in cls:
-                cls._descriptions[item.description] = item
-                cls._lowercase_descriptions[item.description.lower()] = item
-                cls._valid_value_ids[item.valid_value_id] = item
-
     @classmethod
     def by_description(cls, description: str) -> Optional["CancerTreatmentIntent"]:
         """
         Returns the CancerTreatmentIntent matching the given description.
         """
-        cls._build_maps()
-        return cls._descriptions.get(description)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -59,8 +41,7 @@ class CancerTreatmentIntent(Enum):
         """
         Returns the CancerTreatmentIntent matching the given description (case-insensitive).
         """
-        cls._build_maps()
-        return cls._lowercase_descriptions.get(description.lower())
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(
@@ -69,8 +50,7 @@ class CancerTreatmentIntent(Enum):
         """
         Returns the CancerTreatmentIntent matching the given valid value ID.
         """
-        cls._build_maps()
-        return cls._valid_value_ids.get(valid_value_id)
+        return cls._lookup("valid_value_id", valid_value_id)
 
     def get_id(self) -> int:
         """Returns the valid value ID for the CancerTreatmentIntent given."""
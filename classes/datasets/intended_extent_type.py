@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class IntendedExtentType(Enum):
+class IntendedExtentType(IndexedEnum):
     """
     Enum for representing intended extent types.
     """
@@ -48,10 +48,7 @@ class IntendedExtentType(Enum):
         """
         Returns the IntendedExtentType member matching the given description.
         """
-        for member in cls:
-            if member.description == description:
-                return member
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -60,11 +57,7 @@ class IntendedExtentType(Enum):
         """
         Returns the IntendedExtentType member matching the given description (case insensitive).
         """
-        desc_lower = description.lower()
-        for member in cls:
-            if member.description.lower() == desc_lower:
-                return member
-        return None
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(
@@ -73,7 +66,4 @@ class IntendedExtentType(Enum):
         """
         Returns the IntendedExtentType member matching the given valid value ID.
         """
-        for member in cls:
-            if member.valid_value_id == valid_value_id:
-                return member
-        return None
+        return cls._lookup("valid_value_id", valid_value_id)
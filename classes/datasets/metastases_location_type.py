@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class MetastasesLocationType(Enum):
+class MetastasesLocationType(IndexedEnum):
     """
     Enum representing metastases locations for cancer audit datasets,
     with valid value IDs and descriptions.
@@ -28,30 +28,12 @@ class MetastasesLocationType(Enum):
         """Returns the description for the metastases location type."""
         return self._description
 
-    @classmethod
-    def _build_maps(cls) -> None:
-        """
-        Initializes internal lookup maps for MetastasesLocationType enum members.
-
-        It ensures these maps are built only once per class, using `hasattr` to prevent
-        redundant reinitialization.
-        """
-        if not hasattr(cls, "_descriptions"):
-            cls._descriptions: Dict[str, MetastasesLocationType] = {}
-            cls._lowercase_descriptions: Dict[str, MetastasesLocationType] = {}
-            cls._valid_value_ids: Dict[int, MetastasesLocationType] = {}
-            for item in cls:
-                cls._descriptions[item.description] = item
-                cls._lowercase_descriptions[item.description.lower()] = item
-                cls._valid_value_ids[item.valid_value_id] = item
-
     @classmethod
     def by_description(cls, description: str) -> Optional["MetastasesLocationType"]:
         """
         Returns the MetastasesLocationType matching the given description.
         """
-        cls._build_maps()
-        return cls._descriptions.get(description)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -60,8 +42,7 @@ class MetastasesLocationType(Enum):
         """
         Returns the MetastasesLocationType matching the given description (case-insensitive).
         """
-        cls._build_maps()
-        return cls._lowercase_descriptions.get(description.lower())
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(
@@ -70,8 +51,7 @@ class MetastasesLocationType(Enum):
         """
         Returns the MetastasesLocationType matching the given valid value ID.
         """
-        cls._build_maps()
-        return cls._valid_value_ids.get(valid_value_id)
+        return cls._lookup("valid_value_id", valid_value_id)
 
     def get_id(self) -> int:
         """Returns the valid value ID for the metastases location type."""
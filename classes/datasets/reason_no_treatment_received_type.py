@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class ReasonNoTreatmentReceivedType(Enum):
+class ReasonNoTreatmentReceivedType(IndexedEnum):
     """
     Enum representing reasons why no treatment was received in cancer audit datasets,
     with valid value IDs and descriptions.
@@ -29,23 +29,6 @@ class ReasonNoTreatmentReceivedType(Enum):
         """Returns the description for the reason no treatment was received."""
         return self._description
 
-    @classmethod
-    def _build_maps(cls) -> None:
-        """
-        Initializes internal lookup maps for ReasonNoTreatmentReceivedType enum members.
-
-        It ensures these maps are built only once per class, using `hasattr` to prevent
-        redundant reinitialization.
-        """
-        if not hasattr(cls, "_descriptions"):
-            cls._descriptions: Dict[str, ReasonNoTreatmentReceivedType] = {}
-            cls._lowercase_descriptions: Dict[str, ReasonNoTreatmentReceivedType] = {}
-            cls._valid_value_ids: Dict[int, ReasonNoTreatmentReceivedType] = {}
-            for item in cls:
-                cls._descriptions[item.description] = item
-                cls._lowercase_descriptions[item.description.lower()] = item
-                cls._valid_value_ids[item.valid_value_id] = item
-
     @classmethod
     def by_description(
         cls, description: str
@@ -53,8 +36,7 @@ class ReasonNoTreatmentReceivedType(Enum):
         """
         Returns the ReasonNoTreatmentReceivedType matching the given description.
         """
-        cls._build_maps()
-        return cls._descriptions.get(description)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -63,8 +45,7 @@ class ReasonNoTreatmentReceivedType(Enum):
         """
         Returns the ReasonNoTreatmentReceivedType matching the given description (case-insensitive).
         """
-        cls._build_maps()
-        return cls._lowercase_descriptions.get(description.lower())
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(
@@ -73,8 +54,7 @@ class ReasonNoTreatmentReceivedType(Enum):
         """
         Returns the ReasonNoTreatmentReceivedType matching the given valid value ID.
         """
-        cls._build_maps()
-        return cls._valid_value_ids.get(valid_value_id)
+        return cls._lookup("valid_value_id", valid_value_id)
 
     def get_id(self) -> int:
         """Returns the valid value ID for the reason no treatment was received."""
@@ -1,10 +1,10 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 from datetime import date, timedelta
 import random
 
 
-class DateDescription(Enum):
+class DateDescription(IndexedEnum):
     """
     Enum representing various date descriptions and their associated logic.
 
@@ -198,7 +198,7 @@ class DateDescription(Enum):
         Returns:
             Optional[DateDescription]: The matching enum member, or None if not found.
         """
-        return next((d for d in cls if d.description == desc), None)
+        return cls._lookup("description", desc)
 
     @classmethod
     def by_description_case_insensitive(cls, desc: str) -> Optional["DateDescription"]:
@@ -211,4 +211,4 @@ class DateDescription(Enum):
         Returns:
             Optional[DateDescription]: The matching enum member, or None if not found.
         """
-        return next((d for d in cls if d.description.lower() == desc.lower()), None)
+        return cls._lookup_case_insensitive("description", desc)
@@ -1,7 +1,7 @@
-from enum import Enum
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class HasDateOfDeathRemoval(Enum):
+class HasDateOfDeathRemoval(IndexedEnum):
     """
     Enum for mapping binary filter for the presence of a date-of-death removal record.
     """
@@ -24,9 +24,9 @@ class HasDateOfDeathRemoval(Enum):
             ValueError: If the description is not recognized.
         """
         normalized = description.strip().capitalize()
-        for member in cls:
-            if member.value == normalized:
-                return member
-        raise ValueError(
-            f"Invalid value for date-of-death removal filter: '{description}'"
-        )
+        member = cls._lookup("value", normalized)
+        if member is None:
+            raise ValueError(
+                f"Invalid value for date-of-death removal filter: '{description}'"
+            )
+        return member
@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class HasUserDobUpdate(Enum):
+class HasUserDobUpdate(IndexedEnum):
     """
     Enum representing whether a subject has a user-initiated date of birth update.
 
@@ -31,10 +31,7 @@ class HasUserDobUpdate(Enum):
         Returns:
             Optional[HasUserDobUpdate]: The matching enum member, or None if not found.
         """
-        for item in cls:
-            if item.value.lower() == description.lower():
-                return item
-        return None
+        return cls._lookup_case_insensitive("value", description)
 
     def get_description(self) -> str:
         """
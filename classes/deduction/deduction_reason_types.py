@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class DeductionReasonType(Enum):
+class DeductionReasonType(IndexedEnum):
     """
     Enum representing deduction reason types, mapped to valid value IDs, allowed values, and descriptions.
     Provides utility methods for lookup by description, allowed value, and valid value ID.
@@ -74,10 +74,7 @@ class DeductionReasonType(Enum):
         Returns:
             Optional[DeductionReasonType]: The matching enum member, or None if not found.
         """
-        for member in cls:
-            if member.description == description:
-                return member
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -90,11 +87,7 @@ class DeductionReasonType(Enum):
         Returns:
             Optional[DeductionReasonType]: The matching enum member, or None if not found.
         """
-        desc_lower = description.lower()
-        for member in cls:
-            if member.description.lower() == desc_lower:
-                return member
-        return None
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_deduction_code(cls, code: str) -> Optional["DeductionReasonType"]:
@@ -105,11 +98,7 @@ class DeductionReasonType(Enum):
         Returns:
             Optional[DeductionReasonType]: The matching enum member, or None if not found.
         """
-        code_upper = code.upper()
-        for member in cls:
-            if member.allowed_value.upper() == code_upper:
-                return member
-        return None
+        return cls._lookup_case_insensitive("allowed_value", code)
 
     @classmethod
     def by_valid_value_id(cls, valid_value_id: int) -> Optional["DeductionReasonType"]:
@@ -120,7 +109,4 @@ class DeductionReasonType(Enum):
         Returns:
             Optional[DeductionReasonType]: The matching enum member, or None if not found.
         """
-        for member in cls:
-            if member.valid_value_id == valid_value_id:
-                return member
-        return None
+        return cls._lookup("valid_value_id", valid_value_id)
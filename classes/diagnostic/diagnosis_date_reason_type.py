@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class DiagnosisDateReasonType(Enum):
+class DiagnosisDateReasonType(IndexedEnum, last_wins=True):
     """
     Enum representing diagnosis date reasons with valid value IDs and descriptions.
     """
@@ -45,30 +45,12 @@ class DiagnosisDateReasonType(Enum):
         """Returns the description for the diagnosis date reason."""
         return self._description
 
-    @classmethod
-    def _build_maps(cls) -> None:
-        """
-        Initializes internal lookup maps for DiagnosisDateReasonType enum members.
-
-        It ensures these maps are built only once per class, using `hasattr` to prevent
-        redundant reinitialization.
-        """
-        if not hasattr(cls, "_descriptions"):
-            cls._descriptions: Dict[str, DiagnosisDateReasonType] = {}
-            cls._lowercase_descriptions: Dict[str, DiagnosisDateReasonType] = {}
-            cls._valid_value_ids: Dict[Optional[int], DiagnosisDateReasonType] = {}
-            for item in cls:
-                cls._descriptions[item.description] = item
-                cls._lowercase_descriptions[item.description.lower()] = item
-                cls._valid_value_ids[item.valid_value_id] = item
-
     @classmethod
     def by_description(cls, description: str) -> Optional["DiagnosisDateReasonType"]:
         """
         Returns the DiagnosisDateReasonType matching the given description.
         """
-        cls._build_maps()
-        return cls._descriptions.get(description)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -77,8 +59,7 @@ class DiagnosisDateReasonType(Enum):
         """
         Returns the DiagnosisDateReasonType matching the given description (case-insensitive).
         """
-        cls._build_maps()
-        return cls._lowercase_descriptions.get(description.lower())
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(
@@ -87,8 +68,7 @@ class DiagnosisDateReasonType(Enum):
         """
         Returns the DiagnosisDateReasonType matching the given valid value ID.
         """
-        cls._build_maps()
-        return cls._valid_value_ids.get(valid_value_id)
+        return cls._lookup("valid_value_id", valid_value_id)
 
     def get_valid_value_id(self) -> Optional[int]:
         """
@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class DiagnosticTestHasResult(Enum):
+class DiagnosticTestHasResult(IndexedEnum):
     """
     Enum representing possible results of a diagnostic test, mapped to IDs and descriptions.
     """
@@ -43,10 +43,7 @@ class DiagnosticTestHasResult(Enum):
         """
         Returns the enum member matching the given description (case-sensitive).
         """
-        for member in cls:
-            if member.description == description:
-                return member
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -55,18 +52,11 @@ class DiagnosticTestHasResult(Enum):
         """
         Returns the enum member matching the given description (case-insensitive).
         """
-        desc_lower = description.lower()
-        for member in cls:
-            if member.description.lower() == desc_lower:
-                return member
-        return None
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_id(cls, id: int) -> Optional["DiagnosticTestHasResult"]:
         """
         Returns the enum member matching the given ID.
         """
-        for member in cls:
-            if member.valid_value_id == id:
-                return member
-        return None
+        return cls._lookup("valid_value_id", id)
@@ -1,7 +1,7 @@
-from enum import Enum
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class DiagnosticTestIsVoid(Enum):
+class DiagnosticTestIsVoid(IndexedEnum):
     """
     Enum for mapping descriptive yes/no flags to test void state checks.
     """
@@ -24,7 +24,7 @@ class DiagnosticTestIsVoid(Enum):
             ValueError: If the description is not recognized.
         """
         key = description.strip().lower()
-        for member in cls:
-            if member.value == key:
-                return member
-        raise ValueError(f"Unknown test void flag: '{description}'")
+        member = cls._lookup("value", key)
+        if member is None:
+            raise ValueError(f"Unknown test void flag: '{description}'")
+        return member
@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class DiagnosticTestReferralType(Enum):
+class DiagnosticTestReferralType(IndexedEnum):
     """
     Enum representing diagnostic test referral types with valid value IDs and descriptions.
     """
@@ -24,30 +24,12 @@ class DiagnosticTestReferralType(Enum):
         """Returns the description for the diagnostic test referral type."""
         return self._description
 
-    @classmethod
-    def _build_maps(cls) -> None:
-        """
-        Initializes internal lookup maps for DiagnosticTestReferralType enum members.
-
-        It ensures these maps are built only once per class, using `hasattr` to prevent
-        redundant reinitialization.
-        """
-        if not hasattr(cls, "_descriptions"):
-            cls._descriptions: Dict[str, DiagnosticTestReferralType] = {}
-            cls._lowercase_descriptions: Dict[str, DiagnosticTestReferralType] = {}
-            cls._valid_value_ids: Dict[int, DiagnosticTestReferralType] = {}
-            for item in cls:
-                cls._descriptions[item.description] = item
-                cls._lowercase_descriptions[item.description.lower()] = item
-                cls._valid_value_ids[item.valid_value_id] = item
-
     @classmethod
     def by_description(cls, description: str) -> Optional["DiagnosticTestReferralType"]:
         """
         Returns the DiagnosticTestReferralType matching the given description.
         """
-        cls._build_maps()
-        return cls._descriptions.get(description)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -56,8 +38,7 @@ class DiagnosticTestReferralType(Enum):
         """
         Returns the DiagnosticTestReferralType matching the given description (case-insensitive).
         """
-        cls._build_maps()
-        return cls._lowercase_descriptions.get(description.lower())
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(
@@ -66,8 +47,7 @@ class DiagnosticTestReferralType(Enum):
         """
         Returns the DiagnosticTestReferralType matching the given valid value ID.
         """
-        cls._build_maps()
-        return cls._valid_value_ids.get(valid_value_id)
+        return cls._lookup("valid_value_id", valid_value_id)
 
     def get_id(self) -> int:
         """
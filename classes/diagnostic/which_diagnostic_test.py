@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class WhichDiagnosticTest(Enum):
+class WhichDiagnosticTest(IndexedEnum):
     """
     Enum representing which diagnostic test to select, with description and test number.
     Provides utility methods for lookup by description (case-sensitive and insensitive).
@@ -62,10 +62,7 @@ class WhichDiagnosticTest(Enum):
         """
         Returns the enum member matching the given description (case-sensitive).
         """
-        for member in cls:
-            if member.description == description:
-                return member
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -74,8 +71,4 @@ class WhichDiagnosticTest(Enum):
         """
         Returns the enum member matching the given description (case-insensitive).
         """
-        desc_lower = description.lower()
-        for member in cls:
-            if member.description.lower() == desc_lower:
-                return member
-        return None
+        return cls._lookup_case_insensitive("description", description)
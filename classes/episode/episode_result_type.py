@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class EpisodeResultType(Enum):
+class EpisodeResultType(IndexedEnum):
     NO_RESULT = (20311, "No Result")
     NORMAL = (20312, "Normal (No Abnormalities Found)")
     LOW_RISK_ADENOMA = (20314, "Low-risk Adenoma")
@@ -55,20 +55,19 @@ class EpisodeResultType(Enum):
     @classmethod
     def by_id(cls, valid_value_id: int) -> Optional["EpisodeResultType"]:
         """Find an EpisodeResultType by its ID (returns first match if duplicates)."""
-        return next((m for m in cls if m.id == valid_value_id), None)
+        return cls._lookup("id", valid_value_id)
 
     @classmethod
     def by_description(cls, description: str) -> Optional["EpisodeResultType"]:
         """Find an EpisodeResultType by its description (case-sensitive)."""
-        return next((m for m in cls if m.description == description), None)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
         cls, description: str
     ) -> Optional["EpisodeResultType"]:
         """Find an EpisodeResultType by its description (case-insensitive)."""
-        description = description.lower()
-        return next((m for m in cls if m.description.lower() == description), None)
+        return cls._lookup_case_insensitive("description", description)
 
     def __str__(self) -> str:
         """Return a string representation of the EpisodeResultType."""
@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class EpisodeStatusReasonType(Enum):
+class EpisodeStatusReasonType(IndexedEnum):
     """
     Enum representing episode status reasons with valid value IDs and descriptions.
     """
@@ -90,30 +90,12 @@ class EpisodeStatusReasonType(Enum):
         """Returns the description for the episode status reason."""
         return self._description
 
-    @classmethod
-    def _build_maps(cls) -> None:
-        """
-        Initializes internal lookup maps for EpisodeStatusReasonType enum members.
-
-        It ensures these maps are built only once per class, using `hasattr` to prevent
-        redundant reinitialization.
-        """
-        if not hasattr(cls, "_descriptions"):
-            cls._descriptions: Dict[str, EpisodeStatusReasonType] = {}
-            cls._lowercase_descriptions: Dict[str, EpisodeStatusReasonType] = {}
-            cls._valid_value_ids: Dict[Optional[int], EpisodeStatusReasonType] = {}
-            for item in cls:
-                cls._descriptions[item.description] = item
-                cls._lowercase_descriptions[item.description.lower()] = item
-                cls._valid_value_ids[item.valid_value_id] = item
-
     @classmethod
     def by_description(cls, description: str) -> Optional["EpisodeStatusReasonType"]:
         """
         Returns the EpisodeStatusReasonType matching the given description.
         """
-        cls._build_maps()
-        return cls._descriptions.get(description)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -122,8 +104,7 @@ class EpisodeStatusReasonType(Enum):
         """
         Returns the EpisodeStatusReasonType matching the given description (case-insensitive).
         """
-        cls._build_maps()
-        return cls._lowercase_descriptions.get(description.lower())
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(
@@ -132,8 +113,7 @@ class EpisodeStatusReasonType(Enum):
         """
         Returns the EpisodeStatusReasonType matching the given valid value ID.
         """
-        cls._build_maps()
-        return cls._valid_value_ids.get(valid_value_id)
+        return cls._lookup("valid_value_id", valid_value_id)
 
     def get_id(self) -> Optional[int]:
         """
@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class EpisodeStatusType(Enum):
+class EpisodeStatusType(IndexedEnum, last_wins=True):
     """
     Enum representing episode status types with valid value IDs and descriptions.
     """
@@ -26,30 +26,12 @@ class EpisodeStatusType(Enum):
         """Returns the description for the episode status."""
         return self._description
 
-    @classmethod
-    def _build_maps(cls) -> None:
-        """
-        Initializes internal lookup maps for EpisodeStatusType enum members.
-
-        It ensures these maps are built only once per class, using `hasattr` to prevent
-        redundant reinitialization.
-        """
-        if not hasattr(cls, "_descriptions"):
-            cls._descriptions: Dict[str, EpisodeStatusType] = {}
-            cls._lowercase_descriptions: Dict[str, EpisodeStatusType] = {}
-            cls._valid_value_ids: Dict[int, EpisodeStatusType] = {}
-            for item in cls:
-                cls._descriptions[item.description] = item
-                cls._lowercase_descriptions[item.description.lower()] = item
-                cls._valid_value_ids[item.valid_value_id] = item
-
     @classmethod
     def by_description(cls, description: str) -> Optional["EpisodeStatusType"]:
         """
         Returns the EpisodeStatusType matching the given description.
         """
-        cls._build_maps()
-        return cls._descriptions.get(description)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -58,16 +40,14 @@ class EpisodeStatusType(Enum):
         """
         Returns the EpisodeStatusType matching the given description (case-insensitive).
         """
-        cls._build_maps()
-        return cls._lowercase_descriptions.get(description.lower())
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(cls, valid_value_id: int) -> Optional["EpisodeStatusType"]:
         """
         Returns the EpisodeStatusType matching the given valid value ID.
         """
-        cls._build_maps()
-        return cls._valid_value_ids.get(valid_value_id)
+        return cls._lookup("valid_value_id", valid_value_id)
 
     def get_id(self) -> int:
         """
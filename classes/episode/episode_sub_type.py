@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class EpisodeSubType(Enum):
+class EpisodeSubType(IndexedEnum):
     """
     Enum representing sub-types of an episode in the BCSS system.
 
@@ -48,23 +48,6 @@ class EpisodeSubType(Enum):
         """
         return self._description
 
-    @classmethod
-    def _build_maps(cls) -> None:
-        """
-        Initializes internal lookup maps for EpisodeSubType enum members.
-
-        It ensures these maps are built only once per class, using `hasattr` to prevent
-        redundant reinitialization.
-        """
-        if not hasattr(cls, "_descriptions"):
-            cls._descriptions: Dict[str, EpisodeSubType] = {}
-            cls._lowercase_descriptions: Dict[str, EpisodeSubType] = {}
-            cls._valid_value_ids: Dict[int, EpisodeSubType] = {}
-            for item in cls:
-                cls._descriptions[item.description] = item
-                cls._lowercase_descriptions[item.description.lower()] = item
-                cls._valid_value_ids[item.valid_value_id] = item
-
     @classmethod
     def by_description(cls, description: str) -> Optional["EpisodeSubType"]:
         """
@@ -76,8 +59,7 @@ class EpisodeSubType(Enum):
         Returns:
             Optional[EpisodeSubType]: The matching enum member, or None if not found.
         """
-        cls._build_maps()
-        return cls._descriptions.get(description)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -92,8 +74,7 @@ class EpisodeSubType(Enum):
         Returns:
             Optional[EpisodeSubType]: The matching enum member, or None if not found.
         """
-        cls._build_maps()
-        return cls._lowercase_descriptions.get(description.lower())
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(cls, valid_value_id: int) -> Optional["EpisodeSubType"]:
@@ -106,8 +87,7 @@ class EpisodeSubType(Enum):
         Returns:
             Optional[EpisodeSubType]: The matching enum member, or None if not found.
         """
-        cls._build_maps()
-        return cls._valid_value_ids.get(valid_value_id)
+        return cls._lookup("valid_value_id", valid_value_id)
 
     def get_id(self) -> int:
         """
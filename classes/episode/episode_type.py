@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class EpisodeType(Enum):
+class EpisodeType(IndexedEnum):
     """
     Enum representing different types of screening episodes.
 
@@ -64,10 +64,7 @@ class EpisodeType(Enum):
         Returns:
             Optional[EpisodeType]: The matching enum member, or None if not found.
         """
-        for member in cls:
-            if member.description == description:
-                return member
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -82,10 +79,7 @@ class EpisodeType(Enum):
         Returns:
             Optional[EpisodeType]: The matching enum member, or None if not found.
         """
-        for member in cls:
-            if member.description.lower() == description.lower():
-                return member
-        return None
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(cls, valid_value_id: int) -> Optional["EpisodeType"]:
@@ -98,7 +92,4 @@ class EpisodeType(Enum):
         Returns:
             Optional[EpisodeType]: The matching enum member, or None if not found.
         """
-        for member in cls:
-            if member.valid_value_id == valid_value_id:
-                return member
-        return None
+        return cls._lookup("valid_value_id", valid_value_id)
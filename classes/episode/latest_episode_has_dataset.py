@@ -1,7 +1,7 @@
-from enum import Enum
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class LatestEpisodeHasDataset(Enum):
+class LatestEpisodeHasDataset(IndexedEnum):
     """
     Enum for interpreting the presence and completion status of datasets in the latest episode.
 
@@ -32,7 +32,7 @@ class LatestEpisodeHasDataset(Enum):
             ValueError: If the description is not recognized.
         """
         normalized = description.strip().lower()
-        for member in cls:
-            if member.value.lower() == normalized:
-                return member
-        raise ValueError(f"Unknown dataset status: '{description}'")
+        member = cls._lookup_case_insensitive("value", normalized)
+        if member is None:
+            raise ValueError(f"Unknown dataset status: '{description}'")
+        return member
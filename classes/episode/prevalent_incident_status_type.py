@@ -1,7 +1,7 @@
-from enum import Enum
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class PrevalentIncidentStatusType(Enum):
+class PrevalentIncidentStatusType(IndexedEnum):
     """
     Enum for mapping symbolic values for FOBT prevalent/incident episode classification.
 
@@ -28,7 +28,7 @@ class PrevalentIncidentStatusType(Enum):
             ValueError: If the description is not recognized.
         """
         key = description.strip().lower()
-        for member in cls:
-            if member.value == key:
-                return member
-        raise ValueError(f"Unknown FOBT episode status: '{description}'")
+        member = cls._lookup("value", key)
+        if member is None:
+            raise ValueError(f"Unknown FOBT episode status: '{description}'")
+        return member
@@ -1,10 +1,10 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 redirect_to_confirm_string = "Redirect to Confirm Diagnostic Test Result and Outcome"
 
 
-class EventCodeType(Enum):
+class EventCodeType(IndexedEnum, last_wins=True):
     """
     Enum representing event codes with IDs, codes, and descriptions.
     """
@@ -403,40 +403,19 @@ class EventCodeType(Enum):
         """Returns the event code description."""
         return self._description
 
-    @classmethod
-    def _build_maps(cls) -> None:
-        """
-        Initializes internal lookup maps for EventCodeType enum members.
-
-        It ensures these maps are built only once per class, using `hasattr` to prevent
-        redundant reinitialization.
-        """
-        if not hasattr(cls, "_codes"):
-            cls._codes: Dict[str, EventCodeType] = {}
-            cls._descriptions: Dict[str, EventCodeType] = {}
-            cls._lowercase_descriptions: Dict[str, EventCodeType] = {}
-            cls._ids: Dict[int, EventCodeType] = {}
-            for item in cls:
-                cls._codes[item.code] = item
-                cls._descriptions[item.description] = item
-                cls._lowercase_descriptions[item.description.lower()] = item
-                cls._ids[item.id] = item
-
     @classmethod
     def by_code(cls, code: str) -> Optional["EventCodeType"]:
         """
         Returns the EventCodeType matching the given code.
         """
-        cls._build_maps()
-        return cls._codes.get(code)
+        return cls._lookup("code", code)
 
     @classmethod
     def by_description(cls, description: str) -> Optional["EventCodeType"]:
         """
         Returns the EventCodeType matching the given description.
         """
-        cls._build_maps()
-        return cls._descriptions.get(description)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -445,16 +424,14 @@ class EventCodeType(Enum):
         """
         Returns the EventCodeType matching the given description (case-insensitive).
         """
-        cls._build_maps()
-        return cls._lowercase_descriptions.get(description.lower())
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_id(cls, id: int) -> Optional["EventCodeType"]:
         """
         Returns the EventCodeType matching the given ID.
         """
-        cls._build_maps()
-        return cls._ids.get(id)
+        return cls._lookup("id", id)
 
     def get_id(self) -> int:
         """Returns the event code ID."""
@@ -1,11 +1,11 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 discharged_from_surveillance_string = "Discharged from Surveillance - GP Letter Printed"
 handover_into_symptomatic_care_string = "Handover into Symptomatic Care"
 
 
-class EventStatusType(Enum):
+class EventStatusType(IndexedEnum):
     """
     Enum representing various event status types for screening and diagnostic events.
 
@@ -1214,7 +1214,7 @@ class EventStatusType(Enum):
         Returns:
             Optional[EventStatusType]: The matching enum member, or None if not found.
         """
-        return next((e for e in cls if e.id == id_), None)
+        return cls._lookup("id", id_)
 
     @classmethod
     def get_by_code(cls, code: str) -> Optional["EventStatusType"]:
@@ -1227,7 +1227,7 @@ class EventStatusType(Enum):
         Returns:
             Optional[EventStatusType]: The matching enum member, or None if not found.
         """
-        return next((e for e in cls if e.code == code), None)
+        return cls._lookup("code", code)
 
     @classmethod
     def get_by_description(cls, description: str) -> Optional["EventStatusType"]:
@@ -1240,4 +1240,4 @@ class EventStatusType(Enum):
         Returns:
             Optional[EventStatusType]: The matching enum member, or None if not found.
         """
-        return next((e for e in cls if e.description == description), None)
+        return cls._lookup("description", description)
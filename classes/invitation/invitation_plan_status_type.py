@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class InvitationPlanStatusType(Enum):
+class InvitationPlanStatusType(IndexedEnum):
     """
     Invitation Plan Status types, as defined in the VALID_VALUES table.
     """
@@ -44,7 +44,4 @@ class InvitationPlanStatusType(Enum):
         """
         if plan_type_id is None:
             return None
-        for status in cls:
-            if status.id == plan_type_id:
-                return status
-        return None
+        return cls._lookup("id", plan_type_id)
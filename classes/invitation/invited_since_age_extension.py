@@ -1,7 +1,7 @@
-from enum import Enum
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class InvitedSinceAgeExtension(Enum):
+class InvitedSinceAgeExtension(IndexedEnum):
     """
     Enum for mapping subject invitation criteria based on age extension presence.
 
@@ -28,7 +28,9 @@ class InvitedSinceAgeExtension(Enum):
             ValueError: If the description is not recognized.
         """
         key = description.strip().capitalize()
-        for member in cls:
-            if member.value == key:
-                return member
-        raise ValueError(f"Invalid invited-since-age-extension flag: '{description}'")
+        member = cls._lookup("value", key)
+        if member is None:
+            raise ValueError(
+                f"Invalid invited-since-age-extension flag: '{description}'"
+            )
+        return member
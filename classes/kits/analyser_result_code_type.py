@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class AnalyserResultCodeType(Enum):
+class AnalyserResultCodeType(IndexedEnum):
     """
     Enum for analyser result code types, mapped to valid value IDs and descriptions.
     """
@@ -35,10 +35,7 @@ class AnalyserResultCodeType(Enum):
         """
         Returns the enum member matching the given description (case-sensitive).
         """
-        for member in cls:
-            if member.description == description:
-                return member
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -47,11 +44,7 @@ class AnalyserResultCodeType(Enum):
         """
         Returns the enum member matching the given description (case-insensitive).
         """
-        desc_lower = description.lower()
-        for member in cls:
-            if member.description.lower() == desc_lower:
-                return member
-        return None
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(
@@ -60,7 +53,4 @@ class AnalyserResultCodeType(Enum):
         """
         Returns the enum member matching the given valid value ID.
         """
-        for member in cls:
-            if member.valid_value_id == valid_value_id:
-                return member
-        return None
+        return cls._lookup("valid_value_id", valid_value_id)
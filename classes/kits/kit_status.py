@@ -1,7 +1,7 @@
-from enum import Enum
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class KitStatus(Enum):
+class KitStatus(IndexedEnum):
     """
     Enum representing kit statuses.
     """
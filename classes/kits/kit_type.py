@@ -1,7 +1,7 @@
-from enum import Enum
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class KitType(Enum):
+class KitType(IndexedEnum):
     """
     Enum representing kit types.
     """
@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class GeneticConditionType(Enum):
+class GeneticConditionType(IndexedEnum):
     """
     Enum representing genetic condition types with valid value ID, description, and lower age.
     Provides lookup by description and valid value ID.
@@ -37,15 +37,9 @@ class GeneticConditionType(Enum):
     @classmethod
     def by_description(cls, description: str) -> Optional["GeneticConditionType"]:
         """Return the GeneticConditionType instance for the given description."""
-        for member in cls:
-            if member.description == description:
-                return member
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_valid_value_id(cls, valid_value_id: int) -> Optional["GeneticConditionType"]:
         """Return the GeneticConditionType instance for the given valid value ID."""
-        for member in cls:
-            if member.valid_value_id == valid_value_id:
-                return member
-        return None
+        return cls._lookup("valid_value_id", valid_value_id)
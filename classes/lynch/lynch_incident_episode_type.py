@@ -1,7 +1,7 @@
-from enum import Enum
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class LynchIncidentEpisodeType(Enum):
+class LynchIncidentEpisodeType(IndexedEnum):
     """
     Enum for mapping symbolic values used to filter Lynch incident episode linkage.
 
@@ -32,7 +32,9 @@ class LynchIncidentEpisodeType(Enum):
             ValueError: If the description is not recognized.
         """
         key = description.strip().lower()
-        for member in cls:
-            if member.value == key:
-                return member
-        raise ValueError(f"Unknown Lynch incident episode criteria: '{description}'")
+        member = cls._lookup("value", key)
+        if member is None:
+            raise ValueError(
+                f"Unknown Lynch incident episode criteria: '{description}'"
+            )
+        return member
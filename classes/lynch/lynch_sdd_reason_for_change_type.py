@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class LynchSDDReasonForChangeType(Enum):
+class LynchSDDReasonForChangeType(IndexedEnum):
     """
     Enum representing reasons for change to Lynch SDD (Surveillance Due Date).
 
@@ -78,9 +78,7 @@ class LynchSDDReasonForChangeType(Enum):
         Returns:
             Optional[LynchSDDReasonForChangeType]: The matching enum member, or None if not found.
         """
-        return next(
-            (item for item in cls if item.valid_value_id == valid_value_id), None
-        )
+        return cls._lookup("valid_value_id", valid_value_id)
 
     @classmethod
     def by_description(
@@ -95,7 +93,7 @@ class LynchSDDReasonForChangeType(Enum):
         Returns:
             Optional[LynchSDDReasonForChangeType]: The matching enum member, or None if not found.
         """
-        return next((item for item in cls if item.description == description), None)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -110,7 +108,4 @@ class LynchSDDReasonForChangeType(Enum):
         Returns:
             Optional[LynchSDDReasonForChangeType]: The matching enum member, or None if not found.
         """
-        return next(
-            (item for item in cls if item.description.lower() == description.lower()),
-            None,
-        )
+        return cls._lookup_case_insensitive("description", description)
@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class NotifyMessageStatus(Enum):
+class NotifyMessageStatus(IndexedEnum):
     """
     Enum representing the status of a notify message, with utility methods for lookup by description.
     """
@@ -26,10 +26,7 @@ class NotifyMessageStatus(Enum):
         """
         Returns the enum member matching the given description (case-sensitive).
         """
-        for member in cls:
-            if member.description == description:
-                return member
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -38,8 +35,4 @@ class NotifyMessageStatus(Enum):
         """
         Returns the enum member matching the given description (case-insensitive).
         """
-        desc_lower = description.lower()
-        for member in cls:
-            if member.description.lower() == desc_lower:
-                return member
-        return None
+        return cls._lookup_case_insensitive("description", description)
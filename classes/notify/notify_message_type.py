@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class NotifyMessageType(Enum):
+class NotifyMessageType(IndexedEnum):
     """
     Enum representing notify message types, with description and event status ID.
     '11197' is the event status id for all S1 notify message types
@@ -36,10 +36,7 @@ class NotifyMessageType(Enum):
         """
         Returns the enum member matching the given description (case-sensitive).
         """
-        for member in cls:
-            if member.description == description:
-                return member
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -48,8 +45,4 @@ class NotifyMessageType(Enum):
         """
         Returns the enum member matching the given description (case-insensitive).
         """
-        desc_lower = description.lower()
-        for member in cls:
-            if member.description.lower() == desc_lower:
-                return member
-        return None
+        return cls._lookup_case_insensitive("description", description)
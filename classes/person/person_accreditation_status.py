@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class PersonAccreditationStatus(Enum):
+class PersonAccreditationStatus(IndexedEnum):
     """
     Enum representing a person's accreditation status, with utility methods for lookup by description.
     """
@@ -34,10 +34,7 @@ class PersonAccreditationStatus(Enum):
         Returns:
             Optional[PersonAccreditationStatus]: The matching enum member, or None if not found.
         """
-        for member in cls:
-            if member.description == description:
-                return member
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -50,8 +47,4 @@ class PersonAccreditationStatus(Enum):
         Returns:
             Optional[PersonAccreditationStatus]: The matching enum member, or None if not found.
         """
-        desc_lower = description.lower()
-        for member in cls:
-            if member.description.lower() == desc_lower:
-                return member
-        return None
+        return cls._lookup_case_insensitive("description", description)
@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class PersonRoleStatus(Enum):
+class PersonRoleStatus(IndexedEnum):
     """
     Enum representing the status of a person's role, with utility methods for lookup by description.
     """
@@ -28,10 +28,7 @@ class PersonRoleStatus(Enum):
         Returns:
             Optional[PersonRoleStatus]: The matching enum member, or None if not found.
         """
-        for member in cls:
-            if member.description == description:
-                return member
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -44,8 +41,4 @@ class PersonRoleStatus(Enum):
         Returns:
             Optional[PersonRoleStatus]: The matching enum member, or None if not found.
         """
-        desc_lower = description.lower()
-        for member in cls:
-            if member.description.lower() == desc_lower:
-                return member
-        return None
+        return cls._lookup_case_insensitive("description", description)
@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class PersonSelectionCriteriaKey(Enum):
+class PersonSelectionCriteriaKey(IndexedEnum):
     """
     Enum of person selection criteria keys with associated string descriptions.
     Provides lookup methods to retrieve enum members by their description, with
@@ -29,15 +29,6 @@ class PersonSelectionCriteriaKey(Enum):
     ROLE_START_DATE = "role start date"
     SURNAME = "surname"
 
-    @classmethod
-    def _initialize_lookup_maps(cls) -> None:
-        """Initialize the description lookup dictionaries."""
-        cls._descriptions = {}
-        cls._lowercase_descriptions = {}
-        for member in cls:
-            cls._descriptions[member.value] = member
-            cls._lowercase_descriptions[member.value.lower()] = member
-
     @classmethod
     def by_description(cls, description: str) -> Optional["PersonSelectionCriteriaKey"]:
         """
@@ -50,8 +41,7 @@ class PersonSelectionCriteriaKey(Enum):
             Optional[PersonSelectionCriteriaKey]: The corresponding enum member,
             or None if no match is found.
         """
-        cls._initialize_lookup_maps()
-        return cls._descriptions.get(description)
+        return cls._lookup("value", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -67,5 +57,4 @@ class PersonSelectionCriteriaKey(Enum):
             Optional[PersonSelectionCriteriaKey]: The corresponding enum member,
             or None if no match is found.
         """
-        cls._initialize_lookup_maps()
-        return cls._lowercase_descriptions.get(description.lower())
+        return cls._lookup_case_insensitive("value", description)
@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class HasReferralDate(Enum):
+class HasReferralDate(IndexedEnum):
     """
     Enum representing referral date criteria with descriptions.
     """
@@ -21,17 +21,9 @@ class HasReferralDate(Enum):
         """Returns the description for the referral date criteria."""
         return self._description
 
-    @classmethod
-    def _build_map(cls) -> None:
-        if not hasattr(cls, "_descriptions"):
-            cls._descriptions: Dict[str, HasReferralDate] = {}
-            for item in cls:
-                cls._descriptions[item.description] = item
-
     @classmethod
     def by_description(cls, description: str) -> Optional["HasReferralDate"]:
         """
         Returns the HasReferralDate matching the given description.
         """
-        cls._build_map()
-        return cls._descriptions.get(description)
+        return cls._lookup("description", description)
@@ -1,6 +1,7 @@
 import logging
 from typing import List, Optional, Any
 from utils.oracle.oracle import OracleDB
+from utils.parallel_execution import resource_lock
 import oracledb
 from classes.database.database_error import DatabaseError
 from classes.invitation.invitation_plan import InvitationPlan
@@ -106,7 +107,8 @@ class InvitationRepository:
         hub_id = None
         screening_centre_id = None
         params = [number_of_weeks, max_number_of_subjects, hub_id, screening_centre_id]
-        self.oracle_db.execute_stored_procedure(procedure, params)
+        with resource_lock("invitation_generation"):
+            self.oracle_db.execute_stored_procedure(procedure, params)
         logging.debug("exit: InvitationRepository.refresh_invitation_shortlist")
 
     def process_next_invitations(self) -> None:
@@ -116,5 +118,6 @@ class InvitationRepository:
         logging.debug("start: InvitationRepository.process_next_invitations")
         procedure = "PKG_FOBT_CALL.p_generate_invitations_next_sc"
         in_params = [None, None, None]
-        self.oracle_db.execute_stored_procedure(procedure, in_params)
+        with resource_lock("invitation_generation"):
+            self.oracle_db.execute_stored_procedure(procedure, in_params)
         logging.debug("exit: InvitationRepository.process_next_invitations")
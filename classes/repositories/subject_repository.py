@@ -1,11 +1,16 @@
 import logging
 from typing import Optional
 from classes.subject.pi_subject import PISubject
+from classes.subject.pi_subject_creation_result import PISubjectCreationResult
 from classes.subject.subject import Subject
 from classes.user.user import User
+from utils.nhs_number_tools import NHSNumberTools
 from utils.oracle.oracle import OracleDB
+from utils.oracle.oracle_specific_functions.subject_batch import letter_batch_query
 from utils.oracle.subject_selection_query_builder import SubjectSelectionQueryBuilder
 
+DEFAULT_PI_SUBJECT_CHUNK_SIZE = 100
+
 
 class SubjectRepository:
     """
@@ -24,13 +29,55 @@ class SubjectRepository:
         Finds a subject by NHS number.
         """
         query = (
-            "SELECT * FROM screening_subject_t WHERE subject_nhs_number = :nhs_number"
+            "SELECT 1 FROM screening_subject_t WHERE subject_nhs_number = :nhs_number"
         )
-        df = self.oracle_db.execute_query(query, {"nhs_number": nhs_number})
-        if df.empty:
+        if self.oracle_db.fetch_one(query, {"nhs_number": nhs_number}) is None:
             return None
         return True
 
+    def reserve_unused_nhs_numbers(
+        self, count: int, seed: Optional[int] = None, max_attempts: int = 20
+    ) -> list[str]:
+        """
+        Generates NHS numbers that are not in use by any existing subject.
+        Each batch of candidates is generated with NHSNumberTools.generate_random_nhs_numbers (in this worker's
+        partition of the range) and checked against screening_subject_t with a single query.
+        Only the clashes are regenerated.
+
+        Args:
+            count (int): The number of NHS numbers required.
+            seed (Optional[int]): A seed, to generate the same candidates every time.
+            max_attempts (int): The maximum number of batches of candidates to check.
+
+        Returns:
+            list[str]: The unused NHS numbers.
+
+        Raises:
+            RuntimeError: If enough unused NHS numbers could not be generated.
+        """
+        reserved: dict[str, None] = {}
+        for attempt in range(max_attempts):
+            needed = count - len(reserved)
+            if needed <= 0:
+                break
+            candidates = [
+                nhs_number
+                for nhs_number in NHSNumberTools.generate_random_nhs_numbers(
+                    needed, seed=None if seed is None else seed + attempt
+                )
+                if nhs_number not in reserved
+            ]
+            existing = self.oracle_db.get_subject_ids_from_nhs_numbers(candidates)
+            for nhs_number in candidates:
+                if nhs_number not in existing:
+                    reserved[nhs_number] = None
+
+        if len(reserved) < count:
+            raise RuntimeError(
+                f"Failed to reserve {count} unused NHS numbers after {max_attempts} attempts"
+            )
+        return list(reserved)[:count]
+
     def create_pi_subject(self, pio_id: int, pi_subject: PISubject) -> Optional[int]:
         """
         Creates a new screening subject, returning the contact id.
@@ -106,6 +153,105 @@ class SubjectRepository:
 
         return new_contact_id
 
+    def create_pi_subjects(
+        self,
+        pio_id: int,
+        pi_subjects: list[PISubject],
+        chunk_size: int = DEFAULT_PI_SUBJECT_CHUNK_SIZE,
+    ) -> list[PISubjectCreationResult]:
+        """
+        Creates many new screening subjects.
+        The NHS numbers are checked for existing subjects with a single query, and the subjects are then passed
+        to PKG_SSPI.p_process_pi_subject over one connection (taken from the session pool if one is open),
+        committing after every chunk. A subject that fails does not stop the others from being created.
+
+        Args:
+            pio_id (int): The practitioner-in-organisation ID.
+            pi_subjects (list[PISubject]): The subjects to create.
+            chunk_size (int): The number of subjects to create between each commit.
+
+        Returns:
+            list[PISubjectCreationResult]: The contact id or error for each subject, in the order they were provided.
+        """
+        logging.debug(f"Creating {len(pi_subjects)} PI subjects")
+        existing = self.oracle_db.get_subject_ids_from_nhs_numbers(
+            [subject.nhs_number for subject in pi_subjects if subject.nhs_number]
+        )
+        results = []
+        pending = []
+        seen = set()
+        for pi_subject in pi_subjects:
+            nhs_number = pi_subject.nhs_number
+            result = PISubjectCreationResult(nhs_number)
+            results.append(result)
+            if nhs_number is None:
+                result.error = (
+                    "NHS Number must be specified when creating a new subject"
+                )
+            elif nhs_number in existing or nhs_number in seen:
+                result.error = f"Cannot create new subject with NHS Number {nhs_number} because it is already in use"
+            elif pi_subject.pi_reference is None:
+                result.error = "A PI Reference must be specified when creating a new subject, for example 'SELF REFERRAL' or 'AUTOMATED TEST'"
+            else:
+                pending.append((pi_subject, result))
+            if nhs_number is not None:
+                seen.add(nhs_number)
+
+        if pending:
+            self._process_pi_subjects(pio_id, pending, chunk_size)
+
+        failures = [result for result in results if not result.is_success()]
+        logging.debug(
+            f"Created {len(results) - len(failures)} of {len(results)} PI subjects"
+        )
+        return results
+
+    def _process_pi_subjects(
+        self,
+        pio_id: int,
+        pending: list[tuple[PISubject, PISubjectCreationResult]],
+        chunk_size: int,
+    ) -> None:
+        """
+        Passes each subject to PKG_SSPI.p_process_pi_subject over a single connection, committing after every chunk
+        and recording the contact id or error on each result.
+
+        Args:
+            pio_id (int): The practitioner-in-organisation ID.
+            pending (list[tuple[PISubject, PISubjectCreationResult]]): The subjects to process and their results.
+            chunk_size (int): The number of subjects to process between each commit.
+        """
+        procedure = "PKG_SSPI.p_process_pi_subject"
+        conn = self.oracle_db.connect_to_db()
+        try:
+            obj_pi_subject_type = conn.gettype("MPI.OBJ_PI_SUBJECT")
+            cursor = conn.cursor()
+            contact_id = cursor.var(int)
+            error_id = cursor.var(int)
+            error_text = cursor.var(str)
+            for start in range(0, len(pending), chunk_size):
+                for pi_subject, result in pending[start : start + chunk_size]:
+                    pi_struct = obj_pi_subject_type.newobject()
+                    for attr in obj_pi_subject_type.attributes:
+                        setattr(
+                            pi_struct, attr.name, getattr(pi_subject, attr.name.lower())
+                        )
+                    try:
+                        cursor.callproc(
+                            procedure,
+                            [pi_struct, pio_id, contact_id, error_id, error_text],
+                        )
+                    except Exception as e:
+                        result.error = f"Failed to execute {procedure}: {e}"
+                        continue
+                    if error_id.getvalue() != 0:
+                        result.error = f"Database error processing PI subject: {error_text.getvalue()}"
+                    else:
+                        result.contact_id = contact_id.getvalue()
+                conn.commit()
+        finally:
+            self.oracle_db.disconnect_from_db(conn)
+
     def update_pi_subject(self, pio_id: int, pi_subject: PISubject) -> None:
         """
         Updates an existing screening subject.
@@ -241,29 +387,10 @@ class SubjectRepository:
             letter_batch_title (str): The letter batch title.
             assertion (bool): If the subject should have this batch (True), or should not have this batch (False).
         """
-        sql_query = """ SELECT lb.batch_id
-        FROM lett_batch_records lbr
-        INNER JOIN lett_batch lb
-        ON lb.batch_id = lbr.batch_id
-        INNER JOIN valid_values ld
-        ON ld.valid_value_id = lb.description_id
-        INNER JOIN valid_values lbs
-        ON lbs.valid_value_id = lb.status_id
-        WHERE lb.batch_state_id = 12018
-        AND lbr.screening_subject_id = :subject_id
-        AND lbs.allowed_value = :batch_code
-        AND LOWER(ld.description) = LOWER(:batch_title)
-        AND lbr.non_inclusion_id IS NULL
-        AND lbr.key_id != 11539
-        """
-
         subject_id = self.oracle_db.get_subject_id_from_nhs_number(nhs_no)
-
-        params = {
-            "subject_id": subject_id,
-            "batch_code": letter_batch_code,
-            "batch_title": letter_batch_title,
-        }
+        sql_query, params = letter_batch_query(
+            letter_batch_code, letter_batch_title, screening_subject_id=subject_id
+        )
 
         batch_df = self.oracle_db.execute_query(sql_query, params)
         if assertion:
@@ -1,13 +1,15 @@
 import logging
-import random
 from typing import Dict, List
 from utils.oracle.oracle import OracleDB
+from utils.oracle.anon_word_sampler import get_anon_word_sampler
 
 
 class WordRepository:
     """
     Python version using oracledb and pandas for random word and subject detail generation.
     Assumes execute_query is available for running SQL and returning a pandas DataFrame.
+
+    The random words are drawn from the session wide AnonWordSampler, which holds MPI_ANON.ANON_WORD in memory.
     """
 
     def __init__(self):
@@ -15,6 +17,7 @@ class WordRepository:
         db_util: An object that provides the execute_query method as described.
         """
         self.db_util = OracleDB()
+        self.sampler = get_anon_word_sampler()
         self.forename_weighting = [80, 95, 100]
         self.surname_weighting = [90, 97, 100]
         self.names_max_length = 35
@@ -31,7 +34,7 @@ class WordRepository:
             str: A string of random words.
         """
         logging.debug("START: get_random_words_by_weighting")
-        percentage = random.randint(0, 99)
+        percentage = self.sampler.random.randint(0, 99)
         words = 0
         for i, weighting in enumerate(weightings):
             if percentage < weighting:
@@ -52,13 +55,13 @@ class WordRepository:
 
     def get_random_word(self) -> str:
         """
-        Gets a single random word from the database, or "TEST" if an error occurs.
+        Gets a single random word from the in memory word sampler, or "TEST" if an error occurs.
         Returns:
             str: A random word or "TEST" if an error occurs.
         """
         logging.debug("START: get_random_word")
         try:
-            word = self.find_random_word()
+            word = self.sampler.random_word()
             logging.debug("END: get_random_word")
             return word if word else "TEST"
         except Exception as e:
@@ -68,7 +71,8 @@ class WordRepository:
 
     def find_random_word(self) -> str:
         """
-        Finds a random word from the database.
+        Finds a random word from the database, using two queries.
+        get_random_word should be used instead, as it does not query the database for each word.
         Returns:
             str: A random word.
         """
@@ -96,7 +100,7 @@ class WordRepository:
             return "TEST"
         min_seq = int(df_range.iloc[0][min_seq_col])
         max_seq = int(df_range.iloc[0][max_seq_col])
-        random_seq = random.randint(min_seq, max_seq)
+        random_seq = self.sampler.random.randint(min_seq, max_seq)
         word_query = "SELECT WORD FROM MPI_ANON.ANON_WORD WHERE SEQ = :seq"
         df_word = self.db_util.execute_query(word_query, {"seq": random_seq})
         word_col = next((c for c in df_word.columns if c.lower() == "word"), None)
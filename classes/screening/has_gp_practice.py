@@ -1,7 +1,7 @@
-from enum import Enum
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class HasGPPractice(Enum):
+class HasGPPractice(IndexedEnum):
     """
     Enum representing whether a subject has a GP practice and its status.
 
@@ -32,10 +32,7 @@ class HasGPPractice(Enum):
         Returns:
             Optional[HasGPPractice]: The matching enum member, or None if not found.
         """
-        for member in cls:
-            if member.value.lower() == description:
-                return member
-        return None
+        return cls._lookup_case_insensitive("value", description)
 
     def get_description(self):
         """
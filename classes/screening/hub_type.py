@@ -1,7 +1,7 @@
-from enum import Enum
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class HubType(Enum):
+class HubType(IndexedEnum):
     """
     Enum representing hub types.
     """
@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class ScreeningStatusType(Enum):
+class ScreeningStatusType(IndexedEnum):
     """
     Enum representing different screening status types for a subject.
 
@@ -85,10 +85,7 @@ class ScreeningStatusType(Enum):
         Returns:
             Optional[ScreeningStatusType]: The matching enum member, or None if not found.
         """
-        for item in cls:
-            if item.description == description:
-                return item
-        return None
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -103,11 +100,7 @@ class ScreeningStatusType(Enum):
         Returns:
             Optional[ScreeningStatusType]: The matching enum member, or None if not found.
         """
-        description = description.lower()
-        for item in cls:
-            if item.description.lower() == description:
-                return item
-        return None
+        return cls._lookup_case_insensitive("description", description)
 
     @classmethod
     def by_valid_value_id(cls, valid_value_id: int) -> Optional["ScreeningStatusType"]:
@@ -120,7 +113,4 @@ class ScreeningStatusType(Enum):
         Returns:
             Optional[ScreeningStatusType]: The matching enum member, or None if not found.
         """
-        for item in cls:
-            if item.valid_value_id == valid_value_id:
-                return item
-        return None
+        return cls._lookup("valid_value_id", valid_value_id)
@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class SSReasonForChangeType(Enum):
+class SSReasonForChangeType(IndexedEnum):
     """
     Enum representing reasons for change to SS (Screening Status).
 
@@ -146,9 +146,7 @@ class SSReasonForChangeType(Enum):
         Returns:
             Optional[SSReasonForChangeType]: The matching enum member, or None if not found.
         """
-        return next(
-            (item for item in cls if item.valid_value_id == valid_value_id), None
-        )
+        return cls._lookup("valid_value_id", valid_value_id)
 
     @classmethod
     def by_description(cls, description: str) -> Optional["SSReasonForChangeType"]:
@@ -161,7 +159,7 @@ class SSReasonForChangeType(Enum):
         Returns:
             Optional[SSReasonForChangeType]: The matching enum member, or None if not found.
         """
-        return next((item for item in cls if item.description == description), None)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -176,7 +174,4 @@ class SSReasonForChangeType(Enum):
         Returns:
             Optional[SSReasonForChangeType]: The matching enum member, or None if not found.
         """
-        return next(
-            (item for item in cls if item.description.lower() == description.lower()),
-            None,
-        )
+        return cls._lookup_case_insensitive("description", description)
@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Dict, Optional
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class SubjectHubCode(Enum):
+class SubjectHubCode(IndexedEnum):
     """
     Enum representing subject hub code types.
 
@@ -40,9 +40,4 @@ class SubjectHubCode(Enum):
         Returns:
             Optional[SubjectHubCode]: The matching enum member, or None if not found.
         """
-        # Build reverse lookup map once and store it as a class attribute
-        if not hasattr(cls, "_description_map"):
-            cls._description_map: Dict[str, SubjectHubCode] = {
-                member.value: member for member in cls
-            }
-        return cls._description_map.get(description)
+        return cls._lookup("value", description)
@@ -1,7 +1,7 @@
-from enum import Enum
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class SubjectScreeningCentreCode(Enum):
+class SubjectScreeningCentreCode(IndexedEnum):
     """
     Enum representing subject screening centre code types.
 
@@ -38,8 +38,8 @@ class SubjectScreeningCentreCode(Enum):
         """
         return self.value
 
-    @staticmethod
-    def by_description(description: str):
+    @classmethod
+    def by_description(cls, description: str):
         """
         Returns the enum member matching the given description.
 
@@ -49,13 +49,10 @@ class SubjectScreeningCentreCode(Enum):
         Returns:
             Optional[SubjectScreeningCentreCode]: The matching enum member, or None if not found.
         """
-        for item in SubjectScreeningCentreCode:
-            if item.description == description:
-                return item
-        return None  # or raise an exception
+        return cls._lookup("description", description)
 
-    @staticmethod
-    def by_description_case_insensitive(description: str):
+    @classmethod
+    def by_description_case_insensitive(cls, description: str):
         """
         Returns the enum member matching the given description (case-insensitive).
 
@@ -65,8 +62,4 @@ class SubjectScreeningCentreCode(Enum):
         Returns:
             Optional[SubjectScreeningCentreCode]: The matching enum member, or None if not found.
         """
-        description_lower = description.lower()
-        for item in SubjectScreeningCentreCode:
-            if item.description.lower() == description_lower:
-                return item
-        return None  # or raise an exception
+        return cls._lookup_case_insensitive("description", description)
@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class GenderType(Enum):
+class GenderType(IndexedEnum):
     """
     Enum representing gender types for a subject.
 
@@ -72,7 +72,7 @@ class GenderType(Enum):
         Returns:
             Optional[GenderType]: The matching enum member, or None if not found.
         """
-        return next((item for item in cls if item.valid_value_id == id_), None)
+        return cls._lookup("valid_value_id", id_)
 
     @classmethod
     def by_redefined_value(cls, redefined_value: int) -> Optional["GenderType"]:
@@ -85,9 +85,7 @@ class GenderType(Enum):
         Returns:
             Optional[GenderType]: The matching enum member, or None if not found.
         """
-        return next(
-            (item for item in cls if item.redefined_value == redefined_value), None
-        )
+        return cls._lookup("redefined_value", redefined_value)
 
     @classmethod
     def by_allowed_value(cls, allowed_value: str) -> Optional["GenderType"]:
@@ -100,6 +98,4 @@ class GenderType(Enum):
         Returns:
             Optional[GenderType]: The matching enum member, or None if not found.
         """
-        return next(
-            (item for item in cls if item.allowed_value == allowed_value), None
-        )
+        return cls._lookup("allowed_value", allowed_value)
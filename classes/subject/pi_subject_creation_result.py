@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class PISubjectCreationResult:
+    """
+    Data class holding the outcome of creating a single PI subject through PKG_SSPI.p_process_pi_subject.
+    """
+
+    nhs_number: Optional[str]
+    contact_id: Optional[int] = None
+    error: Optional[str] = None
+
+    def is_success(self) -> bool:
+        """
+        Returns True if the subject was created, otherwise False.
+        """
+        return self.error is None and self.contact_id is not None
@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class SubjectAssertionResult:
+    """
+    Data class holding the outcome of checking a single subject against a set of subject selection criteria.
+    """
+
+    nhs_number: str
+    passed: bool = False
+    failed_criteria: list[tuple[str, str]] = field(default_factory=list)
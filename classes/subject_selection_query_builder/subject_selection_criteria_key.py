@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Dict, Optional
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class SubjectSelectionCriteriaKey(Enum):
+class SubjectSelectionCriteriaKey(IndexedEnum):
     """
     Enum representing all possible subject selection criteria keys.
 
@@ -359,8 +359,10 @@ class SubjectSelectionCriteriaKey(Enum):
         """
         return self._allow_more_than_one_value
 
-    @staticmethod
-    def by_description(description: str) -> Optional["SubjectSelectionCriteriaKey"]:
+    @classmethod
+    def by_description(
+        cls, description: str
+    ) -> Optional["SubjectSelectionCriteriaKey"]:
         """
         Returns the enum member matching the given description.
 
@@ -370,10 +372,4 @@ class SubjectSelectionCriteriaKey(Enum):
         Returns:
             Optional[SubjectSelectionCriteriaKey]: The matching enum member, or None if not found.
         """
-        return _description_map.get(description)
-
-
-# Build description-to-enum map
-_description_map: Dict[str, SubjectSelectionCriteriaKey] = {
-    key.description: key for key in SubjectSelectionCriteriaKey
-}
+        return cls._lookup("description", description)
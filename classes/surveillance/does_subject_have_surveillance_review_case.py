@@ -1,7 +1,7 @@
-from enum import Enum
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class DoesSubjectHaveSurveillanceReviewCase(Enum):
+class DoesSubjectHaveSurveillanceReviewCase(IndexedEnum):
     """
     Enum for mapping binary criteria for the presence of a surveillance review case.
     """
@@ -26,7 +26,9 @@ class DoesSubjectHaveSurveillanceReviewCase(Enum):
             ValueError: If the description is not recognized.
         """
         key = description.strip().capitalize()
-        for member in cls:
-            if member.value == key:
-                return member
-        raise ValueError(f"Unknown surveillance review case presence: '{description}'")
+        member = cls._lookup("value", key)
+        if member is None:
+            raise ValueError(
+                f"Unknown surveillance review case presence: '{description}'"
+            )
+        return member
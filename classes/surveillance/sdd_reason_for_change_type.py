@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class SDDReasonForChangeType(Enum):
+class SDDReasonForChangeType(IndexedEnum):
     """
     Enum representing reasons for change to SDD (Surveillance Due Date).
 
@@ -177,9 +177,7 @@ class SDDReasonForChangeType(Enum):
         Returns:
             Optional[SDDReasonForChangeType]: The matching enum member, or None if not found.
         """
-        return next(
-            (item for item in cls if item.valid_value_id == valid_value_id), None
-        )
+        return cls._lookup("valid_value_id", valid_value_id)
 
     @classmethod
     def by_description(cls, description: str) -> Optional["SDDReasonForChangeType"]:
@@ -192,7 +190,7 @@ class SDDReasonForChangeType(Enum):
         Returns:
             Optional[SDDReasonForChangeType]: The matching enum member, or None if not found.
         """
-        return next((item for item in cls if item.description == description), None)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -207,7 +205,4 @@ class SDDReasonForChangeType(Enum):
         Returns:
             Optional[SDDReasonForChangeType]: The matching enum member, or None if not found.
         """
-        return next(
-            (item for item in cls if item.description.lower() == description.lower()),
-            None,
-        )
+        return cls._lookup_case_insensitive("description", description)
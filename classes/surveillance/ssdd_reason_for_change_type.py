@@ -1,8 +1,8 @@
-from enum import Enum
 from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class SSDDReasonForChangeType(Enum):
+class SSDDReasonForChangeType(IndexedEnum):
     """
     Enum representing reasons for change to SSDD (Surveillance Status Due Date).
 
@@ -118,9 +118,7 @@ class SSDDReasonForChangeType(Enum):
         Returns:
             Optional[SSDDReasonForChangeType]: The matching enum member, or None if not found.
         """
-        return next(
-            (item for item in cls if item.valid_value_id == valid_value_id), None
-        )
+        return cls._lookup("valid_value_id", valid_value_id)
 
     @classmethod
     def by_description(cls, description: str) -> Optional["SSDDReasonForChangeType"]:
@@ -133,7 +131,7 @@ class SSDDReasonForChangeType(Enum):
         Returns:
             Optional[SSDDReasonForChangeType]: The matching enum member, or None if not found.
         """
-        return next((item for item in cls if item.description == description), None)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(
@@ -148,7 +146,4 @@ class SSDDReasonForChangeType(Enum):
         Returns:
             Optional[SSDDReasonForChangeType]: The matching enum member, or None if not found.
         """
-        return next(
-            (item for item in cls if item.description.lower() == description.lower()),
-            None,
-        )
+        return cls._lookup_case_insensitive("description", description)
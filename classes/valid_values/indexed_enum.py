@@ -0,0 +1,98 @@
+from enum import Enum, EnumMeta
+from typing import Any, Optional
+
+# The member attributes that are indexed, if the enum has them
+INDEXED_ATTRIBUTES = (
+    "id",
+    "valid_value_id",
+    "code",
+    "allowed_value",
+    "redefined_value",
+    "description",
+    "value",
+)
+
+
+class IndexedEnumMeta(EnumMeta):
+    """
+    Metaclass that builds hash indexes of the enum members once, when the enum class is created.
+
+    Each attribute in INDEXED_ATTRIBUTES that the members have gets an index of attribute value -> member,
+    and string attributes also get an index of lower case value -> member.
+    Where more than one member has the same value, the first member is indexed (matching a linear search),
+    unless the enum is declared with last_wins=True (matching a dict built by looping over the members), e.g.
+        class EventCodeType(IndexedEnum, last_wins=True):
+    """
+
+    @classmethod
+    def __prepare__(metacls, cls, bases, last_wins: bool = False, **kwds):
+        return super().__prepare__(cls, bases, **kwds)
+
+    def __new__(metacls, cls, bases, classdict, last_wins: bool = False, **kwds):
+        enum_class = super().__new__(metacls, cls, bases, classdict, **kwds)
+        indexes: dict[str, dict[Any, Enum]] = {}
+        lowercase_indexes: dict[str, dict[str, Enum]] = {}
+        for member in enum_class:
+            for attribute in INDEXED_ATTRIBUTES:
+                try:
+                    value = getattr(member, attribute)
+                except AttributeError:
+                    continue
+                if callable(value):
+                    continue
+                try:
+                    _add_to_index(indexes, attribute, value, member, last_wins)
+                except TypeError:
+                    continue  # Unhashable values cannot be indexed
+                if isinstance(value, str):
+                    _add_to_index(
+                        lowercase_indexes, attribute, value.lower(), member, last_wins
+                    )
+        enum_class._indexes = indexes
+        enum_class._lowercase_indexes = lowercase_indexes
+        return enum_class
+
+
+def _add_to_index(
+    indexes: dict, attribute: str, value: Any, member: Enum, last_wins: bool
+) -> None:
+    index = indexes.setdefault(attribute, {})
+    if last_wins or value not in index:
+        index[value] = member
+
+
+class IndexedEnum(Enum, metaclass=IndexedEnumMeta):
+    """
+    Base class for the valid value enums, giving O(1) lookups of members by id, code, description etc.
+    """
+
+    @classmethod
+    def _lookup(cls, attribute: str, value: Any) -> Optional[Any]:
+        """
+        Returns the first member whose attribute equals the value.
+
+        Args:
+            attribute (str): The member attribute to search on, e.g. "description"
+            value (Any): The value to search for
+
+        Returns:
+            Optional[IndexedEnum]: The matching member, or None if not found
+        """
+        try:
+            return cls._indexes.get(attribute, {}).get(value)
+        except TypeError:
+            return None
+
+    @classmethod
+    def _lookup_case_insensitive(cls, attribute: str, value: str) -> Optional[Any]:
+        """
+        Returns the first member whose (string) attribute equals the value, ignoring case.
+
+        Args:
+            attribute (str): The member attribute to search on, e.g. "description"
+            value (str): The value to search for
+
+        Returns:
+            Optional[IndexedEnum]: The matching member, or None if not found
+        """
+        return cls._lowercase_indexes.get(attribute, {}).get(value.lower())
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class ValidValueDrift:
+    """
+    Data class describing an enum member that no longer matches the valid_values table.
+
+    Attributes:
+        enum_name (str): The name of the enum, e.g. "ScreeningStatusType"
+        member_name (str): The name of the enum member, e.g. "CALL"
+        valid_value_id (int): The valid value ID hard-coded in the enum member
+        reason (str): Why the member has drifted, e.g. "missing" or "description mismatch"
+        enum_value (Optional[Any]): The value held by the enum member (if the reason is a mismatch)
+        db_value (Optional[Any]): The value held in the database (if the reason is a mismatch)
+    """
+
+    enum_name: str
+    member_name: str
+    valid_value_id: int
+    reason: str
+    enum_value: Optional[Any] = None
+    db_value: Optional[Any] = None
+
+    def __str__(self) -> str:
+        message = f"{self.enum_name}.{self.member_name} ({self.valid_value_id}): {self.reason}"
+        if self.reason != "missing":
+            message += (
+                f" - enum has '{self.enum_value}', database has '{self.db_value}'"
+            )
+        return message
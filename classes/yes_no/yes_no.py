@@ -1,8 +1,8 @@
-from enum import Enum
-from typing import Optional, Dict
+from typing import Optional
+from classes.valid_values.indexed_enum import IndexedEnum
 
 
-class YesNo(Enum):
+class YesNo(IndexedEnum):
     """
     Enum representing Yes/No values with descriptions.
     """
@@ -18,33 +18,16 @@ class YesNo(Enum):
         """Returns the description for the Yes/No value."""
         return self._description
 
-    @classmethod
-    def _build_maps(cls) -> None:
-        """
-        Initializes internal lookup maps for YesNo enum members.
-
-        It ensures these maps are built only once per class, using `hasattr` to prevent
-        redundant reinitialization.
-        """
-        if not hasattr(cls, "_descriptions"):
-            cls._descriptions: Dict[str, YesNo] = {}
-            cls._lowercase_descriptions: Dict[str, YesNo] = {}
-            for item in cls:
-                cls._descriptions[item.description] = item
-                cls._lowercase_descriptions[item.description.lower()] = item
-
     @classmethod
     def by_description(cls, description: str) -> Optional["YesNo"]:
         """
         Returns the YesNo value matching the given description.
         """
-        cls._build_maps()
-        return cls._descriptions.get(description)
+        return cls._lookup("description", description)
 
     @classmethod
     def by_description_case_insensitive(cls, description: str) -> Optional["YesNo"]:
         """
         Returns the YesNo value matching the given description (case-insensitive).
         """
-        cls._build_maps()
-        return cls._lowercase_descriptions.get(description.lower())
+        return cls._lookup_case_insensitive("description", description)
@@ -7,6 +7,7 @@ It is also used to define hooks that can be used to modify the behavior of pytes
 import pytest
 import os
 import typing
+import logging
 from dotenv import load_dotenv
 from pathlib import Path
 from _pytest.python import Function
@@ -16,16 +17,30 @@ from _pytest.config.argparsing import Parser
 from _pytest.fixtures import FixtureRequest
 from playwright.sync_api import Page
 from utils.oracle.oracle_specific_functions.organisation_parameters import (
-    set_org_parameter_value,
+    set_org_parameter_values,
     check_parameter,
 )
-from utils.last_test_run import has_test_run_today
+from utils.oracle.oracle_connection_pool import (
+    open_session_pool,
+    close_session_pool,
+)
+from utils.last_test_run import run_once
+from utils.storage_state_cache import get_storage_state_cache
+from utils.parallel_execution import (
+    SHARED_RESOURCE_FIXTURES,
+    get_worker_partition,
+    group_conflicting_tests,
+    resource_lock,
+)
 from utils.appointments import setup_appointments
 
 # Environment Variable Handling
 
 LOCAL_ENV_PATH = Path(os.getcwd()) / "local.env"
 
+# How long a worker waits for another worker to finish setting up the appointments (setup_appointments with max=True)
+APPOINTMENTS_SETUP_TIMEOUT_SECONDS = 3600
+
 
 @pytest.fixture(autouse=True, scope="session")
 def import_local_env_file() -> None:
@@ -41,6 +56,44 @@ def import_local_env_file() -> None:
         load_dotenv(LOCAL_ENV_PATH, override=False)
 
 
+@pytest.fixture(autouse=True, scope="session")
+def oracle_connection_pool(
+    import_local_env_file: None,
+) -> typing.Generator[None, None, None]:
+    """
+    This fixture opens a session wide Oracle connection pool, which OracleDB (and so every repository) will
+    use instead of opening a new connection per call. The pool is only created on the first DB call, and
+    its sizing can be set in local.env via ORACLE_POOL_MIN, ORACLE_POOL_MAX and ORACLE_POOL_INCREMENT.
+
+    The pool statistics are logged when the session ends.
+    """
+    pool = open_session_pool()
+    yield
+    was_used = pool.is_open()
+    statistics = close_session_pool()
+    if was_used and statistics is not None:
+        logging.info(f"[ORACLE POOL] Session statistics: {statistics.summary()}")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def storage_state_cache(
+    import_local_env_file: None, base_url: typing.Optional[str]
+) -> typing.Generator[None, None, None]:
+    """
+    This fixture configures the session wide storage state cache, which UserTools.user_login uses to reuse
+    the session of a user that has already logged in, instead of logging in through Cognito again.
+    It is enabled in local.env via STORAGE_STATE_CACHE=true, and sessions can be kept between
+    test runs via STORAGE_STATE_TTL_MINUTES.
+
+    The cache statistics are logged when the session ends.
+    """
+    cache = get_storage_state_cache()
+    cache.base_url = base_url or ""
+    yield
+    if cache.hits or cache.misses:
+        logging.info(f"[STORAGE STATE] Session statistics: {cache.summary()}")
+
+
 @pytest.fixture
 def smokescreen_properties() -> dict:
     return PropertiesFile().get_smokescreen_properties()
@@ -48,7 +101,11 @@ def smokescreen_properties() -> dict:
 
 @pytest.fixture
 def general_properties() -> dict:
-    return PropertiesFile().get_general_properties()
+    """
+    Returns the values from tests/bcss_tests.properties. When running in parallel with pytest-xdist,
+    any parallel.<key> values assigned to this worker are used in place of <key>.
+    """
+    return dict(get_worker_partition().properties)
 
 
 # HTML Report Customization
@@ -101,6 +158,36 @@ def pytest_addoption(parser: Parser) -> None:
     )
 
 
+def pytest_collection_modifyitems(config: pytest.Config, items: list) -> None:
+    """
+    When running in parallel with `--dist loadgroup`, groups the tests that use the same shared resource
+    onto the same worker, so they never run at the same time. A test uses a shared resource if it is marked
+    with @pytest.mark.shared_resource("<resource>"), or uses a fixture in SHARED_RESOURCE_FIXTURES.
+
+    Example:
+        pytest -n 4 --dist loadgroup
+    """
+    if getattr(config.option, "dist", "no") != "loadgroup":
+        return
+    tests = []
+    for item in items:
+        resources = [
+            resource
+            for marker in item.iter_markers("shared_resource")
+            for resource in marker.args
+        ]
+        resources += [
+            resource
+            for fixture_name, resource in SHARED_RESOURCE_FIXTURES.items()
+            if fixture_name in getattr(item, "fixturenames", ())
+        ]
+        tests.append((item.nodeid, resources))
+    groups = group_conflicting_tests(tests)
+    for item in items:
+        if item.nodeid in groups:
+            item.add_marker(pytest.mark.xdist_group(name=groups[item.nodeid]))
+
+
 @pytest.fixture
 def subjects_to_run_for(request: FixtureRequest) -> int:
     """
@@ -121,7 +208,8 @@ def setup_org_and_appointments(
 ) -> None:
     """
     Ensures required org parameters and appointments are set up.
-    Only runs once per day per environment, regardless of which test calls it.
+    The appointments are only set up once per day per environment, regardless of which test
+    (or which parallel worker) calls it.
 
     This fixture is designed to be used in tests that require a specific setup of the organisation and appointments.
 
@@ -135,17 +223,22 @@ def setup_org_and_appointments(
         # Your test code here
     """
     org_id = general_properties["eng_screening_centre_id"]
-    param_12_set_correctly = check_parameter(12, org_id, "10")
-    param_28_set_correctly = check_parameter(28, org_id, "07:00")
-    param_29_set_correctly = check_parameter(29, org_id, "20:00")
-    if not param_12_set_correctly:
-        set_org_parameter_value(12, "10", org_id)
-    if not param_28_set_correctly:
-        set_org_parameter_value(28, "07:00", org_id)
-    if not param_29_set_correctly:
-        set_org_parameter_value(29, "20:00", org_id)
+    expected_parameters = {12: "10", 28: "07:00", 29: "20:00"}
+    # Only one worker can check and set the organisation's parameters at a time
+    with resource_lock(f"org_parameters_{org_id}"):
+        parameters_to_set = {
+            param_id: param_value
+            for param_id, param_value in expected_parameters.items()
+            if not check_parameter(param_id, org_id, param_value)
+        }
+        set_org_parameter_values(parameters_to_set, org_id)
 
     base_url = request.config.getoption("--base-url")
-    fixture_name = "setup_org_and_appointments"
-    if not has_test_run_today(fixture_name, base_url):  # type: ignore
-        setup_appointments(page, 0, max=True)
+    # Any other worker reaching this waits for the appointments to be set up, instead of setting them up again
+    with run_once(
+        "setup_org_and_appointments",
+        base_url,  # type: ignore
+        timeout=APPOINTMENTS_SETUP_TIMEOUT_SECONDS,
+    ) as should_run:
+        if should_run:
+            setup_appointments(page, 0, max=True)
@@ -2,6 +2,9 @@ from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
 import pytest
 import logging
+import time
+import weakref
+from typing import Optional
 from utils.oracle.oracle import OracleDB
 from utils.oracle.subject_selection_query_builder import SubjectSelectionQueryBuilder
 from classes.user.user import User
@@ -9,6 +12,17 @@ from classes.subject.subject import Subject
 from utils.table_util import TableUtils
 
 DISPLAY_RS_SELECTOR = "#displayRS"
+GENERATION_TIMEOUT_SECONDS = 120
+INITIAL_REFRESH_INTERVAL_MS = 1000
+MAX_REFRESH_INTERVAL_MS = 8000
+REFRESH_BACKOFF = 1.5
+GENERATION_PENDING_STATUSES = ("Queued", "In Progress")
+
+# The time (time.monotonic) invitations were last requested on each page, kept outside the page object
+# because the tests create a new GenerateInvitationsPage for the click and for the wait
+_generation_requested_at: "weakref.WeakKeyDictionary[Page, float]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 class GenerateInvitationsPage(BasePage):
@@ -25,9 +39,14 @@ class GenerateInvitationsPage(BasePage):
         self.refresh_button = self.page.get_by_role("button", name="Refresh")
         self.planned_invitations_total = self.page.locator("#col8_total")
         self.self_referrals_total = self.page.locator('[id^="col"][id$="_total"]').nth(1)
+        self.generation_seconds: Optional[float] = None
 
     def click_generate_invitations_button(self) -> None:
-        """This function is used to click the Generate Invitations button."""
+        """
+        This function is used to click the Generate Invitations button.
+        The time of the click is noted, so the time the invitations take to generate can be measured from it.
+        """
+        _generation_requested_at[self.page] = time.monotonic()
         self.click(self.generate_invitations_button)
 
     def click_refresh_button(self) -> None:
@@ -46,13 +65,14 @@ class GenerateInvitationsPage(BasePage):
 
     def wait_for_invitation_generation_complete(
         self, number_of_invitations: int
-    ) -> None:
+    ) -> float:
         """
         This function is used to wait for the invitations to be generated.
-        Every 5 seconds it refreshes the table and checks to see if the invitations have been generated.
-        It also checks that enough invitations were generated
+        It waits until the invitations have been generated (see wait_for_invitation_generation), then checks that enough invitations were generated.
         Args:
             number_of_invitations (int): The number of invitations expected to be generated
+        Returns:
+            float: The number of seconds the invitations took to generate
         """
         self.page.wait_for_selector(DISPLAY_RS_SELECTOR, timeout=5000)
 
@@ -62,35 +82,13 @@ class GenerateInvitationsPage(BasePage):
         # Initially, ensure the table contains "Queued"
         expect(self.display_rs).to_contain_text("Queued")
 
-        # Set timeout parameters
-        timeout = 120000  # Total timeout of 120 seconds (in milliseconds)
-        wait_interval = 5000  # Wait 5 seconds between refreshes (in milliseconds)
-        elapsed = 0
-
-        # Loop until the table no longer contains "Queued"
         logging.info("Waiting for successful generation")
-        while (
-            elapsed < timeout
-        ):  # there may be a stored procedure to speed this process up
-            table_text = self.display_rs.text_content()
-            if table_text is None:
-                pytest.fail("Failed to retrieve table text content")
-
-            if "Failed" in table_text:
-                pytest.fail("Invitation has failed to generate")
-            elif "Queued" in table_text or "In Progress" in table_text:
-                # Click the Refresh button
-                self.click_refresh_button()
-                self.page.wait_for_timeout(wait_interval)
-                elapsed += wait_interval
-            else:
-                break
+        generation_seconds = self.wait_for_invitation_generation()
 
         # Final check: ensure that the table now contains "Completed"
         try:
             expect(self.display_rs).to_contain_text("Completed")
             logging.info("Invitations successfully generated")
-            logging.info(f"Invitations took {elapsed / 1000} seconds to generate")
         except Exception as e:
             pytest.fail(f"Invitations not generated successfully: {str(e)}")
 
@@ -102,6 +100,46 @@ class GenerateInvitationsPage(BasePage):
             pytest.fail(
                 f"Expected {number_of_invitations} invitations generated but got {value}"
             )
+        return generation_seconds
+
+    def wait_for_invitation_generation(self) -> float:
+        """
+        Waits until the table no longer shows the invitations as "Queued" or "In Progress", for up to 120 seconds.
+        The table is refreshed after 1 second, backing off to every 8 seconds, so that a quick run is not held up
+        by a fixed 5 second wait and a slow one does not refresh the page more than it needs to.
+
+        The time taken, from the click on Generate Invitations if it was made on this page, is logged and kept in generation_seconds.
+
+        Returns:
+            float: The number of seconds the invitations took to generate
+        """
+        start = time.monotonic()
+        requested_at = _generation_requested_at.pop(self.page, start)
+        interval = INITIAL_REFRESH_INTERVAL_MS
+
+        while True:
+            table_text = self.display_rs.text_content()
+            if table_text is None:
+                pytest.fail("Failed to retrieve table text content")
+
+            if "Failed" in table_text:
+                pytest.fail("Invitation has failed to generate")
+            if not any(status in table_text for status in GENERATION_PENDING_STATUSES):
+                break
+            if time.monotonic() - start >= GENERATION_TIMEOUT_SECONDS:
+                pytest.fail(
+                    f"Invitations were still generating after {GENERATION_TIMEOUT_SECONDS} seconds"
+                )
+
+            self.click_refresh_button()
+            self.page.wait_for_timeout(interval)
+            interval = min(interval * REFRESH_BACKOFF, MAX_REFRESH_INTERVAL_MS)
+
+        self.generation_seconds = time.monotonic() - requested_at
+        logging.info(
+            f"[METRIC] Invitations took {self.generation_seconds:.1f} seconds to generate"
+        )
+        return self.generation_seconds
 
     def wait_for_self_referral_invitation_generation_complete(
         self, expected_minimum: int = 1
@@ -115,32 +153,15 @@ class GenerateInvitationsPage(BasePage):
         Returns:
             bool: True if threshold is met, False otherwise.
         """
-        # Reuse the existing table completion logic — consider extracting this into a shared method later
-        timeout = 120000
-        wait_interval = 5000
-        elapsed = 0
         logging.info(
             "[WAIT] Waiting for self-referral invitation generation to complete"
         )
-
-        while elapsed < timeout:
-            table_text = self.display_rs.text_content()
-            if table_text is None:
-                pytest.fail("Failed to retrieve table text content")
-
-            if "Failed" in table_text:
-                pytest.fail("Invitation has failed to generate")
-            elif "Queued" in table_text or "In Progress" in table_text:
-                self.click_refresh_button()
-                self.page.wait_for_timeout(wait_interval)
-                elapsed += wait_interval
-            else:
-                break
+        self.wait_for_invitation_generation()
 
         try:
             expect(self.display_rs).to_contain_text("Completed")
             logging.info(
-                f"[STATUS] Generation finished after {elapsed / 1000:.1f} seconds"
+                f"[STATUS] Generation finished after {self.generation_seconds:.1f} seconds"
             )
         except Exception as e:
             pytest.fail(f"[ERROR] Invitations not generated successfully: {str(e)}")
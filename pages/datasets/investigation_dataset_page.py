@@ -7,8 +7,121 @@ from utils.oracle.oracle_specific_functions.subject_datasets import (
     get_investigation_dataset_polyp_algorithm_size,
 )
 from typing import Optional, Any, Union, List
+from dataclasses import dataclass, field
 import logging
 
+# How long to wait for the saved dataset to be shown after clicking Save Dataset
+SAVE_DATASET_TIMEOUT_MS = 10000
+
+# Reads every dataset section in one call: its heading, whether it is visible, its subsections and their headings,
+# and the text of each label, whether it is visible, and whether its field (the nearest ancestor with a class
+# containing "row" or "field") is visible. Visibility is worked out in the same way as Playwright's is_visible().
+DATASET_SECTIONS_SCRIPT = """
+(sections) => {
+    const isVisible = element => {
+        const box = element.getBoundingClientRect();
+        return box.width > 0 && box.height > 0 && getComputedStyle(element).visibility !== "hidden";
+    };
+    const fieldContainer = label => {
+        for (let element = label.parentElement; element; element = element.parentElement) {
+            const className = element.getAttribute("class") || "";
+            if (className.includes("row") || className.includes("field")) return element;
+        }
+        return null;
+    };
+    const readLabels = root => Array.from(root.querySelectorAll(".label"), label => {
+        const container = fieldContainer(label);
+        return {
+            text: label.innerText,
+            visible: isVisible(label),
+            container_visible: container !== null && isVisible(container),
+        };
+    });
+    const readSubsections = (section, selector) => Array.from(section.querySelectorAll(selector), subsection => ({
+        headings: Array.from(subsection.querySelectorAll("h5"))
+            .filter(isVisible)
+            .map(heading => heading.innerText),
+        labels: readLabels(subsection),
+    }));
+    return sections.map(section => {
+        const heading = section.querySelector("h4");
+        return {
+            heading: heading ? heading.innerText : null,
+            visible: isVisible(section),
+            labels: readLabels(section),
+            subsections: readSubsections(section, ".DatasetSubSection"),
+            subsection_groups: readSubsections(section, ".DatasetSubSectionGroup"),
+        };
+    });
+}
+"""
+
+
+@dataclass
+class DatasetLabel:
+    """
+    A field label in a dataset section, as read by InvestigationDatasetsPage.get_dataset_sections.
+
+    Attributes:
+        text (str): The normalised label text
+        visible (bool): Whether the label is visible
+        container_visible (bool): Whether the field the label belongs to is visible
+    """
+
+    text: str
+    visible: bool
+    container_visible: bool
+
+
+@dataclass
+class DatasetSubsection:
+    """
+    A subsection (or subsection group) of a dataset section.
+
+    Attributes:
+        headings (List[str]): The normalised text of each visible <h5> heading in the subsection
+        labels (List[DatasetLabel]): The field labels in the subsection
+        locator (Locator): The locator of the subsection
+    """
+
+    headings: List[str]
+    labels: List[DatasetLabel]
+    locator: Locator
+
+
+@dataclass
+class DatasetSection:
+    """
+    A section of the investigation dataset, as read by InvestigationDatasetsPage.get_dataset_sections.
+
+    Attributes:
+        name (Optional[str]): The normalised text of the section's first <h4> heading, or None if it has none
+        visible (bool): Whether the section is visible
+        labels (List[DatasetLabel]): The field labels in the section
+        locator (Locator): The locator of the section
+        subsections (List[DatasetSubsection]): The .DatasetSubSection elements, followed by the .DatasetSubSectionGroup elements
+    """
+
+    name: Optional[str]
+    visible: bool
+    labels: List[DatasetLabel]
+    locator: Locator
+    subsections: List[DatasetSubsection] = field(default_factory=list)
+
+    def get_subsection(self, subsection_name: str) -> Optional[DatasetSubsection]:
+        """
+        Finds a subsection by one of its visible headings (case-insensitive).
+        Args:
+            subsection_name (str): The name of the subsection
+        Returns:
+            Optional[DatasetSubsection]: The subsection, or None if not found
+        """
+        subsection_name = normalize_label(subsection_name)
+        for subsection in self.subsections:
+            if subsection_name in subsection.headings:
+                return subsection
+        return None
+
 
 class InvestigationDatasetsPage(BasePage):
     """Investigation Datasets Page locators, and methods for interacting with the page"""
@@ -41,6 +154,11 @@ class InvestigationDatasetsPage(BasePage):
         self.show_other_findings_information = self.page.locator("#anchorOtherFindings")
         self.show_drug_information_detail = self.page.locator("#anchorDrug")
         self.show_suspected_findings = self.page.locator("#anchorRadiologyFindings")
+        self.suspected_findings_fields = (
+            self.page.locator(".DatasetSection")
+            .filter(has=self.page.locator("h4", has_text="Suspected Findings"))
+            .locator(".label")
+        )
         self.drug_type_option1 = self.page.locator("#UI_BOWEL_PREP_DRUG1")
         self.drug_type_dose1 = self.page.locator("#UI_BOWEL_PREP_DRUG_DOSE1")
         self.show_endoscopy_information_details = self.page.locator(
@@ -62,6 +180,9 @@ class InvestigationDatasetsPage(BasePage):
             "#anchorRadiologyFailure"
         )
         self.add_polyp_button = self.page.get_by_role("button", name="Add Polyp")
+        self.visible_polyp_sections = self.page.locator(
+            'div[id^="divPolypNumber"][id$="Section"]:visible'
+        )
         self.polyp1_add_intervention_button = self.page.get_by_role(
             "link", name=self.add_intervention_string
         )
@@ -302,11 +423,11 @@ class InvestigationDatasetsPage(BasePage):
     def click_show_suspected_findings_details(self) -> None:
         """
         This method is designed to click on the show suspected findings details link.
-        It clicks on the show suspected findings details link.
+        It clicks on the show suspected findings details link, and waits for the suspected findings fields to be shown.
         """
         logging.info("[DEBUG] Clicking on Show Suspected Findings Details")
-        self.page.wait_for_timeout(1000)
         self.show_suspected_findings.click()
+        expect(self.suspected_findings_fields.first).to_be_visible()
 
     def select_drug_type_option1(self, option: str) -> None:
         """
@@ -392,10 +513,12 @@ class InvestigationDatasetsPage(BasePage):
     def click_add_polyp_button(self) -> None:
         """
         This method is designed to click on the add polyp button.
-        It clicks on the add polyp button.
+        It clicks on the add polyp button, and waits for the new polyp section to be shown.
         """
+        polyp_count = self.visible_polyp_sections.count()
         self.click(self.add_polyp_button)
-        self.page.wait_for_timeout(1000)
+        # Wait for the new polyp section to appear, rather than for a fixed time
+        expect(self.visible_polyp_sections).to_have_count(polyp_count + 1)
 
     def click_polyp1_add_intervention_button(self) -> None:
         """
@@ -428,10 +551,19 @@ class InvestigationDatasetsPage(BasePage):
     def click_save_dataset_button(self) -> None:
         """
         This method is designed to click on the save dataset button.
-        It clicks on the save dataset button.
+        It clicks on the save dataset button, and waits for the saved dataset to be shown (with the Edit Dataset button).
+        If the dataset is not saved (e.g. a field failed validation), it carries on after SAVE_DATASET_TIMEOUT_MS.
         """
         self.safe_accept_dialog(self.save_dataset_button)
-        self.page.wait_for_timeout(3000)  # 3 second timeout to allow page to update
+        self.page.wait_for_load_state("load")
+        try:
+            expect(self.edit_dataset_button).to_be_visible(
+                timeout=SAVE_DATASET_TIMEOUT_MS
+            )
+        except AssertionError:
+            logging.warning(
+                "The Edit Dataset button was not shown after saving the dataset"
+            )
 
     def click_save_dataset_button_assert_dialog(self, expected_text: str) -> None:
         """
@@ -642,21 +774,87 @@ class InvestigationDatasetsPage(BasePage):
         """
         logging.info(f"Start: Searching for dataset section '{dataset_section_name}'")
 
-        count = self.sections.count()
-
-        for i in range(count):
-            section = self.sections.nth(i)
-            heading = section.locator("h4")
-            if (
-                heading.inner_text().strip().lower()
-                == dataset_section_name.strip().lower()
-            ):
-                logging.info(f"Dataset section '{dataset_section_name}' found.")
-                return True
+        section_name = normalize_label(dataset_section_name)
+        if any(section.name == section_name for section in self.get_dataset_sections()):
+            logging.info(f"Dataset section '{dataset_section_name}' found.")
+            return True
 
         logging.info(f"Dataset section '{dataset_section_name}' not found.")
         return False
 
+    def get_dataset_sections(self) -> List[DatasetSection]:
+        """
+        Reads every dataset section on the page in a single call: the section headings, subsections and field labels,
+        and whether each of them is visible. Checks against the sections can then be made without going back to the page.
+        Returns:
+            List[DatasetSection]: The dataset sections, in page order
+        """
+        sections = []
+        for i, data in enumerate(self.sections.evaluate_all(DATASET_SECTIONS_SCRIPT)):
+            section = self.sections.nth(i)
+            subsections = [
+                DatasetSubsection(
+                    headings=[normalize_label(text) for text in subsection["headings"]],
+                    labels=self._dataset_labels(subsection["labels"]),
+                    locator=section.locator(selector).nth(j),
+                )
+                for key, selector in (
+                    ("subsections", ".DatasetSubSection"),
+                    ("subsection_groups", ".DatasetSubSectionGroup"),
+                )
+                for j, subsection in enumerate(data[key])
+            ]
+            sections.append(
+                DatasetSection(
+                    name=(
+                        normalize_label(data["heading"])
+                        if data["heading"] is not None
+                        else None
+                    ),
+                    visible=data["visible"],
+                    labels=self._dataset_labels(data["labels"]),
+                    locator=section,
+                    subsections=subsections,
+                )
+            )
+        return sections
+
+    def _dataset_labels(self, labels: List[dict]) -> List[DatasetLabel]:
+        """
+        Builds the labels read by DATASET_SECTIONS_SCRIPT, leaving out any without text.
+        """
+        dataset_labels = [
+            DatasetLabel(
+                text=normalize_label(label["text"]),
+                visible=label["visible"],
+                container_visible=label["container_visible"],
+            )
+            for label in labels
+        ]
+        return [label for label in dataset_labels if label.text]
+
+    def find_dataset_section(
+        self,
+        dataset_section_name: str,
+        sections: Optional[List[DatasetSection]] = None,
+    ) -> Optional[DatasetSection]:
+        """
+        Finds a visible dataset section whose first <h4> header text matches the provided section name (case-insensitive).
+        Args:
+            dataset_section_name (str): The name of the dataset section to find.
+            sections (Optional[List[DatasetSection]]): The sections already read by get_dataset_sections.
+                                                       The page is read if these are not given.
+        Returns:
+            Optional[DatasetSection]: The matching section if visible, or None if not found or not visible.
+        """
+        if sections is None:
+            sections = self.get_dataset_sections()
+        section_name = normalize_label(dataset_section_name)
+        for section in sections:
+            if section.name == section_name and section.visible:
+                return section
+        return None
+
     def get_dataset_section(self, dataset_section_name: str) -> Optional[Locator]:
         """
         Retrieves a dataset section by matching its header text.
@@ -670,24 +868,12 @@ class InvestigationDatasetsPage(BasePage):
         """
         logging.info(f"START: Looking for section '{dataset_section_name}'")
 
-        list_of_sections = self.sections.all()
-        section_found = None
-
-        for section in list_of_sections:
-            header = section.locator("h4")
-            if header.count() > 0:
-                header_text = header.first.inner_text().strip().lower()
-                if (
-                    header_text == dataset_section_name.strip().lower()
-                    and section.is_visible()
-                ):
-                    section_found = section
-                    break
+        section_found = self.find_dataset_section(dataset_section_name)
 
         logging.info(
             f"Dataset section '{dataset_section_name}' found and visible: {section_found is not None}"
         )
-        return section_found
+        return section_found.locator if section_found is not None else None
 
     def is_dataset_section_on_page(
         self, dataset_section: str | List[str], should_be_present: bool = True
@@ -705,8 +891,11 @@ class InvestigationDatasetsPage(BasePage):
         Raises:
             AssertionError: If the actual presence does not match should_be_present.
         """
+        sections = self.get_dataset_sections()
         if isinstance(dataset_section, str):
-            section_found = self.get_dataset_section(dataset_section) is not None
+            section_found = (
+                self.find_dataset_section(dataset_section, sections) is not None
+            )
             if should_be_present:
                 assert (
                     section_found
@@ -719,7 +908,9 @@ class InvestigationDatasetsPage(BasePage):
                 logging.info(f"Section '{dataset_section}' is absent as expected.")
         elif isinstance(dataset_section, list):
             for section_name in dataset_section:
-                section_found = self.get_dataset_section(section_name) is not None
+                section_found = (
+                    self.find_dataset_section(section_name, sections) is not None
+                )
                 if should_be_present:
                     assert (
                         section_found
@@ -752,50 +943,38 @@ class InvestigationDatasetsPage(BasePage):
             f"START: Looking for subsection '{dataset_subsection_name}' in section '{dataset_section_name}'"
         )
 
-        dataset_section = self.get_dataset_section(dataset_section_name)
-        if dataset_section is None:
-            raise ValueError(f"Dataset section '{dataset_section_name}' was not found.")
-
-        def find_visible_subsection(
-            sections: List[Locator], subsection_name: str
-        ) -> Optional[Locator]:
-            """
-            Helper function to find a visible subsection by its header text.
-            Args:
-                sections (List[Locator]): List of section Locators to search through.
-                subsection_name (str): The name of the subsection to find.
-            Returns:
-                Optional[Locator]: The Locator of the found subsection, or None if not found.
-            """
-            for section in sections:
-                header = section.locator("h5")
-                for i in range(header.count()):
-                    hdr = header.nth(i)
-                    if (
-                        hdr.is_visible()
-                        and hdr.inner_text().strip().lower()
-                        == subsection_name.strip().lower()
-                    ):
-                        return section
-            return None
-
-        # Search through .DatasetSubSection
-        subsections = dataset_section.locator(".DatasetSubSection").all()
-        sub_section_found = find_visible_subsection(
-            subsections, dataset_subsection_name
+        sub_section_found = self.find_dataset_subsection(
+            dataset_section_name, dataset_subsection_name
         )
 
-        # If not found, search through .DatasetSubSectionGroup
-        if sub_section_found is None:
-            group_sections = dataset_section.locator(".DatasetSubSectionGroup").all()
-            sub_section_found = find_visible_subsection(
-                group_sections, dataset_subsection_name
-            )
-
         logging.info(
             f"Dataset subsection '{dataset_section_name}', '{dataset_subsection_name}' found: {sub_section_found is not None}"
         )
-        return sub_section_found
+        return sub_section_found.locator if sub_section_found is not None else None
+
+    def find_dataset_subsection(
+        self,
+        dataset_section_name: str,
+        dataset_subsection_name: str,
+        sections: Optional[List[DatasetSection]] = None,
+    ) -> Optional[DatasetSubsection]:
+        """
+        Finds a subsection within a dataset section by one of its visible headers.
+        The `.DatasetSubSection` elements are searched first, followed by the `.DatasetSubSectionGroup` elements.
+        Args:
+            dataset_section_name (str): The name of the dataset section that contains the subsection.
+            dataset_subsection_name (str): The name of the subsection to find.
+            sections (Optional[List[DatasetSection]]): The sections already read by get_dataset_sections.
+                                                       The page is read if these are not given.
+        Returns:
+            Optional[DatasetSubsection]: The subsection, or None if not found.
+        Raises:
+            ValueError: If the specified dataset section cannot be found.
+        """
+        dataset_section = self.find_dataset_section(dataset_section_name, sections)
+        if dataset_section is None:
+            raise ValueError(f"Dataset section '{dataset_section_name}' was not found.")
+        return dataset_section.get_subsection(dataset_subsection_name)
 
     def are_fields_on_page(
         self,
@@ -821,51 +1000,40 @@ class InvestigationDatasetsPage(BasePage):
             f"START: Checking fields in section '{section_name}' and subsection '{subsection_name}'"
         )
 
+        # The section is read in one call, and every field is then checked against it
         section = (
-            self.get_dataset_section(section_name)
+            self.find_dataset_section(section_name)
             if subsection_name is None
-            else self.get_dataset_subsection(section_name, subsection_name)
+            else self.find_dataset_subsection(section_name, subsection_name)
         )
 
         if section is None:
             raise ValueError(f"Dataset section '{section_name}' was not found.")
 
-        label_elements = section.locator(".label").all()
-        label_texts = [label.inner_text() for label in label_elements]
-        normalized_labels = [
-            normalize_label(label) for label in label_texts if normalize_label(label)
-        ]
-
-        def label_matches(idx: int) -> bool:
+        def label_matches(label: DatasetLabel) -> bool:
             """
-            Checks if the label at the given index matches the visibility condition.
+            Checks if the label matches the visibility condition.
             Args:
-                idx (int): The index of the label to check.
+                label (DatasetLabel): The label to check.
             Returns:
                 bool: True if the label matches the visibility condition, False otherwise.
             """
             if visible is True:
-                return label_elements[idx].is_visible()
+                return label.visible
             if visible is False:
-                field_container = label_elements[idx].locator(
-                    "xpath=ancestor::*[contains(@class, 'row') or contains(@class, 'field')][1]"
-                )
-                is_container_visible = field_container.is_visible()
                 logging.info(
-                    f"Label visible: {label_elements[idx].is_visible()}, "
-                    f"Container visible: {is_container_visible} → Effective: {is_container_visible}"
+                    f"Label visible: {label.visible}, "
+                    f"Container visible: {label.container_visible} → Effective: {label.container_visible}"
                 )
-                return not is_container_visible
+                return not label.container_visible
             return True  # visibility doesn't matter
 
         for field_name in field_names:
             field_normalized = normalize_label(field_name)
-            match_found = False
-
-            for i, label in enumerate(normalized_labels):
-                if field_normalized in label and label_matches(i):
-                    match_found = True
-                    break
+            match_found = any(
+                field_normalized in label.text and label_matches(label)
+                for label in section.labels
+            )
 
             logging.info(
                 f"Checking for field '{field_name}' (visible={visible}) → Match found: {match_found}"
@@ -875,7 +1043,9 @@ class InvestigationDatasetsPage(BasePage):
                 logging.info(
                     f"Field '{field_name}' not found or visibility check failed."
                 )
-                logging.info(f"Available labels: {normalized_labels}")
+                logging.info(
+                    f"Available labels: {[label.text for label in section.labels]}"
+                )
                 return False
 
         logging.info("All fields matched.")
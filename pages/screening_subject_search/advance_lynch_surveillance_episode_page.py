@@ -43,7 +43,6 @@ class AdvanceLynchSurveillanceEpisodePage(AdvanceEpisodePage):
     def click_review_suitability_for_lynch_surveillance_button(self) -> None:
         """Click on the 'Review suitability for Lynch Surveillance' button."""
         self.safe_accept_dialog(self.review_suitability_for_lynch_surveillance_button)
-        self.page.wait_for_timeout(500)  # Timeout to allow subject to update on the DB.
 
     def click_refer_for_clinician_review_button(self) -> None:
         """Click on the 'Refer for Clinician Review' button."""
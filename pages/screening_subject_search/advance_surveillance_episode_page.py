@@ -77,7 +77,6 @@ class AdvanceSurveillanceEpisodePage(AdvanceEpisodePage):
     def click_book_surveillance_appointment_button(self) -> None:
         """Click on the 'Book Surveillance Appointment' button."""
         self.safe_accept_dialog(self.book_surveillance_appointment_button)
-        self.page.wait_for_timeout(500)  # Timeout to allow subject to update on the DB.
 
     def click_discharge_from_surveillance_patient_choice_button(
         self,
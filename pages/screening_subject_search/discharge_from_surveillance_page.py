@@ -81,6 +81,3 @@ class DischargeFromSurveillancePage(BasePage):
         self.select_screening_pracitioner_from_index(1)
         self.fill_notes_field("Notes for subject being discharged")
         self.click_save_button()
-        self.page.wait_for_timeout(
-            1000
-        )  # Timeout to allow subject to be updated on the DB.
@@ -159,7 +159,6 @@ class HandoverIntoSymptomaticCarePage(BasePage):
         self.select_practitioner_from_index(1)
         self.fill_notes("Handover notes for Cancer scenario")
         self.click_save_button()
-        self.page.wait_for_timeout(500)  # Timeout to allow subject to update in the DB.
 
     def perform_referral_to_specific_clinician_scenario(self) -> None:
         """
@@ -176,4 +175,3 @@ class HandoverIntoSymptomaticCarePage(BasePage):
         self.select_non_screening_practitioner_link(-1)
         self.fill_notes("Handover notes - referral to Specific Clinician")
         self.click_save_button()
-        self.page.wait_for_timeout(500)  # Timeout to allow subject to update in the DB.
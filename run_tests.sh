@@ -1,3 +1,4 @@
 #!/bin/sh
 
-pytest
+# Set PYTEST_WORKERS to run the tests in parallel, e.g. PYTEST_WORKERS=4 ./run_tests.sh
+pytest ${PYTEST_WORKERS:+-n "$PYTEST_WORKERS" --dist loadgroup} "$@"
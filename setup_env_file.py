@@ -19,6 +19,34 @@ REQUIRED_KEYS = [
     "ORACLE_DB",
     "ORACLE_PASS",
     "",
+    "# Database Connection Pool Configuration (optional, defaults are used if left blank)",
+    "ORACLE_POOL_MIN",
+    "ORACLE_POOL_MAX",
+    "ORACLE_POOL_INCREMENT",
+    "ORACLE_POOL_WAIT_TIMEOUT_SECONDS",
+    "",
+    "# Batch Processing Configuration (optional, set BATCH_STATUS_VERIFY_IN_DB to true to check batch statuses in the DB)",
+    "BATCH_STATUS_VERIFY_IN_DB",
+    "BATCH_STATUS_UI_SAMPLE_SIZE",
+    "",
+    "# Random Word Configuration (optional, used when creating subjects)",
+    "ANON_WORD_SEED",
+    "ANON_WORD_SNAPSHOT",
+    "",
+    "# Login Session Configuration (optional, set STORAGE_STATE_CACHE to true to reuse logged in sessions)",
+    "STORAGE_STATE_CACHE",
+    "STORAGE_STATE_TTL_MINUTES",
+    "",
+    "# Reference Data Configuration (optional, snapshot of valid_values, message_types and org)",
+    "REFERENCE_DATA_SNAPSHOT",
+    "REFERENCE_DATA_MAX_AGE_HOURS",
+    "",
+    "# Parallel Execution Configuration (optional, how long a worker waits for a shared resource lock)",
+    "RESOURCE_LOCK_TIMEOUT_SECONDS",
+    "",
+    "# Page Navigation Configuration (optional, set NAVIGATION_CLICK_THROUGH to true to always click through the menus)",
+    "NAVIGATION_CLICK_THROUGH",
+    "",
     "# Jira / Confluence Configuration",
     "JIRA_URL",
     "JIRA_PROJECT_KEY",
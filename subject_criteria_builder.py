@@ -399,7 +399,7 @@ def show_sql_and_binds(final_criteria: dict, user: User, subject: Subject) -> No
         formatted_query = sqlparse.format(query, reindent=True, keyword_case="upper")
         st.subheader("Generated SQL Query")
         st.code(formatted_query, language="sql")
-        if any(k.lower() == "nhs number" for k in final_criteria.keys()):
+        if bind_vars:
             st.subheader("Bind Variables")
             st.json(bind_vars)
     except Exception as e:
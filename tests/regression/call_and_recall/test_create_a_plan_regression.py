@@ -22,6 +22,7 @@ def before_each(page: Page):
 
 @pytest.mark.regression
 @pytest.mark.call_and_recall
+@pytest.mark.shared_resource("invitation_plans")
 def test_create_a_plan_set_daily_rate(page: Page, general_properties: dict) -> None:
     """
     Verifies that a user is able to click on the Set all button and enter a daily rate.
@@ -54,6 +55,7 @@ def test_create_a_plan_set_daily_rate(page: Page, general_properties: dict) -> N
 
 @pytest.mark.regression
 @pytest.mark.call_and_recall
+@pytest.mark.shared_resource("invitation_plans")
 def test_create_a_plan_weekly_rate(page: Page, general_properties: dict) -> None:
     """
     Verifies that a user can set a weekly invitation rate in Create a Plan.
@@ -86,6 +88,7 @@ def test_create_a_plan_weekly_rate(page: Page, general_properties: dict) -> None
 
 @pytest.mark.regression
 @pytest.mark.call_and_recall
+@pytest.mark.shared_resource("invitation_plans")
 def test_update_invitation_rate_weekly(page: Page, general_properties: dict) -> None:
     """
     Verifies that a Hub Manager State Registered is able to update a weekly Invitation rate
@@ -28,6 +28,7 @@ def before_each(page: Page):
 
 @pytest.mark.regression
 @pytest.mark.call_and_recall
+@pytest.mark.shared_resource("invitation_generation")
 def test_run_fobt_invitations_and_process_s1_batch(
     page: Page, general_properties: dict
 ):
@@ -59,6 +59,7 @@ def before_each(page: Page) -> None:
 
 @pytest.mark.regression
 @pytest.mark.letters_tests
+@pytest.mark.shared_resource("invitation_generation")
 def test_self_refer_subject_in_my_hub_for_fit(page: Page) -> None:
     """
     Scenario: Self-refer a subject in my hub for FIT
@@ -176,6 +177,7 @@ def test_self_refer_subject_in_my_hub_for_fit(page: Page) -> None:
 
 @pytest.mark.regression
 @pytest.mark.letters_tests
+@pytest.mark.shared_resource("invitation_generation")
 def test_invite_self_referral_creates_s83f_batch(page: Page) -> None:
     """
     Scenario: Invite a self-refer subject for FIT creates or updates an S83f letter batch
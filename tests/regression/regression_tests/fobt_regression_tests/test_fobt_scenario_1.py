@@ -3,7 +3,7 @@ from playwright.sync_api import Page
 from utils.user_tools import UserTools
 from utils.oracle.oracle import OracleDB
 from utils.oracle.subject_creation_util import CreateSubjectSteps
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 from utils.call_and_recall_utils import CallAndRecallUtils
 import logging
 from utils.batch_processing import batch_processing
@@ -71,8 +71,6 @@ def test_fobt_scenario_1(page: Page) -> None:
     # When I run the FOBT failsafe trawl for my subject
     CallAndRecallUtils().run_failsafe(nhs_no)
 
-    page.wait_for_timeout(2000)  # Wait for 2 seconds to allow DB to update
-
     # Then my subject has been updated as follows:
     criteria = {
         "subject has episodes": "No",
@@ -83,7 +81,7 @@ def test_fobt_scenario_1(page: Page) -> None:
         "screening status date of change": "Today",
         "screening status reason": "Failsafe Trawl",
     }
-    subject_assertion(nhs_no, criteria)
+    wait_until_subject_matches(nhs_no, criteria)
 
     # When I invite my subject for FOBT screening
     CallAndRecallUtils().invite_subject_for_fobt_screening(nhs_no, user_role)
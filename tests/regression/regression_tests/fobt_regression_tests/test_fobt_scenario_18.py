@@ -41,7 +41,7 @@ from utils.calendar_picker import CalendarPicker
 from utils.fit_kit import FitKitGeneration, FitKitLogged
 from utils.investigation_dataset import InvestigationDatasetCompletion
 from utils.oracle.subject_selection_query_builder import SubjectSelectionQueryBuilder
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 from utils.user_tools import UserTools
 from utils import screening_subject_page_searcher
 from utils.oracle.oracle import OracleDB
@@ -373,7 +373,7 @@ def test_fobt_scenario_18(page: Page) -> None:
     )
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {
             "calculated fobt due date": "2 years from episode end",
@@ -470,10 +470,9 @@ def test_fobt_scenario_18(page: Page) -> None:
     ReopenScreeningEpisodeAfterManualCeasePage(
         page
     ).click_uncease_and_reopen_episode_button()
-    page.wait_for_timeout(500)  # Timeout to allow subject to update in the DB.
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {
             "calculated fobt due date": "As at episode start",
@@ -827,10 +826,9 @@ def test_fobt_scenario_18(page: Page) -> None:
     ReferToMDTPage(page).enter_date_in_mdt_discussion_date_field(datetime.today())
     ReferToMDTPage(page).select_mdt_location_lookup(1)
     ReferToMDTPage(page).click_record_mdt_appointment_button()
-    page.wait_for_timeout(500)  # Timeout to allow subject to update in the DB.
 
     #  Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {"latest event status": "A348 MDT Referral Required"},
     )
@@ -883,7 +881,7 @@ def test_fobt_scenario_18(page: Page) -> None:
     HandoverIntoSymptomaticCarePage(page).fill_with_cancer_details()
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no, {"latest event status": "A346 Handover into Symptomatic Care"}
     )
 
@@ -1114,7 +1112,7 @@ def test_fobt_scenario_18(page: Page) -> None:
     HandoverIntoSymptomaticCarePage(page).fill_with_cancer_details()
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no, {"latest event status": "A346 Handover into Symptomatic Care"}
     )
 
@@ -5,7 +5,7 @@ from playwright.sync_api import Page
 from utils.oracle.subject_creation_util import CreateSubjectSteps
 from utils.sspi_change_steps import SSPIChangeSteps
 from utils.user_tools import UserTools
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 from utils.call_and_recall_utils import CallAndRecallUtils
 from utils import screening_subject_page_searcher
 from utils.batch_processing import batch_processing
@@ -220,7 +220,7 @@ def test_fobt_scenario_4(page: Page) -> None:
     )
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {
             "calculated FOBT due date": "2 years from episode end",
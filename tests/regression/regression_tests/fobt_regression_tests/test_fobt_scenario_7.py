@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 from playwright.sync_api import Page
 from utils.oracle.subject_creation_util import CreateSubjectSteps
 from utils.user_tools import UserTools
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 from utils.call_and_recall_utils import CallAndRecallUtils
 from utils import screening_subject_page_searcher
 from utils.batch_processing import batch_processing
@@ -118,8 +118,6 @@ def test_fobt_scenario_7(page: Page) -> None:
     # When I run the FOBT failsafe trawl for my subject
     CallAndRecallUtils().run_failsafe(nhs_no)
 
-    page.wait_for_timeout(2000)  # Wait for 2 seconds to allow DB to update
-
     # Then my subject has been updated as follows:
     criteria = {
         "subject has episodes": "No",
@@ -130,7 +128,7 @@ def test_fobt_scenario_7(page: Page) -> None:
         "screening status date of change": "Today",
         "screening status reason": "Failsafe Trawl",
     }
-    subject_assertion(nhs_no, criteria)
+    wait_until_subject_matches(nhs_no, criteria)
 
     # Navigate to subject summary page in UI
     screening_subject_page_searcher.navigate_to_subject_summary_page(page, nhs_no)
@@ -58,7 +58,7 @@ from utils.investigation_dataset import InvestigationDatasetCompletion
 from utils.lynch_utils import LynchUtils
 from utils.oracle.oracle import OracleDB
 from utils.sspi_change_steps import SSPIChangeSteps
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 from utils.user_tools import UserTools
 
 
@@ -546,10 +546,9 @@ def test_lynch_scenario_20(page: Page) -> None:
     ReferToMDTPage(page).enter_date_in_mdt_discussion_date_field(datetime.today())
     ReferToMDTPage(page).select_mdt_location_lookup(1)
     ReferToMDTPage(page).click_record_mdt_appointment_button()
-    page.wait_for_timeout(500)  # Timeout to allow subject to update in the DB.
 
     #  Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {"latest event status": "A348 MDT Referral Required"},
     )
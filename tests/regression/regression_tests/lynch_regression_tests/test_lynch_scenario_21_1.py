@@ -67,7 +67,7 @@ from utils.calendar_picker import CalendarPicker
 from utils.investigation_dataset import InvestigationDatasetCompletion
 from utils.lynch_utils import LynchUtils
 from utils.oracle.oracle import OracleDB
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 from utils.user_tools import UserTools
 
 
@@ -571,7 +571,7 @@ def test_lynch_scenario_21_1(page: Page) -> None:
     HandoverIntoSymptomaticCarePage(page).fill_with_cancer_details()
 
     # And my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no, {"latest event status": "A346 Handover into Symptomatic Care"}
     )
 
@@ -70,7 +70,7 @@ from utils.investigation_dataset import InvestigationDatasetCompletion
 from utils.lynch_utils import LynchUtils
 from utils.oracle.oracle import OracleDB
 from utils.sspi_change_steps import SSPIChangeSteps
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 from utils.user_tools import UserTools
 
 
@@ -662,7 +662,7 @@ def test_lynch_scenario_22(page: Page) -> None:
     HandoverIntoSymptomaticCarePage(page).fill_with_cancer_details()
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no, {"latest event status": "A346 Handover into Symptomatic Care"}
     )
 
@@ -15,7 +15,7 @@ from pages.screening_subject_search.subject_screening_summary_page import (
 from utils import screening_subject_page_searcher
 from utils.batch_processing import batch_processing
 from utils.lynch_utils import LynchUtils
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 from utils.user_tools import UserTools
 
 
@@ -141,7 +141,7 @@ def test_lynch_scenario_9(page: Page) -> None:
     ).click_review_suitability_for_lynch_surveillance_button()
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no, {"latest event status": "G6 Review suitability for Lynch Surveillance"}
     )
 
@@ -39,7 +39,7 @@ from utils.calendar_picker import CalendarPicker
 from utils.generate_health_check_forms_util import GenerateHealthCheckFormsUtil
 from utils.sspi_change_steps import SSPIChangeSteps
 from utils.user_tools import UserTools
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 import logging
 from utils.batch_processing import batch_processing
 from pages.logout.log_out_page import LogoutPage
@@ -238,7 +238,7 @@ def test_surveillance_scenario_1(page: Page, general_properties: dict) -> None:
     SubjectScreeningSummaryPage(page).click_advance_surveillance_episode_button()
     AdvanceSurveillanceEpisodePage(page).click_book_surveillance_appointment_button()
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {"latest event status": "X600 Surveillance Appointment Required"},
     )
@@ -307,7 +307,7 @@ def test_surveillance_scenario_1(page: Page, general_properties: dict) -> None:
     # And I complete the Discharge from Surveillance form including Screening Consultant
     DischargeFromSurveillancePage(page).complete_discharge_from_surveillance_form(True)
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {"latest event status": "X390 Discharge from Surveillance - Clinical Decision"},
     )
@@ -404,7 +404,7 @@ def test_surveillance_scenario_1(page: Page, general_properties: dict) -> None:
     AdvanceSurveillanceEpisodePage(page).click_book_surveillance_appointment_button()
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no, {"latest event status": "X600 Surveillance Appointment Required"}
     )
     # When I view the subject
@@ -515,7 +515,7 @@ def test_surveillance_scenario_1(page: Page, general_properties: dict) -> None:
     DischargeFromSurveillancePage(page).complete_discharge_from_surveillance_form(True)
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {
             "latest event status": "X382 Discharge from Screening and Surveillance - Clinical Decision",
@@ -69,7 +69,7 @@ from utils.generate_health_check_forms_util import GenerateHealthCheckFormsUtil
 from utils.investigation_dataset import InvestigationDatasetCompletion
 from utils.oracle.oracle import OracleDB
 from utils.sspi_change_steps import SSPIChangeSteps
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 from utils.user_tools import UserTools
 
 
@@ -202,10 +202,8 @@ def test_surveillance_scenario_12(page: Page, general_properties: dict) -> None:
     # And I advance the subject's episode for "Invite for Diagnostic Test >>"
     AdvanceSurveillanceEpisodePage(page).click_invite_for_diagnostic_test_button()
 
-    page.wait_for_timeout(500)  # Timeout to allow subject to update on the DB
-
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {
             "latest event status": "A59 Invited for Diagnostic Test",
@@ -1,7 +1,7 @@
 import pytest
 from playwright.sync_api import Page
 from utils.user_tools import UserTools
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 import logging
 from utils.batch_processing import batch_processing
 from pages.logout.log_out_page import LogoutPage
@@ -125,7 +125,7 @@ def test_surveillance_scenario_3(page: Page, general_properties: dict) -> None:
     DischargeFromSurveillancePage(page).complete_discharge_from_surveillance_form(False)
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {"latest event status": "X392 Discharge from Surveillance - Patient Choice"},
     )
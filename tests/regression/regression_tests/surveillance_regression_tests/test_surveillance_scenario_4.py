@@ -1,7 +1,7 @@
 import pytest
 from playwright.sync_api import Page
 from utils.user_tools import UserTools
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 import logging
 from utils.batch_processing import batch_processing
 from pages.logout.log_out_page import LogoutPage
@@ -171,10 +171,8 @@ def test_surveillance_scenario_4(page: Page) -> None:
     # And I advance the subject's episode for "Invite for Diagnostic Test >>"
     AdvanceSurveillanceEpisodePage(page).click_invite_for_diagnostic_test_button()
 
-    page.wait_for_timeout(500)  # Timeout to allow subject to update on the DB
-
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {
             "latest event status": "A59 Invited for Diagnostic Test",
@@ -403,7 +401,7 @@ def test_surveillance_scenario_4(page: Page) -> None:
     DischargeFromSurveillancePage(page).complete_discharge_from_surveillance_form(False)
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {
             "latest event status": "X380 Discharge from Screening and Surveillance - Patient Choice"
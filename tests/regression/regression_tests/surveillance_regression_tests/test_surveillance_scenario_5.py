@@ -32,7 +32,7 @@ from utils.calendar_picker import CalendarPicker
 from utils.investigation_dataset import InvestigationDatasetCompletion
 from utils.oracle.oracle import OracleDB
 from utils.user_tools import UserTools
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 import logging
 from utils.batch_processing import batch_processing
 from pages.logout.log_out_page import LogoutPage
@@ -195,10 +195,8 @@ def test_surveillance_scenario_5(page: Page, general_properties: dict) -> None:
     # And I advance the subject's episode for "Invite for Diagnostic Test >>"
     AdvanceSurveillanceEpisodePage(page).click_invite_for_diagnostic_test_button()
 
-    page.wait_for_timeout(500)  # Timeout to allow subject to update on the DB
-
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {
             "latest event status": "A59 Invited for Diagnostic Test",
@@ -418,7 +416,7 @@ def test_surveillance_scenario_5(page: Page, general_properties: dict) -> None:
     DischargeFromSurveillancePage(page).complete_discharge_from_surveillance_form(False)
 
     # # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {
             "latest event status": "X398 Discharge from Surveillance - No Patient Contact"
@@ -531,7 +529,7 @@ def test_surveillance_scenario_5(page: Page, general_properties: dict) -> None:
     AdvanceSurveillanceEpisodePage(page).click_book_surveillance_appointment_button()
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {"latest event status": "X600 Surveillance Appointment Invited"},
     )
@@ -593,7 +591,7 @@ def test_surveillance_scenario_5(page: Page, general_properties: dict) -> None:
     DischargeFromSurveillancePage(page).complete_discharge_from_surveillance_form(False)
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {
             "latest event status": "X398 Discharge from Surveillance - No Patient Contact"
@@ -16,7 +16,7 @@ from utils.batch_processing import batch_processing
 from utils.generate_health_check_forms_util import GenerateHealthCheckFormsUtil
 from utils.oracle.oracle import OracleDB
 from utils.sspi_change_steps import SSPIChangeSteps
-from utils.subject_assertion import subject_assertion
+from utils.subject_assertion import subject_assertion, wait_until_subject_matches
 from utils.user_tools import UserTools
 
 
@@ -150,7 +150,7 @@ def test_surveillance_scenario_6(page: Page, general_properties: dict) -> None:
     DischargeFromSurveillancePage(page).complete_discharge_from_surveillance_form(False)
 
     # Then my subject has been updated as follows:
-    subject_assertion(
+    wait_until_subject_matches(
         nhs_no,
         {
             "latest event status": "X381 Discharge from Screening and Surveillance - No Patient Contact"
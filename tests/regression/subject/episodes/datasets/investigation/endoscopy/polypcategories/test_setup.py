@@ -36,7 +36,7 @@ from utils.calendar_picker import CalendarPicker
 from utils.fit_kit import FitKitGeneration
 from utils.oracle.oracle import OracleDB
 from utils.oracle.oracle_specific_functions.kit_management import (
-    update_kit_service_management_entity,
+    update_kit_service_management_entities,
     execute_fit_kit_stored_procedures,
 )
 from utils.oracle.subject_selection_query_builder import SubjectSelectionQueryBuilder
@@ -196,9 +196,6 @@ def setup_a99_status(page: Page, df: pd.DataFrame) -> pd.DataFrame:
         logging.info(f"Processing abnormal kit with Device ID: {device_id}")
         device_ids.append((device_id, False))
 
-    nhs_nos = []
-    normal_flags = []
-
     smokescreen_properties = {
         "c3_fit_kit_analyser_code": "UU2_tdH3",
         "c3_fit_kit_authorised_user": "AUTO1",
@@ -206,12 +203,8 @@ def setup_a99_status(page: Page, df: pd.DataFrame) -> pd.DataFrame:
         "c3_fit_kit_abnormal_result": "150",
     }
 
-    for device_id, is_normal in device_ids:
-        nhs_no = update_kit_service_management_entity(
-            device_id, is_normal, smokescreen_properties
-        )
-        nhs_nos.append(nhs_no)
-        normal_flags.append(is_normal)
+    nhs_nos = update_kit_service_management_entities(device_ids, smokescreen_properties)
+    normal_flags = [is_normal for _, is_normal in device_ids]
 
     try:
         execute_fit_kit_stored_procedures()
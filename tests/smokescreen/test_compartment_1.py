@@ -16,6 +16,7 @@ from utils.oracle.oracle_specific_functions.subject_batch import there_is_letter
 @pytest.mark.smokescreen
 @pytest.mark.compartment1
 @pytest.mark.compartment1_plan_creation
+@pytest.mark.shared_resource("invitation_plans")
 def test_create_invitations_plan(page: Page, smokescreen_properties: dict) -> None:
     """
     This is used to create the invitations plan. As it is not always needed it is separate to the main Compartment 1 function
@@ -46,6 +47,7 @@ def test_create_invitations_plan(page: Page, smokescreen_properties: dict) -> No
 @pytest.mark.vpn_required
 @pytest.mark.smokescreen
 @pytest.mark.compartment1
+@pytest.mark.shared_resource("invitation_generation")
 def test_compartment_1(page: Page, smokescreen_properties: dict) -> None:
     """
     This is the main compartment 1 function. It covers the following:
@@ -6,7 +6,7 @@ from utils.batch_processing import batch_processing
 from utils.fit_kit import FitKitLogged
 from utils.screening_subject_page_searcher import verify_subject_event_status_by_nhs_no
 from utils.oracle.oracle_specific_functions.kit_management import (
-    update_kit_service_management_entity,
+    update_kit_service_management_entities,
     execute_fit_kit_stored_procedures,
 )
 from utils.user_tools import UserTools
@@ -30,17 +30,12 @@ def test_compartment_3(page: Page, smokescreen_properties: dict) -> None:
     # and get device IDs and their flags
     device_ids = FitKitLogged().process_kit_data(smokescreen_properties)
     # Retrieve NHS numbers for each device_id and determine normal/abnormal status
-    nhs_numbers = []
-    normal_flags = []
-
-    for device_id, is_normal in device_ids:
-        nhs_number = update_kit_service_management_entity(
-            device_id, is_normal, smokescreen_properties
-        )
-        nhs_numbers.append(nhs_number)
-        normal_flags.append(
-            is_normal
-        )  # Store the flag (True for normal, False for abnormal)
+    nhs_numbers = update_kit_service_management_entities(
+        device_ids, smokescreen_properties
+    )
+    normal_flags = [
+        is_normal for _, is_normal in device_ids
+    ]  # Store the flag (True for normal, False for abnormal)
 
     # Run two stored procedures to process any kit queue records at status BCSS_READY
     try:
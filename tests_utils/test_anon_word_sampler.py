@@ -0,0 +1,42 @@
+import pytest
+import classes.repositories.word_repository as word_repository
+from classes.repositories.word_repository import WordRepository
+from utils.oracle.anon_word_sampler import AnonWordSampler
+
+pytestmark = [pytest.mark.utils]
+
+words = ["ALPHA", "BRAVO", "CHARLIE", "DELTA", "ECHO"]
+
+
+def test_seeded_samplers_draw_the_same_words() -> None:
+    first = AnonWordSampler(words, seed=42)
+    second = AnonWordSampler(words, seed=42)
+
+    drawn = [first.random_word() for _ in range(20)]
+    assert drawn == [second.random_word() for _ in range(20)]
+    assert set(drawn) <= set(words)
+    assert AnonWordSampler([]).random_word() is None
+
+
+def test_snapshot_round_trip(tmp_path) -> None:
+    snapshot = tmp_path / "snapshots" / "anon_words.txt"
+    AnonWordSampler(words).save_snapshot(snapshot)
+
+    assert AnonWordSampler.from_snapshot(snapshot).words == tuple(words)
+
+
+def test_word_repository_uses_sampler(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        word_repository,
+        "get_anon_word_sampler",
+        lambda: AnonWordSampler(words, seed=1),
+    )
+    details = WordRepository().get_random_subject_details()
+
+    assert details["county"] in words
+    assert all(word in words for word in details["forename"].split(" "))
+
+    monkeypatch.setattr(
+        word_repository, "get_anon_word_sampler", lambda: AnonWordSampler([])
+    )
+    assert WordRepository().get_random_word() == "TEST"
@@ -0,0 +1,51 @@
+import pytest
+import utils.batch_processing as batch_processing
+from classes.subject.subject_assertion_result import SubjectAssertionResult
+from utils.batch_processing import verify_latest_event_status_in_db
+
+pytestmark = [pytest.mark.utils]
+
+subject_statuses = {
+    "9990000001": "S9",
+    "9990000002": "S10",
+    "9990000003": "S1",
+}
+
+
+@pytest.fixture
+def checked_statuses(monkeypatch: pytest.MonkeyPatch) -> list:
+    checked = []
+
+    def fake_subject_assertion_bulk(nhs_numbers: list, criteria: dict) -> dict:
+        status = criteria["latest event status"].split(" ")[0]
+        checked.append((status, list(nhs_numbers)))
+        return {
+            nhs_no: SubjectAssertionResult(nhs_no, subject_statuses[nhs_no] == status)
+            for nhs_no in nhs_numbers
+        }
+
+    monkeypatch.setattr(
+        batch_processing, "subject_assertion_bulk", fake_subject_assertion_bulk
+    )
+    return checked
+
+
+def test_only_unmatched_subjects_are_checked_against_next_status(
+    checked_statuses: list,
+) -> None:
+    verify_latest_event_status_in_db(
+        ["9990000001", "9990000002"],
+        ["S9 - Pre-invitation Sent", "S10 - Invitation & Test Kit Sent"],
+    )
+
+    assert checked_statuses == [
+        ("S9", ["9990000001", "9990000002"]),
+        ("S10", ["9990000002"]),
+    ]
+
+
+def test_subject_with_wrong_status_fails(checked_statuses: list) -> None:
+    with pytest.raises(pytest.fail.Exception, match=r"1 of 2 subjects.*9990000003"):
+        verify_latest_event_status_in_db(
+            ["9990000001", "9990000003"], "S9 - Pre-invitation Sent"
+        )
@@ -0,0 +1,161 @@
+import pytest
+import utils.oracle.subject_creation_util as subject_creation_util
+from datetime import date
+from types import SimpleNamespace
+from classes.repositories.subject_repository import SubjectRepository
+from classes.subject.pi_subject import PISubject
+from classes.subject.pi_subject_creation_result import PISubjectCreationResult
+from utils.nhs_number_tools import NHSNumberTools
+from utils.oracle.oracle import OracleDB
+from utils.oracle.subject_creation_util import CreateSubjectSteps
+
+pytestmark = [pytest.mark.utils]
+
+
+class FakeVar:
+    def __init__(self) -> None:
+        self.value = None
+
+    def getvalue(self):
+        return self.value
+
+
+class FakeCursor:
+    def __init__(self, connection: "FakeConnection") -> None:
+        self.connection = connection
+
+    def var(self, var_type: type) -> FakeVar:
+        return FakeVar()
+
+    def callproc(self, procedure: str, params: list) -> None:
+        pi_struct, _, contact_id, error_id, error_text = params
+        if pi_struct.NHS_NUMBER == "9990000003":
+            error_id.value, error_text.value = 1, "Invalid GP practice"
+        else:
+            self.connection.calls += 1
+            error_id.value, contact_id.value = 0, self.connection.calls
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.commits = 0
+        self.closed = False
+
+    def gettype(self, name: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            attributes=[SimpleNamespace(name="NHS_NUMBER")],
+            newobject=SimpleNamespace,
+        )
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_create_pi_subjects(monkeypatch: pytest.MonkeyPatch) -> None:
+    connections = []
+
+    def connect_to_db(self) -> FakeConnection:
+        connections.append(FakeConnection())
+        return connections[-1]
+
+    monkeypatch.setattr(OracleDB, "connect_to_db", connect_to_db)
+    monkeypatch.setattr(
+        OracleDB,
+        "get_subject_ids_from_nhs_numbers",
+        lambda self, nhs_numbers: {"9990000002": 2},
+    )
+    subjects = [
+        PISubject(nhs_number=nhs_number, pi_reference="AUTOMATED TEST")
+        for nhs_number in ["9990000001", "9990000002", "9990000003", "9990000004"]
+    ]
+    subjects.append(PISubject(nhs_number="9990000005"))
+
+    results = SubjectRepository().create_pi_subjects(1, subjects, chunk_size=2)
+
+    assert [result.contact_id for result in results] == [1, None, None, 2, None]
+    assert "already in use" in results[1].error
+    assert results[2].error.endswith("Invalid GP practice")
+    assert "PI Reference" in results[4].error
+    assert len(connections) == 1
+    assert connections[0].commits == 2
+    assert connections[0].closed
+
+
+def test_reserve_unique_nhs_numbers(monkeypatch: pytest.MonkeyPatch) -> None:
+    batches = iter(
+        [["9990000001", "9990000002", "9990000003"], ["9990000001", "9990000004"]]
+    )
+    checked = []
+
+    def get_subject_ids_from_nhs_numbers(self, nhs_numbers: list) -> dict:
+        checked.append(list(nhs_numbers))
+        return {"9990000002": 2}
+
+    monkeypatch.setattr(
+        NHSNumberTools,
+        "generate_random_nhs_numbers",
+        lambda count, seed=None: next(batches),
+    )
+    monkeypatch.setattr(
+        OracleDB, "get_subject_ids_from_nhs_numbers", get_subject_ids_from_nhs_numbers
+    )
+
+    nhs_numbers = CreateSubjectSteps().reserve_unique_nhs_numbers(3)
+
+    assert nhs_numbers == ["9990000001", "9990000003", "9990000004"]
+    assert checked == [["9990000001", "9990000002", "9990000003"], ["9990000004"]]
+
+
+def test_failed_subject_creations_are_raised(monkeypatch: pytest.MonkeyPatch) -> None:
+    active_plan = {
+        "invitations_per_day": 1,
+        "start_date": date(2025, 1, 1),
+        "end_date": date(2025, 12, 31),
+    }
+    monkeypatch.setattr(
+        subject_creation_util.InvitationRepository,
+        "get_active_plan",
+        lambda self, hub_org_id, sc_org_id: active_plan,
+    )
+    monkeypatch.setattr(
+        subject_creation_util,
+        "WordRepository",
+        lambda: SimpleNamespace(get_random_subject_details=lambda: {}),
+    )
+    monkeypatch.setattr(
+        subject_creation_util.DataCreation,
+        "generate_random_subject",
+        lambda self, details, pi_reference, region: PISubject(
+            pi_reference=pi_reference
+        ),
+    )
+    monkeypatch.setattr(CreateSubjectSteps, "get_pio_id_for_region", lambda *_: 1)
+    monkeypatch.setattr(
+        CreateSubjectSteps,
+        "reserve_unique_nhs_numbers",
+        lambda self, count: ["9990000001", "9990000002", "9990000003"],
+    )
+
+    def create_pi_subjects(self, pio_id: int, pi_subjects: list) -> list:
+        return [
+            PISubjectCreationResult("9990000001", contact_id=1),
+            PISubjectCreationResult("9990000002", error="Invalid GP practice"),
+            PISubjectCreationResult("9990000003", error="Invalid postcode"),
+        ]
+
+    monkeypatch.setattr(SubjectRepository, "create_pi_subjects", create_pi_subjects)
+
+    with pytest.raises(ValueError) as error:
+        CreateSubjectSteps().additional_subjects_are_created(4, 1, 2, "England")
+
+    assert "2 of 3 PI subjects" in str(error.value)
+    assert "9990000002: Invalid GP practice; 9990000003: Invalid postcode" in str(
+        error.value
+    )
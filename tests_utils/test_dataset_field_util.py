@@ -0,0 +1,122 @@
+import pytest
+from utils.dataset_field_util import (
+    DatasetField,
+    DatasetFieldUtil,
+    FILL_FIELDS_SCRIPT,
+    FORM_MAP_SCRIPT,
+)
+
+pytestmark = [pytest.mark.utils]
+
+
+class FakeLocator:
+    def __init__(self, selector: str, checked: bool = False):
+        self.selector = selector
+        self.checked = checked
+        self.filled = None
+
+    @property
+    def first(self):
+        return self
+
+    def locator(self, selector):
+        return FakeLocator(f"{self.selector} >> {selector}")
+
+    def fill(self, value):
+        self.filled = value
+
+    def select_option(self, option):
+        self.filled = option
+
+    def is_checked(self):
+        return self.checked
+
+    def evaluate(self, script):
+        return "Yes"
+
+
+class FakePage:
+    def __init__(self, form_map: dict):
+        self.form_map = form_map
+        self.lookups = []
+        self.locators = {}
+        self.passes = []
+        self.visible_fields = set()
+
+    def evaluate(self, script, arg):
+        if script == FILL_FIELDS_SCRIPT:
+            self.passes.append([field[0] for field in arg])
+            for index, (text, selector, div, value) in enumerate(arg):
+                if text not in self.visible_fields:
+                    return index
+            return len(arg)
+        assert script == FORM_MAP_SCRIPT
+        self.lookups.append(tuple(arg))
+        text, selector, div = arg
+        return self.form_map.get((text, selector), [])
+
+    def locator(self, selector):
+        return self.locators.setdefault(selector, FakeLocator(selector))
+
+
+def test_fields_are_found_from_the_form_map() -> None:
+    page = FakePage(
+        {
+            ("End time of procedure", "input"): ["4"],
+            ("Patient sedation", 'input[type="radio"]'): ["7", "8"],
+        }
+    )
+    page.locators['[data-form-map-id="8"]'] = FakeLocator(
+        '[data-form-map-id="8"]', checked=True
+    )
+
+    DatasetFieldUtil(page).populate_input_locator_for_field(
+        "End time of procedure", "09:30"
+    )
+    assert page.locators['[data-form-map-id="4"]'].filled == "09:30"
+
+    DatasetFieldUtil(page).assert_radio_to_right_is_selected(
+        "Patient sedation", "Yes", div="sedationDiv"
+    )
+    assert page.lookups[-1] == (
+        "Patient sedation",
+        'input[type="radio"]',
+        "sedationDiv",
+    )
+
+
+def test_fields_not_on_the_page_yet_use_the_layout_selector() -> None:
+    page = FakePage({})
+
+    locator = DatasetFieldUtil(page).get_select_locator_for_field_inside_div(
+        "Insufflation", "endoscopyDiv"
+    )
+
+    assert (
+        locator.selector == 'div#endoscopyDiv >> select:right-of(:text("Insufflation"))'
+    )
+
+
+def test_fields_are_filled_in_one_pass() -> None:
+    page = FakePage({("Polyp Size", "input"): ["3"]})
+    page.visible_fields = {"Location", "Classification", "Device"}
+    steps = []
+
+    DatasetFieldUtil(page).populate_fields(
+        [
+            DatasetField("Location", "Caecum"),
+            DatasetField("Polyp Size", 12, "input"),
+            DatasetField("Classification", "Ip"),
+            lambda: steps.append(list(page.passes)),
+            DatasetField("Device", "Cold snare"),
+        ]
+    )
+
+    # Polyp Size is not on the page yet, so is filled on its own before the pass carries on
+    assert page.passes == [
+        ["Location", "Polyp Size", "Classification"],
+        ["Classification"],
+        ["Device"],
+    ]
+    assert page.locators['[data-form-map-id="3"]'].filled == "12"
+    assert steps == [page.passes[:2]]
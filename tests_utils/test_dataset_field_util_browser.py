@@ -0,0 +1,84 @@
+import pytest
+from playwright.sync_api import Page
+from utils.dataset_field_util import DatasetFieldUtil
+
+pytestmark = [pytest.mark.utils_local]
+
+# A cut down investigation dataset, laid out in the same way as BCSS (labels in the left column of each table)
+DATASET_FORM = """
+<div class="DatasetSection" id="divEndoscopyInformation">
+  <table>
+    <tr><td>Bowel preparation quality</td><td><select id="bowelPreparation"><option>Excellent</option></select></td></tr>
+    <tr><td>Comfort during examination</td><td><select id="comfortExamination"><option>No discomfort</option></select></td></tr>
+    <tr><td>Scope ID</td><td><input id="scopeId"></td></tr>
+    <tr><td>Outcome at time of procedure</td><td><select id="outcomeAtTimeOfProcedure"><option>Leave department</option></select></td></tr>
+    <tr><td>Late outcome</td><td><select id="lateOutcome"><option>No complications</option></select></td></tr>
+  </table>
+</div>
+<div class="DatasetSection" id="divPolypNumber1Section">
+  <table>
+    <tr><td>Location</td><td><select id="polyp1Location"><option>Rectum</option></select></td></tr>
+    <tr><td>Classification</td><td><select id="polyp1Classification"><option>Ip</option></select></td></tr>
+  </table>
+</div>
+<a id="anchorRadiologyFindings" href="#"
+   onclick="document.getElementById('divSuspectedFindings').style.display = 'block'; return false;">Show</a>
+<div class="DatasetSection" id="divSuspectedFindings" style="display: none">
+  <table>
+    <tr><td>Extracolonic Summary Code</td><td><select id="extracolonicSummaryCode"><option>E1</option></select></td></tr>
+  </table>
+</div>
+<input type="button" id="addPolyp" value="Add Polyp" onclick="
+  document.body.insertAdjacentHTML('beforeend',
+    '<div class=&quot;DatasetSection&quot; id=&quot;divPolypNumber2Section&quot;><table>'
+    + '<tr><td>Location</td><td><select id=&quot;polyp2Location&quot;><option>Caecum</option></select></td></tr>'
+    + '</table></div>');">
+"""
+
+
+def assert_same_control_as_playwright(
+    page: Page, control: str, text: str, div: str | None = None
+) -> None:
+    locators = DatasetFieldUtil(page).get_locators_right_of(control, text, div)
+    assert locators, f"No {control} found to the right of '{text}'"
+    scope = page.locator(f"div#{div}") if div else page
+    expected = scope.locator(f'{control}:right-of(:text("{text}"))').first
+    assert locators[0].evaluate("element => element.id") == expected.evaluate(
+        "element => element.id"
+    )
+
+
+def test_form_map_finds_the_same_controls_as_the_layout_selector(page: Page):
+    page.set_content(DATASET_FORM)
+
+    for text in [
+        "Bowel preparation quality",
+        "Comfort during examination",
+        "Outcome at time of procedure",
+        "Late outcome",
+    ]:
+        assert_same_control_as_playwright(page, "select", text)
+    assert_same_control_as_playwright(page, "input", "Scope ID")
+    assert_same_control_as_playwright(
+        page, "select", "Location", "divPolypNumber1Section"
+    )
+
+
+def test_form_map_is_rebuilt_when_a_section_is_shown(page: Page):
+    page.set_content(DATASET_FORM)
+    util = DatasetFieldUtil(page)
+    assert (
+        util.get_locators_right_of("select", "Location", "divPolypNumber2Section") == []
+    )
+    util.get_locators_right_of("select", "Extracolonic Summary Code")
+
+    page.locator("#addPolyp").click()
+    page.locator("#anchorRadiologyFindings").click()
+
+    assert_same_control_as_playwright(
+        page, "select", "Location", "divPolypNumber2Section"
+    )
+    assert_same_control_as_playwright(page, "select", "Extracolonic Summary Code")
+    assert util.get_locators_right_of("select", "Extracolonic Summary Code")[
+        0
+    ].is_visible()
@@ -0,0 +1,89 @@
+import pytest
+from classes.event.event_code_type import EventCodeType
+from classes.event.event_status_type import EventStatusType
+from classes.screening.screening_status_type import ScreeningStatusType
+from classes.valid_values.indexed_enum import IndexedEnum, IndexedEnumMeta
+
+pytestmark = [pytest.mark.utils]
+
+
+class ExampleType(IndexedEnum):
+    FIRST = (1, "Example")
+    SECOND = (2, "Other")
+    DUPLICATE = (1, "example")
+
+    def __init__(self, valid_value_id: int, description: str):
+        self._valid_value_id = valid_value_id
+        self._description = description
+
+    @property
+    def valid_value_id(self) -> int:
+        return self._valid_value_id
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+
+class LastWinsExampleType(IndexedEnum, last_wins=True):
+    FIRST = (1, "Example")
+    DUPLICATE = (1, "Duplicate")
+
+    def __init__(self, valid_value_id: int, description: str):
+        self._valid_value_id = valid_value_id
+
+    @property
+    def valid_value_id(self) -> int:
+        return self._valid_value_id
+
+
+def test_lookups_use_the_indexes() -> None:
+    assert ExampleType._lookup("valid_value_id", 2) is ExampleType.SECOND
+    assert ExampleType._lookup("description", "example") is ExampleType.DUPLICATE
+    assert ExampleType._lookup("value", (2, "Other")) is ExampleType.SECOND
+    assert ExampleType._lookup("valid_value_id", 3) is None
+    assert ExampleType._lookup("code", "X") is None
+    assert ExampleType._lookup("valid_value_id", [1]) is None
+
+
+def test_duplicate_values_index_the_first_member_by_default() -> None:
+    assert ExampleType._lookup("valid_value_id", 1) is ExampleType.FIRST
+    assert (
+        ExampleType._lookup_case_insensitive("description", "EXAMPLE")
+        is ExampleType.FIRST
+    )
+    assert (
+        LastWinsExampleType._lookup("valid_value_id", 1)
+        is LastWinsExampleType.DUPLICATE
+    )
+    assert ScreeningStatusType.by_valid_value_id(0) is ScreeningStatusType.NULL
+
+
+def test_valid_value_enum_lookups() -> None:
+    for status in EventStatusType:
+        assert EventStatusType.get_by_id(status.id) is not None
+        assert EventStatusType.get_by_code(status.code) is status
+    assert EventStatusType.get_by_code("not a code") is None
+    assert EventCodeType.by_code("E6") is EventCodeType.E6
+    assert EventCodeType.by_description("Enter Diagnostic Test Outcome") is (
+        EventCodeType.E6
+    )
+
+
+def test_lookups_do_not_scan_the_members(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Looks up the last EventStatusType (the worst case for the linear scan the indexes replaced)
+    with iterating over the members disabled, so a lookup that scans the members fails.
+    """
+    last_status = list(EventStatusType)[-1]
+    last_event_code = list(EventCodeType)[-1]
+
+    def no_scan(enum_class):
+        raise AssertionError(f"{enum_class.__name__} members were scanned")
+
+    monkeypatch.setattr(IndexedEnumMeta, "__iter__", no_scan)
+
+    assert EventStatusType.get_by_code(last_status.code) is last_status
+    assert EventStatusType.get_by_id(last_status.id) is not None
+    assert EventCodeType.by_code(last_event_code.code) is last_event_code
+    assert ScreeningStatusType.by_valid_value_id(0) is ScreeningStatusType.NULL
@@ -0,0 +1,149 @@
+import pytest
+from pages.datasets.investigation_dataset_page import (
+    DATASET_SECTIONS_SCRIPT,
+    InvestigationDatasetsPage,
+)
+
+pytestmark = [pytest.mark.utils]
+
+
+def label(text: str, visible: bool = True, container_visible: bool = True) -> dict:
+    return {"text": text, "visible": visible, "container_visible": container_visible}
+
+
+def section(
+    heading: str,
+    labels: list[dict],
+    visible: bool = True,
+    subsections: list[dict] | None = None,
+    subsection_groups: list[dict] | None = None,
+) -> dict:
+    return {
+        "heading": heading,
+        "visible": visible,
+        "labels": labels,
+        "subsections": subsections or [],
+        "subsection_groups": subsection_groups or [],
+    }
+
+
+class FakeSections:
+    def __init__(self, sections: list[dict], selector: str = ".DatasetSection"):
+        self.sections = sections
+        self.selector = selector
+        self.calls = 0
+
+    def evaluate_all(self, script):
+        assert script == DATASET_SECTIONS_SCRIPT
+        self.calls += 1
+        return self.sections
+
+    def nth(self, index):
+        return FakeSections(self.sections, f"{self.selector}[{index}]")
+
+    def locator(self, selector):
+        return FakeSections(self.sections, f"{self.selector} >> {selector}")
+
+
+def make_page(sections: list[dict]) -> InvestigationDatasetsPage:
+    dataset_page = InvestigationDatasetsPage.__new__(InvestigationDatasetsPage)
+    dataset_page.sections = FakeSections(sections)
+    return dataset_page
+
+
+dataset = [
+    section("Investigation Dataset", [label("Site")]),
+    section("Drug Information", [label("Drug Type")], visible=False),
+    section(
+        "Endoscopy Information",
+        [
+            label("Scope\xa0ID"),
+            label("Insufflation", visible=False, container_visible=False),
+        ],
+        subsections=[
+            {"headings": ["Completion Proof"], "labels": [label("Proof Type")]},
+        ],
+        subsection_groups=[
+            {"headings": ["Polyp  1"], "labels": [label("Location")]},
+        ],
+    ),
+]
+
+
+def test_sections_and_subsections_are_found_from_one_read() -> None:
+    dataset_page = make_page(dataset)
+
+    assert (
+        dataset_page.get_dataset_section("endoscopy information").selector
+        == ".DatasetSection[2]"
+    )
+    assert (
+        dataset_page.get_dataset_subsection("Endoscopy Information", "polyp 1").selector
+        == ".DatasetSection[2] >> .DatasetSubSectionGroup[0]"
+    )
+    assert (
+        dataset_page.get_dataset_subsection("Endoscopy Information", "Unknown") is None
+    )
+
+    # Hidden sections are present, but can't be found
+    assert dataset_page.get_dataset_section("Drug Information") is None
+    assert dataset_page.is_dataset_section_present("Drug Information")
+    with pytest.raises(ValueError):
+        dataset_page.get_dataset_subsection("Drug Information", "Drug Type")
+
+    dataset_page.sections.calls = 0
+    dataset_page.is_dataset_section_on_page(
+        ["Investigation Dataset", "Endoscopy Information"]
+    )
+    dataset_page.is_dataset_section_on_page(["Drug Information", "Other"], False)
+    assert dataset_page.sections.calls == 2
+
+
+def test_fields_are_checked_against_the_label_visibility() -> None:
+    dataset_page = make_page(dataset)
+
+    assert dataset_page.are_fields_on_page(
+        "Endoscopy Information", None, ["Scope ID", "Insufflation"]
+    )
+    assert dataset_page.are_fields_on_page(
+        "Endoscopy Information", None, ["scope id"], visible=True
+    )
+    assert not dataset_page.are_fields_on_page(
+        "Endoscopy Information", None, ["Insufflation"], visible=True
+    )
+    assert dataset_page.are_fields_on_page(
+        "Endoscopy Information", None, ["Insufflation"], visible=False
+    )
+    assert not dataset_page.are_fields_on_page(
+        "Endoscopy Information", None, ["Scope ID"], visible=False
+    )
+    assert dataset_page.are_fields_on_page(
+        "Endoscopy Information", "Polyp 1", ["Location"], visible=True
+    )
+    assert not dataset_page.are_fields_on_page(
+        "Endoscopy Information", "Polyp 1", ["Scope ID"]
+    )
+    with pytest.raises(ValueError):
+        dataset_page.are_fields_on_page("Drug Information", None, ["Drug Type"])
+
+
+def test_empty_labels_do_not_shift_the_visibility_of_the_next_label() -> None:
+    # An empty visible label before a hidden one used to lend the hidden label its visibility
+    dataset_page = make_page(
+        [
+            section(
+                "Endoscopy Information",
+                [
+                    label(" ", visible=True),
+                    label("Retroverted view", visible=False, container_visible=False),
+                ],
+            )
+        ]
+    )
+
+    assert not dataset_page.are_fields_on_page(
+        "Endoscopy Information", None, ["Retroverted view"], visible=True
+    )
+    assert dataset_page.are_fields_on_page(
+        "Endoscopy Information", None, ["Retroverted view"], visible=False
+    )
@@ -0,0 +1,95 @@
+import pytest
+import pages.call_and_recall.generate_invitations_page as generate_invitations_page
+from pages.call_and_recall.generate_invitations_page import GenerateInvitationsPage
+
+pytestmark = [pytest.mark.utils]
+
+
+class FakeTable:
+    def __init__(self, text: str):
+        self.text = text
+
+    def text_content(self) -> str:
+        return self.text
+
+
+class FakePage:
+    def __init__(self):
+        self.waits = []
+
+    def wait_for_timeout(self, timeout: float) -> None:
+        self.waits.append(timeout)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(generate_invitations_page.time, "monotonic", clock.monotonic)
+    return clock
+
+
+def make_page(statuses: list, clock: FakeClock) -> GenerateInvitationsPage:
+    """Each refresh shows the next status and takes 2 seconds"""
+    generate_page = GenerateInvitationsPage.__new__(GenerateInvitationsPage)
+    generate_page.page = FakePage()
+    generate_page.display_rs = FakeTable(statuses.pop(0))
+    generate_page.generate_invitations_button = "Generate Invitations"
+    generate_page.click = lambda locator: None
+    generate_page.refreshes = 0
+
+    def click_refresh_button():
+        generate_page.refreshes += 1
+        clock.now += 2
+        if statuses:
+            generate_page.display_rs.text = statuses.pop(0)
+
+    generate_page.click_refresh_button = click_refresh_button
+    return generate_page
+
+
+def test_page_is_refreshed_with_a_backoff(clock: FakeClock) -> None:
+    generate_page = make_page(
+        ["Queued", "Queued", "In Progress", "In Progress", "Completed"], clock
+    )
+
+    generate_page.wait_for_invitation_generation()
+
+    assert generate_page.page.waits == [1000, 1500, 2250, 3375]
+    assert generate_page.refreshes == 4
+
+
+def test_generation_time_is_measured_from_the_click(clock: FakeClock) -> None:
+    generate_page = make_page(["Queued", "Completed"], clock)
+    generate_page.click_generate_invitations_button()
+    clock.now += 30
+
+    seconds = generate_page.wait_for_invitation_generation()
+
+    assert seconds == 32
+    assert generate_page.generation_seconds == seconds
+
+    # A second wait on the same page is not measured from the earlier click
+    generate_page.display_rs.text = "Completed"
+    assert generate_page.wait_for_invitation_generation() == 0
+
+
+def test_a_run_still_generating_after_the_timeout_fails(clock: FakeClock) -> None:
+    generate_page = make_page(["Queued"], clock)
+
+    with pytest.raises(pytest.fail.Exception, match="still generating after 120"):
+        generate_page.wait_for_invitation_generation()
+
+    assert generate_page.refreshes == 60
+    assert max(generate_page.page.waits) == 8000
+
+    failed_page = make_page(["In Progress", "Failed"], clock)
+    with pytest.raises(pytest.fail.Exception, match="failed to generate"):
+        failed_page.wait_for_invitation_generation()
@@ -0,0 +1,136 @@
+import pytest
+import utils.oracle.oracle_specific_functions.kit_management as kit_management
+from classes.database.bulk_write_result import BulkWriteResult
+from utils.oracle.oracle_specific_functions.kit_management import (
+    update_kit_service_management_entities,
+)
+
+pytestmark = [pytest.mark.utils]
+
+COLUMNS = [
+    "DEVICE_ID",
+    "SUBJECT_NHS_NUMBER",
+    "TEST_KIT_NAME",
+    "TEST_KIT_TYPE",
+    "LOGGED_BY_HUB",
+    "DATE_TIME_LOGGED",
+    "CALCULATED_RESULT",
+    "POST_RESPONSE",
+    "POST_ATTEMPTS",
+    "PUT_RESPONSE",
+    "PUT_ATTEMPTS",
+]
+
+smokescreen_properties = {
+    "c3_fit_kit_normal_result": "75",
+    "c3_fit_kit_abnormal_result": "150",
+    "c3_fit_kit_analyser_code": "HMJackalt",
+    "c3_fit_kit_authorised_user": "AUTO1",
+}
+
+
+def service_management_row(device_id: str, nhs_number: str) -> tuple:
+    return (device_id, nhs_number, "FIT", "FIT", "BCS01", None, None, 0, 0, None, 0)
+
+
+class FakeCursor:
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+        self.arraysize = 100
+        self.description = [(column,) for column in COLUMNS]
+        self.executions = []
+
+    def execute(self, query: str, parameters: dict) -> None:
+        self.executions.append((query, parameters))
+
+    def fetchall(self) -> list:
+        return self.rows
+
+
+class FakeConnection:
+    def __init__(self, rows: list) -> None:
+        self.fake_cursor = FakeCursor(rows)
+
+    def cursor(self) -> FakeCursor:
+        return self.fake_cursor
+
+
+class FakeOracleDB:
+    conn: FakeConnection
+    updates: list
+
+    def connect_to_db(self) -> FakeConnection:
+        return FakeOracleDB.conn
+
+    def disconnect_from_db(self, conn: FakeConnection) -> None:
+        pass
+
+    def string_list(self, conn: FakeConnection, values: list[str]) -> list[str]:
+        return list(values)
+
+    def bulk_update_or_insert_data_to_table(
+        self, statement: str, params_list: list[dict]
+    ) -> BulkWriteResult:
+        FakeOracleDB.updates.append(params_list)
+        return BulkWriteResult(row_counts=[1] * len(params_list))
+
+
+@pytest.fixture
+def fake_db(monkeypatch: pytest.MonkeyPatch):
+    def make(rows: list) -> FakeConnection:
+        monkeypatch.setattr(FakeOracleDB, "conn", FakeConnection(rows), raising=False)
+        monkeypatch.setattr(FakeOracleDB, "updates", [], raising=False)
+        return FakeOracleDB.conn
+
+    monkeypatch.setattr(kit_management, "OracleDB", FakeOracleDB)
+    return make
+
+
+def test_every_device_is_read_in_a_single_query(fake_db) -> None:
+    conn = fake_db(
+        [
+            service_management_row("DEVICE2", "9990000002"),
+            service_management_row("DEVICE1", "9990000001"),
+        ]
+    )
+
+    nhs_numbers = update_kit_service_management_entities(
+        [("DEVICE1", True), ("DEVICE2", False)], smokescreen_properties
+    )
+
+    assert nhs_numbers == ["9990000001", "9990000002"]
+    assert len(conn.fake_cursor.executions) == 1
+    assert conn.fake_cursor.executions[0][1] == {"device_ids": ["DEVICE1", "DEVICE2"]}
+    [params_list] = FakeOracleDB.updates
+    assert [params["device_id"] for params in params_list] == ["DEVICE1", "DEVICE2"]
+    assert [params["test_result"] for params in params_list] == [75, 150]
+
+
+def test_a_device_without_a_record_is_reported(fake_db) -> None:
+    fake_db([service_management_row("DEVICE1", "9990000001")])
+
+    with pytest.raises(IndexError, match="device_id=DEVICE2"):
+        update_kit_service_management_entities(
+            [("DEVICE1", True), ("DEVICE2", True)], smokescreen_properties
+        )
+    assert FakeOracleDB.updates == []
+
+
+def test_null_responses_are_not_read_as_nan(fake_db) -> None:
+    # With a NULL and a number in the same column, the DataFrame holds the NULL as NaN
+    not_posted = list(service_management_row("DEVICE1", "9990000001"))
+    not_posted[7:11] = [None, None, None, None]
+    posted = list(service_management_row("DEVICE2", "9990000002"))
+    posted[7:11] = [201, 1, 200, 1]
+    fake_db([tuple(not_posted), tuple(posted)])
+
+    update_kit_service_management_entities(
+        [("DEVICE1", True), ("DEVICE2", True)], smokescreen_properties
+    )
+
+    [params_list] = FakeOracleDB.updates
+    assert params_list[0]["post_response"] == 0
+    assert params_list[0]["post_attempts"] == 0
+    assert params_list[0]["put_response"] is None
+    assert params_list[0]["put_attempts"] is None
+    assert params_list[1]["post_response"] == 201
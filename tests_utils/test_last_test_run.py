@@ -0,0 +1,104 @@
+import subprocess
+import sys
+import threading
+import pytest
+import utils.last_test_run as last_test_run
+from pathlib import Path
+from utils.last_test_run import get_last_run, has_test_run_today, run_once
+
+pytestmark = [pytest.mark.utils]
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setattr(
+        last_test_run, "LAST_RUN_FILE", str(tmp_path / ".test_last_runs.json")
+    )
+    monkeypatch.setattr(last_test_run, "LOCK_DIRECTORY", tmp_path / ".locks")
+    return tmp_path
+
+
+def test_setup_runs_once_per_day_and_records_its_duration() -> None:
+    with run_once("setup_appointments", "https://bcss") as should_run:
+        assert should_run
+    with run_once("setup_appointments", "https://bcss") as should_run:
+        assert not should_run
+    with run_once("setup_appointments", "https://other-bcss") as should_run:
+        assert should_run
+
+    last_run = get_last_run("setup_appointments", "https://bcss")
+    assert last_run["session"] == last_test_run.SESSION_ID
+    assert last_run["duration_seconds"] is not None
+    assert has_test_run_today("setup_appointments", "https://bcss")
+
+
+def test_failed_setup_is_not_recorded() -> None:
+    with pytest.raises(RuntimeError):
+        with run_once("setup_appointments", "https://bcss") as should_run:
+            assert should_run
+            raise RuntimeError("setup failed")
+    with run_once("setup_appointments", "https://bcss") as should_run:
+        assert should_run
+
+
+def test_session_and_environment_scopes(monkeypatch: pytest.MonkeyPatch) -> None:
+    with run_once("setup_org", "https://bcss", scope="session") as should_run:
+        assert should_run
+    with run_once("setup_org", "https://bcss", scope="session") as should_run:
+        assert not should_run
+
+    monkeypatch.setattr(last_test_run, "SESSION_ID", "a later session")
+    with run_once("setup_org", "https://bcss", scope="session") as should_run:
+        assert should_run
+    with run_once("setup_org", "https://bcss", scope="environment") as should_run:
+        assert not should_run
+
+    with pytest.raises(ValueError, match="scope"):
+        with run_once("setup_org", "https://bcss", scope="week"):
+            pass
+
+
+def test_waiting_process_does_not_repeat_the_setup(registry: Path) -> None:
+    script = (
+        "import sys, time; import utils.last_test_run as last_test_run; from pathlib import Path\n"
+        f"last_test_run.LAST_RUN_FILE = {str(registry / '.test_last_runs.json')!r}\n"
+        f"last_test_run.LOCK_DIRECTORY = Path({str(registry / '.locks')!r})\n"
+        "with last_test_run.run_once('setup_appointments', 'https://bcss') as should_run:\n"
+        "    print(should_run, flush=True); time.sleep(1)"
+    )
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-c", script],
+            stdout=subprocess.PIPE,
+            text=True,
+            cwd=Path(__file__).parent.parent,
+        )
+        for _ in range(2)
+    ]
+    outputs = sorted(worker.communicate(timeout=60)[0].strip() for worker in workers)
+    assert outputs == ["False", "True"]
+
+
+def test_waiting_for_the_setup_times_out() -> None:
+    setup_started = threading.Event()
+    setup_finished = threading.Event()
+
+    def run_setup() -> None:
+        with run_once("setup_appointments", "https://bcss") as should_run:
+            assert should_run
+            setup_started.set()
+            setup_finished.wait(timeout=10)
+
+    setup = threading.Thread(target=run_setup)
+    setup.start()
+    setup_started.wait(timeout=10)
+    try:
+        with pytest.raises(TimeoutError, match="run_once_setup_appointments"):
+            with run_once("setup_appointments", "https://bcss", timeout=0.2):
+                pass
+    finally:
+        setup_finished.set()
+        setup.join()
+
+    with run_once("setup_appointments", "https://bcss", timeout=0.2) as should_run:
+        assert not should_run
@@ -22,3 +22,25 @@ def test_nhs_number_checks() -> None:
 def test_spaced_nhs_number() -> None:
     assert NHSNumberTools.spaced_nhs_number("1234567890") == "123 456 7890"
     assert NHSNumberTools.spaced_nhs_number(3216549870) == "321 654 9870"
+
+
+def test_generate_random_nhs_numbers() -> None:
+    nhs_numbers = NHSNumberTools.generate_random_nhs_numbers(500, seed=7)
+
+    assert len(set(nhs_numbers)) == 500
+    assert all(NHSNumberTools.is_valid_nhs_number(nhs_no) for nhs_no in nhs_numbers)
+    assert nhs_numbers == NHSNumberTools.generate_random_nhs_numbers(500, seed=7)
+
+
+def test_generate_random_nhs_numbers_in_partition(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "4")
+    assert NHSNumberTools.worker_partition() == (3, 4)
+
+    nhs_numbers = NHSNumberTools.generate_random_nhs_numbers(100)
+    assert all("9750000000" <= nhs_no <= "9999999999" for nhs_no in nhs_numbers)
+
+    with pytest.raises(ValueError, match="Invalid partition"):
+        NHSNumberTools.generate_random_nhs_numbers(1, partition=4, partitions=4)
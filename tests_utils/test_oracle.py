@@ -0,0 +1,199 @@
+import pytest
+from utils.oracle.oracle import OracleDB
+
+pytestmark = [pytest.mark.utils]
+
+
+class FakeCursor:
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.description = [("SUBJECT_NHS_NUMBER",), ("SCREENING_STATUS_ID",)]
+        self.fetch_calls = 0
+
+    def execute(self, query: str, parameters: dict) -> None:
+        self.parameters = parameters
+
+    def fetchmany(self) -> list:
+        self.fetch_calls += 1
+        batch = self.rows[: self.arraysize]
+        self.rows = self.rows[self.arraysize :]
+        return batch
+
+
+class FakeConnection:
+    def __init__(self, rows: list) -> None:
+        self.fake_cursor = FakeCursor(rows)
+        self.closed = False
+
+    def cursor(self) -> FakeCursor:
+        return self.fake_cursor
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_db(monkeypatch: pytest.MonkeyPatch):
+    def make(rows: list) -> tuple[OracleDB, FakeConnection]:
+        conn = FakeConnection(rows)
+        db = OracleDB()
+        monkeypatch.setattr(db, "connect_to_db", lambda: conn)
+        return db, conn
+
+    return make
+
+
+def test_iter_rows_streams_in_batches(fake_db) -> None:
+    rows = [(str(9000000000 + i), 4001) for i in range(5)]
+    db, conn = fake_db(rows)
+
+    result = list(db.iter_rows("SELECT ...", {"status": 4001}, arraysize=2))
+
+    assert len(result) == 5
+    assert result[0] == {
+        "subject_nhs_number": "9000000000",
+        "screening_status_id": 4001,
+    }
+    assert conn.fake_cursor.arraysize == 2
+    assert conn.fake_cursor.fetch_calls == 4  # 3 batches and the final empty fetch
+    assert conn.closed
+
+
+def test_iter_rows_binds_lists_as_collections(
+    fake_db, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db, conn = fake_db([])
+    monkeypatch.setattr(
+        db, "string_list", lambda conn, values: ("ODCIVARCHAR2LIST", tuple(values))
+    )
+
+    list(db.iter_rows("SELECT ...", {"nhs_numbers": ["9000000001"], "status": 4001}))
+
+    assert conn.fake_cursor.parameters == {
+        "nhs_numbers": ("ODCIVARCHAR2LIST", ("9000000001",)),
+        "status": 4001,
+    }
+
+
+def test_fetch_one_and_fetch_scalar(fake_db) -> None:
+    db, conn = fake_db([("9000000001", 4004), ("9000000002", 4005)])
+    assert db.fetch_one("SELECT ...") == {
+        "subject_nhs_number": "9000000001",
+        "screening_status_id": 4004,
+    }
+    assert conn.closed
+
+    db, _ = fake_db([("9000000001", 4004)])
+    assert db.fetch_scalar("SELECT ...") == "9000000001"
+
+    db, _ = fake_db([])
+    assert db.fetch_one("SELECT ...") is None
+    assert db.fetch_scalar("SELECT ...") is None
+
+
+class FakeProcedureCursor:
+    def __init__(self, failing_subject_ids: set) -> None:
+        self.failing_subject_ids = failing_subject_ids
+        self.calls = []
+
+    def callproc(self, procedure: str, params: list) -> None:
+        self.calls.append(params[0])
+        if params[0] in self.failing_subject_ids:
+            raise RuntimeError("ORA-20000: timed events failed")
+
+
+def test_exec_bcss_timed_events_for_subjects(monkeypatch: pytest.MonkeyPatch) -> None:
+    db = OracleDB()
+    cursor = FakeProcedureCursor(failing_subject_ids={2})
+    connections = []
+
+    def connect_to_db() -> FakeConnection:
+        conn = FakeConnection([])
+        conn.fake_cursor = cursor
+        connections.append(conn)
+        return conn
+
+    monkeypatch.setattr(db, "connect_to_db", connect_to_db)
+    monkeypatch.setattr(
+        db,
+        "get_subject_ids_from_nhs_numbers",
+        lambda nhs_numbers: {"9000000001": 1, "9000000002": 2},
+    )
+
+    results = db.exec_bcss_timed_events_for_subjects(
+        ["9000000001", "9000000002", "9000000003", "9000000001"]
+    )
+
+    assert [result.nhs_number for result in results] == [
+        "9000000001",
+        "9000000002",
+        "9000000003",
+    ]
+    assert results[0].success and results[0].subject_id == 1
+    assert not results[1].success and "ORA-20000" in results[1].error
+    assert not results[2].success and results[2].subject_id is None
+    assert cursor.calls == [1, 2]
+    assert len(connections) == 1 and connections[0].closed
+
+
+class FakeBatchError:
+    def __init__(self, offset: int, message: str) -> None:
+        self.offset = offset
+        self.message = message
+
+
+class FakeBulkCursor:
+    def executemany(
+        self,
+        statement: str,
+        params_list: list,
+        batcherrors: bool,
+        arraydmlrowcounts: bool,
+    ) -> None:
+        self.params_list = params_list
+
+    def getbatcherrors(self) -> list:
+        return [FakeBatchError(1, "ORA-00001: unique constraint violated")]
+
+    def getarraydmlrowcounts(self) -> list:
+        return [1, 0, 1]
+
+
+class FakeBulkConnection(FakeConnection):
+    def __init__(self) -> None:
+        super().__init__([])
+        self.fake_cursor = FakeBulkCursor()
+        self.committed = False
+        self.rolled_back = False
+
+    def commit(self) -> None:
+        self.committed = True
+
+    def rollback(self) -> None:
+        self.rolled_back = True
+
+
+@pytest.mark.parametrize("rollback_on_error", [False, True])
+def test_bulk_update_or_insert_data_to_table(
+    monkeypatch: pytest.MonkeyPatch, rollback_on_error: bool
+) -> None:
+    db = OracleDB()
+    conn = FakeBulkConnection()
+    monkeypatch.setattr(db, "connect_to_db", lambda: conn)
+
+    result = db.bulk_update_or_insert_data_to_table(
+        "INSERT INTO example_table (val) VALUES (:val)",
+        [{"val": 1}, {"val": 1}, {"val": 2}],
+        rollback_on_error=rollback_on_error,
+    )
+
+    assert result.row_counts == [1, 0, 1]
+    assert result.total_rows_affected() == 2
+    assert not result.is_success()
+    assert result.errors == {1: "ORA-00001: unique constraint violated"}
+    assert result.committed is not rollback_on_error
+    assert conn.committed is not rollback_on_error
+    assert conn.rolled_back is rollback_on_error
+    assert conn.closed
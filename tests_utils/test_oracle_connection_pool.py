@@ -0,0 +1,97 @@
+import pytest
+import utils.oracle.oracle_connection_pool as oracle_connection_pool
+from utils.oracle.oracle_connection_pool import OracleConnectionPool
+
+pytestmark = [pytest.mark.utils]
+
+
+class FakePool:
+    def __init__(self, max_size: int, **kwargs) -> None:
+        self.max = max_size
+        self.kwargs = kwargs
+        self.busy = 0
+        self.closed = False
+        self.timed_out = False
+
+    def acquire(self) -> object:
+        if self.timed_out:
+            raise oracle_connection_pool.oracledb.DatabaseError("DPY-4005: timed out")
+        self.busy += 1
+        return object()
+
+    def close(self, force: bool = False) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_pool(monkeypatch: pytest.MonkeyPatch) -> list:
+    created = []
+
+    def create_pool(**kwargs) -> FakePool:
+        pool = FakePool(kwargs["max"], **kwargs)
+        created.append(pool)
+        return pool
+
+    monkeypatch.setattr(oracle_connection_pool.oracledb, "create_pool", create_pool)
+    return created
+
+
+def test_pool_is_created_lazily(fake_pool: list) -> None:
+    pool = OracleConnectionPool(min_size=1, max_size=2)
+    assert not pool.is_open()
+    assert fake_pool == []
+
+    pool.acquire()
+    assert pool.is_open()
+    assert len(fake_pool) == 1
+
+
+def test_pool_statistics(fake_pool: list) -> None:
+    pool = OracleConnectionPool(min_size=1, max_size=2)
+    pool.acquire()
+    pool.acquire()
+    pool.acquire()  # The fake pool is now fully busy, so this counts as a wait
+
+    statistics = pool.close()
+    assert statistics.acquires == 3
+    assert statistics.waits == 1
+    assert statistics.peak_busy == 3
+    assert fake_pool[0].closed
+    assert not pool.is_open()
+
+
+def test_waiting_for_a_busy_pool_times_out(fake_pool: list) -> None:
+    pool = OracleConnectionPool(min_size=1, max_size=1, wait_timeout_seconds=5)
+    pool.acquire()
+    assert fake_pool[0].kwargs["getmode"] == (
+        oracle_connection_pool.oracledb.POOL_GETMODE_TIMEDWAIT
+    )
+    assert fake_pool[0].kwargs["wait_timeout"] == 5000
+
+    fake_pool[0].timed_out = True
+    with pytest.raises(RuntimeError, match="within 5 seconds"):
+        pool.acquire()
+
+
+def test_pool_sizing_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ORACLE_POOL_MIN", "2")
+    monkeypatch.setenv("ORACLE_POOL_MAX", "8")
+    monkeypatch.setenv("ORACLE_POOL_INCREMENT", "")
+    pool = OracleConnectionPool.from_environment()
+    assert pool.min_size == 2
+    assert pool.max_size == 8
+    assert pool.increment == oracle_connection_pool.DEFAULT_POOL_INCREMENT
+    assert (
+        pool.wait_timeout_seconds
+        == oracle_connection_pool.DEFAULT_POOL_WAIT_TIMEOUT_SECONDS
+    )
+
+    monkeypatch.setenv("ORACLE_POOL_WAIT_TIMEOUT_SECONDS", "30")
+    assert OracleConnectionPool.from_environment().wait_timeout_seconds == 30
+
+    monkeypatch.setenv("ORACLE_POOL_MAX", "lots")
+    with pytest.raises(ValueError, match="ORACLE_POOL_MAX must be an integer"):
+        OracleConnectionPool.from_environment()
+
+    with pytest.raises(ValueError, match="Invalid pool sizing"):
+        OracleConnectionPool(min_size=5, max_size=2)
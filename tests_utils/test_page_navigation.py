@@ -0,0 +1,112 @@
+import pytest
+import utils.page_navigation as page_navigation
+from utils.page_navigation import Route, navigate_to
+
+pytestmark = [pytest.mark.utils]
+
+BASE_URL = "https://bcss.example"
+
+
+class FakeTitle:
+    def __init__(self, page):
+        self.page = page
+
+    @property
+    def first(self):
+        return self
+
+    def count(self):
+        return 1
+
+    def inner_text(self):
+        return self.page.title
+
+
+class FakePage:
+    def __init__(self):
+        self.url = f"{BASE_URL}/"
+        self.title = "Main Menu"
+        self.visits = []
+        self.redirect_to = None
+
+    def goto(self, url):
+        self.visits.append(url)
+        if self.redirect_to:
+            self.url, self.title = self.redirect_to
+        else:
+            self.url = url if url.startswith("http") else f"{BASE_URL}{url}"
+            self.title = "Active Batch List"
+
+    def locator(self, selector):
+        return FakeTitle(self)
+
+
+class FakeBasePage:
+    def __init__(self, page):
+        self.page = page
+
+    def click_main_menu_link(self):
+        self.page.visits.append("menu")
+        self.page.url, self.page.title = f"{BASE_URL}/menu", "Main Menu"
+
+
+class FakeCommunicationsProductionPage(FakeBasePage):
+    def go_to_active_batch_list_page(self):
+        self.page.visits.append("click")
+        self.page.url = f"{BASE_URL}/letters/activebatchlist"
+        self.page.title = "Active Batch List"
+
+
+@pytest.fixture(autouse=True)
+def fake_routes(monkeypatch):
+    monkeypatch.setattr(page_navigation, "BasePage", FakeBasePage)
+    monkeypatch.setattr(page_navigation, "_learnt_urls", {})
+    monkeypatch.delenv("NAVIGATION_CLICK_THROUGH", raising=False)
+    monkeypatch.setitem(
+        page_navigation.ROUTES,
+        "active_batch_list",
+        Route(
+            menu=((FakeCommunicationsProductionPage, "go_to_active_batch_list_page"),),
+            title="Active Batch List",
+        ),
+    )
+
+
+def test_pages_are_gone_to_directly_once_their_url_is_known() -> None:
+    page = FakePage()
+
+    navigate_to(page, "active_batch_list")
+    navigate_to(page, "active_batch_list")
+    assert page.visits == ["menu", "click", f"{BASE_URL}/letters/activebatchlist"]
+
+    navigate_to(page, "active_batch", batch_id=123)
+    assert page.visits[-1] == "/letters/activebatch/123"
+    with pytest.raises(ValueError):
+        navigate_to(page, "active_batch")
+    with pytest.raises(ValueError):
+        navigate_to(page, "unknown_page")
+
+
+def test_menus_are_clicked_through_when_asked_or_the_url_does_not_reach_the_page(
+    monkeypatch,
+) -> None:
+    page = FakePage()
+    navigate_to(page, "active_batch_list")
+
+    navigate_to(page, "active_batch_list", click_through=True)
+    assert page.visits[-2:] == ["menu", "click"]
+
+    monkeypatch.setenv("NAVIGATION_CLICK_THROUGH", "true")
+    navigate_to(page, "active_batch_list")
+    assert page.visits[-2:] == ["menu", "click"]
+    monkeypatch.delenv("NAVIGATION_CLICK_THROUGH")
+
+    # The session has moved on, so the remembered URL goes back to the main menu
+    page.redirect_to = (f"{BASE_URL}/menu", "Main Menu")
+    visits = len(page.visits)
+    navigate_to(page, "active_batch_list")
+    assert page.visits[visits:] == [
+        f"{BASE_URL}/letters/activebatchlist",
+        "menu",
+        "click",
+    ]
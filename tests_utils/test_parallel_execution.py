@@ -0,0 +1,119 @@
+import re
+import subprocess
+import sys
+import threading
+import pytest
+import utils.parallel_execution as parallel_execution
+from pathlib import Path
+from utils.oracle.subject_selection_query_builder import SubjectSelectionQueryBuilder
+from utils.parallel_execution import (
+    WorkerPartition,
+    group_conflicting_tests,
+    partition_properties,
+    resource_lock,
+)
+from classes.subject.subject import Subject
+from classes.user.user import User
+
+pytestmark = [pytest.mark.utils]
+
+properties = {
+    "screening_centre_code": "BCS001",
+    "eng_hub_id": "23159",
+    "parallel.screening_centre_code": "BCS001, BCS002",
+    "parallel.partition_subjects": "true",
+}
+
+
+def test_worker_properties_are_taken_from_the_parallel_values() -> None:
+    assert partition_properties(properties, 0, 1)["screening_centre_code"] == "BCS001"
+    assert partition_properties(properties, 1, 3)["screening_centre_code"] == "BCS002"
+    assert partition_properties(properties, 2, 3)["screening_centre_code"] == "BCS001"
+    assert partition_properties(properties, 1, 3)["eng_hub_id"] == "23159"
+
+
+def test_subject_selection_is_partitioned_by_worker(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        parallel_execution, "_worker_partition", WorkerPartition("gw2", 2, 4)
+    )
+    query, bind_vars = SubjectSelectionQueryBuilder().build_subject_selection_query(
+        {"screening status": "Call"}, User(), Subject(), use_cache=False
+    )
+    partition = re.search(r"MOD\(ss\.screening_subject_id, :(\w+)\) = :(\w+)", query)
+    assert partition is not None
+    assert (bind_vars[partition[1]], bind_vars[partition[2]]) == (4, 2)
+
+    query, _ = SubjectSelectionQueryBuilder().build_subject_selection_query(
+        {"nhs number": "9999999999"}, User(), Subject(), use_cache=False
+    )
+    assert "MOD(" not in query  # A specific subject is never filtered out
+
+    monkeypatch.setattr(
+        parallel_execution, "_worker_partition", WorkerPartition("master", 0, 1)
+    )
+    query, _ = SubjectSelectionQueryBuilder().build_subject_selection_query(
+        {"screening status": "Call"}, User(), Subject(), use_cache=False
+    )
+    assert "MOD(" not in query
+
+
+def test_resource_lock_is_held_across_processes(tmp_path: Path) -> None:
+    holder = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys, time; from pathlib import Path; from utils.parallel_execution import resource_lock\n"
+            f"with resource_lock('letter_batch_S1', directory=Path({str(tmp_path)!r})):\n"
+            "    print('locked', flush=True); time.sleep(30)",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+        cwd=Path(__file__).parent.parent,
+    )
+    try:
+        assert holder.stdout is not None and holder.stdout.readline() == "locked\n"
+        with pytest.raises(TimeoutError, match="letter_batch_S1"):
+            with resource_lock("letter_batch_S1", timeout=0.5, directory=tmp_path):
+                pass
+    finally:
+        holder.kill()
+        holder.wait()
+
+    # The lock is released when the process holding it is killed, and is re-entrant
+    with resource_lock("letter_batch_S1", timeout=5, directory=tmp_path):
+        with resource_lock("letter_batch_S1", timeout=5, directory=tmp_path):
+            pass
+
+
+def test_resource_lock_blocks_other_threads(tmp_path: Path) -> None:
+    timed_out = []
+
+    def try_to_lock():
+        try:
+            with resource_lock("org_parameters_1", timeout=0.2, directory=tmp_path):
+                timed_out.append(False)
+        except TimeoutError:
+            timed_out.append(True)
+
+    with resource_lock("org_parameters_1", directory=tmp_path):
+        thread = threading.Thread(target=try_to_lock)
+        thread.start()
+        thread.join()
+    assert timed_out == [True]
+
+
+def test_conflicting_tests_are_grouped() -> None:
+    groups = group_conflicting_tests(
+        [
+            ("test_a", ["invitation_generation"]),
+            ("test_b", ["invitation_plans"]),
+            ("test_c", ["invitation_plans", "invitation_generation"]),
+            ("test_d", ["org_parameters"]),
+            ("test_e", []),
+        ]
+    )
+    assert groups["test_a"] == groups["test_b"] == groups["test_c"]
+    assert groups["test_d"] == "org_parameters"
+    assert "test_e" not in groups
@@ -0,0 +1,135 @@
+import pytest
+import utils.oracle.reference_data_cache as reference_data_cache
+from classes.screening.screening_status_type import ScreeningStatusType
+from utils.oracle.reference_data_cache import ReferenceDataCache, in_list_clause
+
+pytestmark = [pytest.mark.utils]
+
+tables = {
+    "valid_values": [
+        {
+            "valid_value_id": 4001,
+            "domain": "SCREENING_STATUS",
+            "allowed_value": "C",
+            "description": "Call",
+        },
+        {
+            "valid_value_id": 4002,
+            "domain": "SCREENING_STATUS",
+            "allowed_value": "I",
+            "description": "Inactive",
+        },
+        {
+            "valid_value_id": 4004,
+            "domain": "SCREENING_STATUS",
+            "allowed_value": "R",
+            "description": "Recall (renamed)",
+        },
+    ],
+    "message_types": [
+        {"message_type_id": 1, "message_attribute_id": None, "description": "Info"}
+    ],
+    "org": [{"org_id": 1, "org_code": "BCS01"}],
+}
+
+
+def test_lookups_are_served_from_memory() -> None:
+    cache = ReferenceDataCache(tables)
+
+    assert cache.valid_value(4001)["description"] == "Call"
+    assert cache.valid_value_ids(allowed_value="I") == [4002]
+    assert cache.valid_value_ids(description="CALL", domain="SCREENING_STATUS") == [
+        4001
+    ]
+    assert cache.valid_value_ids(description="Unknown") == []
+    assert cache.message_type(1)["description"] == "Info"
+    assert cache.org_id("BCS01") == 1
+    assert cache.org_code(1) == "BCS01"
+    assert not ReferenceDataCache({}).has_table("valid_values")
+
+
+def test_snapshot_round_trip_keeps_the_version(tmp_path) -> None:
+    snapshot = tmp_path / "snapshots" / "reference_data.json"
+    cache = ReferenceDataCache(tables)
+    cache.save_snapshot(snapshot)
+
+    loaded = ReferenceDataCache.from_snapshot(snapshot)
+    assert loaded.version == cache.version
+    assert loaded.created == cache.created
+    assert not loaded.is_stale()
+    assert ReferenceDataCache({"org": []}).version != cache.version
+
+
+def test_drift_report_flags_changed_members() -> None:
+    drift = ReferenceDataCache(tables).drift_report([ScreeningStatusType])
+    drift_by_member = {item.member_name: item for item in drift}
+
+    assert "CALL" not in drift_by_member
+    assert drift_by_member["RECALL"].reason == "description mismatch"
+    assert drift_by_member["RECALL"].db_value == "Recall (renamed)"
+    assert drift_by_member["CEASED"].reason == "missing"
+    assert "NULL" not in drift_by_member  # Members without a valid value ID are ignored
+
+    with pytest.raises(ValueError, match="valid_values"):
+        ReferenceDataCache({}).drift_report([ScreeningStatusType])
+
+
+def test_stale_snapshot_is_used_when_the_database_is_unavailable(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    snapshot = tmp_path / "reference_data.json"
+    ReferenceDataCache(tables, created="2020-01-01T00:00:00+00:00").save_snapshot(
+        snapshot
+    )
+    monkeypatch.setenv("REFERENCE_DATA_SNAPSHOT", str(snapshot))
+    monkeypatch.setattr(reference_data_cache, "_session_cache", None)
+
+    def database_unavailable():
+        raise RuntimeError("no connection")
+
+    monkeypatch.setattr(ReferenceDataCache, "from_database", database_unavailable)
+    cache = reference_data_cache.get_reference_data_cache()
+    assert cache.valid_value_ids(allowed_value="C") == [4001]
+
+    def table_unavailable(table):
+        raise RuntimeError("no connection")
+
+    monkeypatch.setattr(
+        reference_data_cache, "_load_table_from_database", table_unavailable
+    )
+    monkeypatch.setenv("REFERENCE_DATA_SNAPSHOT", "")
+    monkeypatch.setattr(reference_data_cache, "_session_cache", None)
+    assert not reference_data_cache.get_reference_data_cache().has_table("org")
+
+
+def test_tables_are_loaded_when_first_used_without_a_snapshot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loaded = []
+
+    def load_table(table):
+        loaded.append(table)
+        return tables[table]
+
+    monkeypatch.setattr(reference_data_cache, "_load_table_from_database", load_table)
+    monkeypatch.delenv("REFERENCE_DATA_SNAPSHOT", raising=False)
+    monkeypatch.setattr(reference_data_cache, "_session_cache", None)
+    cache = reference_data_cache.get_reference_data_cache()
+    assert loaded == []
+
+    assert cache.valid_value_ids(allowed_value="C") == [4001]
+    assert cache.valid_value_ids(description="inactive") == [4002]
+    assert cache.has_table("valid_values")
+    assert loaded == ["valid_values"]
+    assert "org=not loaded" in cache.summary()
+
+    assert cache.org_id("BCS01") == 1
+    assert loaded == ["valid_values", "org"]
+
+
+def test_in_list_clause() -> None:
+    assert in_list_clause("lb.status_id", "status_id", [1, 2]) == (
+        "lb.status_id IN (:status_id_0, :status_id_1)",
+        {"status_id_0": 1, "status_id_1": 2},
+    )
+    assert in_list_clause("lb.status_id", "status_id", []) == ("1=0", {})
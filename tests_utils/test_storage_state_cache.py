@@ -0,0 +1,143 @@
+import os
+import time
+import pytest
+import utils.storage_state_cache
+import utils.user_tools
+from pathlib import Path
+from utils.storage_state_cache import StorageStateCache
+from utils.user_tools import UserTools
+
+pytestmark = [pytest.mark.utils]
+
+state = {"cookies": [{"name": "session", "value": "abc"}], "origins": []}
+
+
+def test_sessions_are_reused_within_the_test_session(tmp_path) -> None:
+    cache = StorageStateCache("https://bcss", directory=tmp_path)
+    assert cache.get("Hub Manager at BCS01") is None
+
+    cache.save("Hub Manager at BCS01", state)
+    assert cache.get("Hub Manager at BCS01") == state
+    assert cache.get("Screening Centre Manager at BCS001") is None
+    assert list(tmp_path.iterdir()) == []  # Only saved to disk when a TTL is set
+
+    cache.invalidate("Hub Manager at BCS01")
+    assert cache.get("Hub Manager at BCS01") is None
+    assert "reused=1, logins=3, rejected=1" in cache.summary()
+
+
+def test_sessions_are_keyed_by_base_url_and_worker(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    cache = StorageStateCache("https://bcss", directory=tmp_path)
+    cache.save("Hub Manager at BCS01", state)
+
+    cache.base_url = "https://other-bcss"
+    assert cache.get("Hub Manager at BCS01") is None
+    cache.base_url = "https://bcss"
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    assert cache.get("Hub Manager at BCS01") is None
+
+
+def test_sessions_are_persisted_until_the_ttl_expires(tmp_path) -> None:
+    StorageStateCache("https://bcss", ttl_minutes=30, directory=tmp_path).save(
+        "Hub Manager at BCS01", state
+    )
+    assert len(list(tmp_path.iterdir())) == 1
+
+    later_session = StorageStateCache(
+        "https://bcss", ttl_minutes=30, directory=tmp_path
+    )
+    assert later_session.get("Hub Manager at BCS01") == state
+
+    saved_file = next(tmp_path.iterdir())
+    an_hour_ago = time.time() - 3600
+    os.utime(saved_file, (an_hour_ago, an_hour_ago))
+    expired_session = StorageStateCache(
+        "https://bcss", ttl_minutes=30, directory=tmp_path
+    )
+    assert expired_session.get("Hub Manager at BCS01") is None
+
+    disabled = StorageStateCache("https://bcss", enabled=False, directory=tmp_path)
+    disabled.save("Hub Manager at BCS01", state)
+    assert disabled.get("Hub Manager at BCS01") is None
+
+
+class FakeContext:
+    def __init__(self):
+        self.cookies = []
+
+    def clear_cookies(self):
+        self.cookies = []
+
+    def add_cookies(self, cookies):
+        self.cookies.extend(cookies)
+
+    def storage_state(self):
+        return {"cookies": list(self.cookies), "origins": []}
+
+
+class FakePage:
+    def __init__(self):
+        self.context = FakeContext()
+        self.visited = []
+
+    def goto(self, url):
+        self.visited.append(url)
+
+
+def test_user_login_falls_back_to_cognito_when_the_session_is_rejected(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    logins = []
+
+    class FakeCognitoLoginPage:
+        def __init__(self, page):
+            self.page = page
+
+        def login_as_user(self, username, password):
+            logins.append(username)
+            self.page.context.add_cookies([{"name": "session", "value": username}])
+
+    cache = StorageStateCache("https://bcss", directory=tmp_path)
+    accepted_sessions = []
+    monkeypatch.setattr(
+        utils.user_tools,
+        "USERS_FILE",
+        Path(__file__).parent / "resources" / "test_users.json",
+    )
+    monkeypatch.setattr(utils.user_tools, "get_storage_state_cache", lambda: cache)
+    monkeypatch.setattr(utils.user_tools, "CognitoLoginPage", FakeCognitoLoginPage)
+    monkeypatch.setattr(
+        UserTools,
+        "_is_main_menu_displayed",
+        staticmethod(
+            lambda page, after_login=False: after_login
+            or page.context.cookies[0]["value"] in accepted_sessions
+        ),
+    )
+    monkeypatch.setenv("BCSS_PASS", "password")
+
+    page = FakePage()
+    UserTools.user_login(page, "Test User")
+    accepted_sessions.append("TEST_USER1")
+    UserTools.user_login(page, "Test User")
+    assert logins == ["TEST_USER1"]  # The second login reused the stored session
+
+    accepted_sessions.clear()
+    UserTools.user_login(page, "Test User")
+    assert logins == ["TEST_USER1", "TEST_USER1"]
+    assert cache.rejections == 1
+    assert cache.get("Test User") is not None
+
+
+def test_the_cache_is_only_enabled_when_opted_in(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(utils.storage_state_cache, "_session_cache", None)
+    monkeypatch.delenv("STORAGE_STATE_CACHE", raising=False)
+    assert not utils.storage_state_cache.get_storage_state_cache().enabled
+
+    monkeypatch.setattr(utils.storage_state_cache, "_session_cache", None)
+    monkeypatch.setenv("STORAGE_STATE_CACHE", "true")
+    assert utils.storage_state_cache.get_storage_state_cache().enabled
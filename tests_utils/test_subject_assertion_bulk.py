@@ -0,0 +1,62 @@
+import pytest
+import utils.subject_assertion as subject_assertion_module
+from utils.subject_assertion import subject_assertion_bulk
+
+pytestmark = [pytest.mark.utils]
+
+criteria = {
+    "nhs number": "ignored",
+    "subject age": "> 60",
+    "subject has episodes": "yes",
+}
+
+
+def fake_iter_rows(self, query: str, parameters: dict | None = None):
+    bound_nhs_numbers = parameters["nhs_numbers"]
+    if "criterion_2" in query:
+        rows = {"9990000001": (1, 1), "9990000002": (1, 0)}
+    elif "MONTHS_BETWEEN" in query:
+        rows = {"9990000003": (1,)}
+    else:
+        rows = {}
+    for nhs_number in bound_nhs_numbers:
+        if nhs_number in rows:
+            row = {"subject_nhs_number": nhs_number}
+            for index, value in enumerate(rows[nhs_number], start=1):
+                row[f"criterion_{index}"] = value
+            yield row
+
+
+@pytest.fixture
+def fake_db(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(subject_assertion_module.OracleDB, "iter_rows", fake_iter_rows)
+    monkeypatch.setattr(
+        subject_assertion_module.OracleDB,
+        "get_subject_ids_from_nhs_numbers",
+        lambda self, nhs_numbers: {"9990000003": 3},
+    )
+
+
+def test_subject_assertion_bulk(fake_db: None) -> None:
+    results = subject_assertion_bulk(
+        ["9990000001", "9990000002", "9990000003", "9990000004"], criteria
+    )
+
+    assert results["9990000001"].passed
+    assert results["9990000002"].failed_criteria == [("subject has episodes", "yes")]
+    assert results["9990000003"].failed_criteria == [("subject has episodes", "yes")]
+    assert results["9990000004"].failed_criteria == [("nhs number", "9990000004")]
+    assert not any(
+        results[nhs_number].passed
+        for nhs_number in ["9990000002", "9990000003", "9990000004"]
+    )
+
+
+def test_subject_assertion_bulk_chunks_nhs_numbers(
+    fake_db: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(subject_assertion_module, "BULK_ASSERTION_CHUNK_SIZE", 1)
+    results = subject_assertion_bulk(["9990000001", "9990000002"], criteria)
+
+    assert results["9990000001"].passed
+    assert not results["9990000002"].passed
@@ -1,8 +1,12 @@
+import re
 import pytest
 from utils.oracle.subject_selection_query_builder import (
     SubjectSelectionQueryBuilder,
     SubjectSelectionCriteriaKey,
 )
+from classes.subject_selection_query_builder.selection_builder_exception import (
+    SelectionBuilderException,
+)
 from classes.subject.subject import Subject
 from classes.user.user import User
 
@@ -71,3 +75,198 @@ def test_dispatch_known_key_executes(builder, dummy_user, dummy_subject):
     where_clause = " ".join(builder.sql_where)
     assert "c.date_of_birth" in where_clause
     assert "FLOOR(MONTHS_BETWEEN(TRUNC(SYSDATE), c.date_of_birth)/12)" in where_clause
+
+
+def test_criteria_values_are_bound(builder, dummy_user, dummy_subject):
+    criteria = {
+        "subject age": "> 28",
+        "latest episode type": "FOBT",
+        "screening due date": "2020-01-01",
+    }
+    query, bind_vars = builder.build_subject_selection_query(
+        criteria, dummy_user, dummy_subject, enable_logging=False
+    )
+
+    assert "> :b1" in query
+    assert "TO_DATE( :b3, 'yyyy-mm-dd')" in query
+    assert "FETCH FIRST :b4 ROWS ONLY" in query
+    assert "2020-01-01" not in query
+    assert bind_vars["b1"] == 28
+    assert bind_vars["b3"] == "2020-01-01"
+    assert bind_vars["b4"] == 1
+    assert sorted(re.findall(r":(\w+)", query)) == sorted(bind_vars)
+
+
+def test_same_criteria_shape_gives_identical_sql(dummy_user, dummy_subject):
+    (
+        first_query,
+        first_bind_vars,
+    ) = SubjectSelectionQueryBuilder().build_subject_selection_query(
+        {"subject age": "Between 60 and 72", "subject hub code": "BCS01"},
+        dummy_user,
+        dummy_subject,
+        subjects_to_retrieve=1,
+        enable_logging=False,
+    )
+    (
+        second_query,
+        second_bind_vars,
+    ) = SubjectSelectionQueryBuilder().build_subject_selection_query(
+        {"subject age": "Between 50 and 55", "subject hub code": "BCS02"},
+        dummy_user,
+        dummy_subject,
+        subjects_to_retrieve=5,
+        enable_logging=False,
+    )
+
+    assert first_query == second_query
+    assert first_bind_vars == {"b1": 60, "b2": 72, "b3": "BCS01", "b4": 1}
+    assert second_bind_vars == {"b1": 50, "b2": 55, "b3": "BCS02", "b4": 5}
+
+
+def test_repeat_build_uses_query_cache(dummy_user, dummy_subject):
+    SubjectSelectionQueryBuilder.query_cache.clear()
+    criteria = {"nhs number": "9990000001", "subject has episodes": "yes"}
+    first_query, _ = SubjectSelectionQueryBuilder().build_subject_selection_query(
+        criteria, dummy_user, dummy_subject, enable_logging=False
+    )
+    criteria["nhs number"] = "9990000002"
+    (
+        second_query,
+        second_bind_vars,
+    ) = SubjectSelectionQueryBuilder().build_subject_selection_query(
+        criteria,
+        dummy_user,
+        dummy_subject,
+        subjects_to_retrieve=3,
+        enable_logging=False,
+    )
+
+    assert second_query == first_query
+    assert second_bind_vars["nhs_number"] == "9990000002"
+    assert second_bind_vars[re.search(r"FETCH FIRST :(\w+)", second_query)[1]] == 3
+    assert SubjectSelectionQueryBuilder.query_cache.hits == 1
+    assert SubjectSelectionQueryBuilder.query_cache.misses == 1
+
+
+def test_unchanged_criteria_bypass_query_cache(dummy_user, dummy_subject):
+    SubjectSelectionQueryBuilder.query_cache.clear()
+    dummy_subject.screening_status_id = 4001
+    SubjectSelectionQueryBuilder().build_subject_selection_query(
+        {"screening status": "unchanged"},
+        dummy_user,
+        dummy_subject,
+        enable_logging=False,
+    )
+
+    assert len(SubjectSelectionQueryBuilder.query_cache) == 0
+    assert SubjectSelectionQueryBuilder.query_cache.misses == 0
+
+
+def test_criteria_diagnosis_query_has_column_per_criterion(dummy_user, dummy_subject):
+    criteria = {
+        "nhs number": "9990000001",
+        "subject age": "> 60",
+        "subject hub code": "#BCS01",
+        "subject has episodes": "yes",
+    }
+    (
+        query,
+        bind_vars,
+        column_criteria,
+    ) = SubjectSelectionQueryBuilder().build_criteria_diagnosis_query(
+        criteria,
+        dummy_user,
+        dummy_subject,
+        base_criteria_keys=["nhs number"],
+        enable_logging=False,
+    )
+
+    assert column_criteria == {
+        "criterion_1": "subject age",
+        "criterion_2": "subject has episodes",
+    }
+    assert query.startswith("SELECT MAX(CASE WHEN (")
+    assert query.count("THEN 1 ELSE 0 END) AS criterion_") == 2
+    assert "FETCH FIRST" not in query
+    where_clause = query.split(" WHERE 1=1 ")[-1]
+    assert ":nhs_number" in where_clause
+    assert ":b1" not in where_clause
+    assert sorted(set(re.findall(r":(\w+)", query))) == sorted(bind_vars)
+
+
+def test_criteria_values_share_cached_query(dummy_user, dummy_subject):
+    SubjectSelectionQueryBuilder.query_cache.clear()
+    first_query, _ = SubjectSelectionQueryBuilder().build_subject_selection_query(
+        {"subject age": "> 60", "note count": "Between 1 and 3"},
+        dummy_user,
+        dummy_subject,
+        enable_logging=False,
+    )
+    (
+        second_query,
+        second_bind_vars,
+    ) = SubjectSelectionQueryBuilder().build_subject_selection_query(
+        {"subject age": "> 70", "note count": "Between 2 and 5"},
+        dummy_user,
+        dummy_subject,
+        enable_logging=False,
+    )
+    SubjectSelectionQueryBuilder().build_subject_selection_query(
+        {"subject age": "< 70", "note count": "Between 2 and 5"},
+        dummy_user,
+        dummy_subject,
+        enable_logging=False,
+    )
+
+    assert second_query == first_query
+    assert second_bind_vars == {"b1": 70, "b2": 2, "b3": 5, "b4": 1}
+    assert SubjectSelectionQueryBuilder.query_cache.hits == 1
+    assert len(SubjectSelectionQueryBuilder.query_cache) == 2
+
+
+def test_invalid_criteria_are_rejected_on_cache_hit(dummy_user, dummy_subject):
+    SubjectSelectionQueryBuilder.query_cache.clear()
+    SubjectSelectionQueryBuilder().build_subject_selection_query(
+        {"nhs number": "9990000001"}, dummy_user, dummy_subject, enable_logging=False
+    )
+
+    with pytest.raises(SelectionBuilderException):
+        SubjectSelectionQueryBuilder().build_subject_selection_query(
+            {"nhs number": "NOT: 9990000001"},
+            dummy_user,
+            dummy_subject,
+            enable_logging=False,
+        )
+    with pytest.raises(ValueError, match="'NOT:' qualifier"):
+        SubjectSelectionQueryBuilder().build_subject_selection_query(
+            {"subject age": "NOT: null"},
+            dummy_user,
+            dummy_subject,
+            enable_logging=False,
+        )
+    assert SubjectSelectionQueryBuilder.query_cache.hits == 0
+
+
+def test_criteria_diagnosis_query_binds_nhs_numbers_as_one_list(
+    dummy_user, dummy_subject
+):
+    queries = []
+    for nhs_numbers in (["9990000001"], ["9990000001", "9990000002", "9990000003"]):
+        (
+            query,
+            bind_vars,
+            _,
+        ) = SubjectSelectionQueryBuilder().build_criteria_diagnosis_query(
+            {"subject has episodes": "yes"},
+            dummy_user,
+            dummy_subject,
+            base_criteria_keys=[],
+            enable_logging=False,
+            nhs_numbers=nhs_numbers,
+        )
+        queries.append(query)
+        assert bind_vars["nhs_numbers"] == nhs_numbers
+
+    assert queries[0] == queries[1]
+    assert "IN (SELECT column_value FROM TABLE(:nhs_numbers))" in queries[0]
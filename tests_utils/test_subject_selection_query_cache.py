@@ -0,0 +1,41 @@
+import pytest
+from utils.oracle.subject_selection_query_cache import (
+    CachedQueryTemplate,
+    SubjectSelectionQueryCache,
+)
+
+pytestmark = [pytest.mark.utils]
+
+
+def test_least_recently_used_template_is_evicted() -> None:
+    cache = SubjectSelectionQueryCache(max_size=2)
+    cache.put("a", CachedQueryTemplate("query a", {}))
+    cache.put("b", CachedQueryTemplate("query b", {}))
+    assert cache.get("a") is not None  # "b" is now the least recently used
+    cache.put("c", CachedQueryTemplate("query c", {}))
+
+    assert cache.get("b") is None
+    assert cache.get("c").query == "query c"
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 1, 1)
+    assert "hit_rate=66.7%" in cache.summary()
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+
+
+def test_template_rebinds_values() -> None:
+    template = CachedQueryTemplate(
+        query="SELECT ... WHERE c.nhs_number = :nhs_number FETCH FIRST :b2 ROWS ONLY",
+        bind_vars={"b1": 4001, "nhs_number": "9990000001", "b2": 1},
+        value_binds={"nhs number": ["nhs_number"]},
+        row_count_bind="b2",
+    )
+
+    bind_vars = template.bind({"nhs number": ["9990000002"]}, 10)
+    assert bind_vars == {"b1": 4001, "nhs_number": "9990000002", "b2": 10}
+    assert template.bind_vars["nhs_number"] == "9990000001"
+
+    with pytest.raises(ValueError, match="Invalid cache size"):
+        SubjectSelectionQueryCache(max_size=0)
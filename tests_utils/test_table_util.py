@@ -0,0 +1,185 @@
+import pytest
+from types import SimpleNamespace
+from utils.table_util import (
+    TableUtils,
+    TABLE_HEADERS_SCRIPT,
+    TABLE_NEXT_PAGE_SCRIPT,
+    TABLE_ROW_CELLS_SCRIPT,
+    TABLE_SNAPSHOT_SCRIPT,
+)
+
+pytestmark = [pytest.mark.utils]
+
+
+def table_page(headers: list[str], rows: list[list[str]]) -> dict:
+    return {
+        "headers": headers,
+        "column_headers": headers,
+        "second_row_headers": [],
+        "header_version": "1",
+        "rows": rows,
+        "empty": False,
+    }
+
+
+class FakeTable:
+    def __init__(self, pages: list[dict]):
+        self.pages = pages
+        self.current_page = 0
+        self.calls = []
+
+    @property
+    def first(self):
+        return self
+
+    def nth(self, index):
+        return ("row", index)
+
+    def evaluate(self, script, arg=None):
+        self.calls.append(script)
+        if script == TABLE_NEXT_PAGE_SCRIPT:
+            if self.current_page + 1 >= len(self.pages):
+                return False
+            self.current_page += 1
+            return True
+        table = self.pages[self.current_page]
+        if script == TABLE_ROW_CELLS_SCRIPT:
+            row_index, column_indexes = arg
+            row = table["rows"][row_index - 1]
+            return {
+                "header_version": table["header_version"],
+                "cells": [row[index - 1] for index in column_indexes],
+            }
+        assert script in (TABLE_SNAPSHOT_SCRIPT, TABLE_HEADERS_SCRIPT)
+        return table
+
+
+class FakePage:
+    def __init__(self, table: FakeTable):
+        self.table = table
+        self.navigation_handlers = []
+
+    def locator(self, selector):
+        return self.table
+
+    def on(self, event, handler):
+        assert event == "framenavigated"
+        self.navigation_handlers.append(handler)
+
+    def navigate(self):
+        for handler in self.navigation_handlers:
+            handler(SimpleNamespace(parent_frame=None))
+
+
+subjects = table_page(
+    ["NHS Number", "Surname", "Status"],
+    [
+        ["9990000001", "SMITH", "Active"],
+        ["9990000002", "JONES ", "Inactive"],
+        ["9990000003", "BROWN", "Active"],
+    ],
+)
+
+
+def test_table_is_read_in_a_single_call() -> None:
+    table = FakeTable([subjects])
+    table_utils = TableUtils(FakePage(table), "#subjects")
+
+    full_table = table_utils.get_full_table_with_headers()
+
+    assert len(table.calls) == 1
+    assert full_table[2] == {
+        "NHS Number": "9990000002",
+        "Surname": "JONES ",
+        "Status": "Inactive",
+    }
+    assert table_utils.get_row_data_with_headers(0)["Surname"] == "SMITH"
+    assert table_utils.get_cell_value("status", 3) == "Active"
+    assert table_utils.get_row_index("Surname", "JONES") == 2
+    assert table_utils.get_row_where({"Surname": "BROWN", "Status": "Active"}) == (
+        "row",
+        2,
+    )
+    assert table_utils.get_row_where({"Surname": "GREEN"}) is None
+    with pytest.raises(ValueError):
+        table_utils.get_cell_value("Date of Birth", 1)
+    with pytest.raises(ValueError):
+        table_utils.get_row_index("Surname", "GREEN")
+
+
+def test_rows_are_streamed_across_datatables_pages() -> None:
+    second_page = table_page(
+        ["NHS Number", "Surname", "Status"], [["9990000004", "GREEN", "Active"]]
+    )
+    table = FakeTable([subjects, second_page])
+    table_utils = TableUtils(FakePage(table), "#subjects")
+
+    assert len(table_utils.get_table_data()) == 3
+
+    dataframe = table_utils.get_table_dataframe(all_pages=True)
+    assert list(dataframe["Surname"]) == ["SMITH", "JONES ", "BROWN", "GREEN"]
+    assert table.calls.count(TABLE_NEXT_PAGE_SCRIPT) == 2
+
+    rows = table_utils.iter_table_rows()
+    assert next(rows)["NHS Number"] == "9990000004"
+    assert table.calls.count(TABLE_NEXT_PAGE_SCRIPT) == 2  # Pages are read lazily
+
+
+def test_cell_lookups_use_the_cached_headers() -> None:
+    table = FakeTable([dict(subjects)])
+    page = FakePage(table)
+    table_utils = TableUtils(page, "#subjects")
+
+    assert table_utils.get_cell_values(1, ["NHS Number", "Status"]) == {
+        "NHS Number": "9990000001",
+        "Status": "Active",
+    }
+    assert table_utils.get_cell_value("Surname", 2) == "JONES "
+    assert table.calls == [
+        TABLE_HEADERS_SCRIPT,
+        TABLE_ROW_CELLS_SCRIPT,
+        TABLE_ROW_CELLS_SCRIPT,
+    ]
+
+    # The header changes, so the columns are found again before the cells are read
+    table.pages[0] = dict(
+        table_page(["Status", "NHS Number"], [["Inactive", "9990000009"]]),
+        header_version="2",
+    )
+    assert table_utils.get_cell_value("NHS Number", 1) == "9990000009"
+    assert table.calls.count(TABLE_HEADERS_SCRIPT) == 2
+
+    page.navigate()
+    assert table_utils.get_cell_value("Status", 1) == "Inactive"
+    assert table.calls.count(TABLE_HEADERS_SCRIPT) == 3
+
+
+def test_column_indexes_are_never_out_of_date() -> None:
+    table = FakeTable([dict(subjects)])
+    page = FakePage(table)
+    table_utils = TableUtils(page, "#subjects")
+
+    assert table_utils.get_column_index("Status") == 3
+    # The header changes without the page navigating, e.g. after changing the visible columns
+    table.pages[0] = dict(
+        table_page(["Status", "NHS Number"], [["Inactive", "9990000009"]]),
+        header_version="2",
+    )
+    assert table_utils.get_column_index("Status") == 1
+    assert table.calls == [TABLE_HEADERS_SCRIPT, TABLE_HEADERS_SCRIPT]
+
+
+def test_each_page_has_a_single_navigation_listener() -> None:
+    table = FakeTable([dict(subjects)])
+    page = FakePage(table)
+    first_table_utils = TableUtils(page, "#subjects")
+    second_table_utils = TableUtils(page, "#subjects")
+    TableUtils(page, "#other")
+
+    assert len(page.navigation_handlers) == 1
+    first_table_utils.get_cell_value("Status", 1)
+    second_table_utils.get_cell_value("Status", 1)
+    assert table.calls.count(TABLE_HEADERS_SCRIPT) == 1
+
+    page.navigate()
+    assert second_table_utils._header_cache is None
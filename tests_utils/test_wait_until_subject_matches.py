@@ -0,0 +1,71 @@
+import pytest
+import utils.subject_assertion as subject_assertion_module
+from classes.subject.subject import Subject
+from utils.subject_assertion import wait_until_subject_matches
+
+pytestmark = [pytest.mark.utils]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 2))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(subject_assertion_module.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(subject_assertion_module.time, "sleep", clock.sleep)
+    monkeypatch.setattr(
+        Subject, "populate_subject_object_from_nhs_no", lambda self, nhs_number: self
+    )
+    return clock
+
+
+def test_returns_as_soon_as_the_subject_matches(
+    clock: FakeClock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    queries = []
+
+    def fake_fetch_one(self, query: str, parameters: dict | None = None):
+        queries.append(query)
+        return {"subject_matches": 1} if len(queries) == 4 else None
+
+    monkeypatch.setattr(subject_assertion_module.OracleDB, "fetch_one", fake_fetch_one)
+    criteria = {"latest event status": "A59 Invited for Diagnostic Test"}
+
+    elapsed = wait_until_subject_matches("9990000001", criteria)
+
+    assert clock.sleeps == [0.1, 0.2, 0.4]
+    assert elapsed == pytest.approx(0.7)
+    assert queries[0].startswith("SELECT 1 AS subject_matches FROM dual WHERE EXISTS")
+    assert "nhs number" not in criteria  # The caller's criteria are not changed
+
+
+def test_reports_the_failed_criteria_after_the_timeout(
+    clock: FakeClock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        subject_assertion_module.OracleDB, "fetch_one", lambda self, query, bind: None
+    )
+
+    def failing_subject_assertion(nhs_number, criteria, user_role=None):
+        raise AssertionError("Failed criteria: latest event status")
+
+    monkeypatch.setattr(
+        subject_assertion_module, "subject_assertion", failing_subject_assertion
+    )
+    with pytest.raises(AssertionError, match="latest event status"):
+        wait_until_subject_matches(
+            "9990000001", {"latest event status": "A59"}, timeout=10, backoff=3
+        )
+    assert clock.sleeps == [0.1, 0.3, 0.9, 2.7, 5, 1.0]
+    assert clock.now == pytest.approx(10)
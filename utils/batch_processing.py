@@ -1,7 +1,3 @@
-from pages.base_page import BasePage
-from pages.communication_production.communications_production_page import (
-    CommunicationsProductionPage,
-)
 from pages.communication_production.manage_active_batch_page import (
     ManageActiveBatchPage,
 )
@@ -15,13 +11,19 @@ from utils.oracle.oracle_specific_functions.subject_batch import (
 )
 from utils.oracle.oracle import OracleDB
 from utils.pdf_reader import extract_nhs_no_from_pdf
+from utils.subject_assertion import subject_assertion_bulk
+from utils.parallel_execution import resource_lock
+from utils.page_navigation import navigate_to
 import os
+import random
 import pytest
 from playwright.sync_api import Page
 import logging
 import pandas as pd
 from typing import Optional, Tuple
 
+DEFAULT_UI_STATUS_SAMPLE_SIZE = 1
+
 
 def batch_processing(
     page: Page,
@@ -31,6 +33,8 @@ def batch_processing(
     run_timed_events: bool = False,
     get_subjects_from_pdf: bool = False,
     save_csv_as_df: bool = False,
+    verify_status_in_db: Optional[bool] = None,
+    ui_status_sample_size: Optional[int] = None,
 ) -> Optional[pd.DataFrame]:
     """
     Processes a batch in the BCSS UI by navigating to the batch, extracting subject NHS numbers (from the database or PDF),
@@ -44,65 +48,83 @@ def batch_processing(
         run_timed_events (bool): An optional input that executes bcss_timed_events if set to True
         get_subjects_from_pdf (bool): An optional input to change the method of retrieving subjects from the batch from the DB to the PDF file.
         save_csv_as_df (bool): An optional input to save the CSV from batches as a pandas DF
+        verify_status_in_db (bool): An optional input to check the latest event status of every subject with one DB query,
+                                    and only check a sample of them in the UI. Defaults to BATCH_STATUS_VERIFY_IN_DB in local.env, or False.
+        ui_status_sample_size (int): The number of subjects, picked at random, to check in the UI when verify_status_in_db is True.
+                                     Defaults to BATCH_STATUS_UI_SAMPLE_SIZE in local.env, or 1.
     """
-    logging.info(
-        f"[BATCH PROCESSING] Processing {batch_type} - {batch_description} batch"
-    )
-    BasePage(page).click_main_menu_link()
-    BasePage(page).go_to_communications_production_page()
-    CommunicationsProductionPage(page).go_to_active_batch_list_page()
-    ActiveBatchListPage(page).enter_event_code_filter(batch_type)
-
-    batch_description_cells = page.locator(f"//td[text()='{batch_description}']")
-
-    if (
-        batch_description_cells.count() == 0
-        and page.locator("td", has_text="No matching records found").is_visible()
-    ):
-        pytest.fail(f"No {batch_type} {batch_description} batch found")
-
-    for i in range(batch_description_cells.count()):
-        row = batch_description_cells.nth(i).locator("..")  # Get the parent row
-
-        # Check if the row contains "Open"
-        if row.locator("td", has_text="Open").count() > 0:
-            # Find the first link in that row and click it
-            link = row.locator("a").first
-            link_text = link.inner_text()  # Get the batch id dynamically
+    # Only one worker can process the batches for an event code at a time
+    with resource_lock(f"letter_batch_{batch_type}"):
+        logging.info(
+            f"[BATCH PROCESSING] Processing {batch_type} - {batch_description} batch"
+        )
+        navigate_to(page, "active_batch_list")
+        ActiveBatchListPage(page).enter_event_code_filter(batch_type)
+
+        batch_description_cells = page.locator(f"//td[text()='{batch_description}']")
+
+        if (
+            batch_description_cells.count() == 0
+            and page.locator("td", has_text="No matching records found").is_visible()
+        ):
+            pytest.fail(f"No {batch_type} {batch_description} batch found")
+
+        for i in range(batch_description_cells.count()):
+            row = batch_description_cells.nth(i).locator("..")  # Get the parent row
+
+            # Check if the row contains "Open"
+            if row.locator("td", has_text="Open").count() > 0:
+                # Find the first link in that row and click it
+                link = row.locator("a").first
+                link_text = link.inner_text()  # Get the batch id dynamically
+                logging.info(
+                    f"[ASSERTIONS COMPLETE] Successfully found an open '{batch_type} - {batch_description}' batch"
+                )
+                link.click()
+                break
+            elif (i + 1) == batch_description_cells.count():
+                pytest.fail(
+                    f"[ASSERTIONS FAILED] No open '{batch_type} - {batch_description}' batch found"
+                )
+
+        if get_subjects_from_pdf:
             logging.info(
-                f"[ASSERTIONS COMPLETE] Successfully found an open '{batch_type} - {batch_description}' batch"
+                f"[UI METHOD] Getting NHS Numbers for batch {link_text} from the PDF File"
             )
-            link.click()
-            break
-        elif (i + 1) == batch_description_cells.count():
-            pytest.fail(
-                f"[ASSERTIONS FAILED] No open '{batch_type} - {batch_description}' batch found"
+            nhs_no_df, csv_df = prepare_and_print_batch(
+                page, link_text, get_subjects_from_pdf, save_csv_as_df
             )
+        else:
+            logging.info(
+                f"[DB METHOD] Getting NHS Numbers for batch {link_text} from the DB"
+            )
+            nhs_no_df, csv_df = prepare_and_print_batch(
+                page, link_text, get_subjects_from_pdf, save_csv_as_df
+            )
+            nhs_no_df = get_nhs_no_from_batch_id(link_text)
 
-    if get_subjects_from_pdf:
-        logging.info(
-            f"[UI METHOD] Getting NHS Numbers for batch {link_text} from the PDF File"
-        )
-        nhs_no_df, csv_df = prepare_and_print_batch(
-            page, link_text, get_subjects_from_pdf, save_csv_as_df
-        )
-    else:
-        logging.info(
-            f"[DB METHOD] Getting NHS Numbers for batch {link_text} from the DB"
-        )
-        nhs_no_df, csv_df = prepare_and_print_batch(
-            page, link_text, get_subjects_from_pdf, save_csv_as_df
-        )
-        nhs_no_df = get_nhs_no_from_batch_id(link_text)
-
-    check_batch_in_archived_batch_list(page, link_text)
+        check_batch_in_archived_batch_list(page, link_text)
 
     if nhs_no_df is None:
         raise ValueError("No NHS numbers were retrieved for the batch")
 
     if latest_event_status:
-        for subject in range(len(nhs_no_df)):
-            nhs_no = nhs_no_df["subject_nhs_number"].iloc[subject]
+        nhs_numbers = list(nhs_no_df["subject_nhs_number"])
+        if verify_status_in_db is None:
+            verify_status_in_db = (
+                os.getenv("BATCH_STATUS_VERIFY_IN_DB", "").strip().lower() == "true"
+            )
+        if verify_status_in_db:
+            verify_latest_event_status_in_db(nhs_numbers, latest_event_status)
+            if ui_status_sample_size is None:
+                ui_status_sample_size = int(
+                    os.getenv("BATCH_STATUS_UI_SAMPLE_SIZE", "").strip()
+                    or DEFAULT_UI_STATUS_SAMPLE_SIZE
+                )
+            nhs_numbers = random.sample(
+                nhs_numbers, min(ui_status_sample_size, len(nhs_numbers))
+            )
+        for nhs_no in nhs_numbers:
             verify_subject_event_status_by_nhs_no(page, nhs_no, latest_event_status)
 
     if run_timed_events:
@@ -195,9 +217,7 @@ def check_batch_in_archived_batch_list(page: Page, link_text) -> None:
         page (Page): This is the playwright page object
         link_text (str): The batch ID
     """
-    BasePage(page).click_main_menu_link()
-    BasePage(page).go_to_communications_production_page()
-    CommunicationsProductionPage(page).go_to_archived_batch_list_page()
+    navigate_to(page, "archived_batch_list")
     ArchivedBatchListPage(page).enter_id_filter(link_text)
     try:
         ArchivedBatchListPage(page).verify_table_data(link_text)
@@ -208,3 +228,35 @@ def check_batch_in_archived_batch_list(page: Page, link_text) -> None:
         logging.error(
             f"[UI ASSERTIONS] Batch {link_text} not visible in archived batch list: {str(e)}"
         )
+
+
+def verify_latest_event_status_in_db(
+    nhs_numbers: list, latest_event_status: str | list
+) -> None:
+    """
+    Checks that every subject has (one of) the expected latest event status(es), using one DB query per status
+    through the 'latest event status' subject selection criteria.
+
+    Args:
+        nhs_numbers (list): The NHS numbers of the subjects in the batch
+        latest_event_status (str | list): The status, or list of statuses, the subjects should have. E.g. "S9 - Pre-invitation Sent"
+    """
+    statuses = (
+        latest_event_status
+        if isinstance(latest_event_status, list)
+        else [latest_event_status]
+    )
+    remaining = [str(nhs_no) for nhs_no in nhs_numbers]
+    for status in statuses:
+        results = subject_assertion_bulk(remaining, {"latest event status": status})
+        remaining = [nhs_no for nhs_no in remaining if not results[nhs_no].passed]
+        if not remaining:
+            break
+
+    if remaining:
+        pytest.fail(
+            f"[DB ASSERTIONS FAILED] {len(remaining)} of {len(nhs_numbers)} subjects do not have the latest event status {latest_event_status}: {remaining}"
+        )
+    logging.info(
+        f"[DB ASSERTIONS COMPLETE] All {len(nhs_numbers)} subjects have the latest event status {latest_event_status}"
+    )
@@ -25,36 +25,40 @@ class CallAndRecallUtils:
         """
         subject_id = int(self.oracledb.get_subject_id_from_nhs_number(nhs_no))
         conn = self.oracledb.connect_to_db()
-        conn.callTimeout = 30000  # Setting call timeout to 30 seconds
-        cur = conn.cursor()
+        conn.call_timeout = 30000  # Setting call timeout to 30 seconds
+        try:
+            cur = conn.cursor()
 
-        pi = cur.var(oracledb.NUMBER)
-        pi.setvalue(0, subject_id)
+            pi = cur.var(oracledb.NUMBER)
+            pi.setvalue(0, subject_id)
 
-        out_cursor = cur.var(oracledb.CURSOR)
+            out_cursor = cur.var(oracledb.CURSOR)
 
-        cur.execute(
-            """
-            BEGIN
-                pkg_fobt_call.p_failsafe_trawl(
-                    pi_subject_id => :pi,
-                    po_cur_error  => :po
-                );
-            END;""",
-            {"pi": str(subject_id), "po": out_cursor},
-        )
+            cur.execute(
+                """
+                BEGIN
+                    pkg_fobt_call.p_failsafe_trawl(
+                        pi_subject_id => :pi,
+                        po_cur_error  => :po
+                    );
+                END;""",
+                {"pi": str(subject_id), "po": out_cursor},
+            )
 
-        result_cursor = out_cursor.getvalue()
-        row = result_cursor.fetchone()
-        conn.commit()
+            result_cursor = out_cursor.getvalue()
+            row = result_cursor.fetchone()
+            conn.commit()
+
+            # Clean up
+            result_cursor.close()
+            cur.close()
+        finally:
+            # Pooled connections keep their settings, so reset the call timeout before releasing it
+            conn.call_timeout = 0
+            self.oracledb.disconnect_from_db(conn)
         assert (
             "The action was performed successfully" in row
         ), f"Error when executing failsafe for {nhs_no}: {row}"
-
-        # Clean up
-        result_cursor.close()
-        cur.close()
-        conn.close()
         logging.info(
             f"[FAILSAFE TRAWL RUN] FOBT failsafe trawl run for subject {nhs_no}"
         )
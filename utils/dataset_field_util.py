@@ -1,16 +1,329 @@
 from playwright.sync_api import Page, Locator
-from typing import Optional, List
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Optional, List, Union
 import logging
 from pages.datasets.investigation_dataset_page import (
     to_enum_name_or_value,
 )
 
+FORM_MAP_ID_ATTRIBUTE = "data-form-map-id"
+
+# The controls that can be found to the right of a label
+CONTROL_SELECTORS = {
+    "input": "input",
+    "select": "select",
+    "checkbox": 'input[type="checkbox"]',
+    "radio": 'input[type="radio"]',
+}
+
+# Finds the controls to the right of a label, in the same way as Playwright's
+# `<selector>:right-of(:text("<label>"))`, and returns their form map IDs, nearest first.
+#
+# The form map is kept on the page, so the text of each element is only worked out once, and each label
+# is only resolved once. A MutationObserver marks the map as dirty whenever elements are added or removed,
+# or shown or hidden (e.g. when a section is expanded), and the map is then rebuilt on the next lookup.
+# A navigation starts a new page, so also starts a new map.
+_FORM_MAP_FUNCTIONS_TEMPLATE = """
+const findControlIds = (text, selector, div) => {
+    let map = window.bcssFormMap;
+    // Picks up changes made by the page's scripts since the last lookup, before the observer is called
+    if (map && window.bcssFormMapObserver.takeRecords().length) map.dirty = true;
+    if (!map || map.dirty) {
+        map = window.bcssFormMap = {
+            dirty: false, texts: new Map(), resolved: new Map(), nextId: map ? map.nextId : 0
+        };
+        if (!window.bcssFormMapObserver) {
+            window.bcssFormMapObserver = new MutationObserver(() => {
+                if (window.bcssFormMap) window.bcssFormMap.dirty = true;
+            });
+            window.bcssFormMapObserver.observe(document.documentElement, {
+                childList: true, subtree: true, characterData: true,
+                attributes: true, attributeFilter: ["style", "class", "hidden", "open"],
+            });
+        }
+    }
+
+    const key = [text, selector, div || ""].join("|");
+    if (map.resolved.has(key)) return map.resolved.get(key);
+
+    const normalize = value => value.trim().replace(/\\s+/g, " ").toLowerCase();
+    const skip = element => ["SCRIPT", "NOSCRIPT", "STYLE"].includes(element.nodeName)
+        || (document.head && document.head.contains(element));
+    const elementText = element => {
+        if (map.texts.has(element)) return map.texts.get(element);
+        let full = "";
+        if (!skip(element)) {
+            if (element instanceof HTMLInputElement
+                && (element.type === "submit" || element.type === "button")) {
+                full = element.value;
+            } else {
+                for (let child = element.firstChild; child; child = child.nextSibling) {
+                    if (child.nodeType === Node.TEXT_NODE) full += child.nodeValue || "";
+                    else if (child.nodeType === Node.ELEMENT_NODE) full += elementText(child).full;
+                }
+            }
+        }
+        const value = { full: full, normalized: normalize(full) };
+        map.texts.set(element, value);
+        return value;
+    };
+
+    // The smallest elements containing the text, as matched by :text()
+    const query = normalize(text);
+    const findLabels = scope => Array.from(scope.querySelectorAll("*")).filter(element => {
+        if (!elementText(element).normalized.includes(query)) return false;
+        return !Array.from(element.children).some(
+            child => elementText(child).normalized.includes(query)
+        );
+    });
+
+    // The controls in each scope, nearest to a label in the same scope first
+    const scopes = div ? document.querySelectorAll(`div#${CSS.escape(div)}`) : [document];
+    const controls = [];
+    for (const scope of scopes) {
+        const labels = findLabels(scope);
+        const labelBoxes = labels.map(label => label.getBoundingClientRect());
+        const scored = [];
+        for (const control of scope.querySelectorAll(selector)) {
+            const box = control.getBoundingClientRect();
+            let best;
+            labels.forEach((label, index) => {
+                if (label === control) return;
+                const labelBox = labelBoxes[index];
+                const distance = box.left - labelBox.right;
+                if (distance < 0) return;
+                const score = distance + Math.max(labelBox.bottom - box.bottom, 0)
+                    + Math.max(box.top - labelBox.top, 0);
+                if (best === undefined || score < best) best = score;
+            });
+            if (best !== undefined) scored.push({ control: control, score: best });
+        }
+        scored.sort((first, second) => first.score - second.score);
+        controls.push(...scored.map(({ control }) => control));
+    }
+
+    const ids = controls.map(control => {
+        if (!control.hasAttribute("FORM_MAP_ID_ATTRIBUTE")) {
+            control.setAttribute("FORM_MAP_ID_ATTRIBUTE", String(map.nextId++));
+        }
+        return control.getAttribute("FORM_MAP_ID_ATTRIBUTE");
+    });
+    map.resolved.set(key, ids);
+    return ids;
+};
+"""
+FORM_MAP_FUNCTIONS = _FORM_MAP_FUNCTIONS_TEMPLATE.replace(
+    "FORM_MAP_ID_ATTRIBUTE", FORM_MAP_ID_ATTRIBUTE
+)
+
+FORM_MAP_SCRIPT = f"""
+([text, selector, div]) => {{
+{FORM_MAP_FUNCTIONS}
+    return findControlIds(text, selector, div);
+}}
+"""
+
+# Gets the label of a radio button, trying both wrapped label and label-for approaches
+RADIO_LABEL_SCRIPT = """
+(radio) => {
+    // Case 1: Wrapped inside label
+    let label = radio.closest('label');
+    if (label) {
+        return label.innerText.trim();
+    }
+    // Case 2: label-for pattern
+    const id = radio.id;
+    if (id) {
+        label = document.querySelector(`label[for="${id}"]`);
+        if (label) {
+            return label.innerText.trim();
+        }
+    }
+    // Fallback: Try immediate text sibling
+    return radio.nextSibling?.textContent?.trim() || "";
+}
+"""
+
+# Fills in each field in turn, selecting an option (by value or label, as select_option does) or filling an input,
+# and dispatching the input and change events that the page's scripts listen for. Because the change events are
+# handled straight away, fields shown by an earlier field are found later in the same pass.
+# Stops at the first field that is not visible and enabled, or does not have the option yet, and returns
+# the number of fields filled, so the rest can be filled once it has appeared.
+FILL_FIELDS_SCRIPT = f"""
+(fields) => {{
+{FORM_MAP_FUNCTIONS}
+    const isVisible = element => {{
+        const box = element.getBoundingClientRect();
+        return box.width > 0 && box.height > 0
+            && getComputedStyle(element).visibility !== "hidden";
+    }};
+    const dispatch = element => {{
+        element.dispatchEvent(new Event("input", {{ bubbles: true }}));
+        element.dispatchEvent(new Event("change", {{ bubbles: true }}));
+    }};
+
+    for (let index = 0; index < fields.length; index++) {{
+        const [text, selector, div, value] = fields[index];
+        const ids = findControlIds(text, selector, div);
+        const control = ids.length
+            ? document.querySelector(`[{FORM_MAP_ID_ATTRIBUTE}="${{ids[0]}}"]`)
+            : null;
+        if (!control || !isVisible(control) || control.disabled || control.readOnly) return index;
+
+        if (control instanceof HTMLSelectElement) {{
+            const option = Array.from(control.options).find(
+                option => option.value === value || option.label === value
+            );
+            if (!option) return index;
+            control.value = option.value;
+        }} else {{
+            control.focus();
+            control.value = value;
+        }}
+        dispatch(control);
+    }}
+    return fields.length;
+}}
+"""
+
+
+@dataclass
+class DatasetField:
+    """
+    A field to fill in with DatasetFieldUtil.populate_fields.
+
+    Attributes:
+        text (str): The text of the element the field is to the right of
+        value (Any): The value to fill in, or the option (value or label) to select
+        control (str): "select" or "input"
+        div (Optional[str]): The ID of the DIV the text belongs in
+    """
+
+    text: str
+    value: Any
+    control: str = "select"
+    div: Optional[str] = None
 
-class DatasetFieldUtil:
 
+class DatasetFieldUtil:
     def __init__(self, page: Page):
         self.page = page
 
+    def get_locators_right_of(
+        self, control: str, text: str, div: Optional[str] = None
+    ) -> List[Locator]:
+        """
+        Finds the controls to the right of any element containing the text, at any vertical position, nearest first.
+        This matches `<control>:right-of(:text("<text>"))`, but uses the page's form map, so that each field is only
+        found once (rather than on every action), and the returned locators do not need a layout pass to resolve.
+        Args:
+            control (str): The type of control, one of "input", "select", "checkbox" or "radio"
+            text (str): The text of the element you want to get the controls to the right of
+            div (str, optional): The ID of the DIV the text belongs in
+        Returns:
+            List[Locator]: the locators of the controls, nearest first
+        """
+        ids = self.page.evaluate(
+            FORM_MAP_SCRIPT, [text, CONTROL_SELECTORS[control], div]
+        )
+        return [
+            self.page.locator(f'[{FORM_MAP_ID_ATTRIBUTE}="{control_id}"]')
+            for control_id in ids
+        ]
+
+    def get_locator_right_of(
+        self, control: str, text: str, div: Optional[str] = None
+    ) -> Locator:
+        """
+        Returns the nearest control to the right of any element containing the text, at any vertical position.
+        If there is not one on the page yet, the layout selector is returned, so that Playwright waits for it to appear.
+        Args:
+            control (str): The type of control, one of "input", "select", "checkbox" or "radio"
+            text (str): The text of the element you want to get the control to the right of
+            div (str, optional): The ID of the DIV the text belongs in
+        Returns:
+            Locator: the locator of the control
+        """
+        locators = self.get_locators_right_of(control, text, div)
+        if locators:
+            return locators[0]
+        scope = self.page.locator(f"div#{div}") if div else self.page
+        return scope.locator(
+            f'{CONTROL_SELECTORS[control]}:right-of(:text("{text}"))'
+        ).first
+
+    def populate_fields(
+        self, fields: List[Union[DatasetField, Callable[[], None]]]
+    ) -> None:
+        """
+        Fills in a section of a dataset in as few calls to the browser as possible.
+        Consecutive fields are filled in a single pass on the page, which dispatches the change events the page's
+        scripts expect. If a field is not on the page yet (e.g. it is shown by a field filled before it, or its options
+        are still loading), that field is filled on its own, which waits for it to appear, and the pass carries on after it.
+        Steps that cannot be filled in a single pass, such as lookups and fields that raise a dialog, can be given as
+        callables, which are called in order between the fields.
+        Args:
+            fields (List[Union[DatasetField, Callable[[], None]]]): The fields to fill in, and any other steps, in order
+        """
+        pending: List[DatasetField] = []
+        for field in fields:
+            if isinstance(field, DatasetField):
+                pending.append(field)
+            else:
+                self._populate_in_one_pass(pending)
+                pending = []
+                field()
+        self._populate_in_one_pass(pending)
+
+    def _populate_in_one_pass(self, fields: List[DatasetField]) -> None:
+        """
+        Fills in the fields in a single pass on the page, filling any field that is not on the page yet on its own.
+        """
+        while fields:
+            filled = self.page.evaluate(
+                FILL_FIELDS_SCRIPT,
+                [
+                    [
+                        field.text,
+                        CONTROL_SELECTORS[field.control],
+                        field.div,
+                        (
+                            field.value.value
+                            if isinstance(field.value, Enum)
+                            else str(field.value)
+                        ),
+                    ]
+                    for field in fields
+                ],
+            )
+            for field in fields[:filled]:
+                logging.info(
+                    f"Filled field '{field.text}' with '{to_enum_name_or_value(field.value)}'"
+                )
+            if filled < len(fields):
+                # Wait for the field to appear, rather than for a fixed time
+                self._populate_field(fields[filled])
+                filled += 1
+            fields = fields[filled:]
+
+    def _populate_field(self, field: DatasetField) -> None:
+        """
+        Fills in a single field, waiting for it to appear.
+        """
+        if field.control == "input" and field.div:
+            self.populate_input_locator_for_field_inside_div(
+                field.text, field.div, str(field.value)
+            )
+        elif field.control == "input":
+            self.populate_input_locator_for_field(field.text, str(field.value))
+        elif field.div:
+            self.populate_select_locator_for_field_inside_div(
+                field.text, field.div, field.value
+            )
+        else:
+            self.populate_select_locator_for_field(field.text, field.value)
+
     def get_input_locator_for_field(self, text: str) -> Locator:
         """
         Matches input elements that are to the right of any element matching the inner selector, at any vertical position.
@@ -19,7 +332,7 @@ class DatasetFieldUtil:
         Returns:
             Locator: the locator of the input
         """
-        return self.page.locator(f'input:right-of(:text("{text}"))').first
+        return self.get_locator_right_of("input", text)
 
     def populate_input_locator_for_field(self, text: str, value: str) -> None:
         """
@@ -40,7 +353,7 @@ class DatasetFieldUtil:
         Returns:
             Locator: the locator of the input
         """
-        return self.page.locator(f'select:right-of(:text("{text}"))').first
+        return self.get_locator_right_of("select", text)
 
     def populate_select_locator_for_field(self, text: str, option: str) -> None:
         """
@@ -64,8 +377,7 @@ class DatasetFieldUtil:
         Returns:
             Locator: the locator of the input
         """
-        container = self.page.locator(f"div#{div}")
-        return container.locator(f'input:right-of(:text("{text}"))').first
+        return self.get_locator_right_of("input", text, div)
 
     def populate_input_locator_for_field_inside_div(
         self, text: str, div: str, value: str
@@ -90,8 +402,7 @@ class DatasetFieldUtil:
         Returns:
             Locator: the locator of the input
         """
-        container = self.page.locator(f"div#{div}")
-        return container.locator(f'select:right-of(:text("{text}"))').first
+        return self.get_locator_right_of("select", text, div)
 
     def populate_select_locator_for_field_inside_div(
         self, text: str, div: str, option: str
@@ -357,14 +668,8 @@ class DatasetFieldUtil:
         if expected_state not in ("Ticked", "Unticked"):
             raise ValueError('expected_state must be either "Ticked" or "Unticked"')
 
-        scope = self.page
-        if div:
-            scope = self.page.locator(f"div#{div}")
-
-        # Use :right-of to locate checkbox right of the label text
-        checkbox = scope.locator(
-            f'input[type="checkbox"]:right-of(:text("{text}"))'
-        ).first
+        # Locate the checkbox right of the label text
+        checkbox = self.get_locator_right_of("checkbox", text, div)
 
         if not checkbox.is_visible():
             raise AssertionError(f'Checkbox to the right of "{text}" is not visible.')
@@ -396,44 +701,17 @@ class DatasetFieldUtil:
         logging.info(
             f"Checking that the radio select next to {text} is {expected_value}"
         )
-        scope = self.page
-        if div:
-            scope = self.page.locator(f"div#{div}")
+        # Find all radio buttons to the right of the label text, nearest first
+        radio_buttons = self.get_locators_right_of("radio", text, div)
 
-        # Find all radio buttons to the right of the label text
-        radio_buttons = scope.locator(f'input[type="radio"]:right-of(:text("{text}"))')
-
-        count = radio_buttons.count()
-        if count == 0:
+        if not radio_buttons:
             raise AssertionError(f'No radio buttons found to the right of "{text}".')
 
         found_match = False
 
-        for radio_index in range(count):
-            radio = radio_buttons.nth(radio_index)
+        for radio in radio_buttons:
             if radio.is_checked():
-                # Try both wrapped label and label-for approaches
-                label_text = radio.evaluate(
-                    """
-                    (radio) => {
-                        // Case 1: Wrapped inside label
-                        let label = radio.closest('label');
-                        if (label) {
-                            return label.innerText.trim();
-                        }
-                        // Case 2: label-for pattern
-                        const id = radio.id;
-                        if (id) {
-                            label = document.querySelector(`label[for="${id}"]`);
-                            if (label) {
-                                return label.innerText.trim();
-                            }
-                        }
-                        // Fallback: Try immediate text sibling
-                        return radio.nextSibling?.textContent?.trim() || "";
-                    }
-                """
-                )
+                label_text = radio.evaluate(RADIO_LABEL_SCRIPT)
                 found_match = True
                 assert label_text == expected_value, (
                     f'Expected selected radio to be "{expected_value}" to the right of "{text}", '
@@ -470,13 +748,8 @@ class DatasetFieldUtil:
         state_word = "enabled" if should_be_enabled else "disabled"
         logging.info(f'Checking that the checkbox next to "{text}" is {state_word}')
 
-        # Restrict the search to a container if one is supplied
-        scope = self.page.locator(f"div#{div}") if div else self.page
-
-        # Playwright’s relational selector: anything :right-of the label text
-        checkbox = scope.locator(
-            f'input[type="checkbox"]:right-of(:text("{text}"))'
-        ).first
+        # The nearest checkbox right of the label text, restricted to a container if one is supplied
+        checkbox = self.get_locator_right_of("checkbox", text, div)
 
         if checkbox.count() == 0:
             raise AssertionError(f'No checkbox found to the right of "{text}".')
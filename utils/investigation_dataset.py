@@ -1,5 +1,6 @@
 from playwright.sync_api import Page
 from enum import StrEnum
+from functools import partial
 from datetime import datetime
 import logging
 from typing import Optional
@@ -44,7 +45,7 @@ from pages.datasets.investigation_dataset_page import (
 from pages.screening_subject_search.advance_fobt_screening_episode_page import (
     AdvanceFOBTScreeningEpisodePage,
 )
-from utils.dataset_field_util import DatasetFieldUtil
+from utils.dataset_field_util import DatasetField, DatasetFieldUtil
 from pages.screening_subject_search.record_diagnosis_date_page import (
     RecordDiagnosisDatePage,
 )
@@ -445,45 +446,65 @@ class InvestigationDatasetCompletion:
                     - "fit for subsequent endoscopic referral" (Optional[str]): Enum value for referral fitness.
                     - "aspirant endoscopist" (Optional[int or None]): Index for aspirant dropdown, or None to mark absence.
         """
+        # The lookups open a pop-up, so they are filled on their own between the other fields
+        fields = []
         for key, value in general_information.items():
             match key:
                 case "site":
-                    self.investigation_datasets_pom.select_site_lookup_option_index(
-                        value
+                    fields.append(
+                        partial(
+                            self.investigation_datasets_pom.select_site_lookup_option_index,
+                            value,
+                        )
                     )
                 case "practitioner":
-                    self.investigation_datasets_pom.select_practitioner_option_index(
-                        value
+                    fields.append(
+                        partial(
+                            self.investigation_datasets_pom.select_practitioner_option_index,
+                            value,
+                        )
                     )
                 case "testing clinician":
                     if isinstance(value, int):
-                        self.investigation_datasets_pom.select_testing_clinician_option_index(
-                            value
+                        fields.append(
+                            partial(
+                                self.investigation_datasets_pom.select_testing_clinician_option_index,
+                                value,
+                            )
                         )
                     elif isinstance(value, str):
-                        self.investigation_datasets_pom.select_testing_clinician_from_name(
-                            value
+                        fields.append(
+                            partial(
+                                self.investigation_datasets_pom.select_testing_clinician_from_name,
+                                value,
+                            )
                         )
                 case "reporting radiologist":
-                    InvestigationDatasetsPage(
-                        self.page
-                    ).select_reporting_radiologist_option_index(value)
+                    fields.append(
+                        partial(
+                            self.investigation_datasets_pom.select_reporting_radiologist_option_index,
+                            value,
+                        )
+                    )
                 case "fit for subsequent endoscopic referral":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Fit for Subsequent Endoscopic Referral",
-                        value,
+                    fields.append(
+                        DatasetField("Fit for Subsequent Endoscopic Referral", value)
                     )
 
         if "aspirant endoscopist" in general_information:
             aspirant = general_information["aspirant endoscopist"]
             if aspirant is None:
-                InvestigationDatasetsPage(
-                    self.page
-                ).check_aspirant_endoscopist_not_present()
+                fields.append(
+                    self.investigation_datasets_pom.check_aspirant_endoscopist_not_present
+                )
             else:
-                InvestigationDatasetsPage(
-                    self.page
-                ).select_aspirant_endoscopist_option_index(aspirant)
+                fields.append(
+                    partial(
+                        self.investigation_datasets_pom.select_aspirant_endoscopist_option_index,
+                        aspirant,
+                    )
+                )
+        DatasetFieldUtil(self.page).populate_fields(fields)
 
     def fill_out_completion_information(self, completion_information: dict) -> None:
         """
@@ -649,36 +670,30 @@ class InvestigationDatasetCompletion:
         logging.info("Filling out Radiology Information")
 
         # Use for loop and match-case for radiology data fields
+        fields = []
         for key, value in radiology_data.items():
             match key:
                 case "examination quality":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Examination Quality", value
-                    )
+                    fields.append(DatasetField("Examination Quality", value))
                 case "scan position":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Number of Scan Positions", value
-                    )
+                    fields.append(DatasetField("Number of Scan Positions", value))
                 case "procedure outcome":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        self.outcome_at_time_of_procedure_string, value
+                    fields.append(
+                        DatasetField(self.outcome_at_time_of_procedure_string, value)
                     )
                 case "late outcome":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Late Outcome", value
-                    )
+                    fields.append(DatasetField("Late Outcome", value))
                 case "segmental inadequacy":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Segmental Inadequacy", value
-                    )
+                    fields.append(DatasetField("Segmental Inadequacy", value))
                 case "intracolonic summary code":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Intracolonic Summary Code",
-                        "divIntracolonicSummaryCode",
-                        value,
+                    fields.append(
+                        DatasetField(
+                            "Intracolonic Summary Code",
+                            value,
+                            div="divIntracolonicSummaryCode",
+                        )
                     )
+        DatasetFieldUtil(self.page).populate_fields(fields)
 
     def process_polyps(
         self,
@@ -733,82 +748,62 @@ class InvestigationDatasetCompletion:
         """
         # Endoscopy Information
         # Use for loop and match-case for endoscopy_information fields
+        fields = []
         for key, value in endoscopy_information.items():
             match key:
                 case "endoscope inserted":
                     if value == "yes":
-                        InvestigationDatasetsPage(
-                            self.page
-                        ).check_endoscope_inserted_yes()
+                        fields.append(
+                            self.investigation_datasets_pom.check_endoscope_inserted_yes
+                        )
                     elif value == "no":
-                        InvestigationDatasetsPage(
-                            self.page
-                        ).check_endoscope_inserted_no()
+                        fields.append(
+                            self.investigation_datasets_pom.check_endoscope_inserted_no
+                        )
                 case "procedure type":
                     if value == "therapeutic":
-                        InvestigationDatasetsPage(
-                            self.page
-                        ).select_therapeutic_procedure_type()
+                        fields.append(
+                            self.investigation_datasets_pom.select_therapeutic_procedure_type
+                        )
                     elif value == "diagnostic":
-                        InvestigationDatasetsPage(
-                            self.page
-                        ).select_diagnostic_procedure_type()
+                        fields.append(
+                            self.investigation_datasets_pom.select_diagnostic_procedure_type
+                        )
                 case "bowel preparation quality":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Bowel preparation quality", value
-                    )
+                    fields.append(DatasetField("Bowel preparation quality", value))
                 case "comfort during examination":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Comfort during examination", value
-                    )
+                    fields.append(DatasetField("Comfort during examination", value))
                 case "comfort during recovery":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Comfort during recovery", value
-                    )
+                    fields.append(DatasetField("Comfort during recovery", value))
                 case "endoscopist defined extent":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Endoscopist defined extent", value
-                    )
+                    fields.append(DatasetField("Endoscopist defined extent", value))
                 case "scope imager used":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Scope imager used", value
-                    )
+                    fields.append(DatasetField("Scope imager used", value))
                 case "retroverted view":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Retroverted view", value
-                    )
+                    fields.append(DatasetField("Retroverted view", value))
                 case "start of intubation time":
-                    DatasetFieldUtil(self.page).populate_input_locator_for_field(
-                        "Start of intubation time", value
+                    fields.append(
+                        DatasetField("Start of intubation time", value, "input")
                     )
                 case "start of extubation time":
-                    DatasetFieldUtil(self.page).populate_input_locator_for_field(
-                        "Start of extubation time", value
+                    fields.append(
+                        DatasetField("Start of extubation time", value, "input")
                     )
                 case "end time of procedure":
-                    DatasetFieldUtil(self.page).populate_input_locator_for_field(
-                        "End time of procedure", value
-                    )
+                    fields.append(DatasetField("End time of procedure", value, "input"))
                 case "scope id":
-                    DatasetFieldUtil(self.page).populate_input_locator_for_field(
-                        "Scope ID", value
-                    )
+                    fields.append(DatasetField("Scope ID", value, "input"))
                 case "detection assistant used":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Detection Assistant (AI) used?", value
-                    )
+                    fields.append(DatasetField("Detection Assistant (AI) used?", value))
                 case "insufflation":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Insufflation", value
-                    )
+                    fields.append(DatasetField("Insufflation", value))
                 case "outcome at time of procedure":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        self.outcome_at_time_of_procedure_string, value
+                    fields.append(
+                        DatasetField(self.outcome_at_time_of_procedure_string, value)
                     )
                 case "late outcome":
-                    DatasetFieldUtil(self.page).populate_select_locator_for_field(
-                        "Late outcome", value
-                    )
+                    fields.append(DatasetField("Late outcome", value))
+        DatasetFieldUtil(self.page).populate_fields(fields)
 
     def fill_polyp_x_information(
         self, polyp_information: dict, polyp_number: int
@@ -820,85 +815,93 @@ class InvestigationDatasetCompletion:
         """
         # Polyp Information
         self.investigation_datasets_pom.click_add_polyp_button()
+        polyp_section = f"divPolypNumber{polyp_number}Section"
+        fields = []
         for key, value in polyp_information.items():
             match key:
                 case "location":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Location", f"divPolypNumber{polyp_number}Section", value
-                    )
+                    fields.append(DatasetField("Location", value, div=polyp_section))
                 case "classification":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Classification", f"divPolypNumber{polyp_number}Section", value
+                    fields.append(
+                        DatasetField("Classification", value, div=polyp_section)
                     )
                 case "optical diagnosis":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Optical Diagnosis",
-                        f"divPolypOpticalDiagnosis{polyp_number}",
-                        value,
+                    fields.append(
+                        DatasetField(
+                            "Optical Diagnosis",
+                            value,
+                            div=f"divPolypOpticalDiagnosis{polyp_number}",
+                        )
                     )
                 case "estimate of whole polyp size":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_input_locator_for_field_inside_div(
-                        self.estimate_whole_polyp_size_string,
-                        f"divPolypNumber{polyp_number}Section",
-                        value,
+                    fields.append(
+                        DatasetField(
+                            self.estimate_whole_polyp_size_string,
+                            value,
+                            "input",
+                            polyp_section,
+                        )
                     )
                 case "optical diagnosis confidence":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Optical Diagnosis Confidence",
-                        f"divPolypOpticalDiagnosisConfidence{polyp_number}",
-                        value,
+                    fields.append(
+                        DatasetField(
+                            "Optical Diagnosis Confidence",
+                            value,
+                            div=f"divPolypOpticalDiagnosisConfidence{polyp_number}",
+                        )
                     )
                 case "polyp access":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        self.polyp_access_string,
-                        f"divPolypNumber{polyp_number}Section",
-                        value,
+                    fields.append(
+                        DatasetField(self.polyp_access_string, value, div=polyp_section)
                     )
                 case "secondary piece":
-                    self.page.once("dialog", lambda dialog: dialog.accept())
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Secondary Piece",
-                        f"divPolypSecondaryPiece{polyp_number}",
-                        value,
+                    # Selecting a secondary piece raises a dialog, so is done on its own
+                    fields.append(
+                        partial(
+                            self.populate_select_accepting_dialog,
+                            "Secondary Piece",
+                            f"divPolypSecondaryPiece{polyp_number}",
+                            value,
+                        )
                     )
                 case "left in situ":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Left in Situ",
-                        f"divLeftInSitu{polyp_number}",
-                        value,
+                    fields.append(
+                        DatasetField(
+                            "Left in Situ", value, div=f"divLeftInSitu{polyp_number}"
+                        )
                     )
                 case "reason left in situ":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Reason Left in Situ",
-                        f"divLeftInSituReason{polyp_number}",
-                        value,
+                    fields.append(
+                        DatasetField(
+                            "Reason Left in Situ",
+                            value,
+                            div=f"divLeftInSituReason{polyp_number}",
+                        )
                     )
                 case "polyp type left in situ":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Polyp Type Left in Situ",
-                        f"divLeftInSituPolypType{polyp_number}",
-                        value,
+                    fields.append(
+                        DatasetField(
+                            "Polyp Type Left in Situ",
+                            value,
+                            div=f"divLeftInSituPolypType{polyp_number}",
+                        )
                     )
+        DatasetFieldUtil(self.page).populate_fields(fields)
+
+    def populate_select_accepting_dialog(
+        self, text: str, div: str, option: str
+    ) -> None:
+        """
+        Selects an option in the select to the right of the text, accepting the dialog this raises.
+        Args:
+            text (str): The text of the element the select is to the right of
+            div (str): The ID of the DIV the text belongs in
+            option (str): The option to select
+        """
+        self.page.once("dialog", lambda dialog: dialog.accept())
+        DatasetFieldUtil(self.page).populate_select_locator_for_field_inside_div(
+            text, div, option
+        )
 
     def fill_polyp_x_intervention(
         self, polyp_intervention: dict, polyp_number: int
@@ -908,71 +911,7 @@ class InvestigationDatasetCompletion:
         Args:
             polyp_1_intervention (dict): A dictionary containing the polyp 1 intervention to be filled in the form.
         """
-        self.investigation_datasets_pom.click_polyp_add_intervention_button(
-            polyp_number
-        )
-        for key, value in polyp_intervention.items():
-            match key:
-                case "modality":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Modality",
-                        f"divPolypTherapy{polyp_number}_1Section",
-                        value,
-                    )
-                case "device":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Device",
-                        f"divPolypTherapy{polyp_number}_1Section",
-                        value,
-                    )
-                case "excised":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Excised", f"divPolypResected{polyp_number}_1", value
-                    )
-                case "retrieved":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Retrieved",
-                        f"divPolypTherapy{polyp_number}_1Section",
-                        value,
-                    )
-                case "image id":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_input_locator_for_field_inside_div(
-                        "Image ID", f"divPolypImageId{polyp_number}_1", value
-                    )
-                case "excision technique":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        self.excision_technique_string,
-                        f"divPolypTherapy{polyp_number}_1Section",
-                        value,
-                    )
-                case "polyp appears fully resected endoscopically":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Polyp appears fully resected endoscopically",
-                        f"divPolypAppearsFullyResected{polyp_number}_1",
-                        value,
-                    )
-                case "intervention success":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Intervention Success",
-                        f"divResectionSuccess{polyp_number}_1",
-                        value,
-                    )
+        self.fill_polyp_x_multiple_interventions([polyp_intervention], polyp_number)
 
     def fill_polyp_x_multiple_interventions(
         self, interventions: list[dict], polyp_number: int
@@ -987,66 +926,64 @@ class InvestigationDatasetCompletion:
             self.investigation_datasets_pom.click_polyp_add_intervention_button(
                 polyp_number
             )
+            therapy_section = f"divPolypTherapy{polyp_number}_{i}Section"
+            fields = []
             for key, value in intervention.items():
                 match key:
                     case "modality":
-                        DatasetFieldUtil(
-                            self.page
-                        ).populate_select_locator_for_field_inside_div(
-                            "Modality",
-                            f"divPolypTherapy{polyp_number}_{i}Section",
-                            value,
+                        fields.append(
+                            DatasetField("Modality", value, div=therapy_section)
                         )
                     case "device":
-                        DatasetFieldUtil(
-                            self.page
-                        ).populate_select_locator_for_field_inside_div(
-                            "Device", f"divPolypTherapy{polyp_number}_{i}Section", value
+                        fields.append(
+                            DatasetField("Device", value, div=therapy_section)
                         )
                     case "excised":
-                        DatasetFieldUtil(
-                            self.page
-                        ).populate_select_locator_for_field_inside_div(
-                            "Excised", f"divPolypResected{polyp_number}_{i}", value
+                        fields.append(
+                            DatasetField(
+                                "Excised",
+                                value,
+                                div=f"divPolypResected{polyp_number}_{i}",
+                            )
                         )
                     case "retrieved":
-                        DatasetFieldUtil(
-                            self.page
-                        ).populate_select_locator_for_field_inside_div(
-                            "Retrieved",
-                            f"divPolypTherapy{polyp_number}_{i}Section",
-                            value,
+                        fields.append(
+                            DatasetField("Retrieved", value, div=therapy_section)
                         )
                     case "image id":
-                        DatasetFieldUtil(
-                            self.page
-                        ).populate_input_locator_for_field_inside_div(
-                            "Image ID", f"divPolypImageId{polyp_number}_{i}", value
+                        fields.append(
+                            DatasetField(
+                                "Image ID",
+                                value,
+                                "input",
+                                f"divPolypImageId{polyp_number}_{i}",
+                            )
                         )
                     case "excision technique":
-                        DatasetFieldUtil(
-                            self.page
-                        ).populate_select_locator_for_field_inside_div(
-                            self.excision_technique_string,
-                            f"divPolypTherapy{polyp_number}_{i}Section",
-                            value,
+                        fields.append(
+                            DatasetField(
+                                self.excision_technique_string,
+                                value,
+                                div=therapy_section,
+                            )
                         )
                     case "polyp appears fully resected endoscopically":
-                        DatasetFieldUtil(
-                            self.page
-                        ).populate_select_locator_for_field_inside_div(
-                            "Polyp appears fully resected endoscopically",
-                            f"divPolypAppearsFullyResected{polyp_number}_{i}",
-                            value,
+                        fields.append(
+                            DatasetField(
+                                "Polyp appears fully resected endoscopically",
+                                value,
+                                div=f"divPolypAppearsFullyResected{polyp_number}_{i}",
+                            )
                         )
                     case "intervention success":
-                        DatasetFieldUtil(
-                            self.page
-                        ).populate_select_locator_for_field_inside_div(
-                            "Intervention Success",
-                            f"divResectionSuccess{polyp_number}_{i}",
-                            value,
+                        fields.append(
+                            DatasetField(
+                                "Intervention Success",
+                                value,
+                                div=f"divResectionSuccess{polyp_number}_{i}",
+                            )
                         )
+            DatasetFieldUtil(self.page).populate_fields(fields)
 
     def fill_polyp_x_histology(self, polyp_histology: dict, polyp_number: int) -> None:
         """
@@ -1055,103 +992,132 @@ class InvestigationDatasetCompletion:
             polyp_histology (dict): A dictionary containing the polyp 1 histology to be filled in the form.
         """
         self.click_show_histology_details_if_present(polyp_number)
+        histology_details = f"divPolypHistology{polyp_number}_1Details"
+        fields = []
         for key, value in polyp_histology.items():
             match key:
                 case "pathology lost":
-                    self.investigation_datasets_pom.assert_dialog_text(
-                        "Please consider raising an AVI", True
+                    # Selecting pathology lost raises a dialog, so is done on its own
+                    fields.append(
+                        partial(
+                            self.investigation_datasets_pom.assert_dialog_text,
+                            "Please consider raising an AVI",
+                            True,
+                        )
                     )
-                    self.investigation_datasets_pom.populate_select_by_id(
-                        "POLYP_PATHOLOGY_LOST", polyp_number, value
+                    fields.append(
+                        partial(
+                            self.investigation_datasets_pom.populate_select_by_id,
+                            "POLYP_PATHOLOGY_LOST",
+                            polyp_number,
+                            value,
+                        )
                     )
                 case "reason pathology lost":
-                    self.investigation_datasets_pom.populate_select_by_id(
-                        "POLYP_PATHOLOGY_LOST_REASON", polyp_number, value
+                    fields.append(
+                        partial(
+                            self.investigation_datasets_pom.populate_select_by_id,
+                            "POLYP_PATHOLOGY_LOST_REASON",
+                            polyp_number,
+                            value,
+                        )
                     )
                 case "date of receipt":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_input_locator_for_field_inside_div(
-                        "Date of Receipt",
-                        f"divPolypHistology{polyp_number}_1Details",
-                        value.strftime("%d/%m/%Y"),
+                    fields.append(
+                        DatasetField(
+                            "Date of Receipt",
+                            value.strftime("%d/%m/%Y"),
+                            "input",
+                            histology_details,
+                        )
                     )
                 case "date of reporting":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_input_locator_for_field_inside_div(
-                        "Date of Reporting",
-                        f"divPolypHistology{polyp_number}_1Details",
-                        value.strftime("%d/%m/%Y"),
+                    fields.append(
+                        DatasetField(
+                            "Date of Reporting",
+                            value.strftime("%d/%m/%Y"),
+                            "input",
+                            histology_details,
+                        )
                     )
                 case "pathology provider":
-                    DatasetFieldUtil(self.page).click_lookup_link_inside_div(
-                        "Pathology Provider",
-                        f"divPolypHistology{polyp_number}_1Details",
+                    # Lookups open a popup, so are done on their own
+                    fields.append(
+                        partial(
+                            DatasetFieldUtil(self.page).click_lookup_link_inside_div,
+                            "Pathology Provider",
+                            histology_details,
+                        )
+                    )
+                    fields.append(
+                        partial(
+                            self.investigation_datasets_pom.select_lookup_option_index,
+                            value,
+                        )
                     )
-                    self.investigation_datasets_pom.select_lookup_option_index(value)
                 case "pathologist":
-                    DatasetFieldUtil(self.page).click_lookup_link_inside_div(
-                        "Pathologist",
-                        f"divPolypHistology{polyp_number}_1Details",
+                    fields.append(
+                        partial(
+                            DatasetFieldUtil(self.page).click_lookup_link_inside_div,
+                            "Pathologist",
+                            histology_details,
+                        )
+                    )
+                    fields.append(
+                        partial(
+                            self.investigation_datasets_pom.select_lookup_option_index,
+                            value,
+                        )
                     )
-                    self.investigation_datasets_pom.select_lookup_option_index(value)
                 case "polyp type":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Polyp Type",
-                        f"divPolypHistology{polyp_number}_1Details",
-                        value,
+                    fields.append(
+                        DatasetField("Polyp Type", value, div=histology_details)
                     )
                 case "serrated lesion sub type":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Polyp Sub Type",
-                        f"divSubTypeSerratedLesion{polyp_number}_1",
-                        value,
+                    fields.append(
+                        DatasetField(
+                            "Polyp Sub Type",
+                            value,
+                            div=f"divSubTypeSerratedLesion{polyp_number}_1",
+                        )
                     )
                 case "adenoma sub type":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Polyp Sub Type",
-                        f"divSubTypeAdenoma{polyp_number}_1",
-                        value,
+                    fields.append(
+                        DatasetField(
+                            "Polyp Sub Type",
+                            value,
+                            div=f"divSubTypeAdenoma{polyp_number}_1",
+                        )
                     )
                 case "polyp excision complete":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Polyp Excision Complete",
-                        f"divExcisionComplete{polyp_number}_1",
-                        value,
+                    fields.append(
+                        DatasetField(
+                            "Polyp Excision Complete",
+                            value,
+                            div=f"divExcisionComplete{polyp_number}_1",
+                        )
                     )
                 case "polyp size":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_input_locator_for_field_inside_div(
-                        "Polyp Size",
-                        f"divPolypHistology{polyp_number}_1Details",
-                        value,
+                    fields.append(
+                        DatasetField("Polyp Size", value, "input", histology_details)
                     )
                 case "polyp dysplasia":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Polyp Dysplasia",
-                        f"divTumourFindings{polyp_number}_1",
-                        value,
+                    fields.append(
+                        DatasetField(
+                            "Polyp Dysplasia",
+                            value,
+                            div=f"divTumourFindings{polyp_number}_1",
+                        )
                     )
                 case "polyp carcinoma":
-                    DatasetFieldUtil(
-                        self.page
-                    ).populate_select_locator_for_field_inside_div(
-                        "Polyp Carcinoma",
-                        f"divTumourFindings{polyp_number}_1",
-                        value,
+                    fields.append(
+                        DatasetField(
+                            "Polyp Carcinoma",
+                            value,
+                            div=f"divTumourFindings{polyp_number}_1",
+                        )
                     )
+        DatasetFieldUtil(self.page).populate_fields(fields)
 
     def fill_out_other_findings_information(self, other_findings: dict) -> None:
         """
@@ -1,10 +1,22 @@
 import os
 import json
-from datetime import date
-from typing import Dict, Any, Optional
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional
+from utils.parallel_execution import resource_lock
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 LAST_RUN_FILE = os.path.join(PROJECT_ROOT, ".test_last_runs.json")
+LOCK_DIRECTORY = Path(PROJECT_ROOT) / ".locks"
+REGISTRY_LOCK = "test_last_runs"
+RUN_ONCE_SCOPES = ("day", "session", "environment")
+
+# Every pytest-xdist worker in a test session shares the same test run ID
+SESSION_ID = os.getenv("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
 
 
 def load_last_run_data() -> Dict[str, Any]:
@@ -12,7 +24,7 @@ def load_last_run_data() -> Dict[str, Any]:
     Loads the last run data from the JSON file.
 
     Returns:
-        Dict[str, Any]: A dictionary mapping environments to test names and their last run date.
+        Dict[str, Any]: A dictionary mapping environments to test names and their last run details.
     """
     if os.path.exists(LAST_RUN_FILE):
         try:
@@ -29,12 +41,117 @@ def load_last_run_data() -> Dict[str, Any]:
 def save_last_run_data(data: Dict[str, Any]) -> None:
     """
     Saves the last run data to the JSON file.
+    The file is replaced in one step, so other processes never read a half written file.
 
     Args:
-        data (Dict[str, Any]): The data to save, mapping environments to test names and their last run date.
+        data (Dict[str, Any]): The data to save, mapping environments to test names and their last run details.
     """
-    with open(LAST_RUN_FILE, "w") as f:
+    temporary_file = f"{LAST_RUN_FILE}.{os.getpid()}.tmp"
+    with open(temporary_file, "w") as f:
         json.dump(data, f, indent=2)
+    os.replace(temporary_file, LAST_RUN_FILE)
+
+
+def get_last_run(test_name: str, base_url: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Returns the details of the last completed run of a test or setup in the given environment.
+
+    Args:
+        test_name (str): The name of the test or setup.
+        base_url (str, optional): The environment base URL.
+
+    Returns:
+        Dict[str, Any]: The date, session, completion time and duration of the last run, or an empty dictionary if it has not run.
+    """
+    return load_last_run_data().get(base_url or "unknown", {}).get(test_name, {})
+
+
+def record_run(
+    test_name: str,
+    base_url: Optional[str] = None,
+    duration_seconds: Optional[float] = None,
+) -> None:
+    """
+    Records that a test or setup has completed in the given environment.
+
+    Args:
+        test_name (str): The name of the test or setup.
+        base_url (str, optional): The environment base URL.
+        duration_seconds (float, optional): How long the run took.
+    """
+    with resource_lock(REGISTRY_LOCK, directory=LOCK_DIRECTORY):
+        data = load_last_run_data()
+        data.setdefault(base_url or "unknown", {})[test_name] = {
+            "date": date.today().isoformat(),
+            "session": SESSION_ID,
+            "completed_at": datetime.now().isoformat(timespec="seconds"),
+            "duration_seconds": (
+                round(duration_seconds, 1) if duration_seconds is not None else None
+            ),
+        }
+        save_last_run_data(data)
+
+
+def _has_run(last_run: Dict[str, Any], scope: str) -> bool:
+    if not last_run:
+        return False
+    if scope == "day":
+        return last_run.get("date") == date.today().isoformat()
+    if scope == "session":
+        return last_run.get("session") == SESSION_ID
+    return True
+
+
+@contextmanager
+def run_once(
+    test_name: str,
+    base_url: Optional[str] = None,
+    scope: str = "day",
+    timeout: Optional[float] = None,
+) -> Iterator[bool]:
+    """
+    Runs a setup only once per day, test session or environment, even when several processes reach it at once.
+
+    Yields True to the caller that should run the setup, and False once it has already run. A lock is held while
+    the setup runs, so any other process reaching it waits for the setup to finish (and then gets False), rather
+    than running it again. The run is only recorded (with its duration) if the setup completes without an error.
+
+    Args:
+        test_name (str): The name of the test or setup.
+        base_url (str, optional): The environment base URL.
+        scope (str): "day" to run once per day, "session" to run once per test session (shared by every xdist worker),
+                     or "environment" to only ever run once in the environment.
+        timeout (Optional[float]): How long to wait, in seconds, for another process running the setup to finish.
+                                   This should be longer than the setup takes. Defaults to the resource_lock timeout.
+
+    Raises:
+        ValueError: If the scope is not recognised.
+        TimeoutError: If another process is still running the setup after the timeout.
+
+    Example:
+        with run_once("setup_org_and_appointments", base_url) as should_run:
+            if should_run:
+                setup_appointments(page, 0, max=True)
+    """
+    if scope not in RUN_ONCE_SCOPES:
+        raise ValueError(f"Invalid scope '{scope}', expected one of {RUN_ONCE_SCOPES}")
+
+    with resource_lock(
+        f"run_once_{test_name}", timeout=timeout, directory=LOCK_DIRECTORY
+    ):
+        last_run = get_last_run(test_name, base_url)
+        if _has_run(last_run, scope):
+            logging.info(
+                f"[RUN ONCE] {test_name} has already run ({scope} scope), completed at {last_run.get('completed_at', last_run.get('date'))}"
+            )
+            yield False
+            return
+
+        start = time.monotonic()
+        yield True
+        duration_seconds = time.monotonic() - start
+        record_run(test_name, base_url, duration_seconds)
+        logging.info(f"[RUN ONCE] {test_name} completed in {duration_seconds:.1f}s")
 
 
 def has_test_run_today(test_name: str, base_url: Optional[str] = None) -> bool:
@@ -42,6 +159,9 @@ def has_test_run_today(test_name: str, base_url: Optional[str] = None) -> bool:
     Checks if the given test has already run today in the given environment.
     If not, updates the record to mark it as run today for that environment.
 
+    Prefer run_once for setups, which only records the run once the setup has completed,
+    and makes other processes wait for it instead of skipping it while it is still running.
+
     Args:
         test_name (str): The name of the test to check.
         base_url (str, optional): The environment base URL.
@@ -49,21 +169,5 @@ def has_test_run_today(test_name: str, base_url: Optional[str] = None) -> bool:
     Returns:
         bool: True if the test has already run today in this environment, False otherwise.
     """
-    data = load_last_run_data()
-    today = date.today().isoformat()
-    env = base_url or "unknown"
-
-    # Ensure the environment key exists
-    env_data = data.get(env, {})
-
-    # Check if the test has run today in this environment
-    last_run = env_data.get(test_name, {})
-    if last_run.get("date") == today:
-        return True
-    else:
-        # Update only the relevant environment/test combination
-        if env not in data:
-            data[env] = {}
-        data[env][test_name] = {"date": today}
-        save_last_run_data(data)
-        return False
+    with run_once(test_name, base_url) as should_run:
+        return not should_run
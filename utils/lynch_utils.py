@@ -17,7 +17,6 @@ from classes.subject_selection_query_builder.selection_builder_exception import
     SelectionBuilderException,
 )
 
-from utils import nhs_number_tools
 from utils.oracle.oracle import OracleDB
 
 DATE_FORMAT_DD_MM_YYYY = "%d/%m/%Y"
@@ -124,27 +123,15 @@ class LynchUtils:
         )
 
         # Ensure NHS number uniqueness
-        attempts = 1
-        max_attempts = 100
-        while True:
-            if pi_subject.nhs_number is None:
+        if pi_subject.nhs_number is None:
+            raise SelectionBuilderException("Generated subject has no NHS number", None)
+        if subject_repo.find_by_nhs_number(pi_subject.nhs_number) is not None:
+            try:
+                pi_subject.nhs_number = subject_repo.reserve_unused_nhs_numbers(1)[0]
+            except RuntimeError:
                 raise SelectionBuilderException(
-                    "Generated subject has no NHS number", None
+                    "Could not generate unique NHS number", None
                 )
-            if (
-                subject_repo.find_by_nhs_number(pi_subject.nhs_number) is None
-                or attempts > max_attempts
-            ):
-                break
-            pi_subject.nhs_number = (
-                nhs_number_tools.NHSNumberTools.generate_random_nhs_number()
-            )
-            attempts += 1
-
-        if attempts > max_attempts:
-            raise SelectionBuilderException(
-                "Could not generate unique NHS number", None
-            )
 
         LynchUtils.delete_validated_lynch_patient(pi_subject.nhs_number)
 
@@ -1,8 +1,17 @@
 import logging
 import random
+import numpy as np
+from typing import Optional
+from utils.parallel_execution import worker_partition
 
 logger = logging.getLogger(__name__)
 
+# Random NHS numbers are generated in the 999 range, which is not issued to real patients
+NHS_NUMBER_BASE = 900000000
+NHS_NUMBER_RANGE = 100000000
+# Modulus 11 weights for the first 9 digits of an NHS number
+NHS_NUMBER_WEIGHTS = np.arange(10, 1, -1)
+
 
 class NHSNumberTools:
     """
@@ -72,6 +81,59 @@ class NHSNumberTools:
                     return nhs_number_full
                 # If invalid, continue loop to generate a new one
 
+    @staticmethod
+    def generate_random_nhs_numbers(
+        count: int,
+        seed: Optional[int] = None,
+        partition: Optional[int] = None,
+        partitions: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Generates many unique, checksum valid, random NHS numbers at once.
+        The modulus 11 checksums are calculated for the whole batch as a single vector operation.
+
+        The range of NHS numbers can be split into partitions, so that parallel workers never generate the same number.
+        If partition and partitions are not given, they are taken from the pytest-xdist worker (e.g. gw2 of 4 workers),
+        or the whole range is used when not running under xdist.
+
+        Args:
+            count (int): The number of NHS numbers to generate
+            seed (Optional[int]): A seed, to generate the same NHS numbers every time
+            partition (Optional[int]): The zero based partition of the range to generate the NHS numbers in
+            partitions (Optional[int]): The number of partitions to split the range into
+
+        Returns:
+            list[str]: The generated NHS numbers
+        """
+        if partition is None or partitions is None:
+            partition, partitions = NHSNumberTools.worker_partition()
+        if partitions < 1 or not 0 <= partition < partitions:
+            raise ValueError(f"Invalid partition {partition} of {partitions}")
+        partition_size = NHS_NUMBER_RANGE // partitions
+        low = NHS_NUMBER_BASE + partition * partition_size
+
+        rng = np.random.default_rng(seed)
+        generated: dict[int, None] = {}
+        while len(generated) < count:
+            # Roughly 1 in 11 bases give a checksum of 10, so generate a few extra
+            bases = rng.integers(
+                low, low + partition_size, size=(count - len(generated)) * 12 // 10 + 10
+            )
+            digits = (bases[:, None] // 10 ** np.arange(8, -1, -1)) % 10
+            checksums = (11 - (digits @ NHS_NUMBER_WEIGHTS) % 11) % 11
+            valid = checksums != 10
+            for nhs_number in (bases[valid] * 10 + checksums[valid]).tolist():
+                generated[nhs_number] = None
+        return [str(nhs_number) for nhs_number in list(generated)[:count]]
+
+    @staticmethod
+    def worker_partition() -> tuple[int, int]:
+        """
+        Returns the partition of the NHS number range for the current pytest-xdist worker,
+        as (partition, partitions). This is (0, 1) when not running under xdist.
+        """
+        return worker_partition()
+
     @staticmethod
     def is_valid_nhs_number(nhs_number: str) -> bool:
         """
@@ -0,0 +1,134 @@
+import logging
+import os
+import random
+import threading
+from pathlib import Path
+from typing import Optional, Sequence
+from utils.oracle.oracle import OracleDB
+
+DEFAULT_MAX_WORDS = 50000
+
+
+class AnonWordSampler:
+    """
+    Holds the words from MPI_ANON.ANON_WORD in memory, so that random words can be drawn without any DB round-trips.
+
+    The words are loaded once per session by get_anon_word_sampler. The sampler can be configured in local.env with:
+        ANON_WORD_SEED: A seed for the random number generator, so that the same words are drawn on every run
+        ANON_WORD_SNAPSHOT: The path of a snapshot file. If it exists the words are loaded from it instead of the DB,
+                            otherwise it is created from the words loaded from the DB (allowing offline runs later on)
+    """
+
+    def __init__(self, words: Sequence[str], seed: Optional[int] = None):
+        self.words = tuple(words)
+        self.random = random.Random(seed)
+
+    @classmethod
+    def from_database(
+        cls, seed: Optional[int] = None, max_words: int = DEFAULT_MAX_WORDS
+    ) -> "AnonWordSampler":
+        """
+        Loads the words from MPI_ANON.ANON_WORD. If the table holds more than max_words words,
+        a block sample of roughly max_words words is taken instead (using the seed, so the sample is repeatable).
+
+        Args:
+            seed (Optional[int]): The seed for the random number generator and the block sample
+            max_words (int): The maximum number of words to load before block sampling
+
+        Returns:
+            AnonWordSampler: The sampler holding the loaded words
+        """
+        db = OracleDB()
+        word_count = db.fetch_scalar("SELECT COUNT(*) FROM MPI_ANON.ANON_WORD") or 0
+        if word_count > max_words:
+            percentage = max(max_words / word_count * 100, 0.000001)
+            sample_clause = f"SAMPLE BLOCK ({percentage:.6f}) SEED ({seed or 0})"
+        else:
+            sample_clause = ""
+        words = [
+            row["word"]
+            for row in db.iter_rows(
+                f"SELECT WORD FROM MPI_ANON.ANON_WORD {sample_clause} ORDER BY SEQ",
+                arraysize=5000,
+            )
+            if row["word"]
+        ]
+        logging.info(
+            f"[ANON WORDS] Loaded {len(words)} of {word_count} words from MPI_ANON.ANON_WORD"
+        )
+        return cls(words, seed)
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot_path: str | Path, seed: Optional[int] = None
+    ) -> "AnonWordSampler":
+        """
+        Loads the words from a snapshot file created by save_snapshot.
+
+        Args:
+            snapshot_path (str | Path): The path of the snapshot file
+            seed (Optional[int]): The seed for the random number generator
+
+        Returns:
+            AnonWordSampler: The sampler holding the loaded words
+        """
+        words = [
+            line
+            for line in Path(snapshot_path).read_text(encoding="utf-8").splitlines()
+            if line
+        ]
+        logging.info(f"[ANON WORDS] Loaded {len(words)} words from {snapshot_path}")
+        return cls(words, seed)
+
+    def save_snapshot(self, snapshot_path: str | Path) -> None:
+        """
+        Saves the words to a snapshot file, with one word per line.
+
+        Args:
+            snapshot_path (str | Path): The path of the snapshot file
+        """
+        path = Path(snapshot_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("\n".join(self.words) + "\n", encoding="utf-8")
+        logging.info(f"[ANON WORDS] Saved {len(self.words)} words to {snapshot_path}")
+
+    def random_word(self) -> Optional[str]:
+        """
+        Returns a random word, or None if there are no words.
+        """
+        if not self.words:
+            return None
+        return self.words[self.random.randrange(len(self.words))]
+
+
+_session_sampler: Optional[AnonWordSampler] = None
+_session_sampler_lock = threading.Lock()
+
+
+def get_anon_word_sampler() -> AnonWordSampler:
+    """
+    Returns the session wide word sampler, loading the words (from the snapshot or the DB) on first use.
+    If the words cannot be loaded an empty sampler is used, so the DB is not retried for every word.
+
+    Returns:
+        AnonWordSampler: The session sampler
+    """
+    global _session_sampler
+    with _session_sampler_lock:
+        if _session_sampler is None:
+            seed_value = os.getenv("ANON_WORD_SEED", "").strip()
+            seed = int(seed_value) if seed_value else None
+            snapshot_path = os.getenv("ANON_WORD_SNAPSHOT", "").strip()
+            try:
+                if snapshot_path and Path(snapshot_path).is_file():
+                    _session_sampler = AnonWordSampler.from_snapshot(
+                        snapshot_path, seed
+                    )
+                else:
+                    _session_sampler = AnonWordSampler.from_database(seed)
+                    if snapshot_path and _session_sampler.words:
+                        _session_sampler.save_snapshot(snapshot_path)
+            except Exception as e:
+                logging.warning(f"[ANON WORDS] Unable to load the words: {e}")
+                _session_sampler = AnonWordSampler([], seed)
+        return _session_sampler
@@ -4,8 +4,12 @@ from dotenv import load_dotenv
 from sqlalchemy import create_engine
 import pandas as pd
 import logging
-from typing import Optional
+from typing import Any, Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor
 import pprint
+from classes.database.bulk_write_result import BulkWriteResult
+from classes.database.timed_events_result import TimedEventsResult
+from utils.oracle.oracle_connection_pool import get_session_pool
 
 
 class OracleDB:
@@ -18,15 +22,21 @@ class OracleDB:
     def connect_to_db(self) -> oracledb.Connection:
         """
         This function is used to connect to the Oracle DB. All the credentials are retrieved from a .env file
+        If a session connection pool has been opened (see utils/oracle/oracle_connection_pool.py),
+        the connection is acquired from the pool instead and is released back to it on disconnect.
 
         Returns:
             conn (oracledb.Connection): The Oracle DB connection object
         """
         try:
             logging.debug("Attempting DB connection...")
-            conn = oracledb.connect(
-                user=self.user, password=self.password, dsn=self.dns
-            )
+            pool = get_session_pool()
+            if pool is not None:
+                conn = pool.acquire()
+            else:
+                conn = oracledb.connect(
+                    user=self.user, password=self.password, dsn=self.dns
+                )
             logging.debug("DB connection successful!")
             return conn
         except Exception as queryExecutionError:
@@ -34,7 +44,7 @@ class OracleDB:
 
     def disconnect_from_db(self, conn: oracledb.Connection) -> None:
         """
-        Disconnects from the DB
+        Disconnects from the DB. Pooled connections are released back to the pool.
 
         Args:
             conn (oracledb.Connection): The Oracle DB connection object
@@ -46,51 +56,159 @@ class OracleDB:
         self,
         nhs_number_df: Optional[pd.DataFrame] = None,
         nhs_number: Optional[str] = None,
-    ) -> None:
+        max_workers: int = 1,
+    ) -> list[TimedEventsResult]:
         """
         Executes bcss_timed_events for either a DataFrame of NHS numbers or a single NHS number.
+        Any subjects that fail are logged, see exec_bcss_timed_events_for_subjects for details of how the batch is run.
 
         Args:
             nhs_number_df (Optional[pd.DataFrame]): DataFrame with NHS numbers under 'subject_nhs_number'.
             nhs_number (Optional[str]): A single NHS number.
+            max_workers (int): The number of connections to spread the procedure calls across.
+
+        Returns:
+            list[TimedEventsResult]: The outcome for each subject
 
         Raises:
             ValueError: If neither nhs_number_df nor nhs_number is provided.
         """
-        conn = self.connect_to_db()
-        try:
-            subject_ids = []
-
-            if nhs_number_df is not None:
-                subject_ids = [
-                    self.get_subject_id_from_nhs_number(row["subject_nhs_number"])
-                    for _, row in nhs_number_df.iterrows()
-                ]
-            elif nhs_number is not None:
-                subject_ids = [self.get_subject_id_from_nhs_number(nhs_number)]
+        if nhs_number_df is not None:
+            nhs_numbers = nhs_number_df["subject_nhs_number"].tolist()
+        elif nhs_number is not None:
+            nhs_numbers = [nhs_number]
+        else:
+            raise ValueError("Must provide either nhs_number_df or nhs_number")
+
+        results = self.exec_bcss_timed_events_for_subjects(nhs_numbers, max_workers)
+        for result in results:
+            if not result.success:
+                logging.error(
+                    f"[ORACLE] Failed to execute bcss_timed_events for {result.nhs_number}: {result.error}"
+                )
+        return results
+
+    def exec_bcss_timed_events_for_subjects(
+        self, nhs_numbers: list[str], max_workers: int = 1
+    ) -> list[TimedEventsResult]:
+        """
+        Executes bcss_timed_events for a batch of subjects.
+        All of the subject IDs are resolved with a single query, and the procedure calls are then made over one
+        connection per worker (taken from the session pool if one is open) rather than one connection per subject.
+
+        Args:
+            nhs_numbers (list[str]): The NHS numbers of the subjects. Duplicates are only run once.
+            max_workers (int): The number of connections to spread the procedure calls across. Defaults to 1.
+
+        Returns:
+            list[TimedEventsResult]: The outcome for each unique NHS number, in the order they were provided
+        """
+        unique_nhs_numbers = list(dict.fromkeys(str(nhs_no) for nhs_no in nhs_numbers))
+        subject_ids = self.get_subject_ids_from_nhs_numbers(unique_nhs_numbers)
+
+        results: dict[str, TimedEventsResult] = {}
+        pending = []
+        for nhs_no in unique_nhs_numbers:
+            subject_id = subject_ids.get(nhs_no)
+            if subject_id is None:
+                results[nhs_no] = TimedEventsResult(
+                    nhs_number=nhs_no, error="No subject found with this NHS number"
+                )
             else:
-                raise ValueError("Must provide either nhs_number_df or nhs_number")
+                pending.append(
+                    TimedEventsResult(nhs_number=nhs_no, subject_id=subject_id)
+                )
+
+        worker_count = max(1, min(max_workers, len(pending)))
+        chunks = [pending[index::worker_count] for index in range(worker_count)]
+        if worker_count == 1:
+            self._run_timed_events_chunk(chunks[0])
+        else:
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                list(executor.map(self._run_timed_events_chunk, chunks))
+
+        for result in pending:
+            results[result.nhs_number] = result
+        return [results[nhs_no] for nhs_no in unique_nhs_numbers]
 
-            for subject_id in subject_ids:
+    def _run_timed_events_chunk(self, chunk: list[TimedEventsResult]) -> None:
+        """
+        Runs bcss_timed_events for each subject in the chunk over a single connection, recording the outcome on each result.
+
+        Args:
+            chunk (list[TimedEventsResult]): The subjects to process, with their subject IDs populated
+        """
+        if not chunk:
+            return
+        conn = self.connect_to_db()
+        try:
+            cursor = conn.cursor()
+            for result in chunk:
                 try:
                     logging.debug(
-                        f"[ORACLE] Attempting to execute stored procedure: 'bcss_timed_events', [{subject_id}, 'Y']"
+                        f"[ORACLE] Attempting to execute stored procedure: 'bcss_timed_events', [{result.subject_id}, 'Y']"
                     )
-                    cursor = conn.cursor()
-                    cursor.callproc("bcss_timed_events", [subject_id, "Y"])
+                    cursor.callproc("bcss_timed_events", [result.subject_id, "Y"])
+                    result.success = True
                     logging.debug("Stored procedure execution successful!")
                 except Exception as spExecutionError:
-                    logging.error(
-                        f"[ORACLE] Failed to execute stored procedure with execution error: {spExecutionError}"
-                    )
+                    result.error = str(spExecutionError)
+        finally:
+            self.disconnect_from_db(conn)
 
-        except Exception as queryExecutionError:
-            logging.error(
-                f"[ORACLE] Failed to extract subject ID with error: {queryExecutionError}"
+    def get_subject_ids_from_nhs_numbers(
+        self, nhs_numbers: list[str]
+    ) -> dict[str, int]:
+        """
+        Obtains the subject_screening_id of many subjects with a single query, binding the NHS numbers as an array.
+
+        Args:
+            nhs_numbers (list[str]): The NHS numbers of the subjects
+
+        Returns:
+            dict[str, int]: The subject ids keyed by NHS number. NHS numbers with no subject are not included.
+        """
+        valid_nhs_numbers = [
+            str(nhs_no) for nhs_no in nhs_numbers if str(nhs_no).isdigit()
+        ]
+        if not valid_nhs_numbers:
+            return {}
+        logging.debug(
+            f"[ORACLE] Attempting to get subject_ids for {len(valid_nhs_numbers)} nhs numbers"
+        )
+        conn = self.connect_to_db()
+        try:
+            cursor = conn.cursor()
+            cursor.arraysize = len(valid_nhs_numbers)
+            cursor.execute(
+                """
+                SELECT ss.subject_nhs_number, ss.screening_subject_id
+                FROM screening_subject_t ss
+                WHERE ss.subject_nhs_number IN (SELECT column_value FROM TABLE(:nhs_numbers))
+                """,
+                {"nhs_numbers": self.string_list(conn, valid_nhs_numbers)},
             )
+            rows = cursor.fetchall()
         finally:
-            if conn is not None:
-                self.disconnect_from_db(conn)
+            self.disconnect_from_db(conn)
+        return {str(nhs_no): subject_id for nhs_no, subject_id in rows}
+
+    def string_list(
+        self, conn: oracledb.Connection, values: list[str]
+    ) -> oracledb.DbObject:
+        """
+        Creates a SYS.ODCIVARCHAR2LIST collection, which allows a list of values to be bound as a single bind variable.
+        It can be used in SQL with `IN (SELECT column_value FROM TABLE(:bind_name))`
+
+        Args:
+            conn (oracledb.Connection): The connection the collection will be bound on
+            values (list[str]): The values to put in the collection
+
+        Returns:
+            oracledb.DbObject: The collection object
+        """
+        list_type = conn.gettype("SYS.ODCIVARCHAR2LIST")
+        return list_type.newobject([str(value) for value in values])
 
     def get_subject_id_from_nhs_number(self, nhs_number: str) -> str:
         """
@@ -101,17 +219,19 @@ class OracleDB:
 
         Returns:
             subject_id (str): The subject id for the provided nhs number
+
+        Raises:
+            ValueError: If no subject exists with the provided nhs number
         """
-        conn = self.connect_to_db()
         logging.debug(
             f"[ORACLE] Attempting to get subject_id from nhs number: {nhs_number}"
         )
-        cursor = conn.cursor()
-        cursor.execute(
-            f"SELECT SCREENING_SUBJECT_ID FROM SCREENING_SUBJECT_T WHERE SUBJECT_NHS_NUMBER = {int(nhs_number)}"
+        subject_id = self.fetch_scalar(
+            "SELECT SCREENING_SUBJECT_ID FROM SCREENING_SUBJECT_T WHERE SUBJECT_NHS_NUMBER = :nhs_number",
+            {"nhs_number": str(nhs_number)},
         )
-        result = cursor.fetchall()
-        subject_id = result[0][0]
+        if subject_id is None:
+            raise ValueError(f"No subject found with NHS number: {nhs_number}")
         logging.debug(f"Able to extract subject ID: {subject_id}")
         return subject_id
 
@@ -200,6 +320,101 @@ class OracleDB:
                 self.disconnect_from_db(conn)
         return df
 
+    def fetch_scalar(self, query: str, parameters: dict | None = None) -> Any:
+        """
+        Executes a query and returns the first column of the first row, without building a DataFrame.
+        Useful for single value lookups such as IDs and counts.
+
+        Args:
+            query (str): The SQL query you wish to run
+            parameters (dict | None): Optional - Any parameters you want to pass on in a dictionary
+
+        Returns:
+            Any: The first value returned by the query, or None if no rows were returned
+
+        Raises:
+            RuntimeError: If the query fails to execute
+        """
+        row = self.fetch_one(query, parameters)
+        if row is None:
+            return None
+        return next(iter(row.values()))
+
+    def fetch_one(self, query: str, parameters: dict | None = None) -> Optional[dict]:
+        """
+        Executes a query and returns the first row as a dictionary, without building a DataFrame.
+        The keys are the lower case column names, matching the column names returned by execute_query.
+
+        Args:
+            query (str): The SQL query you wish to run
+            parameters (dict | None): Optional - Any parameters you want to pass on in a dictionary
+
+        Returns:
+            Optional[dict]: The first row of the result, or None if no rows were returned
+
+        Raises:
+            RuntimeError: If the query fails to execute
+        """
+        rows = self.iter_rows(query, parameters, arraysize=1)
+        try:
+            return next(rows, None)
+        finally:
+            rows.close()
+
+    def iter_rows(
+        self, query: str, parameters: dict | None = None, arraysize: int = 500
+    ) -> Iterator[dict]:
+        """
+        Executes a query and yields each row as a dictionary, fetching from the database in batches of `arraysize` rows.
+        This allows large result sets to be processed without holding the whole result in memory.
+        The keys are the lower case column names, matching the column names returned by execute_query.
+
+        The connection is held until the generator is exhausted or closed.
+        Any list parameters are bound as a single SYS.ODCIVARCHAR2LIST (see string_list).
+
+        Args:
+            query (str): The SQL query you wish to run
+            parameters (dict | None): Optional - Any parameters you want to pass on in a dictionary
+            arraysize (int): The number of rows to fetch from the database per round-trip
+
+        Yields:
+            dict: A row of the result keyed by lower case column name
+
+        Raises:
+            RuntimeError: If the query fails to execute
+        """
+        conn = self.connect_to_db()
+        try:
+            if parameters:
+                params_str = pprint.pformat(parameters, indent=2)
+                logging.debug(
+                    f"[ORACLE] Executing query: {query} with parameters:\n{params_str}"
+                )
+            else:
+                logging.debug(f"[ORACLE] Executing query: {query}")
+            parameters = dict(parameters or {})
+            for name, value in parameters.items():
+                if isinstance(value, list):
+                    parameters[name] = self.string_list(conn, value)
+            cursor = conn.cursor()
+            cursor.arraysize = arraysize
+            cursor.prefetchrows = arraysize + 1
+            try:
+                cursor.execute(query, parameters)
+            except Exception as executionError:
+                raise RuntimeError(
+                    f"[ORACLE] Failed to execute query with execution error {executionError}"
+                )
+            columns = [column[0].lower() for column in cursor.description]
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(columns, row))
+        finally:
+            self.disconnect_from_db(conn)
+
     def execute_stored_procedure(
         self,
         procedure: str,
@@ -324,6 +539,68 @@ class OracleDB:
             if conn is not None:
                 self.disconnect_from_db(conn)
 
+    def bulk_update_or_insert_data_to_table(
+        self,
+        statement: str,
+        params_list: list[dict],
+        rollback_on_error: bool = False,
+    ) -> BulkWriteResult:
+        """
+        This is used to run the same insert or update statement for many sets of parameters in a single round-trip.
+        It uses cursor.executemany with batch errors enabled, so a failing row does not stop the others,
+        and commits once at the end.
+
+        Args:
+            statement (str): The SQL statement you wish to run
+            params_list (list[dict]): A dictionary of parameters for each row
+            rollback_on_error (bool): If True, nothing is committed when any row fails. Defaults to False.
+
+        Returns:
+            BulkWriteResult: The number of rows affected by each parameter set, and any errors keyed by the position of the parameter set
+
+        Raises:
+            RuntimeError: If the statement could not be executed at all
+        """
+        result = BulkWriteResult()
+        if not params_list:
+            return result
+        conn = self.connect_to_db()
+        try:
+            logging.debug(
+                f"[ORACLE] Executing statement for {len(params_list)} rows: {statement}"
+            )
+            cursor = conn.cursor()
+            try:
+                cursor.executemany(
+                    statement, params_list, batcherrors=True, arraydmlrowcounts=True
+                )
+            except Exception as dbUpdateInsertError:
+                raise RuntimeError(
+                    f"[ORACLE] Failed to insert/update values in the DB table with error {dbUpdateInsertError}"
+                )
+            result.errors = {
+                error.offset: error.message for error in cursor.getbatcherrors()
+            }
+            result.row_counts = cursor.getarraydmlrowcounts()
+            if result.errors and rollback_on_error:
+                conn.rollback()
+                logging.error(
+                    f"[ORACLE] {len(result.errors)} rows failed, rolled back: {result.errors}"
+                )
+            else:
+                conn.commit()
+                result.committed = True
+                if result.errors:
+                    logging.error(
+                        f"[ORACLE] {len(result.errors)} rows failed: {result.errors}"
+                    )
+                logging.debug(
+                    f"DB table successfully updated! Rows affected: {result.total_rows_affected()}"
+                )
+        finally:
+            self.disconnect_from_db(conn)
+        return result
+
 
 class OracleSubjectTools(OracleDB):
     def __init__(self):
@@ -0,0 +1,227 @@
+import oracledb
+import os
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+DEFAULT_POOL_MIN = 1
+DEFAULT_POOL_MAX = 4
+DEFAULT_POOL_INCREMENT = 1
+DEFAULT_POOL_WAIT_TIMEOUT_SECONDS = 60
+
+
+@dataclass
+class PoolStatistics:
+    """
+    Data class holding the usage statistics gathered while a connection pool was open.
+    """
+
+    acquires: int = 0
+    waits: int = 0
+    peak_busy: int = 0
+    total_wait_seconds: float = 0.0
+
+    def summary(self) -> str:
+        """
+        Returns a single line summary of the statistics, suitable for logging.
+        """
+        return (
+            f"acquires={self.acquires}, waits={self.waits}, "
+            f"peak_busy={self.peak_busy}, total_wait={self.total_wait_seconds:.3f}s"
+        )
+
+
+class OracleConnectionPool:
+    """
+    Provides pooled Oracle connections backed by oracledb.create_pool.
+
+    The pool itself is only created when the first connection is requested, so sessions that never
+    touch the database do not pay for it. The credentials are taken from the same environment variables
+    used by OracleDB, and the pool sizing can be configured in local.env with:
+        ORACLE_POOL_MIN, ORACLE_POOL_MAX and ORACLE_POOL_INCREMENT
+    If every connection is busy, acquire waits up to ORACLE_POOL_WAIT_TIMEOUT_SECONDS for one to become free.
+    """
+
+    def __init__(
+        self,
+        min_size: int = DEFAULT_POOL_MIN,
+        max_size: int = DEFAULT_POOL_MAX,
+        increment: int = DEFAULT_POOL_INCREMENT,
+        wait_timeout_seconds: int = DEFAULT_POOL_WAIT_TIMEOUT_SECONDS,
+    ):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError(
+                f"Invalid pool sizing: min={min_size}, max={max_size}, increment={increment}"
+            )
+        if wait_timeout_seconds < 1:
+            raise ValueError(
+                f"Invalid pool wait timeout: {wait_timeout_seconds} seconds"
+            )
+        self.min_size = min_size
+        self.max_size = max_size
+        self.increment = increment
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self.statistics = PoolStatistics()
+        self._pool: Optional[oracledb.ConnectionPool] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> "OracleConnectionPool":
+        """
+        Creates an OracleConnectionPool using the sizing values set in the environment (or the defaults if they are not set).
+
+        Returns:
+            OracleConnectionPool: The configured (but not yet opened) connection pool
+        """
+        return cls(
+            min_size=_int_from_env("ORACLE_POOL_MIN", DEFAULT_POOL_MIN),
+            max_size=_int_from_env("ORACLE_POOL_MAX", DEFAULT_POOL_MAX),
+            increment=_int_from_env("ORACLE_POOL_INCREMENT", DEFAULT_POOL_INCREMENT),
+            wait_timeout_seconds=_int_from_env(
+                "ORACLE_POOL_WAIT_TIMEOUT_SECONDS", DEFAULT_POOL_WAIT_TIMEOUT_SECONDS
+            ),
+        )
+
+    def _get_pool(self) -> oracledb.ConnectionPool:
+        """
+        Returns the underlying oracledb pool, creating it on first use.
+
+        Returns:
+            oracledb.ConnectionPool: The underlying pool
+        """
+        with self._lock:
+            if self._pool is None:
+                logging.debug(
+                    f"[ORACLE POOL] Creating connection pool (min={self.min_size}, max={self.max_size}, increment={self.increment})"
+                )
+                try:
+                    self._pool = oracledb.create_pool(
+                        user=os.getenv("ORACLE_USERNAME"),
+                        password=os.getenv("ORACLE_PASS"),
+                        dsn=os.getenv("ORACLE_DB"),
+                        min=self.min_size,
+                        max=self.max_size,
+                        increment=self.increment,
+                        getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+                        wait_timeout=self.wait_timeout_seconds * 1000,
+                    )
+                except Exception as poolCreationError:
+                    raise RuntimeError(
+                        f"Database connection pool creation failed: {poolCreationError}"
+                    )
+            return self._pool
+
+    def acquire(self) -> oracledb.Connection:
+        """
+        Acquires a connection from the pool, waiting for one to become free if the pool is fully busy.
+        Closing the returned connection releases it back to the pool.
+
+        Returns:
+            conn (oracledb.Connection): A pooled Oracle DB connection object
+
+        Raises:
+            RuntimeError: If no connection became free within the wait timeout
+        """
+        pool = self._get_pool()
+        must_wait = pool.busy >= self.max_size
+        start = time.perf_counter()
+        try:
+            conn = pool.acquire()
+        except oracledb.Error as acquireError:
+            if not must_wait:
+                raise
+            raise RuntimeError(
+                f"No database connection became free within {self.wait_timeout_seconds} seconds, "
+                f"as all {self.max_size} pooled connections were busy. Increase ORACLE_POOL_MAX, "
+                f"or check for connections that are not being closed: {acquireError}"
+            ) from acquireError
+        waited = time.perf_counter() - start
+        with self._lock:
+            self.statistics.acquires += 1
+            if must_wait:
+                self.statistics.waits += 1
+                self.statistics.total_wait_seconds += waited
+            self.statistics.peak_busy = max(self.statistics.peak_busy, pool.busy)
+        return conn
+
+    def is_open(self) -> bool:
+        """
+        Returns True if the underlying pool has been created and not yet closed.
+        """
+        return self._pool is not None
+
+    def close(self) -> PoolStatistics:
+        """
+        Closes the underlying pool (if it was ever opened) and returns the statistics gathered.
+
+        Returns:
+            PoolStatistics: The usage statistics for the lifetime of the pool
+        """
+        with self._lock:
+            if self._pool is not None:
+                self._pool.close(force=True)
+                self._pool = None
+                logging.debug("[ORACLE POOL] Connection pool closed")
+        return self.statistics
+
+
+_session_pool: Optional[OracleConnectionPool] = None
+
+
+def open_session_pool() -> OracleConnectionPool:
+    """
+    Registers a session wide connection pool. From this point on OracleDB.connect_to_db hands out pooled connections.
+
+    Returns:
+        OracleConnectionPool: The session pool
+    """
+    global _session_pool
+    if _session_pool is None:
+        _session_pool = OracleConnectionPool.from_environment()
+    return _session_pool
+
+
+def get_session_pool() -> Optional[OracleConnectionPool]:
+    """
+    Returns the session wide connection pool, or None if one has not been opened.
+    """
+    return _session_pool
+
+
+def close_session_pool() -> Optional[PoolStatistics]:
+    """
+    Closes the session wide connection pool, after which OracleDB goes back to using standalone connections.
+
+    Returns:
+        Optional[PoolStatistics]: The statistics gathered by the pool, or None if no pool was open
+    """
+    global _session_pool
+    if _session_pool is None:
+        return None
+    statistics = _session_pool.close()
+    _session_pool = None
+    return statistics
+
+
+def _int_from_env(key: str, default: int) -> int:
+    """
+    Reads an integer from the environment, falling back to the default when the value is missing or blank.
+
+    Args:
+        key (str): The environment variable name
+        default (int): The value to use when the variable is not set
+
+    Returns:
+        int: The integer value
+    """
+    value = os.getenv(key, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(
+            f"Environment variable {key} must be an integer, got '{value}'"
+        )
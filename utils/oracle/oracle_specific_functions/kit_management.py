@@ -4,6 +4,57 @@ import pandas as pd
 from datetime import datetime
 from utils.oracle.oracle_specific_functions.enums import SqlQueryValues
 
+# This SQL is similar to the one used in pkg_test_kit_queue.p_get_fit_monitor_details, without its WHERE clause
+SERVICE_MANAGEMENT_QUERY = """SELECT kq.device_id, kq.test_kit_name, kq.test_kit_type, kq.test_kit_status,
+    CASE WHEN tki.logged_in_flag = 'Y' THEN kq.logged_by_hub END AS logged_by_hub,
+    CASE WHEN tki.logged_in_flag = 'Y' THEN kq.date_time_logged END AS date_time_logged,
+    tki.logged_in_on AS tk_logged_date_time, kq.test_result, kq.calculated_result,
+    kq.error_code,
+    (SELECT vvt.description
+    FROM tk_analyser_t tka
+    INNER JOIN tk_analyser_type_error tkate ON tkate.tk_analyser_type_id = tka.tk_analyser_type_id
+    INNER JOIN valid_values vvt ON tkate.tk_analyser_error_type_id = vvt.valid_value_id
+    WHERE tka.analyser_code = kq.analyser_code AND tkate.error_code = kq.error_code)
+    AS analyser_error_description, kq.analyser_code, kq.date_time_authorised,
+    kq.authoriser_user_code, kq.datestamp, kq.bcss_error_id,
+    REPLACE(mt.description, 'ERROR - ', '') AS error_type,
+    NVL(mta.allowed_value, 'N') AS error_ok_to_archive,
+    kq.post_response, kq.post_attempts, kq.put_response,
+    kq.put_attempts, kq.date_time_error_archived,
+    kq.error_archived_user_code, sst.screening_subject_id,
+    sst.subject_nhs_number, tki.test_results, tki.issue_date,
+    o.org_code AS issued_by_hub
+    FROM kit_queue kq
+    LEFT OUTER JOIN tk_items_t tki ON tki.device_id = kq.device_id
+    OR (tki.device_id IS NULL AND tki.kitid = pkg_test_kit.f_get_kit_id_from_device_id(kq.device_id))
+    LEFT OUTER JOIN screening_subject_t sst ON sst.screening_subject_id = tki.screening_subject_id
+    LEFT OUTER JOIN ep_subject_episode_t ep ON ep.subject_epis_id = tki.subject_epis_id
+    LEFT OUTER JOIN message_types mt ON kq.bcss_error_id = mt.message_type_id
+    LEFT OUTER JOIN valid_values mta ON mta.valid_value_id = mt.message_attribute_id AND mta.valid_value_id = 305482
+    LEFT OUTER JOIN ORG o ON ep.start_hub_id = o.org_id
+    LEFT OUTER JOIN ORG lo ON lo.org_code = kq.logged_by_hub
+"""
+
+KIT_QUEUE_UPDATE_QUERY = """
+    UPDATE kit_queue kq
+    SET kq.test_kit_name = :test_kit_name,
+    kq.test_kit_type = :test_kit_type,
+    kq.test_kit_status =:test_kit_status,
+    kq.logged_by_hub = :logged_by_hub,
+    kq.date_time_logged = :date_time_logged,
+    kq.test_result = :test_result,
+    kq.calculated_result = :calculated_result,
+    kq.error_code = NULL,
+    kq.analyser_code = :analyser_code,
+    kq.date_time_authorised = TO_TIMESTAMP(:date_time_authorised, 'DD-Mon-YY HH24.MI.SS.FF9'),
+    kq.authoriser_user_code = :authoriser_user_code,
+    kq.post_response = :post_response,
+    kq.post_attempts = :post_attempts,
+    kq.put_response = :put_response,
+    kq.put_attempts = :put_attempts
+    WHERE kq.device_id = :device_id
+    """
+
 
 def get_kit_id_from_db(
     tk_type_id: int, hub_id: int, no_of_kits_to_retrieve: int
@@ -84,6 +135,32 @@ def get_kit_id_logged_from_db(smokescreen_properties: dict) -> pd.DataFrame:
     return kit_id_df
 
 
+def get_service_management_by_device_ids(device_ids: list[str]) -> pd.DataFrame:
+    """
+    Gets the service management records of many devices with a single query, binding the device IDs as an array.
+
+    Args:
+        device_ids (list[str]): The device IDs
+
+    Returns:
+        pd.DataFrame: A pandas DataFrame containing the records, with the same columns as get_service_management_by_device_id
+    """
+    query = f"""{SERVICE_MANAGEMENT_QUERY}    WHERE kq.test_kit_type = 'FIT'
+    AND kq.device_id IN (SELECT column_value FROM TABLE(:device_ids))
+    """
+    db = OracleDB()
+    conn = db.connect_to_db()
+    try:
+        cursor = conn.cursor()
+        cursor.arraysize = max(len(device_ids), 1)
+        cursor.execute(query, {"device_ids": db.string_list(conn, device_ids)})
+        columns = [column[0].lower() for column in cursor.description]
+        rows = cursor.fetchall()
+    finally:
+        db.disconnect_from_db(conn)
+    return pd.DataFrame(rows, columns=columns)
+
+
 def get_service_management_by_device_id(device_id: str) -> pd.DataFrame:
     """
     This SQL is similar to the one used in pkg_test_kit_queue.p_get_fit_monitor_details, but adapted to allow us to pick out sub-sets of records
@@ -95,35 +172,7 @@ def get_service_management_by_device_id(device_id: str) -> pd.DataFrame:
         get_service_management_df (pd.DataFrame): A pandas DataFrame containing the result of the query
     """
 
-    query = """SELECT kq.device_id, kq.test_kit_name, kq.test_kit_type, kq.test_kit_status,
-    CASE WHEN tki.logged_in_flag = 'Y' THEN kq.logged_by_hub END AS logged_by_hub,
-    CASE WHEN tki.logged_in_flag = 'Y' THEN kq.date_time_logged END AS date_time_logged,
-    tki.logged_in_on AS tk_logged_date_time, kq.test_result, kq.calculated_result,
-    kq.error_code,
-    (SELECT vvt.description
-    FROM tk_analyser_t tka
-    INNER JOIN tk_analyser_type_error tkate ON tkate.tk_analyser_type_id = tka.tk_analyser_type_id
-    INNER JOIN valid_values vvt ON tkate.tk_analyser_error_type_id = vvt.valid_value_id
-    WHERE tka.analyser_code = kq.analyser_code AND tkate.error_code = kq.error_code)
-    AS analyser_error_description, kq.analyser_code, kq.date_time_authorised,
-    kq.authoriser_user_code, kq.datestamp, kq.bcss_error_id,
-    REPLACE(mt.description, 'ERROR - ', '') AS error_type,
-    NVL(mta.allowed_value, 'N') AS error_ok_to_archive,
-    kq.post_response, kq.post_attempts, kq.put_response,
-    kq.put_attempts, kq.date_time_error_archived,
-    kq.error_archived_user_code, sst.screening_subject_id,
-    sst.subject_nhs_number, tki.test_results, tki.issue_date,
-    o.org_code AS issued_by_hub
-    FROM kit_queue kq
-    LEFT OUTER JOIN tk_items_t tki ON tki.device_id = kq.device_id
-    OR (tki.device_id IS NULL AND tki.kitid = pkg_test_kit.f_get_kit_id_from_device_id(kq.device_id))
-    LEFT OUTER JOIN screening_subject_t sst ON sst.screening_subject_id = tki.screening_subject_id
-    LEFT OUTER JOIN ep_subject_episode_t ep ON ep.subject_epis_id = tki.subject_epis_id
-    LEFT OUTER JOIN message_types mt ON kq.bcss_error_id = mt.message_type_id
-    LEFT OUTER JOIN valid_values mta ON mta.valid_value_id = mt.message_attribute_id AND mta.valid_value_id = 305482
-    LEFT OUTER JOIN ORG o ON ep.start_hub_id = o.org_id
-    LEFT OUTER JOIN ORG lo ON lo.org_code = kq.logged_by_hub
-    WHERE kq.test_kit_type = 'FIT' AND kq.device_id = :device_id
+    query = f"""{SERVICE_MANAGEMENT_QUERY}    WHERE kq.test_kit_type = 'FIT' AND kq.device_id = :device_id
     """
     params = {"device_id": device_id}
     get_service_management_df = OracleDB().execute_query(query, params)
@@ -145,7 +194,87 @@ def update_kit_service_management_entity(
     Returns:
         subject_nhs_number (str): The NHS Number of the affected subject
     """
-    get_service_management_df = get_service_management_by_device_id(device_id)
+    subject_nhs_number, params = _get_kit_queue_update_params(
+        device_id,
+        get_service_management_by_device_id(device_id),
+        normal,
+        smokescreen_properties,
+    )
+
+    # Execute query
+    rows_affected = OracleDB().update_or_insert_data_to_table(
+        KIT_QUEUE_UPDATE_QUERY, params
+    )
+    logging.info(f"Rows affected: {rows_affected}")
+    # Return the subject NHS number
+    return subject_nhs_number
+
+
+def update_kit_service_management_entities(
+    device_ids: list[tuple[str, bool]], smokescreen_properties: dict
+) -> list[str]:
+    """
+    This method is used to update the KIT_QUEUE table on the DB for many devices at once.
+    The service management records of every device are read in a single query, and the update is run
+    for every device in a single bulk statement, instead of one query and statement per device.
+
+    Args:
+        device_ids (list[tuple[str, bool]]): The device IDs, each paired with whether it should be marked as normal (True) or abnormal (False)
+        smokescreen_properties(): A dictionary containing all values needed to run the query
+
+    Returns:
+        list[str]: The NHS Numbers of the affected subjects, in the same order as the device IDs
+
+    Raises:
+        RuntimeError: If the update failed for any of the devices
+    """
+    service_management_df = get_service_management_by_device_ids(
+        [device_id for device_id, _ in device_ids]
+    )
+    nhs_numbers = []
+    params_list = []
+    for device_id, normal in device_ids:
+        subject_nhs_number, params = _get_kit_queue_update_params(
+            device_id,
+            service_management_df[service_management_df["device_id"] == device_id],
+            normal,
+            smokescreen_properties,
+        )
+        nhs_numbers.append(subject_nhs_number)
+        params_list.append(params)
+
+    result = OracleDB().bulk_update_or_insert_data_to_table(
+        KIT_QUEUE_UPDATE_QUERY, params_list
+    )
+    if not result.is_success():
+        failed_devices = {
+            device_ids[offset][0]: error for offset, error in result.errors.items()
+        }
+        raise RuntimeError(
+            f"Failed to update the KIT_QUEUE for devices: {failed_devices}"
+        )
+    logging.info(f"Rows affected: {result.total_rows_affected()}")
+    return nhs_numbers
+
+
+def _get_kit_queue_update_params(
+    device_id: str,
+    get_service_management_df: pd.DataFrame,
+    normal: bool,
+    smokescreen_properties: dict,
+) -> tuple[str, dict]:
+    """
+    Builds the parameters for KIT_QUEUE_UPDATE_QUERY from the current service management record for a device
+
+    Args:
+        device_id (str): The device ID
+        get_service_management_df (pd.DataFrame): The service management records of the device
+        normal (bool): Whether the device should be marked as normal or abnormal
+        smokescreen_properties(): A dictionary containing all values needed to run the query
+
+    Returns:
+        tuple[str, dict]: The NHS Number of the affected subject, and the parameters for the update
+    """
     try:
         # Extract the NHS number from the DataFrame
         subject_nhs_number = get_service_management_df["subject_nhs_number"].iloc[0]
@@ -171,26 +300,6 @@ def update_kit_service_management_entity(
         test_result = int(smokescreen_properties["c3_fit_kit_normal_result"])
     else:
         test_result = int(smokescreen_properties["c3_fit_kit_abnormal_result"])
-        # Parameterized query
-    update_query = """
-    UPDATE kit_queue kq
-    SET kq.test_kit_name = :test_kit_name,
-    kq.test_kit_type = :test_kit_type,
-    kq.test_kit_status =:test_kit_status,
-    kq.logged_by_hub = :logged_by_hub,
-    kq.date_time_logged = :date_time_logged,
-    kq.test_result = :test_result,
-    kq.calculated_result = :calculated_result,
-    kq.error_code = NULL,
-    kq.analyser_code = :analyser_code,
-    kq.date_time_authorised = TO_TIMESTAMP(:date_time_authorised, 'DD-Mon-YY HH24.MI.SS.FF9'),
-    kq.authoriser_user_code = :authoriser_user_code,
-    kq.post_response = :post_response,
-    kq.post_attempts = :post_attempts,
-    kq.put_response = :put_response,
-    kq.put_attempts = :put_attempts
-    WHERE kq.device_id = :device_id
-    """
 
     # Parameters dictionary
     params = {
@@ -204,18 +313,14 @@ def update_kit_service_management_entity(
         "analyser_code": smokescreen_properties["c3_fit_kit_analyser_code"],
         "date_time_authorised": str(date_time_authorised),
         "authoriser_user_code": smokescreen_properties["c3_fit_kit_authorised_user"],
-        "post_response": int(post_response) if post_response is not None else 0,
-        "post_attempts": int(post_attempts) if post_attempts is not None else 0,
-        "put_response": put_response,
-        "put_attempts": put_attempts,
+        # NULLs in numeric columns are read into the DataFrame as NaN rather than None
+        "post_response": 0 if pd.isna(post_response) else int(post_response),
+        "post_attempts": 0 if pd.isna(post_attempts) else int(post_attempts),
+        "put_response": None if pd.isna(put_response) else put_response,
+        "put_attempts": None if pd.isna(put_attempts) else put_attempts,
         "device_id": device_id,
     }
-
-    # Execute query
-    rows_affected = OracleDB().update_or_insert_data_to_table(update_query, params)
-    logging.info(f"Rows affected: {rows_affected}")
-    # Return the subject NHS number
-    return subject_nhs_number
+    return subject_nhs_number, params
 
 
 def execute_fit_kit_stored_procedures() -> None:
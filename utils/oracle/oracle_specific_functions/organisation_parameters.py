@@ -1,4 +1,5 @@
 from oracle.oracle import OracleDB
+from utils.parallel_execution import resource_lock
 import logging
 import pandas as pd
 
@@ -15,41 +16,63 @@ def set_org_parameter_value(param_id: int, param_value: str, org_id: str) -> Non
         param_value (str): The new value to set for the parameter.
         org_id (str): The organisation ID for which the parameter should be set.
     """
-    # End any old values
-    sql_update = (
-        "UPDATE org_parameters op "
-        "SET op.effective_from = op.effective_from - 1, "
-        "op.effective_to = CASE WHEN op.effective_to IS NULL THEN TRUNC(SYSDATE)-1 ELSE op.effective_to - 1 END, "
-        "op.audit_reason = 'AUTOMATED TESTING - END', "
-        "op.datestamp = SYSTIMESTAMP "
-        "WHERE op.org_id = :org_id "
-        "AND param_id = :param_id"
-    )
-    params = {"org_id": org_id, "param_id": param_id}
-    logging.info(f"executing query to end any old values: {sql_update}")
-    OracleDB().update_or_insert_data_to_table(sql_update, params)
-
-    # Insert new value
-    sql_insert = """
-        INSERT INTO org_parameters (
-        org_param_id, org_code, org_id, param_id, val,
-        effective_from, pio_id, audit_reason, datestamp
-        )
-        VALUES (
-        seq_org_param.NEXTVAL,
-        (SELECT org_code FROM org WHERE org_id = :org_id),
-        :org_id,
-        :param_id,
-        :param_value,
-        TRUNC(SYSDATE),
-        1,
-        'AUTOMATED TESTING - ADD',
-        SYSTIMESTAMP
+    set_org_parameter_values({param_id: param_value}, org_id)
+
+
+def set_org_parameter_values(param_values: dict[int, str], org_id: str) -> None:
+    """
+    Updates the values of several organisation parameters in the database.
+    The old values for every parameter are ended in one bulk update, and the new values are added in one bulk insert.
+
+    Args:
+        param_values (dict[int, str]): The new value to set for each parameter, keyed by parameter ID.
+        org_id (str): The organisation ID for which the parameters should be set.
+    """
+    if not param_values:
+        return
+
+    # Only one worker can change the organisation's parameters at a time
+    with resource_lock(f"org_parameters_{org_id}"):
+        # End any old values
+        sql_update = (
+            "UPDATE org_parameters op "
+            "SET op.effective_from = op.effective_from - 1, "
+            "op.effective_to = CASE WHEN op.effective_to IS NULL THEN TRUNC(SYSDATE)-1 ELSE op.effective_to - 1 END, "
+            "op.audit_reason = 'AUTOMATED TESTING - END', "
+            "op.datestamp = SYSTIMESTAMP "
+            "WHERE op.org_id = :org_id "
+            "AND param_id = :param_id"
         )
-        """
-    params = {"org_id": org_id, "param_id": param_id, "param_value": param_value}
-    logging.info(f"executing query to set new value: {sql_insert}")
-    OracleDB().update_or_insert_data_to_table(sql_insert, params)
+        params_list = [
+            {"org_id": org_id, "param_id": param_id} for param_id in param_values
+        ]
+        logging.info(f"executing query to end any old values: {sql_update}")
+        OracleDB().bulk_update_or_insert_data_to_table(sql_update, params_list)
+
+        # Insert new values
+        sql_insert = """
+            INSERT INTO org_parameters (
+            org_param_id, org_code, org_id, param_id, val,
+            effective_from, pio_id, audit_reason, datestamp
+            )
+            VALUES (
+            seq_org_param.NEXTVAL,
+            (SELECT org_code FROM org WHERE org_id = :org_id),
+            :org_id,
+            :param_id,
+            :param_value,
+            TRUNC(SYSDATE),
+            1,
+            'AUTOMATED TESTING - ADD',
+            SYSTIMESTAMP
+            )
+            """
+        params_list = [
+            {"org_id": org_id, "param_id": param_id, "param_value": param_value}
+            for param_id, param_value in param_values.items()
+        ]
+        logging.info(f"executing query to set new values: {sql_insert}")
+        OracleDB().bulk_update_or_insert_data_to_table(sql_insert, params_list)
 
 
 def get_org_parameter_value(param_id: int, org_id: str) -> pd.DataFrame:
@@ -1,5 +1,7 @@
 from oracle.oracle import OracleDB
+from utils.oracle.reference_data_cache import get_reference_data_cache, in_list_clause
 import pandas as pd
+from typing import Optional
 
 
 def get_nhs_no_from_batch_id(batch_id: str) -> pd.DataFrame:
@@ -28,19 +30,56 @@ def get_nhs_no_from_batch_id(batch_id: str) -> pd.DataFrame:
     return nhs_number_df
 
 
-def there_is_letter_batch(
+def letter_batch_query(
     letter_batch_code: str,
     letter_batch_title: str,
-) -> bool:
+    screening_subject_id: Optional[int] = None,
+) -> tuple[str, dict]:
     """
-    This function checks if there is a letter batch with the specified code and title in the database.
+    Builds the query used to find the open letter batches with the specified code and title.
+    The valid value IDs of the code and title are looked up from the reference data cache,
+    falling back to joining to valid_values if the cache could not be loaded.
+
     Args:
-        letter_batch_code (str): The code of the letter batch to check.
-        letter_batch_title (str): The title of the letter batch to check.
+        letter_batch_code (str): The code of the letter batch.
+        letter_batch_title (str): The title of the letter batch.
+        screening_subject_id (Optional[int]): If given, only the batches this subject is in are found.
+
     Returns:
-        bool: True if the letter batch exists, False otherwise.
+        tuple[str, dict]: The query and its bind variables.
     """
-    sql_query = """ SELECT lb.batch_id
+    subject_clause = ""
+    subject_binds = {}
+    if screening_subject_id is not None:
+        subject_clause = "AND lbr.screening_subject_id = :subject_id"
+        subject_binds = {"subject_id": screening_subject_id}
+
+    reference_data = get_reference_data_cache()
+    if reference_data.has_table("valid_values"):
+        status_clause, status_binds = in_list_clause(
+            "lb.status_id",
+            "status_id",
+            reference_data.valid_value_ids(allowed_value=letter_batch_code),
+        )
+        description_clause, description_binds = in_list_clause(
+            "lb.description_id",
+            "description_id",
+            reference_data.valid_value_ids(description=letter_batch_title),
+        )
+        sql_query = f""" SELECT lb.batch_id
+        FROM lett_batch_records lbr
+        INNER JOIN lett_batch lb
+        ON lb.batch_id = lbr.batch_id
+        WHERE lb.batch_state_id = 12018
+        AND {status_clause}
+        AND {description_clause}
+        AND lbr.non_inclusion_id IS NULL
+        AND lbr.key_id != 11539
+        {subject_clause}
+"""
+        return sql_query, {**status_binds, **description_binds, **subject_binds}
+
+    sql_query = f""" SELECT lb.batch_id
         FROM lett_batch_records lbr
         INNER JOIN lett_batch lb
         ON lb.batch_id = lbr.batch_id
@@ -53,14 +92,29 @@ def there_is_letter_batch(
         AND LOWER(ld.description) = LOWER(:batch_title)
         AND lbr.non_inclusion_id IS NULL
         AND lbr.key_id != 11539
-        """
-
-
+        {subject_clause}
+"""
     params = {
         "batch_code": letter_batch_code,
         "batch_title": letter_batch_title,
+        **subject_binds,
     }
+    return sql_query, params
 
+
+def there_is_letter_batch(
+    letter_batch_code: str,
+    letter_batch_title: str,
+) -> bool:
+    """
+    This function checks if there is a letter batch with the specified code and title in the database.
+    Args:
+        letter_batch_code (str): The code of the letter batch to check.
+        letter_batch_title (str): The title of the letter batch to check.
+    Returns:
+        bool: True if the letter batch exists, False otherwise.
+    """
+    sql_query, params = letter_batch_query(letter_batch_code, letter_batch_title)
     batch_df = OracleDB().execute_query(sql_query, params)
     if not batch_df.empty:
         return True
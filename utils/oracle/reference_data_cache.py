@@ -0,0 +1,496 @@
+import hashlib
+import importlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+from classes.valid_values.indexed_enum import IndexedEnum
+from classes.valid_values.valid_value_drift import ValidValueDrift
+from utils.oracle.oracle import OracleDB
+
+# Increase this if the tables or columns below change, so that older snapshots are re-synced
+SNAPSHOT_FORMAT_VERSION = 1
+DEFAULT_MAX_AGE_HOURS = 24
+
+REFERENCE_DATA_QUERIES = {
+    "valid_values": "SELECT valid_value_id, domain, allowed_value, description FROM valid_values ORDER BY valid_value_id",
+    "message_types": "SELECT message_type_id, message_attribute_id, description FROM message_types ORDER BY message_type_id",
+    "org": "SELECT org_id, org_code FROM org ORDER BY org_id",
+}
+
+CLASSES_DIRECTORY = Path(__file__).resolve().parents[2] / "classes"
+
+
+class ReferenceDataCache:
+    """
+    Holds the reference data tables (valid_values, message_types and org) in memory,
+    so that IDs, codes and descriptions can be looked up without joining to these tables at runtime.
+
+    The tables are loaded once per session by get_reference_data_cache. The cache can be configured in local.env with:
+        REFERENCE_DATA_SNAPSHOT: The path of a snapshot file. If it exists (and is not too old) the tables are loaded from it
+                                 instead of the DB, otherwise it is (re)created from the tables loaded from the DB
+        REFERENCE_DATA_MAX_AGE_HOURS: How old the snapshot can be before it is re-synced from the DB (default 24).
+                                      A stale snapshot is still used if the DB cannot be reached
+    Without a snapshot, each table is only loaded from the DB the first time it is used.
+
+    Args:
+        tables (dict[str, list[dict]]): The rows of each table that has already been loaded, keyed by table name
+        created (Optional[str]): When the tables were loaded, as an ISO 8601 timestamp. Defaults to now
+        loader (Optional[Callable[[str], list[dict]]]): Loads the rows of a table the first time it is used, if it is
+                                                        not in tables. If None, those tables are empty
+    """
+
+    def __init__(
+        self,
+        tables: dict[str, list[dict]],
+        created: Optional[str] = None,
+        loader: Optional[Callable[[str], list[dict]]] = None,
+    ):
+        self.tables = dict(tables)
+        self.created = created or datetime.now(timezone.utc).isoformat()
+        self._loader = loader
+        self._load_lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._valid_values: dict[int, dict] = {}
+        self._valid_value_ids_by_allowed_value: dict[str, list[int]] = {}
+        self._valid_value_ids_by_description: dict[str, list[int]] = {}
+        self._message_types: dict[int, dict] = {}
+        self._org_ids: dict[str, int] = {}
+        self._org_codes: dict[int, str] = {}
+        for table in self.tables:
+            self._index_table(table)
+
+    @classmethod
+    def from_database(cls) -> "ReferenceDataCache":
+        """
+        Loads the reference data tables from the database.
+
+        Returns:
+            ReferenceDataCache: The cache holding the loaded tables
+        """
+        tables = {
+            table: _load_table_from_database(table) for table in REFERENCE_DATA_QUERIES
+        }
+        cache = cls(tables)
+        logging.info(f"[REFERENCE DATA] Loaded {cache.summary()} from the database")
+        return cache
+
+    @classmethod
+    def from_snapshot(cls, snapshot_path: str | Path) -> "ReferenceDataCache":
+        """
+        Loads the reference data tables from a snapshot file created by save_snapshot.
+
+        Args:
+            snapshot_path (str | Path): The path of the snapshot file
+
+        Returns:
+            ReferenceDataCache: The cache holding the loaded tables
+
+        Raises:
+            ValueError: If the snapshot was created with a different format version
+        """
+        snapshot = json.loads(Path(snapshot_path).read_text(encoding="utf-8"))
+        if snapshot.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"Snapshot format version {snapshot.get('format_version')} does not match {SNAPSHOT_FORMAT_VERSION}"
+            )
+        cache = cls(snapshot["tables"], snapshot["created"])
+        logging.info(f"[REFERENCE DATA] Loaded {cache.summary()} from {snapshot_path}")
+        return cache
+
+    def save_snapshot(self, snapshot_path: str | Path) -> None:
+        """
+        Saves the reference data tables to a snapshot file, along with the format version, data version and creation time.
+
+        Args:
+            snapshot_path (str | Path): The path of the snapshot file
+        """
+        path = Path(snapshot_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        snapshot = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "version": self.version,
+            "created": self.created,
+            "tables": {
+                table: self._load_table(table) for table in REFERENCE_DATA_QUERIES
+            },
+        }
+        path.write_text(json.dumps(snapshot, default=str), encoding="utf-8")
+        logging.info(f"[REFERENCE DATA] Saved {self.summary()} to {snapshot_path}")
+
+    @property
+    def version(self) -> str:
+        """
+        A version string that changes whenever the content of the loaded tables changes.
+        """
+        if self._version is None:
+            self._version = self._calculate_version()
+        return self._version
+
+    def _load_table(self, table: str) -> list[dict]:
+        """
+        Returns the rows of a table, loading it with the loader if it has not been loaded yet.
+        If the table cannot be loaded, it is left empty for the rest of the session.
+        """
+        with self._load_lock:
+            if table not in self.tables:
+                rows: list[dict] = []
+                if self._loader is not None:
+                    try:
+                        rows = self._loader(table)
+                        logging.info(
+                            f"[REFERENCE DATA] Loaded {table} ({len(rows)} rows)"
+                        )
+                    except Exception as e:
+                        logging.warning(f"[REFERENCE DATA] Unable to load {table}: {e}")
+                self.tables[table] = rows
+                self._version = None
+                self._index_table(table)
+            return self.tables[table]
+
+    def _index_table(self, table: str) -> None:
+        """
+        Builds the lookups for a table that has just been loaded.
+        """
+        rows = self.tables[table]
+        if table == "valid_values":
+            for row in rows:
+                self._valid_values[row["valid_value_id"]] = row
+                self._valid_value_ids_by_allowed_value.setdefault(
+                    row["allowed_value"], []
+                ).append(row["valid_value_id"])
+                self._valid_value_ids_by_description.setdefault(
+                    (row["description"] or "").lower(), []
+                ).append(row["valid_value_id"])
+        elif table == "message_types":
+            self._message_types = {row["message_type_id"]: row for row in rows}
+        elif table == "org":
+            self._org_ids = {row["org_code"]: row["org_id"] for row in rows}
+            self._org_codes = {row["org_id"]: row["org_code"] for row in rows}
+
+    def _calculate_version(self) -> str:
+        """
+        Returns a version string that changes whenever the content of the tables changes.
+        """
+        content = json.dumps(self.tables, sort_keys=True, default=str)
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+        return f"v{SNAPSHOT_FORMAT_VERSION}-{digest}"
+
+    def is_stale(self, max_age_hours: float = DEFAULT_MAX_AGE_HOURS) -> bool:
+        """
+        Returns True if the tables were loaded from the database more than max_age_hours ago.
+
+        Args:
+            max_age_hours (float): The maximum age of the data in hours
+        """
+        created = datetime.fromisoformat(self.created)
+        return datetime.now(timezone.utc) - created > timedelta(hours=max_age_hours)
+
+    def has_table(self, table: str) -> bool:
+        """
+        Returns True if the table has been loaded (and is not empty), loading it if it has not been used yet.
+
+        Args:
+            table (str): The name of the table, e.g. "valid_values"
+        """
+        return bool(self._load_table(table))
+
+    def summary(self) -> str:
+        """
+        Returns a single line summary of the cache, suitable for logging.
+        """
+        counts = ", ".join(
+            f"{table}={len(self.tables[table]) if table in self.tables else 'not loaded'}"
+            for table in REFERENCE_DATA_QUERIES
+        )
+        return f"reference data {self.version} ({counts})"
+
+    def valid_value(self, valid_value_id: int) -> Optional[dict]:
+        """
+        Returns the valid_values row with the given ID.
+
+        Args:
+            valid_value_id (int): The valid value ID
+
+        Returns:
+            Optional[dict]: The row (valid_value_id, domain, allowed_value, description), or None if not found
+        """
+        self._load_table("valid_values")
+        return self._valid_values.get(valid_value_id)
+
+    def valid_value_ids(
+        self,
+        allowed_value: Optional[str] = None,
+        description: Optional[str] = None,
+        domain: Optional[str] = None,
+    ) -> list[int]:
+        """
+        Returns the IDs of the valid values matching all of the given filters.
+        The description is matched case-insensitively, the allowed value and domain are matched exactly.
+
+        Args:
+            allowed_value (Optional[str]): The allowed value (code) to match
+            description (Optional[str]): The description to match
+            domain (Optional[str]): The domain to match
+
+        Returns:
+            list[int]: The matching valid value IDs
+        """
+        self._load_table("valid_values")
+        description_lower = description.lower() if description is not None else None
+        if allowed_value is not None:
+            candidates = self._valid_value_ids_by_allowed_value.get(allowed_value, [])
+        elif description_lower is not None:
+            candidates = self._valid_value_ids_by_description.get(description_lower, [])
+        else:
+            candidates = list(self._valid_values)
+        rows = [self._valid_values[valid_value_id] for valid_value_id in candidates]
+        return [
+            row["valid_value_id"]
+            for row in rows
+            if (allowed_value is None or row["allowed_value"] == allowed_value)
+            and (domain is None or row["domain"] == domain)
+            and (
+                description_lower is None
+                or (row["description"] or "").lower() == description_lower
+            )
+        ]
+
+    def message_type(self, message_type_id: int) -> Optional[dict]:
+        """
+        Returns the message_types row with the given ID.
+
+        Args:
+            message_type_id (int): The message type ID
+
+        Returns:
+            Optional[dict]: The row (message_type_id, message_attribute_id, description), or None if not found
+        """
+        self._load_table("message_types")
+        return self._message_types.get(message_type_id)
+
+    def org_id(self, org_code: str) -> Optional[int]:
+        """
+        Returns the ID of the organisation with the given code, or None if not found.
+
+        Args:
+            org_code (str): The organisation code, e.g. "BCS01"
+        """
+        self._load_table("org")
+        return self._org_ids.get(org_code)
+
+    def org_code(self, org_id: int) -> Optional[str]:
+        """
+        Returns the code of the organisation with the given ID, or None if not found.
+
+        Args:
+            org_id (int): The organisation ID
+        """
+        self._load_table("org")
+        return self._org_codes.get(org_id)
+
+    def drift_report(
+        self, enums: Optional[Iterable[type[IndexedEnum]]] = None
+    ) -> list[ValidValueDrift]:
+        """
+        Compares the valid value IDs hard-coded in the enums against the valid_values table,
+        reporting members whose ID no longer exists or whose code / description no longer matches.
+
+        Args:
+            enums (Optional[Iterable[type[IndexedEnum]]]): The enums to check, defaults to every valid value enum under classes/
+
+        Returns:
+            list[ValidValueDrift]: The members that have drifted from the database
+
+        Raises:
+            ValueError: If the valid_values table has not been loaded
+        """
+        if not self.has_table("valid_values"):
+            raise ValueError("The valid_values table has not been loaded")
+        drift = []
+        for enum_class in find_valid_value_enums() if enums is None else enums:
+            for member in enum_class:
+                drift.extend(self._member_drift(enum_class, member))
+        for item in drift:
+            logging.warning(f"[REFERENCE DATA DRIFT] {item}")
+        logging.info(
+            f"[REFERENCE DATA] Drift report against {self.version}: {len(drift)} drifted members"
+        )
+        return drift
+
+    def _member_drift(
+        self, enum_class: type[IndexedEnum], member: IndexedEnum
+    ) -> list[ValidValueDrift]:
+        """
+        Returns the drift of a single enum member, ignoring members without a valid value ID (e.g. NULL / NOT_NULL).
+        """
+        valid_value_id = _member_attribute(member, "valid_value_id", "id")
+        if not isinstance(valid_value_id, int) or valid_value_id <= 0:
+            return []
+        row = self.valid_value(valid_value_id)
+        if row is None:
+            return [
+                ValidValueDrift(
+                    enum_class.__name__, member.name, valid_value_id, "missing"
+                )
+            ]
+        drift = []
+        code = _member_attribute(member, "code", "allowed_value")
+        if (
+            isinstance(code, str)
+            and row["allowed_value"]
+            and code != row["allowed_value"]
+        ):
+            drift.append(
+                ValidValueDrift(
+                    enum_class.__name__,
+                    member.name,
+                    valid_value_id,
+                    "allowed value mismatch",
+                    code,
+                    row["allowed_value"],
+                )
+            )
+        description = _member_attribute(member, "description")
+        if (
+            isinstance(description, str)
+            and row["description"]
+            and description.strip().lower() != row["description"].strip().lower()
+        ):
+            drift.append(
+                ValidValueDrift(
+                    enum_class.__name__,
+                    member.name,
+                    valid_value_id,
+                    "description mismatch",
+                    description,
+                    row["description"],
+                )
+            )
+        return drift
+
+
+def _load_table_from_database(table: str) -> list[dict]:
+    """
+    Loads the rows of a reference data table from the database.
+    """
+    return list(OracleDB().iter_rows(REFERENCE_DATA_QUERIES[table], arraysize=5000))
+
+
+def _member_attribute(member: IndexedEnum, *attributes: str) -> Any:
+    """
+    Returns the first of the attributes that the enum member has, or None if it has none of them.
+    """
+    for attribute in attributes:
+        if attribute in type(member)._indexes:
+            return getattr(member, attribute)
+    return None
+
+
+def find_valid_value_enums() -> list[type[IndexedEnum]]:
+    """
+    Imports every module under classes/ and returns the enums that hold valid value IDs
+    (those with a valid_value_id, or an id alongside a code or description).
+
+    Returns:
+        list[type[IndexedEnum]]: The valid value enums, sorted by name
+    """
+    for module_path in CLASSES_DIRECTORY.rglob("*.py"):
+        relative_path = module_path.relative_to(CLASSES_DIRECTORY.parent)
+        importlib.import_module(".".join(relative_path.with_suffix("").parts))
+
+    enums = []
+    pending = list(IndexedEnum.__subclasses__())
+    while pending:
+        enum_class = pending.pop()
+        pending.extend(enum_class.__subclasses__())
+        indexes = enum_class._indexes
+        if "valid_value_id" in indexes or (
+            "id" in indexes
+            and any(key in indexes for key in ("code", "allowed_value", "description"))
+        ):
+            enums.append(enum_class)
+    return sorted(enums, key=lambda enum_class: enum_class.__name__)
+
+
+def in_list_clause(
+    column: str, bind_prefix: str, values: list[Any]
+) -> tuple[str, dict]:
+    """
+    Builds an IN list condition for values looked up from the cache, with a bind variable per value.
+
+    Args:
+        column (str): The column to compare, e.g. "lb.status_id"
+        bind_prefix (str): The prefix of the bind variable names, e.g. "status_id"
+        values (list[Any]): The values to match
+
+    Returns:
+        tuple[str, dict]: The condition and its bind variables. If there are no values the condition is never true
+    """
+    if not values:
+        return "1=0", {}
+    bind_vars = {f"{bind_prefix}_{index}": value for index, value in enumerate(values)}
+    placeholders = ", ".join(f":{bind_name}" for bind_name in bind_vars)
+    return f"{column} IN ({placeholders})", bind_vars
+
+
+_session_cache: Optional[ReferenceDataCache] = None
+_session_cache_lock = threading.Lock()
+
+
+def get_reference_data_cache() -> ReferenceDataCache:
+    """
+    Returns the session wide reference data cache. If a snapshot is configured, the tables are loaded (from the snapshot
+    or the DB) on first use, otherwise each table is loaded from the DB the first time it is used.
+    If a table cannot be loaded, it is left empty (has_table returns False), so that callers can fall back to joining to it.
+
+    Returns:
+        ReferenceDataCache: The session cache
+    """
+    global _session_cache
+    with _session_cache_lock:
+        if _session_cache is None:
+            _session_cache = _load_reference_data_cache()
+        return _session_cache
+
+
+def _load_reference_data_cache() -> ReferenceDataCache:
+    """
+    Loads the reference data cache as described in get_reference_data_cache.
+    """
+    snapshot_path = os.getenv("REFERENCE_DATA_SNAPSHOT", "").strip()
+    max_age_value = os.getenv("REFERENCE_DATA_MAX_AGE_HOURS", "").strip()
+    max_age_hours = float(max_age_value) if max_age_value else DEFAULT_MAX_AGE_HOURS
+
+    if not snapshot_path:
+        return ReferenceDataCache({}, loader=_load_table_from_database)
+
+    snapshot = None
+    if Path(snapshot_path).is_file():
+        try:
+            snapshot = ReferenceDataCache.from_snapshot(snapshot_path)
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"[REFERENCE DATA] Unable to load the snapshot: {e}")
+    if snapshot is not None and not snapshot.is_stale(max_age_hours):
+        return snapshot
+
+    try:
+        cache = ReferenceDataCache.from_database()
+    except Exception as e:
+        if snapshot is not None:
+            logging.warning(
+                f"[REFERENCE DATA] Unable to sync from the database ({e}), using the stale snapshot {snapshot.version}"
+            )
+            return snapshot
+        logging.warning(f"[REFERENCE DATA] Unable to load the reference data: {e}")
+        return ReferenceDataCache({})
+
+    if snapshot is not None and snapshot.version != cache.version:
+        logging.info(
+            f"[REFERENCE DATA] Reference data has changed from {snapshot.version} to {cache.version}"
+        )
+    cache.save_snapshot(snapshot_path)
+    return cache
@@ -3,12 +3,12 @@ from datetime import date, timedelta
 from typing import Optional
 import random
 from utils.oracle.oracle import OracleDB
-from utils.nhs_number_tools import NHSNumberTools
 from classes.screening.region_type import RegionType
 from classes.repositories.invitation_repository import InvitationRepository
 from classes.data.data_creation import DataCreation
 from classes.repositories.word_repository import WordRepository
 from classes.subject.pi_subject import PISubject
+from classes.subject.pi_subject_creation_result import PISubjectCreationResult
 from classes.repositories.subject_repository import SubjectRepository
 from dateutil.relativedelta import relativedelta
 from classes.user.user_role_type import UserRoleType
@@ -59,15 +59,23 @@ class CreateSubjectSteps:
 
     def additional_subjects_are_created(
         self, num_subjects: int, sc_org_id: int, hub_org_id: int, region_str: str
-    ) -> None:
+    ) -> list[PISubjectCreationResult]:
         """
         Creates sufficient additional subjects so that there are at least X subjects to invite per day.
+        The subjects are generated locally, given NHS numbers reserved with a single existence check,
+        and then created in bulk using SubjectRepository.create_pi_subjects.
 
         Args:
             num_subjects (int): Required number of subjects per day.
             sc_org_id (int): Screening center ID.
             hub_org_id (int): Hub ID.
             region (str): Region name.
+
+        Returns:
+            list[PISubjectCreationResult]: The contact id for each subject created (empty if none were needed).
+
+        Raises:
+            ValueError: If any of the subjects could not be created, listing their NHS numbers and errors.
         """
         logging.debug(
             f"Creating additional subjects for {num_subjects} per day, screening center {sc_org_id}, hub {hub_org_id}, region {region_str}"
@@ -87,56 +95,69 @@ class CreateSubjectSteps:
             logging.debug(
                 f"Don't need to add more subjects (numRequired={num_subjects}, numAvailable={active_plan['invitations_per_day']})"
             )
-        else:
+            return []
+
+        logging.debug(
+            f"Need to add more subjects (numRequired={num_subjects}, numAvailable={active_plan['invitations_per_day']})"
+        )
+
+        total_number_of_new_subjects = num_subjects - active_plan["invitations_per_day"]
+        plan_duration_days = (active_plan["end_date"] - active_plan["start_date"]).days
+        pio_id = self.get_pio_id_for_region(region)
+
+        logging.debug(f"adding {total_number_of_new_subjects} more subjects")
+        word_repo = WordRepository()
+        data_creation = DataCreation()
+        new_subjects = []
+        for nhs_number in self.reserve_unique_nhs_numbers(total_number_of_new_subjects):
+            # Generate a random subject
+            new_subject = data_creation.generate_random_subject(
+                word_repo.get_random_subject_details(),
+                "AUTOMATED TEST",
+                region,
+            )
+            new_subject.nhs_number = nhs_number
+            # Random birth date: start_date + random offset - 60 years
+            day_offset = random.randint(0, plan_duration_days)
+            new_subject.birth_date = (
+                active_plan["start_date"]
+                + timedelta(days=day_offset)
+                - timedelta(days=60 * 365)
+            )
             logging.debug(
-                f"Need to add more subjects (numRequired={num_subjects}, numAvailable={active_plan['invitations_per_day']})"
+                f"Creating new Subject {self.get_subject_details(new_subject)}"
             )
+            new_subjects.append(new_subject)
 
-            total_number_of_new_subjects = (
-                num_subjects - active_plan["invitations_per_day"]
+        results = SubjectRepository().create_pi_subjects(pio_id, new_subjects)
+        failures = [result for result in results if not result.is_success()]
+        if failures:
+            details = "; ".join(
+                f"{result.nhs_number}: {result.error}" for result in failures
             )
-            plan_duration_days = (
-                active_plan["end_date"] - active_plan["start_date"]
-            ).days
-            pio_id = self.get_pio_id_for_region(region)
-
-            logging.debug(f"adding {total_number_of_new_subjects} more subjects")
-            for _ in range(total_number_of_new_subjects):
-                # Generate a random subject
-                new_subject = DataCreation().generate_random_subject(
-                    WordRepository().get_random_subject_details(),
-                    "AUTOMATED TEST",
-                    region,
-                )
-                # Random birth date: start_date + random offset - 60 years
-                day_offset = random.randint(0, plan_duration_days)
-                birth_date = (
-                    active_plan["start_date"]
-                    + timedelta(days=day_offset)
-                    - timedelta(days=60 * 365)
-                )
-                new_subject.birth_date = birth_date
-
-                # Ensure NHS number is unique
-                attempts = 1
-                max_attempts = 20
-                while (
-                    new_subject.nhs_number is not None
-                    and self.subject_exists(new_subject.nhs_number)
-                    and attempts <= max_attempts
-                ):
-                    new_subject.nhs_number = NHSNumberTools.generate_random_nhs_number()
-                    attempts += 1
-
-                if attempts > max_attempts:
-                    logging.error(
-                        f"Failed to create random NHS number for subject: {self.get_subject_details(new_subject)}"
-                    )
-                else:
-                    logging.debug(
-                        f"Creating new Subject {self.get_subject_details(new_subject)}"
-                    )
-                    SubjectRepository().create_pi_subject(pio_id, new_subject)
+            raise ValueError(
+                f"Database error processing {len(failures)} of {len(results)} PI subjects: {details}"
+            )
+        return results
+
+    def reserve_unique_nhs_numbers(
+        self, count: int, seed: Optional[int] = None, max_attempts: int = 20
+    ) -> list[str]:
+        """
+        Generates NHS numbers that are not in use by any existing subject.
+        See SubjectRepository.reserve_unused_nhs_numbers.
+
+        Args:
+            count (int): The number of NHS numbers required.
+            seed (Optional[int]): A seed, to generate the same candidates every time.
+            max_attempts (int): The maximum number of batches of candidates to check.
+
+        Returns:
+            list[str]: The unused NHS numbers.
+        """
+        return SubjectRepository().reserve_unused_nhs_numbers(
+            count, seed=seed, max_attempts=max_attempts
+        )
 
     def get_pio_id_for_region(self, region: "RegionType") -> int:
         """
@@ -166,8 +187,8 @@ class CreateSubjectSteps:
             bool: True if subject exists, False otherwise.
         """
         query = "SELECT COUNT(*) AS cnt FROM screening_subject_t WHERE subject_nhs_number = :nhs_number"
-        df = self.oracle_db.execute_query(query, {"nhs_number": nhs_number})
-        return not df.empty and int(df.iloc[0]["cnt"]) > 0
+        count = self.oracle_db.fetch_scalar(query, {"nhs_number": nhs_number})
+        return count is not None and int(count) > 0
 
     def complete_nhs_number(self, incomplete_nhs_number: str) -> str:
         """
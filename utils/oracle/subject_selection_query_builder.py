@@ -1,5 +1,6 @@
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 import logging
+import re
 from datetime import datetime, date
 from classes.bowel_scope.bowel_scope_dd_reason_for_change_type import (
     BowelScopeDDReasonForChangeType,
@@ -26,6 +27,7 @@ from classes.subject_selection_query_builder.subject_selection_criteria_key impo
 )
 from classes.subject.subject import Subject
 from classes.user.user import User
+from utils.parallel_execution import get_worker_partition
 from classes.subject_selection_query_builder.selection_builder_exception import (
     SelectionBuilderException,
 )
@@ -103,6 +105,10 @@ from classes.datasets.treatment_given import TreatmentGiven
 from classes.datasets.cancer_treatment_intent import CancerTreatmentIntent
 from classes.notify.notify_message_status import NotifyMessageStatus
 from classes.notify.notify_message_type import NotifyMessageType
+from utils.oracle.subject_selection_query_cache import (
+    CachedQueryTemplate,
+    SubjectSelectionQueryCache,
+)
 
 
 class SubjectSelectionQueryBuilder:
@@ -121,6 +127,27 @@ class SubjectSelectionQueryBuilder:
     # -- Semantic Messages --
     _REASON_NO_EXISTING_SUBJECT = "no existing subject"
 
+    # -- Criteria whose value is bound as-is, so does not change the SQL --
+    _VALUE_ONLY_CRITERIA = {
+        SubjectSelectionCriteriaKey.NHS_NUMBER,
+        SubjectSelectionCriteriaKey.CADS_TUMOUR_HEIGHT_OF_TUMOUR_ABOVE_ANAL_VERGE,
+        SubjectSelectionCriteriaKey.HAS_GP_PRACTICE_ASSOCIATED_WITH_SCREENING_CENTRE_CODE,
+    }
+
+    # -- Criteria whose value is a comparator and bound numbers (see _bind_numeric_comparison) --
+    _NUMERIC_CRITERIA = {
+        SubjectSelectionCriteriaKey.SUBJECT_AGE,
+        SubjectSelectionCriteriaKey.SUBJECT_AGE_YD,
+        SubjectSelectionCriteriaKey.NOTE_COUNT,
+    }
+
+    # -- Compiled queries, shared by all builders --
+    query_cache = SubjectSelectionQueryCache()
+
+    # -- Numeric Criteria Values --
+    _NUMERIC_COMPARISON = re.compile(r"^(<=|>=|!=|<>|=|<|>)?\s*(\d+)$")
+    _NUMERIC_RANGE = re.compile(r"^between\s+(\d+)\s+and\s+(\d+)$", re.IGNORECASE)
+
     def __init__(self):
         """
         Initialise the query builder with empty SQL clause lists and bind variable dictionary.
@@ -134,7 +161,10 @@ class SubjectSelectionQueryBuilder:
         self.sql_from_cancer_audit_datasets = []
         self.sql_from_surveillance_review = []
         self.bind_vars = {}
+        self.bind_count = 0
         self.criteria_value_count = 0
+        self.criteria_where_fragments: dict[str, list[str]] = {}
+        self.criteria_bind_names: dict[str, list[str]] = {}
 
         self.xt = "xt"
         self.ap = "ap"
@@ -151,10 +181,161 @@ class SubjectSelectionQueryBuilder:
         subject: "Subject",
         subjects_to_retrieve: Optional[int] = None,
         enable_logging: bool = True,
+        use_cache: bool = True,
     ) -> tuple[str, dict]:
         """
         This method builds a SQL query string based on the provided selection criteria.
         It combines all of the different sections of the query into one string.
+
+        Compiled queries are cached against the shape of the criteria (see _get_cache_key),
+        so building a query for criteria that have been seen before only needs the new values binding.
+        The criteria are validated before the cache is checked, so invalid criteria are always rejected.
+        Set use_cache to False to always build the query from scratch.
+        """
+        row_count = subjects_to_retrieve if subjects_to_retrieve is not None else 1
+        cache_key, criteria_values = (
+            self._get_cache_key(criteria, user, subject) if use_cache else (None, {})
+        )
+        template = self.query_cache.get(cache_key) if cache_key is not None else None
+        if template is not None:
+            self.bind_vars = template.bind(criteria_values, row_count)
+            query = template.query
+        else:
+            query = self._build_query(criteria, user, subject, row_count)
+            value_binds = {
+                criteria_key: self.criteria_bind_names.get(criteria_key, [])
+                for criteria_key in criteria_values
+            }
+            if cache_key is not None and all(
+                len(value_binds[criteria_key]) == len(values)
+                for criteria_key, values in criteria_values.items()
+            ):
+                self.query_cache.put(
+                    cache_key,
+                    CachedQueryTemplate(
+                        query=query,
+                        bind_vars=dict(self.bind_vars),
+                        value_binds=value_binds,
+                        row_count_bind=self.row_count_bind,
+                    ),
+                )
+
+        if enable_logging:
+            logging.info(f"[SUBJECT SELECTION QUERY BUILDER] Final query: {query}")
+        return query, self.bind_vars
+
+    def build_criteria_diagnosis_query(
+        self,
+        criteria: Dict[str, str],
+        user: "User",
+        subject: "Subject",
+        base_criteria_keys: Iterable[str],
+        shared_criteria_keys: Iterable[str] = (),
+        enable_logging: bool = True,
+        nhs_numbers: Optional[list[str]] = None,
+    ) -> tuple[str, dict, dict[str, str]]:
+        """
+        Builds a single query that shows which criteria a subject does and does not match,
+        instead of running a separate query for each criterion.
+
+        The subjects are selected using only the base criteria (e.g. the NHS number). Every other criterion
+        gets its own `MAX(CASE WHEN <criterion predicate> THEN 1 ELSE 0 END)` column, which is 1 if the subject matches it.
+        The predicates of the shared criteria (e.g. 'which diagnostic test') are included in every other column,
+        as the criteria that follow them depend on them.
+
+        The joins needed by all of the criteria are kept, so if one of these filters out the subject
+        every column will be NULL.
+
+        If nhs_numbers is given, the query is restricted to those subjects and returns one row per subject,
+        with the NHS number in the subject_nhs_number column. A subject filtered out by the joins has no row.
+        The NHS numbers are bound as a single list (:nhs_numbers), so the SQL is the same however many there are.
+        OracleDB.iter_rows binds the list as a SYS.ODCIVARCHAR2LIST.
+
+        Args:
+            criteria (Dict[str, str]): The subject selection criteria
+            user (User): The user the criteria are checked for
+            subject (Subject): The subject used for any 'unchanged' criteria
+            base_criteria_keys (Iterable[str]): The criteria keys used to select the subjects
+            shared_criteria_keys (Iterable[str]): The criteria keys included in the predicate of every other criterion
+            enable_logging (bool): Whether to log the query
+            nhs_numbers (Optional[list[str]]): The NHS numbers of the subjects to check, when checking more than one
+
+        Returns:
+            tuple[str, dict, dict[str, str]]: The query, its bind variables, and the criteria key for each column name
+        """
+        base_criteria_keys = set(base_criteria_keys)
+        shared_criteria_keys = set(shared_criteria_keys)
+        self._compile_criteria(criteria, user, subject)
+
+        columns = []
+        column_criteria = {}
+        for criteria_key in self.criteria_where_fragments:
+            if criteria_key in base_criteria_keys:
+                continue
+            predicate = [" 1=1 "]
+            for other_key, fragments in self.criteria_where_fragments.items():
+                if other_key == criteria_key or other_key in shared_criteria_keys:
+                    predicate.extend(fragments)
+            column_name = f"criterion_{len(columns) + 1}"
+            columns.append(
+                f"MAX(CASE WHEN ({' '.join(predicate)}) THEN 1 ELSE 0 END) AS {column_name}"
+            )
+            column_criteria[column_name] = criteria_key
+
+        where = [" WHERE 1=1 "]
+        for criteria_key, fragments in self.criteria_where_fragments.items():
+            if criteria_key in base_criteria_keys:
+                where.extend(fragments)
+
+        if nhs_numbers is not None:
+            columns.insert(0, "c.nhs_number AS subject_nhs_number")
+            where.append(
+                " AND c.nhs_number IN (SELECT column_value FROM TABLE(:nhs_numbers)) "
+                " GROUP BY c.nhs_number "
+            )
+            self.bind_vars["nhs_numbers"] = [
+                str(nhs_number) for nhs_number in nhs_numbers
+            ]
+        elif not columns:
+            raise ValueError("No criteria to diagnose")
+
+        query = " ".join(
+            str(part)
+            for part in ["SELECT " + ", ".join(columns)]
+            + self._get_from_clause()
+            + where
+        )
+        if enable_logging:
+            logging.info(f"[SUBJECT SELECTION QUERY BUILDER] Diagnosis query: {query}")
+        return query, self.bind_vars, column_criteria
+
+    def _build_query(
+        self,
+        criteria: Dict[str, str],
+        user: "User",
+        subject: "Subject",
+        subject_count: int,
+    ) -> str:
+        """
+        Builds the SQL query from scratch, populating self.bind_vars as it goes.
+        """
+        self._compile_criteria(criteria, user, subject)
+        self._add_worker_partition(criteria)
+        self._end_where_clause(subject_count)
+
+        return " ".join(
+            str(part)
+            for part in self.sql_select + self._get_from_clause() + self.sql_where
+        )
+
+    def _compile_criteria(
+        self,
+        criteria: Dict[str, str],
+        user: "User",
+        subject: "Subject",
+    ) -> None:
+        """
+        Resets the builder and adds the select, from and where clauses for the criteria.
         """
         # Clear previous state to avoid duplicate SQL fragments
         self.sql_select = []
@@ -166,7 +347,10 @@ class SubjectSelectionQueryBuilder:
         self.sql_from_cancer_audit_datasets = []
         self.sql_from_surveillance_review = []
         self.bind_vars = {}
+        self.bind_count = 0
         self.criteria_value_count = 0
+        self.criteria_where_fragments = {}
+        self.criteria_bind_names = {}
 
         self.xt = "xt"
         self.ap = "ap"
@@ -175,27 +359,90 @@ class SubjectSelectionQueryBuilder:
         self._build_main_from_clause()
         self._start_where_clause()
         self._add_variable_selection_criteria(criteria, user, subject)
-        if subjects_to_retrieve is not None:
-            self._end_where_clause(subjects_to_retrieve)
-        else:
-            self._end_where_clause(1)
 
-        query = " ".join(
-            str(part)
-            for part in (
-                self.sql_select
-                + self.sql_from
-                + self.sql_from_episode
-                + self.sql_from_diagnostic_test
-                + self.sql_from_genetic_condition_diagnosis
-                + self.sql_from_cancer_audit_datasets
-                + self.sql_from_surveillance_review
-                + self.sql_where
-            )
+    def _get_from_clause(self) -> list[str]:
+        """
+        Returns the 'FROM' clause, including all of the joins added by the criteria.
+        """
+        return (
+            self.sql_from
+            + self.sql_from_episode
+            + self.sql_from_diagnostic_test
+            + self.sql_from_genetic_condition_diagnosis
+            + self.sql_from_cancer_audit_datasets
+            + self.sql_from_surveillance_review
         )
-        if enable_logging:
-            logging.info(f"[SUBJECT SELECTION QUERY BUILDER] Final query: {query}")
-        return query, self.bind_vars
+
+    def _get_cache_key(
+        self, criteria: Dict[str, str], user: "User", subject: "Subject"
+    ) -> tuple[Optional[tuple], dict[str, list]]:
+        """
+        Validates the criteria and returns their shape, used as the key for the query cache,
+        along with the values to bind into a cached query.
+
+        The shape is made up of each criteria key, whether it has a 'NOT:' modifier and the part of its value
+        that changes the SQL (see _get_criteria_value_shape), plus the user details used by the user dependent
+        criteria (e.g. 'user organisation'). Each criterion is checked in the same way as when the query is built,
+        so a cached query is never returned for criteria that would fail to build.
+
+        Returns None as the key if any of the criteria use 'unchanged', as those depend on the subject's current values.
+        """
+        shape = []
+        criteria_values = {}
+        uses_subject = False
+        for criterium_key, criterium_value in criteria.items():
+            if "unchanged" in criterium_value.lower():
+                uses_subject = True
+            if not self._preprocess_criteria(criterium_key, criterium_value, subject):
+                continue
+            try:
+                self._resolve_criteria_key()
+            except Exception:
+                raise SelectionBuilderException(
+                    f"Invalid subject selection criteria key: {self.criteria_key_name}"
+                )
+            value_shape, values = self._get_criteria_value_shape()
+            shape.append((criterium_key, self.criteria_has_not_modifier, value_shape))
+            if values:
+                criteria_values[criterium_key] = values
+
+        if uses_subject:
+            return None, {}
+        organisation = user.organisation if user is not None else None
+        cache_key = (
+            tuple(shape),
+            user.user_id if user is not None else None,
+            organisation.code if organisation is not None else None,
+        )
+        return cache_key, criteria_values
+
+    def _get_criteria_value_shape(self) -> tuple[str, list]:
+        """
+        Splits the current criteria value into the part that changes the SQL and the values that are bound.
+        The values of _VALUE_ONLY_CRITERIA are bound as-is, and the values of _NUMERIC_CRITERIA are split into
+        their comparator and bound numbers. For any other criteria the whole value is part of the shape,
+        as it is resolved to different SQL (e.g. 'null' gives 'IS NULL').
+
+        Returns:
+            tuple[str, list]: The part of the value that changes the SQL, and the values bound in the order they are bound
+        """
+        if self.criteria_key in self._VALUE_ONLY_CRITERIA:
+            return "*", [self.criteria_value]
+        if (
+            self.criteria_key in self._NUMERIC_CRITERIA
+            and "/" not in self.criteria_value
+        ):
+            value = self.criteria_value.strip()
+            comparison = self._NUMERIC_COMPARISON.match(value)
+            if comparison:
+                return comparison.group(1) or "=", [int(comparison.group(2))]
+            numeric_range = self._NUMERIC_RANGE.match(value)
+            if numeric_range:
+                return "between", [
+                    int(numeric_range.group(1)),
+                    int(numeric_range.group(2)),
+                ]
+        return self.criteria_value, []
 
     def _build_select_clause(self) -> None:
         """
@@ -242,11 +489,70 @@ class SubjectSelectionQueryBuilder:
         """
         self.sql_where.append(" WHERE 1=1 ")
 
+    def _add_worker_partition(self, criteria: Dict[str, str]) -> None:
+        """
+        When running in parallel, restricts the subjects to this pytest-xdist worker's share of them,
+        so that two workers never select the same subject. Queries for a specific NHS number are not restricted.
+        """
+        nhs_number_key = SubjectSelectionCriteriaKey.NHS_NUMBER.description
+        if any(
+            criteria_key.lower().replace("+", "").strip() == nhs_number_key
+            for criteria_key in criteria
+        ):
+            return
+        partition_clause = get_worker_partition().subject_partition_clause(
+            bind=self._bind
+        )
+        if partition_clause:
+            self.sql_where.append(partition_clause)
+
     def _end_where_clause(self, subject_count: int) -> None:
         """
         End the 'WHERE' clause by fetching x subjects
         """
-        self.sql_where.append(f" FETCH FIRST {subject_count} ROWS ONLY ")
+        self.sql_where.append(f" FETCH FIRST {self._bind(subject_count)} ROWS ONLY ")
+        self.row_count_bind = f"b{self.bind_count}"
+
+    def _bind(self, value: Any) -> str:
+        """
+        Registers a value as a bind variable and returns its placeholder.
+        Bind variables are named in the order they are added (:b1, :b2, ...), so criteria with the same
+        keys and modifiers always produce byte-identical SQL, whatever their values are.
+
+        Args:
+            value (Any): The value to bind
+
+        Returns:
+            str: The placeholder to put in the SQL, e.g. ":b1"
+        """
+        self.bind_count += 1
+        bind_name = f"b{self.bind_count}"
+        self.bind_vars[bind_name] = value
+        return f":{bind_name}"
+
+    def _bind_numeric_comparison(self, value: str) -> str:
+        """
+        Converts a numeric criteria value into a comparison against bind variables.
+        Supports a plain number ("60"), a number with a comparator ("> 28") and a range ("Between 60 and 74").
+        Any other value is returned unchanged.
+
+        Args:
+            value (str): The criteria value
+
+        Returns:
+            str: The comparison to append to the SQL, e.g. " > :b1 "
+        """
+        value = value.strip()
+        comparison = self._NUMERIC_COMPARISON.match(value)
+        if comparison:
+            comparator = comparison.group(1) or "="
+            return f" {comparator} {self._bind(int(comparison.group(2)))} "
+        numeric_range = self._NUMERIC_RANGE.match(value)
+        if numeric_range:
+            lower = self._bind(int(numeric_range.group(1)))
+            upper = self._bind(int(numeric_range.group(2)))
+            return f" BETWEEN {lower} AND {upper} "
+        return value
 
     def _preprocess_criteria(self, key: str, value: str, subject: "Subject") -> bool:
         """
@@ -304,23 +610,43 @@ class SubjectSelectionQueryBuilder:
                 continue
 
             try:
-                self.criteria_key = SubjectSelectionCriteriaKey.by_description(
-                    self.criteria_key_name.replace("+", "")
-                )
-                if self.criteria_key is None:
-                    raise ValueError(
-                        f"No SubjectSelectionCriteriaKey found for description: {self.criteria_key_name}"
-                    )
-
-                self._check_if_more_than_one_criteria_value_is_valid_for_criteria_key()
-                self._check_if_not_modifier_is_valid_for_criteria_key()
+                self._resolve_criteria_key()
+                where_length = len(self.sql_where)
+                bind_names = set(self.bind_vars)
                 self._dispatch_criteria_key(user, subject)
+                self.criteria_where_fragments[criterium_key] = self.sql_where[
+                    where_length:
+                ]
+                self.criteria_bind_names[criterium_key] = [
+                    bind_name
+                    for bind_name in self.bind_vars
+                    if bind_name not in bind_names
+                ]
 
             except Exception:
                 raise SelectionBuilderException(
                     f"Invalid subject selection criteria key: {self.criteria_key_name}"
                 )
 
+    def _resolve_criteria_key(self) -> None:
+        """
+        Looks up the SubjectSelectionCriteriaKey for the current criterion and checks that its value and
+        'NOT:' modifier are allowed for it.
+
+        Raises:
+            ValueError: If the criteria key is not recognised, or its value or modifier is not allowed
+        """
+        self.criteria_key = SubjectSelectionCriteriaKey.by_description(
+            self.criteria_key_name.replace("+", "")
+        )
+        if self.criteria_key is None:
+            raise ValueError(
+                f"No SubjectSelectionCriteriaKey found for description: {self.criteria_key_name}"
+            )
+
+        self._check_if_more_than_one_criteria_value_is_valid_for_criteria_key()
+        self._check_if_not_modifier_is_valid_for_criteria_key()
+
     def _dispatch_criteria_key(self, user: "User", subject: "Subject") -> None:
         """
         Executes the appropriate SQL clause logic based on the resolved SubjectSelectionCriteriaKey.
@@ -817,18 +1143,16 @@ class SubjectSelectionQueryBuilder:
             self.sql_where.append(" AND c.date_of_birth = ")
             self.sql_where.append(
                 self._subtract_years_from_oracle_date(
-                    self._TRUNC_SYSDATE, age_criteria[0]
+                    self._TRUNC_SYSDATE, self._bind(int(age_criteria[0]))
                 )
             )
             self.sql_where.append(" - ")
-            self.sql_where.append(age_criteria[1])
+            self.sql_where.append(self._bind(int(age_criteria[1])))
         else:
             self.sql_where.append(
                 " AND FLOOR(MONTHS_BETWEEN(TRUNC(SYSDATE), c.date_of_birth)/12) "
             )
-            if self.criteria_value[0] in "0123456789":
-                self.sql_where.append("= ")
-            self.sql_where.append(self.criteria_value)
+            self.sql_where.append(self._bind_numeric_comparison(self.criteria_value))
 
     def _add_criteria_subject_lower_fobt_age(self) -> None:
         """
@@ -844,6 +1168,8 @@ class SubjectSelectionQueryBuilder:
 
             if value.lower() == "default":
                 value = "pkg_parameters.f_get_national_param_val (10)"
+            elif value.isdigit():
+                value = self._bind(int(value))
 
             self.sql_where.append(
                 f" AND pkg_bcss_common.f_get_ss_lower_age_limit (ss.screening_subject_id) "
@@ -868,7 +1194,7 @@ class SubjectSelectionQueryBuilder:
 
             self.sql_where.append(
                 f" AND pkg_bcss_common.f_get_lynch_lower_age_limit (ss.screening_subject_id) "
-                f" {comparator} {value} "
+                f" {comparator} {self._bind(int(value))} "
             )
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -890,7 +1216,7 @@ class SubjectSelectionQueryBuilder:
 
             self._add_join_to_latest_episode()
             self.sql_where.append(
-                f" AND ep.episode_type_id {self.criteria_comparator} {episode_type.valid_value_id} "
+                f" AND ep.episode_type_id {self.criteria_comparator} {self._bind(episode_type.valid_value_id)} "
             )
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -911,7 +1237,7 @@ class SubjectSelectionQueryBuilder:
                 )
             self._add_join_to_latest_episode()
             self.sql_where.append(
-                f" AND ep.episode_subtype_id {self.criteria_comparator}{episode_sub_type.get_id()}"
+                f" AND ep.episode_subtype_id {self.criteria_comparator}{self._bind(episode_sub_type.get_id())}"
             )
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -932,7 +1258,7 @@ class SubjectSelectionQueryBuilder:
                 )
             self._add_join_to_latest_episode()
             self.sql_where.append(
-                f" AND ep.episode_status_id {self.criteria_comparator}{episode_status.get_id()} "
+                f" AND ep.episode_status_id {self.criteria_comparator}{self._bind(episode_status.get_id())} "
             )
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -959,7 +1285,7 @@ class SubjectSelectionQueryBuilder:
                 self.sql_where.append(self._SQL_IS_NULL)
             else:
                 self.sql_where.append(
-                    f" {self.criteria_comparator} {episode_status_reason.get_id()} "
+                    f" {self.criteria_comparator} {self._bind(episode_status_reason.get_id())} "
                 )
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -986,7 +1312,7 @@ class SubjectSelectionQueryBuilder:
                 self.sql_where.append(self._SQL_IS_NULL)
             else:
                 self.sql_where.append(
-                    f"{self.criteria_comparator}{recall_calc_method.get_id()}"
+                    f"{self.criteria_comparator}{self._bind(recall_calc_method.get_id())}"
                 )
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -1010,7 +1336,7 @@ class SubjectSelectionQueryBuilder:
                 self.sql_where.append(self._SQL_IS_NULL)
             else:
                 self.sql_where.append(
-                    f"{self.criteria_comparator}{recall_episode_type.get_id()}"
+                    f"{self.criteria_comparator}{self._bind(recall_episode_type.get_id())}"
                 )
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -1038,7 +1364,7 @@ class SubjectSelectionQueryBuilder:
                 )
             else:
                 self.sql_where.append(
-                    f"{self.criteria_comparator}{recall_surveillance_type.get_id()}"
+                    f"{self.criteria_comparator}{self._bind(recall_surveillance_type.get_id())}"
                 )
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -1060,7 +1386,7 @@ class SubjectSelectionQueryBuilder:
                 )
 
             self.sql_where.append(
-                f" AND {column_name} {self.criteria_comparator} {int(event_status.id) }"
+                f" AND {column_name} {self.criteria_comparator} {self._bind(int(event_status.id))}"
             )
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -1084,7 +1410,7 @@ class SubjectSelectionQueryBuilder:
                 self.sql_where.append(" AND NOT EXISTS ( SELECT 'evc' ")
             self.sql_where.append(
                 f"   FROM ep_events_t evc "
-                f"   WHERE evc.event_code_id = {event_code.get_id()} "
+                f"   WHERE evc.event_code_id = {self._bind(event_code.get_id())} "
                 f"   AND evc.subject_epis_id = ep.subject_epis_id) "
             )
         except Exception:
@@ -1109,7 +1435,7 @@ class SubjectSelectionQueryBuilder:
                 self.sql_where.append(" AND NOT EXISTS ( SELECT 'ev' ")
             self.sql_where.append(
                 f"   FROM ep_events_t ev "
-                f"   WHERE ev.event_status_id = {event_status.id} "
+                f"   WHERE ev.event_status_id = {self._bind(event_status.id)} "
                 f"   AND ev.subject_epis_id = ep.subject_epis_id) "
             )
         except Exception:
@@ -1141,7 +1467,7 @@ class SubjectSelectionQueryBuilder:
                 " AND ep.tk_type_id IN ( "
                 " SELECT tkt.tk_type_id"
                 " FROM tk_type_t tkt "
-                f" WHERE tkt.tk_test_class_id {comparator} {kit_class_id} "
+                f" WHERE tkt.tk_test_class_id {comparator} {self._bind(kit_class_id)} "
                 " ) "
             )
 
@@ -1282,7 +1608,7 @@ class SubjectSelectionQueryBuilder:
                 self.sql_where.append(f"IS {diagnosis_date_reason.get_description()}")
             else:
                 self.sql_where.append(
-                    f"{self.criteria_comparator}{diagnosis_date_reason.get_valid_value_id()}"
+                    f"{self.criteria_comparator}{self._bind(diagnosis_date_reason.get_valid_value_id())}"
                 )
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -1601,7 +1927,9 @@ class SubjectSelectionQueryBuilder:
         try:
             comparator = self.criteria_comparator
             value = self.criteria_value.strip().upper()
-            self.sql_where.append(f"AND tk.test_results {comparator} '{value}'")
+            self.sql_where.append(
+                f"AND tk.test_results {comparator} {self._bind(value)}"
+            )
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
 
@@ -1696,7 +2024,7 @@ class SubjectSelectionQueryBuilder:
                 )
 
             self.sql_where.append(
-                f" AND /*ast*/ {self.ap}.appointment_slot_type_id {comparator} {appointment_slot_type.valid_value_id} "
+                f" AND /*ast*/ {self.ap}.appointment_slot_type_id {comparator} {self._bind(appointment_slot_type.valid_value_id)} "
             )
 
         except Exception:
@@ -1722,7 +2050,7 @@ class SubjectSelectionQueryBuilder:
                 )
 
             self.sql_where.append(
-                f" AND /*as*/ {self.ap}.appointment_status_id {comparator} {appointment_status_type.valid_value_id} "
+                f" AND /*as*/ {self.ap}.appointment_status_id {comparator} {self._bind(appointment_status_type.valid_value_id)} "
             )
 
         except Exception:
@@ -1860,7 +2188,7 @@ class SubjectSelectionQueryBuilder:
                         "     FROM external_tests_t rnk "
                         f"     WHERE rnk.subject_epis_id = {xt}.subject_epis_id "
                         "     ) xtr "
-                        f"   WHERE xtr.test_number = {test_number}"
+                        f"   WHERE xtr.test_number = {self._bind(test_number)}"
                         " )"
                     )
                     return
@@ -1910,7 +2238,7 @@ class SubjectSelectionQueryBuilder:
                         self.criteria_key_name, self.criteria_value
                     )
                 self.sql_where.append(
-                    f" {comparator} {diagnostic_test_type.valid_value_id} "
+                    f" {comparator} {self._bind(diagnostic_test_type.valid_value_id)} "
                 )
 
         except Exception:
@@ -1960,7 +2288,7 @@ class SubjectSelectionQueryBuilder:
                 self.sql_where.append(self._SQL_IS_NULL)
             else:
                 result_id = result.valid_value_id
-                self.sql_where.append(f"= {result_id}")
+                self.sql_where.append(f"= {self._bind(result_id)}")
 
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -1989,7 +2317,7 @@ class SubjectSelectionQueryBuilder:
                 self.sql_where.append(self._SQL_IS_NULL)
             else:
                 outcome_id = outcome.valid_value_id
-                self.sql_where.append(f" = {outcome_id} ")
+                self.sql_where.append(f" = {self._bind(outcome_id)} ")
 
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -2016,7 +2344,7 @@ class SubjectSelectionQueryBuilder:
                 self.sql_where.append(f"IS {extent.description}")
             else:
                 self.sql_where.append(
-                    f"{self.criteria_comparator} {extent.valid_value_id}"
+                    f"{self.criteria_comparator} {self._bind(extent.valid_value_id)}"
                 )
 
         except Exception:
@@ -2181,7 +2509,7 @@ class SubjectSelectionQueryBuilder:
             self.sql_where.append(
                 " AND EXISTS (SELECT 'dsc' FROM v_ds_colonoscopy dsc "
                 " WHERE dsc.episode_id = ep.subject_epis_id "
-                f" AND dsc.intended_extent_id = {extent_id})"
+                f" AND dsc.intended_extent_id = {self._bind(extent_id)})"
             )
 
         except Exception:
@@ -2204,7 +2532,7 @@ class SubjectSelectionQueryBuilder:
                 )
 
             self.sql_where.append(
-                f"AND sr.review_status_id {self.criteria_comparator} {surveillance_review_status_type.valid_value_id}"
+                f"AND sr.review_status_id {self.criteria_comparator} {self._bind(surveillance_review_status_type.valid_value_id)}"
             )
 
         except Exception:
@@ -2257,7 +2585,7 @@ class SubjectSelectionQueryBuilder:
                 )
 
             self.sql_where.append(
-                f" AND sr.review_case_type_id {self.criteria_comparator} {surveillance_review_case_type.valid_value_id} "
+                f" AND sr.review_case_type_id {self.criteria_comparator} {self._bind(surveillance_review_case_type.valid_value_id)} "
             )
 
         except Exception:
@@ -2305,7 +2633,7 @@ class SubjectSelectionQueryBuilder:
         """
         try:
             # Assumes criteriaValue contains both comparator and numeric literal, e.g., '>= 2'
-            criteria_value = self.criteria_value.strip()
+            criteria_value = self._bind_numeric_comparison(self.criteria_value)
 
             self.sql_where.append(
                 "AND (SELECT COUNT(*) FROM SUPPORTING_NOTES_T snt "
@@ -2347,7 +2675,7 @@ class SubjectSelectionQueryBuilder:
                 )
             else:
                 self.sql_where.append(
-                    f" {self.criteria_comparator} {episode_result_type.id} "
+                    f" {self.criteria_comparator} {self._bind(episode_result_type.id)} "
                 )
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -2374,7 +2702,7 @@ class SubjectSelectionQueryBuilder:
             else:
                 result_id = result_type.valid_value_id
                 self.sql_where.append(
-                    f" AND {column} {self.criteria_comparator} {result_id} "
+                    f" AND {column} {self.criteria_comparator} {self._bind(result_id)} "
                 )
 
         except Exception:
@@ -2399,7 +2727,7 @@ class SubjectSelectionQueryBuilder:
                         self.criteria_key_name, self.criteria_value
                     )
                 self.sql_where.append(
-                    f" AND {column} {self.criteria_comparator} {referral_type.valid_value_id} "
+                    f" AND {column} {self.criteria_comparator} {self._bind(referral_type.valid_value_id)} "
                 )
 
         except Exception:
@@ -2438,12 +2766,12 @@ class SubjectSelectionQueryBuilder:
                     self.sql_where.append(f"AND {column} IS NULL")
                 else:
                     self.sql_where.append(
-                        f"AND {column} = {subject.lynch_due_date_change_reason_id}"
+                        f"AND {column} = {self._bind(subject.lynch_due_date_change_reason_id)}"
                     )
 
             else:
                 self.sql_where.append(
-                    f"AND {column} {self.criteria_comparator} {reason.valid_value_id}"
+                    f"AND {column} {self.criteria_comparator} {self._bind(reason.valid_value_id)}"
                 )
 
         except Exception:
@@ -2509,18 +2837,18 @@ class SubjectSelectionQueryBuilder:
                 " SELECT 1 FROM notify_message_queue nmq "
                 " INNER JOIN notify_message_definition nmd ON nmd.message_definition_id = nmq.message_definition_id "
                 " WHERE nmq.nhs_number = c.nhs_number "
-                f" AND nmd.event_status_id = {notify_message_event_status_id} "
+                f" AND nmd.event_status_id = {self._bind(notify_message_event_status_id)} "
             )
             if (
                 notify_message_status != NotifyMessageStatus.NONE
                 and notify_message_status is not None
             ):
                 self.sql_where.append(
-                    f" AND nmq.message_status = '{notify_message_status.description}'"
+                    f" AND nmq.message_status = {self._bind(notify_message_status.description)}"
                 )
             if notify_message_code is not None:
                 self.sql_where.append(
-                    f" AND nmd.message_code = '{notify_message_code}'"
+                    f" AND nmd.message_code = {self._bind(notify_message_code)}"
                 )
             self.sql_where.append(")")
 
@@ -2548,18 +2876,18 @@ class SubjectSelectionQueryBuilder:
                 "INNER JOIN notify_message_batch nmb ON nmb.batch_id = nmr.batch_id "
                 "INNER JOIN notify_message_definition nmd ON nmd.message_definition_id = nmb.message_definition_id "
                 "WHERE nmr.subject_id = ss.screening_subject_id "
-                f"AND nmd.event_status_id = {notify_message_event_status_id}"
+                f"AND nmd.event_status_id = {self._bind(notify_message_event_status_id)}"
             )
             if notify_message_code is not None:
                 self.sql_where.append(
-                    f" AND nmd.message_code = '{notify_message_code}'"
+                    f" AND nmd.message_code = {self._bind(notify_message_code)}"
                 )
             if (
                 notify_message_status != NotifyMessageStatus.NONE
                 and notify_message_status is not None
             ):
                 self.sql_where.append(
-                    f" AND nmr.message_status = '{notify_message_status.description}'"
+                    f" AND nmr.message_status = {self._bind(notify_message_status.description)}"
                 )
             self.sql_where.append(")")
 
@@ -2572,10 +2900,10 @@ class SubjectSelectionQueryBuilder:
         """
         try:
             answer = YesNoType.by_description_case_insensitive(self.criteria_value)
-            condition = "'Y'" if answer == YesNoType.YES else "'N'"
+            condition = "Y" if answer == YesNoType.YES else "N"
 
             self.sql_where.append(
-                f"AND pkg_letters.f_subj_prev_diagnosed_cancer(pi_subject_id => ss.screening_subject_id) = {condition}"
+                f"AND pkg_letters.f_subj_prev_diagnosed_cancer(pi_subject_id => ss.screening_subject_id) = {self._bind(condition)}"
             )
         except Exception:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
@@ -2626,7 +2954,7 @@ class SubjectSelectionQueryBuilder:
         if asa_grade is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
         self.sql_where.append(
-            f" AND cads.asa_grade_id = {asa_grade.get_valid_value_id()} "
+            f" AND cads.asa_grade_id = {self._bind(asa_grade.get_valid_value_id())} "
         )
 
     def _add_criteria_cads_staging_scans(self) -> None:
@@ -2641,7 +2969,9 @@ class SubjectSelectionQueryBuilder:
         yes_no = YesNoType.by_description_case_insensitive(self.criteria_value)
         if yes_no is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
-        self.sql_where.append(f" AND cads.staging_scans_done_id = {yes_no.get_id()} ")
+        self.sql_where.append(
+            f" AND cads.staging_scans_done_id = {self._bind(yes_no.get_id())} "
+        )
 
     def _add_criteria_cads_type_of_scan(self) -> None:
         """
@@ -2655,7 +2985,9 @@ class SubjectSelectionQueryBuilder:
         scan_type = ScanType.by_description_case_insensitive(self.criteria_value)
         if scan_type is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
-        self.sql_where.append(f" AND dcss.type_of_scan_id = {scan_type.get_id()} ")
+        self.sql_where.append(
+            f" AND dcss.type_of_scan_id = {self._bind(scan_type.get_id())} "
+        )
 
     def _add_criteria_cads_metastases_present(self) -> None:
         """
@@ -2671,7 +3003,7 @@ class SubjectSelectionQueryBuilder:
         if metastases_present_type is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
         self.sql_where.append(
-            f" AND cads.metastases_found_id = {metastases_present_type.get_id()} "
+            f" AND cads.metastases_found_id = {self._bind(metastases_present_type.get_id())} "
         )
 
     def _add_criteria_cads_metastases_location(self) -> None:
@@ -2689,7 +3021,7 @@ class SubjectSelectionQueryBuilder:
         if metastases_location is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
         self.sql_where.append(
-            f" AND dcm.location_of_metastasis_id = {metastases_location.get_id()} "
+            f" AND dcm.location_of_metastasis_id = {self._bind(metastases_location.get_id())} "
         )
 
     def _add_criteria_cads_metastases_other_location(self, other_location: str) -> None:
@@ -2702,7 +3034,7 @@ class SubjectSelectionQueryBuilder:
         self._add_join_to_cancer_audit_dataset()
         self._add_join_to_cancer_audit_dataset_metastasis()
         self.sql_where.append(
-            f" AND dcm.other_location_of_metastasis = '{other_location}' "
+            f" AND dcm.other_location_of_metastasis = {self._bind(other_location)} "
         )
 
     def _add_criteria_cads_final_pre_treatment_t_category(self) -> None:
@@ -2721,7 +3053,7 @@ class SubjectSelectionQueryBuilder:
         if final_pretreatment_t_category is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
         self.sql_where.append(
-            f" AND cads.final_pre_treat_t_category_id = {final_pretreatment_t_category.get_id()} "
+            f" AND cads.final_pre_treat_t_category_id = {self._bind(final_pretreatment_t_category.get_id())} "
         )
 
     def _add_criteria_cads_final_pre_treatment_n_category(self) -> None:
@@ -2740,7 +3072,7 @@ class SubjectSelectionQueryBuilder:
         if final_pretreatment_n_category is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
         self.sql_where.append(
-            f" AND cads.final_pre_treat_n_category_id = {final_pretreatment_n_category.get_id()} "
+            f" AND cads.final_pre_treat_n_category_id = {self._bind(final_pretreatment_n_category.get_id())} "
         )
 
     def _add_criteria_cads_final_pre_treatment_m_category(self) -> None:
@@ -2759,7 +3091,7 @@ class SubjectSelectionQueryBuilder:
         if final_pretreatment_m_category is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
         self.sql_where.append(
-            f" AND cads.final_pre_treat_m_category_id = {final_pretreatment_m_category.get_id()} "
+            f" AND cads.final_pre_treat_m_category_id = {self._bind(final_pretreatment_m_category.get_id())} "
         )
 
     def _add_criteria_cads_treatment_received(self) -> None:
@@ -2773,7 +3105,9 @@ class SubjectSelectionQueryBuilder:
         yes_no = YesNoType.by_description_case_insensitive(self.criteria_value)
         if yes_no is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
-        self.sql_where.append(f" AND cads.treatment_received_id = {yes_no.get_id()} ")
+        self.sql_where.append(
+            f" AND cads.treatment_received_id = {self._bind(yes_no.get_id())} "
+        )
 
     def _add_criteria_cads_reason_no_treatment_received(self) -> None:
         """
@@ -2791,7 +3125,7 @@ class SubjectSelectionQueryBuilder:
         if reason_no_treatment_recieved is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
         self.sql_where.append(
-            f" AND cads.reason_no_treatment_id = {reason_no_treatment_recieved.get_id()} "
+            f" AND cads.reason_no_treatment_id = {self._bind(reason_no_treatment_recieved.get_id())} "
         )
 
     def _add_criteria_cads_tumour_location(self) -> None:
@@ -2806,7 +3140,9 @@ class SubjectSelectionQueryBuilder:
         location = LocationType.by_description_case_insensitive(self.criteria_value)
         if location is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
-        self.sql_where.append(f" AND dctu.location_id = {location.get_id()} ")
+        self.sql_where.append(
+            f" AND dctu.location_id = {self._bind(location.get_id())} "
+        )
 
     def _add_criteria_cads_tumour_height_of_tumour_above_anal_verge(self) -> None:
         """
@@ -2818,7 +3154,7 @@ class SubjectSelectionQueryBuilder:
         self._add_join_to_cancer_audit_dataset()
         self._add_join_to_cancer_audit_dataset_tumour()
         self.sql_where.append(
-            " AND dctu.height_above_anal_verge = {self.criteria_value} "
+            f" AND dctu.height_above_anal_verge = {self._bind(self.criteria_value)} "
         )
 
     def _add_criteria_cads_tumour_previously_excised_tumour(self) -> None:
@@ -2838,7 +3174,7 @@ class SubjectSelectionQueryBuilder:
         if previously_excised_tumor is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
         self.sql_where.append(
-            f" AND dctu.recurrence_id = {previously_excised_tumor.get_id()} "
+            f" AND dctu.recurrence_id = {self._bind(previously_excised_tumor.get_id())} "
         )
 
     def _add_criteria_cads_treatment_type(self) -> None:
@@ -2854,7 +3190,7 @@ class SubjectSelectionQueryBuilder:
         if treatment is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
         self.sql_where.append(
-            f" AND dctr.treatment_category_id = {treatment.get_id()} "
+            f" AND dctr.treatment_category_id = {self._bind(treatment.get_id())} "
         )
 
     def _add_criteria_cads_treatment_given(self) -> None:
@@ -2870,7 +3206,7 @@ class SubjectSelectionQueryBuilder:
         if treatment is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
         self.sql_where.append(
-            f" AND dctr.treatment_procedure_id = {treatment.get_id()} "
+            f" AND dctr.treatment_procedure_id = {self._bind(treatment.get_id())} "
         )
 
     def _add_criteria_cads_cancer_treatment_intent(self) -> None:
@@ -2888,7 +3224,7 @@ class SubjectSelectionQueryBuilder:
         if cancer_treatment_intent is None:
             raise SelectionBuilderException(self.criteria_key_name, self.criteria_value)
         self.sql_where.append(
-            f" AND dctr.treatment_intent_id = {cancer_treatment_intent.get_id()} "
+            f" AND dctr.treatment_intent_id = {self._bind(cancer_treatment_intent.get_id())} "
         )
 
     def _add_join_to_cancer_audit_dataset_staging_scan(self) -> None:
@@ -2947,7 +3283,7 @@ class SubjectSelectionQueryBuilder:
         self.sql_where.append("   SELECT hub.org_id ")
         self.sql_where.append("   FROM org hub ")
         self.sql_where.append("   WHERE hub.org_code = ")
-        self.sql_where.append(self.single_quoted(hub_code_str))
+        self.sql_where.append(self._bind(hub_code_str))
         self.sql_where.append(") ")
 
     def _add_criteria_subject_screening_centre_code(self, user: "User"):
@@ -2999,7 +3335,7 @@ class SubjectSelectionQueryBuilder:
                 f" AND c.responsible_sc_id {self.criteria_comparator} ("
                 "   SELECT sc.org_id "
                 "   FROM org sc "
-                f"   WHERE sc.org_code = {self.single_quoted(sc_code_str)}"
+                f"   WHERE sc.org_code = {self._bind(sc_code_str)}"
                 ") "
             )
 
@@ -3049,7 +3385,7 @@ class SubjectSelectionQueryBuilder:
             " SELECT o.org_id FROM gp_practice_current_links gpcl "
             " INNER JOIN org o ON gpcl.gp_practice_id = o.org_id "
             " WHERE gpcl.sc_id = ( "
-            f" SELECT org_id FROM org WHERE org_code = {self.single_quoted(self.criteria_value)})) "
+            f" SELECT org_id FROM org WHERE org_code = {self._bind(self.criteria_value)})) "
         )
 
     def _add_criteria_screening_status(self, subject: "Subject"):
@@ -3074,7 +3410,7 @@ class SubjectSelectionQueryBuilder:
                     self.criteria_key_name, self._REASON_NO_EXISTING_SUBJECT
                 )
             self.sql_where.append(" = ")
-            self.sql_where.append(subject.get_screening_status_id())
+            self.sql_where.append(self._bind(subject.get_screening_status_id()))
         else:
             try:
                 screening_status_type = (
@@ -3087,7 +3423,7 @@ class SubjectSelectionQueryBuilder:
                         self.criteria_key_name, self.criteria_value
                     )
                 self.sql_where.append(self.criteria_comparator)
-                self.sql_where.append(screening_status_type.valid_value_id)
+                self.sql_where.append(self._bind(screening_status_type.valid_value_id))
             except Exception:
                 raise SelectionBuilderException(
                     self.criteria_key_name, self.criteria_value
@@ -3118,7 +3454,7 @@ class SubjectSelectionQueryBuilder:
                 self.sql_where.append(self._SQL_IS_NOT_NULL)
             case _:
                 self.sql_where.append(
-                    f"{self.criteria_comparator}{screening_status_type.valid_value_id}"
+                    f"{self.criteria_comparator}{self._bind(screening_status_type.valid_value_id)}"
                 )
 
     def _add_criteria_screening_status_reason(self, subject: "Subject"):
@@ -3144,7 +3480,7 @@ class SubjectSelectionQueryBuilder:
                 self.sql_where.append(" AND ss.ss_reason_for_change_id IS NULL")
             else:
                 self.sql_where.append(
-                    f" AND ss.ss_reason_for_change_id = {subject.get_screening_status_change_reason_id()}"
+                    f" AND ss.ss_reason_for_change_id = {self._bind(subject.get_screening_status_change_reason_id())}"
                 )
         else:
             try:
@@ -3158,7 +3494,7 @@ class SubjectSelectionQueryBuilder:
                         self.criteria_key_name, self.criteria_value
                     )
                 self.sql_where.append(
-                    f" AND ss.ss_reason_for_change_id {self.criteria_comparator}{screening_status_change_reason_type.valid_value_id}"
+                    f" AND ss.ss_reason_for_change_id {self.criteria_comparator}{self._bind(screening_status_change_reason_type.valid_value_id)}"
                 )
             except Exception:
                 raise SelectionBuilderException(
@@ -3184,7 +3520,9 @@ class SubjectSelectionQueryBuilder:
             self._add_check_comparing_one_date_with_another(
                 date_column_name,
                 " = ",
-                self._add_years_to_oracle_date(self.c_dob, self.criteria_value),
+                self._add_years_to_oracle_date(
+                    self.c_dob, self._bind(int(self.criteria_value))
+                ),
                 False,
             )
         elif (
@@ -3195,7 +3533,9 @@ class SubjectSelectionQueryBuilder:
             self._add_check_comparing_one_date_with_another(
                 date_column_name,
                 " = ",
-                self._add_years_to_oracle_date(self.c_dob, criteria_words[0][:-2]),
+                self._add_years_to_oracle_date(
+                    self.c_dob, self._bind(int(criteria_words[0][:-2]))
+                ),
                 False,
             )
         elif self._is_valid_date(self.criteria_value):
@@ -3298,11 +3638,11 @@ class SubjectSelectionQueryBuilder:
                         )
                     else:
                         self.sql_where.append(
-                            f"{due_date_reason}{" = "}{subject.get_screening_due_date_change_reason_id()}"
+                            f"{due_date_reason}{" = "}{self._bind(subject.get_screening_due_date_change_reason_id())}"
                         )
                 case _:
                     self.sql_where.append(
-                        f"{due_date_reason}{self.criteria_comparator}{screening_due_date_change_reason_type.valid_value_id}"
+                        f"{due_date_reason}{self.criteria_comparator}{self._bind(screening_due_date_change_reason_type.valid_value_id)}"
                     )
         except SelectionBuilderException as ssbe:
             raise ssbe
@@ -3350,11 +3690,11 @@ class SubjectSelectionQueryBuilder:
                         self.sql_where.append(self._SQL_IS_NULL)
                     else:
                         self.sql_where.append(
-                            f" = {subject.get_surveillance_due_date_change_reason_id()}"
+                            f" = {self._bind(subject.get_surveillance_due_date_change_reason_id())}"
                         )
                 case _:
                     self.sql_where.append(
-                        f"{self.criteria_comparator}{surveillance_due_date_change_reason.valid_value_id}"
+                        f"{self.criteria_comparator}{self._bind(surveillance_due_date_change_reason.valid_value_id)}"
                     )
         except SelectionBuilderException as ssbe:
             raise ssbe
@@ -3383,7 +3723,7 @@ class SubjectSelectionQueryBuilder:
 
             self.sql_where.append(" AND ss.fs_sdd_reason_for_change_id ")
             self.sql_where.append(
-                f"{self.criteria_comparator}{bowel_scope_due_date_change_reason_type.valid_value_id}"
+                f"{self.criteria_comparator}{self._bind(bowel_scope_due_date_change_reason_type.valid_value_id)}"
             )
 
         except Exception:
@@ -3416,9 +3756,9 @@ class SubjectSelectionQueryBuilder:
                 case ManualCeaseRequested.YES:
                     self.sql_where.append(self._SQL_IS_NOT_NULL)
                 case ManualCeaseRequested.DISCLAIMER_LETTER_REQUIRED:
-                    self.sql_where.append("= 35")  # C1
+                    self.sql_where.append(f"= {self._bind(35)}")  # C1
                 case ManualCeaseRequested.DISCLAIMER_LETTER_SENT:
-                    self.sql_where.append("= 36")  # C2
+                    self.sql_where.append(f"= {self._bind(36)}")  # C2
                 case _:
                     raise SelectionBuilderException(
                         self.criteria_key_name, self.criteria_value
@@ -3451,8 +3791,8 @@ class SubjectSelectionQueryBuilder:
                 raise ValueError("Unrecognized enum value")
         except Exception:
             # Fall back to string matching
-            value_quoted = f"'{self.criteria_value.lower()}'"
-            self.sql_where.append(f"{self.criteria_comparator} {value_quoted} ")
+            value_bound = self._bind(self.criteria_value.lower())
+            self.sql_where.append(f"{self.criteria_comparator} {value_bound} ")
 
     def _add_criteria_ceased_confirmation_user_id(self, user: "User") -> None:
         """
@@ -3471,7 +3811,7 @@ class SubjectSelectionQueryBuilder:
 
         if self.criteria_value.isnumeric():  # actual PIO ID
             self.sql_where.append(self.criteria_comparator)
-            self.sql_where.append(self.criteria_value)
+            self.sql_where.append(self._bind(int(self.criteria_value)))
             self.sql_where.append(" ")
         else:
             try:
@@ -3480,14 +3820,14 @@ class SubjectSelectionQueryBuilder:
                 )
                 if enum_value == CeasedConfirmationUserId.AUTOMATED_PROCESS_ID:
                     self.sql_where.append(self.criteria_comparator)
-                    self.sql_where.append(" 2 ")
+                    self.sql_where.append(f" {self._bind(2)} ")
                 elif enum_value == CeasedConfirmationUserId.NOT_NULL:
                     self.sql_where.append(self._SQL_IS_NOT_NULL)
                 elif enum_value == CeasedConfirmationUserId.NULL:
                     self.sql_where.append(self._SQL_IS_NULL)
                 elif enum_value == CeasedConfirmationUserId.USER_ID:
                     self.sql_where.append(self.criteria_comparator)
-                    self.sql_where.append(str(user.user_id) + " ")
+                    self.sql_where.append(self._bind(user.user_id) + " ")
                 else:
                     raise SelectionBuilderException(
                         self.criteria_key_name, self.criteria_value
@@ -3529,7 +3869,7 @@ class SubjectSelectionQueryBuilder:
                 self.sql_where.append(f" IS {clinical_cease_reason.description}")
             else:
                 self.sql_where.append(
-                    f"{self.criteria_comparator}{clinical_cease_reason.valid_value_id}"
+                    f"{self.criteria_comparator}{self._bind(clinical_cease_reason.valid_value_id)}"
                 )
 
         except Exception:
@@ -3572,7 +3912,7 @@ class SubjectSelectionQueryBuilder:
                 f" SELECT 1"
                 f" FROM ep_events_t sev"
                 f" WHERE sev.screening_subject_id = ss.screening_subject_id"
-                f" AND sev.event_status_id = {event_status.id}"
+                f" AND sev.event_status_id = {self._bind(event_status.id)}"
                 f") "
             )
 
@@ -3673,7 +4013,7 @@ class SubjectSelectionQueryBuilder:
 
         if episode_type is not None:
             self.sql_where.append(
-                f"   AND ep.episode_type_id = {episode_type.valid_value_id} "
+                f"   AND ep.episode_type_id = {self._bind(episode_type.valid_value_id)} "
             )
 
         if self.criteria_key == SubjectSelectionCriteriaKey.SUBJECT_HAS_AN_OPEN_EPISODE:
@@ -3948,7 +4288,7 @@ class SubjectSelectionQueryBuilder:
         Returns:
             str: The SQL expression for the Oracle TO_DATE function.
         """
-        return f" TO_DATE( '{date}', '{format}') "
+        return f" TO_DATE( {self._bind(date)}, '{format}') "
 
     def _add_check_date_is_a_period_ago_or_later(
         self, date_column_name: str, value: str
@@ -4073,7 +4413,7 @@ class SubjectSelectionQueryBuilder:
             date_to_use = DateDescription.by_description_case_insensitive(value)
             if date_to_use is None:
                 raise ValueError(f"No DateDescription found for value: {value}")
-            number_of_months = str(date_to_use.number_of_months)
+            number_of_months = date_to_use.number_of_months
 
             match date_to_use:
                 case DateDescription.NOT_NULL:
@@ -4140,7 +4480,7 @@ class SubjectSelectionQueryBuilder:
                 ):
                     self._add_check_comparing_one_date_with_another(
                         self._subtract_months_from_oracle_date(
-                            "SYSDATE", number_of_months
+                            "SYSDATE", self._bind(number_of_months)
                         ),
                         " <= ",
                         date_column_name,
@@ -4160,7 +4500,7 @@ class SubjectSelectionQueryBuilder:
                         date_column_name,
                         " = ",
                         self._add_months_to_oracle_date(
-                            "gcd.last_colonoscopy_date", number_of_months
+                            "gcd.last_colonoscopy_date", self._bind(number_of_months)
                         ),
                         False,
                     )
@@ -4173,7 +4513,7 @@ class SubjectSelectionQueryBuilder:
                         date_column_name,
                         " = ",
                         self._add_months_to_oracle_date(
-                            "ep.episode_end_date", number_of_months
+                            "ep.episode_end_date", self._bind(number_of_months)
                         ),
                         False,
                     )
@@ -4189,7 +4529,7 @@ class SubjectSelectionQueryBuilder:
                             self.xt
                             + str(self.criteria_value_count)
                             + ".confirmed_date",
-                            number_of_months,
+                            self._bind(number_of_months),
                         ),
                         False,
                     )
@@ -4203,7 +4543,7 @@ class SubjectSelectionQueryBuilder:
                         " = ",
                         self._add_months_to_oracle_date(
                             self.xt + str(self.criteria_value_count) + ".surgery_date",
-                            number_of_months,
+                            self._bind(number_of_months),
                         ),
                         False,
                     )
@@ -4213,7 +4553,7 @@ class SubjectSelectionQueryBuilder:
                         " = ",
                         "MIN",
                         EventStatusType.S10,
-                        number_of_months,
+                        self._bind(number_of_months),
                     )
                 case DateDescription.TWO_YEARS_FROM_LATEST_A37_EVENT:
                     self._add_check_comparing_date_with_earliest_or_latest_event_date(
@@ -4221,7 +4561,7 @@ class SubjectSelectionQueryBuilder:
                         " = ",
                         "MAX",
                         EventStatusType.A37,
-                        number_of_months,
+                        self._bind(number_of_months),
                     )
                 case DateDescription.TWO_YEARS_FROM_LATEST_J8_EVENT:
                     self._add_check_comparing_date_with_earliest_or_latest_event_date(
@@ -4229,7 +4569,7 @@ class SubjectSelectionQueryBuilder:
                         " = ",
                         "MAX",
                         EventStatusType.J8,
-                        number_of_months,
+                        self._bind(number_of_months),
                     )
                 case DateDescription.TWO_YEARS_FROM_LATEST_J15_EVENT:
                     self._add_check_comparing_date_with_earliest_or_latest_event_date(
@@ -4237,7 +4577,7 @@ class SubjectSelectionQueryBuilder:
                         " = ",
                         "MAX",
                         EventStatusType.J15,
-                        number_of_months,
+                        self._bind(number_of_months),
                     )
                 case DateDescription.TWO_YEARS_FROM_LATEST_J16_EVENT:
                     self._add_check_comparing_date_with_earliest_or_latest_event_date(
@@ -4245,7 +4585,7 @@ class SubjectSelectionQueryBuilder:
                         " = ",
                         "MAX",
                         EventStatusType.J16,
-                        number_of_months,
+                        self._bind(number_of_months),
                     )
                 case DateDescription.TWO_YEARS_FROM_LATEST_J25_EVENT:
                     self._add_check_comparing_date_with_earliest_or_latest_event_date(
@@ -4253,7 +4593,7 @@ class SubjectSelectionQueryBuilder:
                         " = ",
                         "MAX",
                         EventStatusType.J25,
-                        number_of_months,
+                        self._bind(number_of_months),
                     )
                 case DateDescription.TWO_YEARS_FROM_LATEST_S158_EVENT:
                     self._add_check_comparing_date_with_earliest_or_latest_event_date(
@@ -4261,7 +4601,7 @@ class SubjectSelectionQueryBuilder:
                         " = ",
                         "MAX",
                         EventStatusType.S158,
-                        number_of_months,
+                        self._bind(number_of_months),
                     )
                 case DateDescription.AS_AT_EPISODE_START:
                     self._add_join_to_latest_episode()
@@ -4421,7 +4761,7 @@ class SubjectSelectionQueryBuilder:
             f"(SELECT {self._add_months_to_oracle_date(f'{min_or_max}({alias}.datestamp)', number_of_months)} "
             f"FROM ep_events_t {alias} "
             f"WHERE {alias}.subject_epis_id = ep.subject_epis_id "
-            f"AND {alias}.event_status_id = {event.id})"
+            f"AND {alias}.event_status_id = {self._bind(event.id)})"
         )
 
         self.sql_where.append(f"AND {date_column_name} {comparator} {subquery}")
@@ -4505,7 +4845,9 @@ class SubjectSelectionQueryBuilder:
         self._add_check_comparing_one_date_with_another(
             date_column_name,
             comparator,
-            self._subtract_years_from_oracle_date("SYSDATE", numerator),
+            self._subtract_years_from_oracle_date(
+                "SYSDATE", self._bind(int(numerator))
+            ),
             False,
         )
 
@@ -4526,7 +4868,9 @@ class SubjectSelectionQueryBuilder:
         self._add_check_comparing_one_date_with_another(
             date_column_name,
             comparator,
-            self._subtract_months_from_oracle_date("SYSDATE", numerator),
+            self._subtract_months_from_oracle_date(
+                "SYSDATE", self._bind(int(numerator))
+            ),
             False,
         )
 
@@ -4547,7 +4891,7 @@ class SubjectSelectionQueryBuilder:
         self._add_check_comparing_one_date_with_another(
             date_column_name,
             comparator,
-            self._subtract_days_from_oracle_date("SYSDATE", numerator),
+            self._subtract_days_from_oracle_date("SYSDATE", self._bind(int(numerator))),
             False,
         )
 
@@ -4568,7 +4912,7 @@ class SubjectSelectionQueryBuilder:
         self._add_check_comparing_one_date_with_another(
             date_column_name,
             comparator,
-            self._add_years_to_oracle_date("SYSDATE", numerator),
+            self._add_years_to_oracle_date("SYSDATE", self._bind(int(numerator))),
             False,
         )
 
@@ -4589,7 +4933,7 @@ class SubjectSelectionQueryBuilder:
         self._add_check_comparing_one_date_with_another(
             date_column_name,
             comparator,
-            self._add_months_to_oracle_date("SYSDATE", numerator),
+            self._add_months_to_oracle_date("SYSDATE", self._bind(int(numerator))),
             False,
         )
 
@@ -4610,7 +4954,7 @@ class SubjectSelectionQueryBuilder:
         self._add_check_comparing_one_date_with_another(
             date_column_name,
             comparator,
-            self._add_days_to_oracle_date("SYSDATE", numerator),
+            self._add_days_to_oracle_date("SYSDATE", self._bind(int(numerator))),
             False,
         )
 
@@ -0,0 +1,117 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Hashable, Optional
+
+DEFAULT_CACHE_SIZE = 256
+
+
+@dataclass
+class CachedQueryTemplate:
+    """
+    Data class holding a compiled subject selection query and what is needed to re-bind it.
+
+    Attributes:
+        query (str): The SQL text, which only contains bind placeholders for the criteria values
+        bind_vars (dict): The bind variables from the build that compiled the template
+        value_binds (dict[str, list[str]]): Maps criteria keys whose values are bound to their bind variable names
+        row_count_bind (str): The name of the bind variable used for FETCH FIRST
+    """
+
+    query: str
+    bind_vars: dict
+    value_binds: dict[str, list[str]] = field(default_factory=dict)
+    row_count_bind: str = ""
+
+    def bind(self, criteria_values: dict[str, list], subjects_to_retrieve: int) -> dict:
+        """
+        Builds the bind variables for a new set of criteria with the same shape as the cached one.
+
+        Args:
+            criteria_values (dict[str, list]): The values to bind for each criteria key, in the order they are bound
+            subjects_to_retrieve (int): The number of subjects to fetch
+
+        Returns:
+            dict: The bind variables to use with the cached query
+        """
+        bind_vars = dict(self.bind_vars)
+        for criteria_key, bind_names in self.value_binds.items():
+            for bind_name, value in zip(bind_names, criteria_values[criteria_key]):
+                bind_vars[bind_name] = value
+        bind_vars[self.row_count_bind] = subjects_to_retrieve
+        return bind_vars
+
+
+class SubjectSelectionQueryCache:
+    """
+    A thread safe LRU cache of compiled subject selection queries, keyed on the shape of the criteria.
+    Keeps hit, miss and eviction counters so that the effectiveness of the cache can be reported.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        if max_size < 1:
+            raise ValueError(f"Invalid cache size: {max_size}")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._templates: OrderedDict[Hashable, CachedQueryTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CachedQueryTemplate]:
+        """
+        Returns the template stored against the key, marking it as the most recently used.
+
+        Args:
+            key (Hashable): The criteria shape
+
+        Returns:
+            Optional[CachedQueryTemplate]: The cached template, or None if there is not one
+        """
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None:
+                self.misses += 1
+                return None
+            self._templates.move_to_end(key)
+            self.hits += 1
+            return template
+
+    def put(self, key: Hashable, template: CachedQueryTemplate) -> None:
+        """
+        Stores a template, evicting the least recently used one if the cache is full.
+
+        Args:
+            key (Hashable): The criteria shape
+            template (CachedQueryTemplate): The compiled template
+        """
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Removes all templates and resets the counters.
+        """
+        with self._lock:
+            self._templates.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def summary(self) -> str:
+        """
+        Returns a single line summary of the cache counters, suitable for logging.
+        """
+        lookups = self.hits + self.misses
+        hit_rate = (self.hits / lookups * 100) if lookups else 0.0
+        return (
+            f"size={len(self)}/{self.max_size}, hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, hit_rate={hit_rate:.1f}%"
+        )
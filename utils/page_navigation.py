@@ -0,0 +1,207 @@
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+from urllib.parse import urlparse
+from playwright.sync_api import Page
+from pages.base_page import BasePage
+from pages.call_and_recall.call_and_recall_page import CallAndRecallPage
+from pages.communication_production.communications_production_page import (
+    CommunicationsProductionPage,
+)
+
+PAGE_TITLE_SELECTOR = "#page-title, #ntshPageTitle"
+
+
+@dataclass(frozen=True)
+class Route:
+    """
+    How to get to a BCSS page.
+
+    Attributes:
+        path (Optional[str]): The URL path of the page, relative to the base URL, which can contain {param} placeholders.
+                              If this is None, the URL is learnt the first time the page is reached through the menus.
+        menu (Optional[Tuple[Tuple[type, str], ...]]): The page object and method that clicks each menu link, starting
+                                                       from the main menu. None if the page can't be reached from the menus.
+        title (Optional[str]): The text the page title contains, used to check that going straight to the URL reached the page.
+    """
+
+    path: Optional[str] = None
+    menu: Optional[Tuple[Tuple[type, str], ...]] = ()
+    title: Optional[str] = None
+
+
+ROUTES = {
+    "main_menu": Route(title="Main Menu"),
+    "communications_production": Route(
+        menu=((BasePage, "go_to_communications_production_page"),),
+    ),
+    "active_batch_list": Route(
+        menu=(
+            (BasePage, "go_to_communications_production_page"),
+            (CommunicationsProductionPage, "go_to_active_batch_list_page"),
+        ),
+        title="Active Batch List",
+    ),
+    "archived_batch_list": Route(
+        menu=(
+            (BasePage, "go_to_communications_production_page"),
+            (CommunicationsProductionPage, "go_to_archived_batch_list_page"),
+        ),
+        title="Archived Batch List",
+    ),
+    "letter_library_index": Route(
+        menu=(
+            (BasePage, "go_to_communications_production_page"),
+            (CommunicationsProductionPage, "go_to_letter_library_index_page"),
+        ),
+        title="Letter Library Index",
+    ),
+    "active_batch": Route(path="/letters/activebatch/{batch_id}", menu=None),
+    "screening_subject_search": Route(
+        menu=((BasePage, "go_to_screening_subject_search_page"),),
+    ),
+    "call_and_recall": Route(menu=((BasePage, "go_to_call_and_recall_page"),)),
+    "generate_invitations": Route(
+        menu=(
+            (BasePage, "go_to_call_and_recall_page"),
+            (CallAndRecallPage, "go_to_generate_invitations_page"),
+        ),
+        title="Generate Invitations",
+    ),
+    "fit_test_kits": Route(
+        menu=((BasePage, "go_to_fit_test_kits_page"),), title="FIT Test Kits"
+    ),
+    "surveillance_review_summary": Route(
+        path="/surveillance/review/summary", menu=None
+    ),
+    "spine_search": Route(path="/servlet/SpineSearchScreen", menu=None),
+}
+
+# The URLs of pages learnt by clicking through the menus, keyed by the base URL and page name
+_learnt_urls: dict[tuple[str, str], str] = {}
+_learnt_urls_lock = threading.Lock()
+
+
+def _origin(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def _is_on_page(page: Page, route: Route, url: str) -> bool:
+    """
+    Checks that going straight to a URL reached the page, rather than being redirected elsewhere.
+    """
+    if route.title is None:
+        return urlparse(page.url).path.rstrip("/") == urlparse(url).path.rstrip("/")
+    title = page.locator(PAGE_TITLE_SELECTOR).first
+    return (
+        title.count() > 0 and route.title.lower() in (title.inner_text() or "").lower()
+    )
+
+
+def click_through_to(page: Page, page_name: str) -> None:
+    """
+    Goes to a BCSS page by clicking through the main menu and each menu level, as a user would.
+    Tests that check the menus themselves should use this rather than navigate_to.
+
+    Args:
+        page (Page): The Playwright page object
+        page_name (str): The name of the page in ROUTES, e.g. "active_batch_list"
+
+    Raises:
+        ValueError: If the page is not in ROUTES, or can't be reached from the menus
+    """
+    route = get_route(page_name)
+    if route.menu is None:
+        raise ValueError(f"The '{page_name}' page can't be reached from the menus")
+    BasePage(page).click_main_menu_link()
+    for page_object, method in route.menu:
+        getattr(page_object(page), method)()
+
+    if route.path is None and route.menu:
+        with _learnt_urls_lock:
+            _learnt_urls[(_origin(page.url), page_name)] = page.url
+
+
+def navigate_to(
+    page: Page, page_name: str, click_through: Optional[bool] = None, **params: Any
+) -> None:
+    """
+    Goes to a BCSS page in a single page.goto, instead of clicking through the menus.
+
+    Pages with a known URL are always gone to directly. For the other pages, the menus are clicked through the first
+    time, and the URL is remembered for the rest of the test session. If going straight to a remembered URL does not
+    reach the page (e.g. the session has moved on), the menus are clicked through again.
+
+    Args:
+        page (Page): The Playwright page object
+        page_name (str): The name of the page in ROUTES, e.g. "active_batch_list"
+        click_through (Optional[bool]): True to click through the menus (for tests that check the menus).
+                                        Defaults to NAVIGATION_CLICK_THROUGH in local.env, or False.
+        **params: The values of any {param} placeholders in the page's URL, e.g. batch_id=12345
+
+    Raises:
+        ValueError: If the page is not in ROUTES, or a URL parameter is missing
+
+    Example:
+        navigate_to(page, "active_batch_list")
+        navigate_to(page, "active_batch", batch_id=batch_id)
+    """
+    route = get_route(page_name)
+    if click_through is None:
+        click_through = (
+            os.getenv("NAVIGATION_CLICK_THROUGH", "").strip().lower() == "true"
+        )
+    if click_through and route.menu is not None:
+        logging.info(f"[NAVIGATION] Clicking through the menus to '{page_name}'")
+        click_through_to(page, page_name)
+        return
+
+    if route.path is not None:
+        try:
+            path = route.path.format(**params)
+        except KeyError as e:
+            raise ValueError(
+                f"Missing URL parameter {e} for the '{page_name}' page"
+            ) from e
+        logging.info(f"[NAVIGATION] Going to '{page_name}' at {path}")
+        page.goto(path)
+        return
+
+    key = (_origin(page.url), page_name)
+    with _learnt_urls_lock:
+        url = _learnt_urls.get(key)
+    if url is not None:
+        logging.info(f"[NAVIGATION] Going to '{page_name}' at {url}")
+        page.goto(url)
+        if _is_on_page(page, route, url):
+            return
+        logging.warning(
+            f"[NAVIGATION] Going to {url} did not reach '{page_name}', clicking through the menus instead"
+        )
+        with _learnt_urls_lock:
+            _learnt_urls.pop(key, None)
+
+    click_through_to(page, page_name)
+
+
+def get_route(page_name: str) -> Route:
+    """
+    Returns the route to a BCSS page.
+
+    Args:
+        page_name (str): The name of the page in ROUTES
+
+    Returns:
+        Route: The route to the page
+
+    Raises:
+        ValueError: If the page is not in ROUTES
+    """
+    if page_name not in ROUTES:
+        raise ValueError(
+            f"Unknown page '{page_name}', expected one of {sorted(ROUTES)}"
+        )
+    return ROUTES[page_name]
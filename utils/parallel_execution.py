@@ -0,0 +1,293 @@
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+from utils.load_properties_file import PropertiesFile
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+PARALLEL_PROPERTY_PREFIX = "parallel."
+PARTITION_SUBJECTS_PROPERTY = "parallel.partition_subjects"
+# Anchored on the project root, so every worker shares the same locks whatever directory it was started from
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LOCK_DIRECTORY = PROJECT_ROOT / ".locks"
+DEFAULT_LOCK_TIMEOUT_SECONDS = 900
+LOCK_POLL_INTERVAL_SECONDS = 0.5
+
+# Fixtures that change state shared by every worker, mapped to the resource they use.
+# Tests using them are grouped onto the same worker when running with --dist loadgroup, so only fixtures whose
+# changes conflict with the tests themselves belong here. Fixtures that only need to run one at a time (such as
+# setup_org_and_appointments, which holds the org_parameters_<org id> lock and uses run_once) should not be
+# added, as every test using them would then run on a single worker.
+SHARED_RESOURCE_FIXTURES: dict[str, str] = {
+    # Resets the Lynch invitation rates of every screening centre when the test finishes
+    "reset_lynch_invitation_rate": "lynch_invitation_rates",
+}
+
+
+def get_worker_id() -> str:
+    """
+    Returns the pytest-xdist worker running this process (e.g. gw2), or "master" when not running under xdist.
+    """
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+def worker_partition() -> tuple[int, int]:
+    """
+    Returns the partition for the current pytest-xdist worker, as (partition, partitions).
+    This is (0, 1) when not running under xdist.
+    """
+    worker = get_worker_id()
+    worker_count = os.getenv("PYTEST_XDIST_WORKER_COUNT", "")
+    if worker.startswith("gw") and worker[2:].isdigit() and worker_count.isdigit():
+        return int(worker[2:]), int(worker_count)
+    return 0, 1
+
+
+@dataclass
+class WorkerPartition:
+    """
+    The resources assigned to a pytest-xdist worker.
+
+    Attributes:
+        worker_id (str): The xdist worker, e.g. gw2, or "master" when not running under xdist
+        index (int): The zero based index of the worker
+        count (int): The number of workers
+        properties (dict): The bcss_tests.properties values, with this worker's values applied
+        partition_subjects (bool): Whether subject selection queries only return this worker's share of subjects
+    """
+
+    worker_id: str
+    index: int
+    count: int
+    properties: dict = field(default_factory=dict)
+    partition_subjects: bool = True
+
+    def subject_partition_clause(
+        self,
+        column: str = "ss.screening_subject_id",
+        bind: Callable[[int], str] = str,
+    ) -> str:
+        """
+        Returns a where clause condition restricting the subjects to this worker's share of them,
+        so that two workers never select the same subject. This is empty when not running in parallel.
+
+        Args:
+            column (str): The screening subject ID column to partition on
+            bind (Callable[[int], str]): Turns the number of workers and the worker index into SQL,
+                                         e.g. a function that binds them and returns the placeholder.
+                                         By default they are put in the SQL as they are.
+
+        Returns:
+            str: The condition, e.g. " AND MOD(ss.screening_subject_id, 4) = 2 "
+        """
+        if self.count < 2 or not self.partition_subjects:
+            return ""
+        return f" AND MOD({column}, {bind(self.count)}) = {bind(self.index)} "
+
+
+def partition_properties(properties: dict, index: int, count: int) -> dict:
+    """
+    Applies the per-worker values in bcss_tests.properties to the general properties.
+    A property named parallel.<key> holds a comma separated value for each worker, and worker N uses
+    the Nth value (wrapping round if there are more workers than values) in place of <key>.
+
+    e.g. with parallel.screening_centre_code=BCS001,BCS002, gw0 and gw2 use BCS001, and gw1 and gw3 use BCS002.
+
+    Args:
+        properties (dict): The values loaded from bcss_tests.properties
+        index (int): The zero based index of the worker
+        count (int): The number of workers
+
+    Returns:
+        dict: The properties to use for the worker
+    """
+    worker_properties = dict(properties)
+    if count < 2:
+        return worker_properties
+    for key, value in properties.items():
+        if (
+            not key.startswith(PARALLEL_PROPERTY_PREFIX)
+            or key == PARTITION_SUBJECTS_PROPERTY
+        ):
+            continue
+        values = [item.strip() for item in str(value).split(",") if item.strip()]
+        if values:
+            worker_properties[key[len(PARALLEL_PROPERTY_PREFIX) :]] = values[
+                index % len(values)
+            ]
+    return worker_properties
+
+
+_worker_partition: Optional[WorkerPartition] = None
+_worker_partition_lock = threading.Lock()
+
+
+def get_worker_partition() -> WorkerPartition:
+    """
+    Returns the resources assigned to this worker, loaded from bcss_tests.properties on first use.
+
+    Returns:
+        WorkerPartition: The worker partition
+    """
+    global _worker_partition
+    with _worker_partition_lock:
+        if _worker_partition is None:
+            index, count = worker_partition()
+            try:
+                properties = PropertiesFile().get_general_properties()
+            except OSError:
+                properties = {}
+            partition_subjects = str(
+                properties.get(PARTITION_SUBJECTS_PROPERTY, "true")
+            ).strip()
+            _worker_partition = WorkerPartition(
+                worker_id=get_worker_id(),
+                index=index,
+                count=count,
+                properties=partition_properties(properties, index, count),
+                partition_subjects=partition_subjects.lower() != "false",
+            )
+        return _worker_partition
+
+
+_thread_locks: dict[str, threading.RLock] = {}
+_held_locks: dict[str, int] = {}
+_thread_locks_lock = threading.Lock()
+
+
+def _try_lock(handle) -> bool:
+    try:
+        if os.name == "nt":
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(handle) -> None:
+    if os.name == "nt":
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def resource_lock(
+    name: str, timeout: Optional[float] = None, directory: Path = LOCK_DIRECTORY
+) -> Iterator[None]:
+    """
+    Holds a lock on a resource shared by every worker (such as a letter batch or an organisation's parameters),
+    so that only one process on this machine uses it at a time. The lock is an OS file lock, so it is released
+    even if the process holding it is killed. It is re-entrant within a process.
+
+    Args:
+        name (str): The name of the resource, e.g. "letter_batch_S1"
+        timeout (Optional[float]): How long to wait for the lock, in seconds.
+                                   Defaults to RESOURCE_LOCK_TIMEOUT_SECONDS in local.env, or 900.
+        directory (Path): The directory to keep the lock files in
+
+    Raises:
+        TimeoutError: If the lock could not be acquired within the timeout
+    """
+    if timeout is None:
+        timeout = float(
+            os.getenv("RESOURCE_LOCK_TIMEOUT_SECONDS", "").strip()
+            or DEFAULT_LOCK_TIMEOUT_SECONDS
+        )
+    with _thread_locks_lock:
+        thread_lock = _thread_locks.setdefault(name, threading.RLock())
+
+    # Other threads in this process wait on the thread lock, other processes wait on the file lock
+    if not thread_lock.acquire(timeout=timeout):
+        raise TimeoutError(
+            f"Timed out after {timeout} seconds waiting for the '{name}' lock"
+        )
+    try:
+        if _held_locks.get(name):
+            _held_locks[name] += 1
+            try:
+                yield
+            finally:
+                _held_locks[name] -= 1
+            return
+
+        directory.mkdir(parents=True, exist_ok=True)
+        lock_file = directory / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', name)}.lock"
+        handle = open(lock_file, "a+")
+        start = time.monotonic()
+        logged_wait = False
+        while not _try_lock(handle):
+            if time.monotonic() - start > timeout:
+                handle.close()
+                raise TimeoutError(
+                    f"Timed out after {timeout} seconds waiting for the '{name}' lock"
+                )
+            if not logged_wait:
+                logging.info(
+                    f"[RESOURCE LOCK] {get_worker_id()} is waiting for the '{name}' lock"
+                )
+                logged_wait = True
+            time.sleep(LOCK_POLL_INTERVAL_SECONDS)
+        if logged_wait:
+            logging.info(
+                f"[RESOURCE LOCK] {get_worker_id()} acquired the '{name}' lock after {time.monotonic() - start:.1f} seconds"
+            )
+
+        _held_locks[name] = 1
+        try:
+            yield
+        finally:
+            _held_locks[name] = 0
+            _unlock(handle)
+            handle.close()
+    finally:
+        thread_lock.release()
+
+
+def group_conflicting_tests(
+    tests: Iterable[tuple[str, Iterable[str]]],
+) -> dict[str, str]:
+    """
+    Groups tests that use the same shared resources, so they can be scheduled onto the same worker.
+    Tests that share any resource end up in the same group, even through other tests
+    (e.g. a test using A and B joins the tests using A with the tests using B).
+
+    Args:
+        tests (Iterable[tuple[str, Iterable[str]]]): The ID of each test, and the shared resources it uses
+
+    Returns:
+        dict[str, str]: The group name of each test that uses a shared resource, keyed by test ID
+    """
+    parents: dict[str, str] = {}
+
+    def find(resource: str) -> str:
+        parents.setdefault(resource, resource)
+        while parents[resource] != resource:
+            parents[resource] = parents[parents[resource]]
+            resource = parents[resource]
+        return resource
+
+    test_resources = {test_id: sorted(set(resources)) for test_id, resources in tests}
+    for resources in test_resources.values():
+        for resource in resources[1:]:
+            first, other = find(resources[0]), find(resource)
+            if first != other:
+                parents[max(first, other)] = min(first, other)
+
+    return {
+        test_id: find(resources[0])
+        for test_id, resources in test_resources.items()
+        if resources
+    }
@@ -1,4 +1,3 @@
-from pages.base_page import BasePage
 from pages.screening_subject_search.subject_screening_search_page import (
     SubjectScreeningPage,
     SearchAreaSearchOptions,
@@ -7,6 +6,7 @@ from pages.screening_subject_search.subject_screening_summary_page import (
     SubjectScreeningSummaryPage,
 )
 from playwright.sync_api import Page, expect
+from utils.page_navigation import navigate_to
 import logging
 
 
@@ -29,8 +29,7 @@ def verify_subject_event_status_by_nhs_no(
         status_str = f": {str(latest_event_status)}"
 
     logging.info(f"[UI ASSERTIONS] Asserting subject's event status is{status_str}")
-    BasePage(page).click_main_menu_link()
-    BasePage(page).go_to_screening_subject_search_page()
+    navigate_to(page, "screening_subject_search")
     SubjectScreeningPage(page).click_nhs_number_filter()
     SubjectScreeningPage(page).nhs_number_filter.fill(nhs_no)
     SubjectScreeningPage(page).nhs_number_filter.press("Tab")
@@ -251,7 +250,6 @@ def navigate_to_subject_summary_page(page, nhs_no: str) -> None:
         page (Page): The Playwright page object.
         nhs_no (str): The NHS number of the subject to view.
     """
-    BasePage(page).click_main_menu_link()
-    BasePage(page).go_to_screening_subject_search_page()
+    navigate_to(page, "screening_subject_search")
     search_subject_by_nhs_number(page, nhs_no)
     logging.info(f"[SUBJECT VIEW] Subject {nhs_no} loaded in UI")
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from playwright.sync_api import Browser, BrowserContext
+
+DEFAULT_STORAGE_STATE_DIRECTORY = Path(os.getcwd()) / ".storage_states"
+
+
+class StorageStateCache:
+    """
+    Holds the Playwright storage state (cookies and local storage) of each user logged in to BCSS,
+    keyed by the users.json role, the base URL and the pytest-xdist worker (so workers never share a session).
+    This allows UserTools.user_login to reuse an authenticated session instead of logging in through Cognito again.
+
+    The cache is shared across the test session by get_storage_state_cache, and can be configured in local.env with:
+        STORAGE_STATE_CACHE: Set to true to reuse sessions. Users always log in through Cognito if this is not set
+        STORAGE_STATE_TTL_MINUTES: How long a stored session can be reused for. If not set, sessions are only reused
+                                   within the test session. If set, sessions are also saved to .storage_states/ and
+                                   reused by later test sessions until they are older than the TTL
+    """
+
+    def __init__(
+        self,
+        base_url: str = "",
+        ttl_minutes: Optional[float] = None,
+        enabled: bool = True,
+        directory: Path = DEFAULT_STORAGE_STATE_DIRECTORY,
+    ):
+        self.base_url = base_url
+        self.ttl_minutes = ttl_minutes
+        self.enabled = enabled
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.rejections = 0
+        self._states: dict[str, tuple[dict, float]] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, username: str) -> str:
+        worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+        return f"{self.base_url}|{username}|{worker}"
+
+    def _path(self, key: str) -> Path:
+        return (
+            self.directory
+            / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.json"
+        )
+
+    def _is_expired(self, saved_at: float) -> bool:
+        if self.ttl_minutes is None:
+            return False
+        return time.time() - saved_at > self.ttl_minutes * 60
+
+    def get(self, username: str) -> Optional[dict]:
+        """
+        Returns the stored session of the user, if there is one that has not expired.
+
+        Args:
+            username (str): The users.json role, e.g. "Hub Manager State Registered at BCS01"
+
+        Returns:
+            Optional[dict]: The Playwright storage state, or None if the user needs to log in
+        """
+        if not self.enabled:
+            return None
+        key = self._key(username)
+        with self._lock:
+            state, saved_at = self._states.get(key, (None, 0.0))
+            if state is None and self.ttl_minutes is not None:
+                state, saved_at = self._load(key)
+            if state is None or self._is_expired(saved_at):
+                self._states.pop(key, None)
+                self.misses += 1
+                return None
+            self._states[key] = (state, saved_at)
+            self.hits += 1
+            return state
+
+    def save(self, username: str, state: dict) -> None:
+        """
+        Stores the session of a user that has just logged in.
+
+        Args:
+            username (str): The users.json role
+            state (dict): The Playwright storage state of the logged in context
+        """
+        if not self.enabled:
+            return
+        key = self._key(username)
+        with self._lock:
+            self._states[key] = (state, time.time())
+            if self.ttl_minutes is not None:
+                path = self._path(key)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps(state), encoding="utf-8")
+
+    def invalidate(self, username: str) -> None:
+        """
+        Removes the stored session of a user, e.g. when BCSS has rejected it.
+
+        Args:
+            username (str): The users.json role
+        """
+        key = self._key(username)
+        with self._lock:
+            self._states.pop(key, None)
+            self._path(key).unlink(missing_ok=True)
+            self.rejections += 1
+
+    def _load(self, key: str) -> tuple[Optional[dict], float]:
+        """
+        Loads a session saved by an earlier test session, returning (None, 0) if there is not one.
+        """
+        path = self._path(key)
+        try:
+            return json.loads(path.read_text(encoding="utf-8")), path.stat().st_mtime
+        except (OSError, ValueError):
+            return None, 0.0
+
+    def new_context(self, browser: Browser, username: str, **kwargs) -> BrowserContext:
+        """
+        Creates a new browser context, pre-authenticated with the stored session of the user if there is one.
+        UserTools.user_login should still be called on its page, which will log in through Cognito if the session is rejected.
+
+        Args:
+            browser (Browser): The Playwright browser
+            username (str): The users.json role
+            **kwargs: Any other options for browser.new_context
+
+        Returns:
+            BrowserContext: The new context
+        """
+        kwargs.setdefault("base_url", self.base_url or None)
+        return browser.new_context(storage_state=self.get(username), **kwargs)
+
+    def summary(self) -> str:
+        """
+        Returns a single line summary of the cache counters, suitable for logging.
+        """
+        return (
+            f"sessions={len(self._states)}, reused={self.hits}, logins={self.misses}, "
+            f"rejected={self.rejections}"
+        )
+
+
+_session_cache: Optional[StorageStateCache] = None
+_session_cache_lock = threading.Lock()
+
+
+def get_storage_state_cache() -> StorageStateCache:
+    """
+    Returns the session wide storage state cache, configured from the environment on first use.
+
+    Returns:
+        StorageStateCache: The session cache
+    """
+    global _session_cache
+    with _session_cache_lock:
+        if _session_cache is None:
+            ttl_value = os.getenv("STORAGE_STATE_TTL_MINUTES", "").strip()
+            _session_cache = StorageStateCache(
+                ttl_minutes=float(ttl_value) if ttl_value else None,
+                enabled=os.getenv("STORAGE_STATE_CACHE", "").strip().lower() == "true",
+            )
+        return _session_cache
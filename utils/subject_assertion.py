@@ -1,10 +1,19 @@
 from utils.oracle.subject_selection_query_builder import SubjectSelectionQueryBuilder
 from utils.oracle.oracle import OracleDB
 from classes.subject.subject import Subject
+from classes.subject.subject_assertion_result import SubjectAssertionResult
 from classes.user.user import User
 from classes.user.user_role_type import UserRoleType
 from typing import Optional
 import logging
+import time
+
+# Oracle allows up to 1000 expressions in an IN list
+BULK_ASSERTION_CHUNK_SIZE = 500
+DEFAULT_WAIT_TIMEOUT_SECONDS = 30
+DEFAULT_WAIT_BACKOFF = 2.0
+INITIAL_WAIT_INTERVAL_SECONDS = 0.1
+MAX_WAIT_INTERVAL_SECONDS = 5
 
 
 def subject_assertion(
@@ -47,9 +56,113 @@ def subject_assertion(
         logging.info("[DB ASSERTIONS COMPLETE] Subject matches the expected criteria")
         return
 
-    # Check each criterion independently
-    failed_criteria = []
     criteria_keys = [key for key in criteria if key != nhs_number_string]
+    failed_criteria = _diagnose_failed_criteria(
+        builder, criteria, user, subject, nhs_number_string, criteria_keys
+    )
+    if failed_criteria is None:
+        logging.debug(
+            "[SUBJECT ASSERTIONS] Could not diagnose the criteria in one query, checking each criterion independently"
+        )
+        failed_criteria = _check_each_criterion(
+            builder, criteria, user, subject, nhs_number_string, criteria_keys
+        )
+
+    if failed_criteria:
+        log_message = (
+            "[DB ASSERTIONS FAILED] Subject Assertion Failed\nFailed criteria:\n"
+            + "\n".join(
+                [
+                    f"Criteria key: {key}, Criteria Value: {value}"
+                    for key, value in failed_criteria
+                ]
+            )
+        )
+        raise AssertionError(log_message)
+    else:
+        raise AssertionError(
+            "[DB ASSERTIONS FAILED] Subject Assertion Failed: Criteria combination is invalid or conflicting."
+        )
+
+
+def _diagnose_failed_criteria(
+    builder: SubjectSelectionQueryBuilder,
+    criteria: dict,
+    user: User,
+    subject: Subject,
+    nhs_number_string: str,
+    criteria_keys: list,
+) -> Optional[list]:
+    """
+    Works out which criteria the subject does not match using a single query,
+    with one column per criterion showing whether the subject matches it.
+
+    Args:
+        builder (SubjectSelectionQueryBuilder): The query builder
+        criteria (dict): The criteria being asserted, including the NHS number
+        user (User): The user the criteria are checked for
+        subject (Subject): The subject being checked
+        nhs_number_string (str): The NHS number criteria key
+        criteria_keys (list): The criteria keys being asserted, excluding the NHS number
+
+    Returns:
+        Optional[list]: The (key, value) of each failed criterion, or None if the query could not tell
+        (e.g. the joins needed by one criterion exclude the subject)
+    """
+    try:
+        query, bind_vars, column_criteria = builder.build_criteria_diagnosis_query(
+            criteria=criteria,
+            user=user,
+            subject=subject,
+            base_criteria_keys=[nhs_number_string],
+            shared_criteria_keys=[
+                key for key in criteria_keys if key.lower().startswith("which")
+            ],
+            enable_logging=False,
+        )
+    except ValueError:
+        # Every criterion is commented out, so there is nothing to diagnose
+        return []
+
+    row = OracleDB().fetch_one(query, bind_vars)
+    if row is None or any(row[column] is None for column in column_criteria):
+        return None
+
+    failed_criteria = []
+    for column, key in column_criteria.items():
+        if row[column] != 1:
+            logging.warning(
+                f"[ASSERTION MISMATCH] Key: '{key}' | Expected: '{criteria[key]}'"
+            )
+            failed_criteria.append((key, criteria[key]))
+    return failed_criteria
+
+
+def _check_each_criterion(
+    builder: SubjectSelectionQueryBuilder,
+    criteria: dict,
+    user: User,
+    subject: Subject,
+    nhs_number_string: str,
+    criteria_keys: list,
+) -> list:
+    """
+    Works out which criteria the subject does not match by running a separate query for each criterion.
+
+    Args:
+        builder (SubjectSelectionQueryBuilder): The query builder
+        criteria (dict): The criteria being asserted, including the NHS number
+        user (User): The user the criteria are checked for
+        subject (Subject): The subject being checked
+        nhs_number_string (str): The NHS number criteria key
+        criteria_keys (list): The criteria keys being asserted, excluding the NHS number
+
+    Returns:
+        list: The (key, value) of each failed criterion
+    """
+    subject_nhs_number_string = "subject_nhs_number"
+    nhs_number = criteria[nhs_number_string]
+    failed_criteria = []
     for key in criteria_keys:
         # Always include keys that start with 'which' (case-insensitive) in the query
         single_criteria = {nhs_number_string: nhs_number, key: criteria[key]}
@@ -72,19 +185,194 @@ def subject_assertion(
                 f"[ASSERTION MISMATCH] Key: '{key}' | Expected: '{criteria[key]}'"
             )
             failed_criteria.append((key, criteria[key]))
+    return failed_criteria
 
-    if failed_criteria:
-        log_message = (
-            "[DB ASSERTIONS FAILED] Subject Assertion Failed\nFailed criteria:\n"
-            + "\n".join(
-                [
-                    f"Criteria key: {key}, Criteria Value: {value}"
-                    for key, value in failed_criteria
-                ]
+
+def wait_until_subject_matches(
+    nhs_number: str,
+    criteria: dict,
+    timeout: float = DEFAULT_WAIT_TIMEOUT_SECONDS,
+    backoff: float = DEFAULT_WAIT_BACKOFF,
+    user_role: Optional[UserRoleType] = None,
+) -> float:
+    """
+    Waits until a subject matches the provided criteria, e.g. after an action in the UI that updates the subject in the database.
+    A cheap existence query is polled with an exponential backoff, so this returns as soon as the subject matches,
+    instead of waiting for a fixed time.
+
+    If the subject still does not match when the timeout is reached, subject_assertion is run to report the failed criteria.
+
+    Args:
+        nhs_number (str): The NHS number of the subject to wait for.
+        criteria (dict): A dictionary of criteria the subject should match, as used by subject_assertion.
+        timeout (float): The maximum number of seconds to wait.
+        backoff (float): The factor the polling interval grows by after each check, starting from 0.1 seconds (up to 5 seconds).
+        user_role (Optional[UserRoleType]): The user to check the criteria for.
+
+    Returns:
+        float: The number of seconds it took for the subject to match.
+
+    Raises:
+        AssertionError: If the subject does not match the criteria within the timeout.
+    """
+    user = User.from_user_role_type(user_role) if user_role else User()
+    subject = Subject().populate_subject_object_from_nhs_no(nhs_number)
+    criteria = {**criteria, "nhs number": nhs_number}
+    start = time.monotonic()
+    interval = INITIAL_WAIT_INTERVAL_SECONDS
+    checks = 0
+
+    while True:
+        query, bind_vars = SubjectSelectionQueryBuilder().build_subject_selection_query(
+            criteria=criteria,
+            user=user,
+            subject=subject,
+            subjects_to_retrieve=1,
+            enable_logging=checks == 0,
+        )
+        checks += 1
+        if (
+            OracleDB().fetch_one(
+                f"SELECT 1 AS subject_matches FROM dual WHERE EXISTS ({query})",
+                bind_vars,
+            )
+            is not None
+        ):
+            elapsed = time.monotonic() - start
+            logging.info(
+                f"[DB ASSERTIONS COMPLETE] Subject matched the expected criteria after {elapsed:.1f}s ({checks} checks)"
             )
+            return elapsed
+
+        remaining = timeout - (time.monotonic() - start)
+        if remaining <= 0:
+            break
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff, MAX_WAIT_INTERVAL_SECONDS)
+
+    logging.warning(
+        f"[DB ASSERTIONS] Subject did not match the expected criteria within {timeout}s ({checks} checks)"
+    )
+    subject_assertion(nhs_number, criteria, user_role)
+    return time.monotonic() - start
+
+
+def subject_assertion_bulk(
+    nhs_numbers: list[str],
+    criteria: dict,
+    user_role: Optional[UserRoleType] = None,
+) -> dict[str, SubjectAssertionResult]:
+    """
+    Checks many subjects against the same criteria, using one query per chunk of NHS numbers
+    (rather than calling subject_assertion for each subject).
+    Each query returns one row per subject, with a column per criterion showing whether the subject matches it.
+
+    Subjects excluded by the joins one of the criteria needs (e.g. a subject with no episodes) are
+    then checked one criterion at a time, but still for all of those subjects in one query per criterion.
+    NHS numbers with no subject fail on the 'nhs number' criterion.
+
+    'unchanged' criteria are not supported, as these depend on a single subject.
+
+    Args:
+        nhs_numbers (list[str]): The NHS numbers of the subjects to check
+        criteria (dict): A dictionary of criteria to match against the subjects' attributes
+        user_role (Optional[UserRoleType]): The role of the user the criteria are checked for
+
+    Returns:
+        dict[str, SubjectAssertionResult]: The result for each subject, keyed by NHS number
+    """
+    logging.info(
+        f"[DB ASSERTIONS] Checking {len(nhs_numbers)} subjects against the criteria"
+    )
+    user = User.from_user_role_type(user_role) if user_role else User()
+    criteria = {key: value for key, value in criteria.items() if key != "nhs number"}
+    shared_criteria_keys = [key for key in criteria if key.lower().startswith("which")]
+    results = {
+        str(nhs_number): SubjectAssertionResult(str(nhs_number))
+        for nhs_number in nhs_numbers
+    }
+
+    unmatched = _check_subjects_against_criteria(
+        list(results), criteria, user, shared_criteria_keys, results
+    )
+    if unmatched:
+        subject_ids = OracleDB().get_subject_ids_from_nhs_numbers(unmatched)
+        for nhs_number in unmatched:
+            if nhs_number not in subject_ids:
+                results[nhs_number].failed_criteria.append(("nhs number", nhs_number))
+        unmatched = [
+            nhs_number for nhs_number in unmatched if nhs_number in subject_ids
+        ]
+    if unmatched:
+        logging.debug(
+            f"[SUBJECT ASSERTIONS] {len(unmatched)} subjects were excluded by the joins, checking each criterion independently"
         )
-        raise AssertionError(log_message)
-    else:
-        raise AssertionError(
-            "[DB ASSERTIONS FAILED] Subject Assertion Failed: Criteria combination is invalid or conflicting."
+        for key in criteria:
+            single_criteria = {key: criteria[key]}
+            for k in shared_criteria_keys:
+                single_criteria[k] = criteria[k]
+            excluded = _check_subjects_against_criteria(
+                unmatched, single_criteria, user, shared_criteria_keys, {}
+            )
+            for nhs_number in excluded:
+                results[nhs_number].failed_criteria.append((key, criteria[key]))
+
+    for result in results.values():
+        result.passed = not result.failed_criteria
+        for key, value in result.failed_criteria:
+            logging.warning(
+                f"[ASSERTION MISMATCH] NHS Number: {result.nhs_number} | Key: '{key}' | Expected: '{value}'"
+            )
+    logging.info(
+        f"[DB ASSERTIONS COMPLETE] {sum(result.passed for result in results.values())} of {len(results)} subjects match the expected criteria"
+    )
+    return results
+
+
+def _check_subjects_against_criteria(
+    nhs_numbers: list[str],
+    criteria: dict,
+    user: User,
+    shared_criteria_keys: list,
+    results: dict[str, SubjectAssertionResult],
+) -> list[str]:
+    """
+    Runs the multi-subject diagnosis query for the criteria, in chunks of NHS numbers,
+    and adds any failed criteria to the subjects' results.
+
+    Args:
+        nhs_numbers (list[str]): The NHS numbers of the subjects to check
+        criteria (dict): The criteria to check, excluding the NHS number
+        user (User): The user the criteria are checked for
+        shared_criteria_keys (list): The 'which' criteria keys, included in every criterion's check
+        results (dict[str, SubjectAssertionResult]): The results to add any failed criteria to
+
+    Returns:
+        list[str]: The NHS numbers that the query did not return a row for
+    """
+    unmatched = []
+    for start in range(0, len(nhs_numbers), BULK_ASSERTION_CHUNK_SIZE):
+        chunk = nhs_numbers[start : start + BULK_ASSERTION_CHUNK_SIZE]
+        builder = SubjectSelectionQueryBuilder()
+        query, bind_vars, column_criteria = builder.build_criteria_diagnosis_query(
+            criteria=criteria,
+            user=user,
+            subject=None,
+            base_criteria_keys=[],
+            shared_criteria_keys=shared_criteria_keys,
+            enable_logging=False,
+            nhs_numbers=chunk,
         )
+        rows = {
+            str(row["subject_nhs_number"]): row
+            for row in OracleDB().iter_rows(query, bind_vars)
+        }
+        for nhs_number in chunk:
+            row = rows.get(nhs_number)
+            if row is None:
+                unmatched.append(nhs_number)
+                continue
+            for column, key in column_criteria.items():
+                if row[column] != 1:
+                    results[nhs_number].failed_criteria.append((key, criteria[key]))
+    return unmatched
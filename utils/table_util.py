@@ -1,6 +1,237 @@
-from playwright.sync_api import Page, Locator
+from playwright.sync_api import Page, Locator, Frame
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+from weakref import WeakKeyDictionary
 import logging
 import secrets
+import pandas as pd
+
+# The number of DataTables pages iter_table_rows will read before stopping
+MAX_TABLE_PAGES = 500
+# How long to wait for DataTables to redraw the table after moving to the next page
+PAGE_REDRAW_TIMEOUT_MS = 10000
+
+# Reads the headers of a table in the same way as get_table_headers and get_column_index, into headerData.
+# A MutationObserver stamps the table with a new header version whenever its header changes,
+# so that TableUtils can tell when the headers it has cached are out of date.
+READ_HEADERS_SCRIPT = """
+    const texts = cells => Array.from(cells, cell => cell.innerText.trim());
+    const bodyHeaderRow = Array.from(table.querySelectorAll("tbody tr")).find(
+        row => row.querySelector("th")
+    );
+
+    let headers = Array.from(
+        table.querySelectorAll(":scope > thead tr:first-child th span.dt-column-title"),
+        span => span.textContent.trim()
+    );
+    const firstHeadRow = table.querySelector(":scope > thead tr");
+    if (!headers.length && firstHeadRow) {
+        headers = texts(firstHeadRow.querySelectorAll("th"));
+    }
+    if (!headers.length && bodyHeaderRow) {
+        headers = texts(bodyHeaderRow.querySelectorAll("th"));
+    }
+
+    let columnHeaderRow = table.querySelector("thead tr");
+    if (!columnHeaderRow || !columnHeaderRow.querySelector("th")) {
+        columnHeaderRow = bodyHeaderRow;
+    }
+
+    if (!table.headerObserver) {
+        const stamp = () => {
+            table.dataset.headerVersion = Math.random().toString(36).slice(2);
+        };
+        stamp();
+        table.headerObserver = new MutationObserver(stamp);
+        table.headerObserver.observe(table.tHead || table, {
+            childList: true, subtree: true, characterData: true
+        });
+    }
+
+    const headerData = {
+        headers: headers,
+        column_headers: columnHeaderRow ? texts(columnHeaderRow.querySelectorAll("th")) : [],
+        second_row_headers: texts(table.querySelectorAll("thead tr:nth-child(2) th")),
+        header_version: table.dataset.headerVersion,
+    };
+"""
+
+TABLE_HEADERS_SCRIPT = f"""
+table => {{
+{READ_HEADERS_SCRIPT}
+    return headerData;
+}}
+"""
+
+# Reads the headers and every body row of a table in a single round trip to the browser.
+TABLE_SNAPSHOT_SCRIPT = f"""
+table => {{
+{READ_HEADERS_SCRIPT}
+    return {{
+        ...headerData,
+        rows: Array.from(
+            table.querySelectorAll(":scope > tbody tr"),
+            row => Array.from(row.cells, cell => cell.innerText)
+        ),
+        empty: table.querySelector("td.dt-empty, td.dataTables_empty") !== null,
+    }};
+}}
+"""
+
+# Reads the given (1-based) cells of a (1-based) body row, along with the current header version.
+# cells is null if there is no such row, and a cell is null if the row has no such cell.
+TABLE_ROW_CELLS_SCRIPT = """
+(table, [rowIndex, columnIndexes]) => {
+    const row = table.querySelectorAll(":scope > tbody tr")[rowIndex - 1];
+    return {
+        header_version: table.dataset.headerVersion || null,
+        cells: row ? columnIndexes.map(
+            index => row.cells[index - 1] ? row.cells[index - 1].innerText : null
+        ) : null,
+    };
+}
+"""
+
+# Clicks the DataTables "next" button of the table, and waits for the table to be redrawn.
+# Returns false if the table is not paginated or is already on its last page.
+TABLE_NEXT_PAGE_SCRIPT = """
+(table, timeout) => new Promise(resolve => {
+    const container = table.closest(".dt-container, .dataTables_wrapper");
+    const next = container && container.querySelector(
+        ".dt-paging-button.next, .paginate_button.next"
+    );
+    if (!next || next.classList.contains("disabled")
+        || next.getAttribute("aria-disabled") === "true") {
+        resolve(false);
+        return;
+    }
+    const observer = new MutationObserver(() => {
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(true);
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(true);
+    }, timeout);
+    observer.observe(table.tBodies[0] || table, {
+        childList: true, subtree: true, characterData: true
+    });
+    next.click();
+})
+"""
+
+
+@dataclass
+class TableHeaders:
+    """
+    The headers of a table, as cached by TableUtils.
+
+    Attributes:
+        headers (list[str]): The column headers, as returned by get_table_headers
+        column_headers (list[str]): The column headers used to find a column index, as in get_column_index
+        version (str): The header version stamped on the table when the headers were read
+    """
+
+    headers: list[str] = field(default_factory=list)
+    column_headers: list[str] = field(default_factory=list)
+    version: str = ""
+
+    def __post_init__(self) -> None:
+        self._column_indexes: dict[str, int] = {}
+        for index, header in enumerate(self.column_headers):
+            self._column_indexes.setdefault(header.strip().lower(), index + 1)
+
+    @classmethod
+    def from_script(cls, data: dict, **kwargs):
+        """
+        Creates the headers from the result of a script that reads them.
+
+        Args:
+            data (dict): The result of TABLE_HEADERS_SCRIPT or TABLE_SNAPSHOT_SCRIPT
+            **kwargs: Any other fields of the class
+        """
+        column_headers = data["column_headers"]
+        second_row_headers = data["second_row_headers"]
+        # Use the second row only if it contains meaningful text (not filters, dropdowns, or placeholder values)
+        if second_row_headers and all(
+            h and not any(c in h.lower() for c in ("input", "all", "select"))
+            for h in second_row_headers
+        ):
+            column_headers = second_row_headers
+        return cls(
+            headers=data["headers"],
+            column_headers=column_headers,
+            version=data.get("header_version") or "",
+            **kwargs,
+        )
+
+    def column_index(self, column_name: str) -> int:
+        """
+        Returns the 1-based index of a column, or -1 if it is not found.
+
+        Args:
+            column_name (str): Name of the column (e.g., 'NHS Number')
+        """
+        return self._column_indexes.get(column_name.strip().lower(), -1)
+
+
+@dataclass
+class TableSnapshot(TableHeaders):
+    """
+    The contents of a table, as read in a single call by TableUtils.get_table_snapshot.
+
+    Attributes:
+        rows (list[list[str]]): The text of each cell in each body row
+        empty (bool): Whether the table is showing DataTables' "No data available" row
+    """
+
+    rows: list[list[str]] = field(default_factory=list)
+    empty: bool = False
+
+    def row_data(self, row_number: int) -> dict[str, str]:
+        """
+        Returns a row as a dict of header / cell value pairs.
+
+        Args:
+            row_number (int): The zero based row number
+        """
+        cells = self.rows[row_number]
+        return {
+            header: cells[index] if index < len(cells) else ""
+            for index, header in enumerate(self.headers)
+        }
+
+    def row_dicts(self) -> list[dict[str, str]]:
+        """
+        Returns every data row as a dict of header / cell value pairs.
+        """
+        if self.empty:
+            return []
+        return [self.row_data(row_number) for row_number in range(len(self.rows))]
+
+
+# The cached headers of the tables on each page, keyed by table locator. Each page has a single framenavigated
+# listener, which clears its headers when it navigates, however many TableUtils are created for it.
+_page_header_caches: "WeakKeyDictionary[Page, dict[str, TableHeaders]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_page_header_cache(page: Page) -> dict[str, TableHeaders]:
+    """
+    Returns the cached headers of the tables on a page, listening for the page navigating the first time it is seen.
+    """
+    cache = _page_header_caches.get(page)
+    if cache is None:
+        cache = _page_header_caches[page] = {}
+
+        def clear_on_navigation(frame: Frame) -> None:
+            if frame.parent_frame is None:
+                cache.clear()
+
+        page.on("framenavigated", clear_on_navigation)
+    return cache
 
 
 class TableUtils:
@@ -27,10 +258,53 @@ class TableUtils:
 
         self.tbody_tr_string = "tbody tr"
 
+        # The headers are cached until the page navigates, or the header of the table changes
+        self._header_caches: dict[str, TableHeaders] = (
+            _get_page_header_cache(page) if hasattr(page, "on") else {}
+        )
+
+    @property
+    def _header_cache(self) -> Optional[TableHeaders]:
+        return self._header_caches.get(self.table_id)
+
+    def _cache_headers(self, headers: TableHeaders) -> None:
+        # Tables that have not been rendered yet have no headers, so are not cached
+        if headers.headers or headers.column_headers:
+            self._header_caches[self.table_id] = headers
+
+    def invalidate_header_cache(self) -> None:
+        """
+        Clears the cached headers, so they are read from the table again when next needed.
+        This happens automatically when the page navigates, or when the header of the table changes.
+        """
+        self._header_caches.pop(self.table_id, None)
+
+    def get_headers(self, refresh: bool = False) -> TableHeaders:
+        """
+        Returns the headers of the table, reading them in a single call to the browser if they are not cached.
+
+        Args:
+            refresh (bool): If True, the headers are read from the table even if they are cached.
+
+        Returns:
+            TableHeaders: The headers of the table.
+        """
+        if refresh or self._header_cache is None:
+            headers = TableHeaders.from_script(
+                self.table.first.evaluate(TABLE_HEADERS_SCRIPT)
+            )
+            logging.debug(
+                f"Headers Found for {self.table_id}: {headers.column_headers}"
+            )
+            self._cache_headers(headers)
+            return headers
+        return self._header_cache
+
     def get_column_index(self, column_name: str) -> int:
         """
         Finds the column index dynamically based on column name.
         Works even if <thead> is missing and header is inside <tbody>.
+        The headers are read from the table in a single call, so the index is never out of date.
 
         Args:
             column_name (str): Name of the column (e.g., 'NHS Number')
@@ -38,39 +312,19 @@ class TableUtils:
         Return:
             An int (1-based column index or -1 if not found)
         """
-        # Try to find headers in <thead> first
-        header_row = self.table.locator("thead tr").first
-        if not header_row.locator("th").count():
-            # Fallback: look for header in <tbody> if <thead> is missing or empty
-            header_row = (
-                self.table.locator(self.tbody_tr_string)
-                .filter(has=self.page.locator("th"))
-                .first
-            )
+        return self.get_headers(refresh=True).column_index(column_name)
 
-        headers = header_row.locator("th")
-
-        # Extract first-row headers (general headers)
-        header_texts = headers.evaluate_all("ths => ths.map(th => th.innerText.trim())")
-        logging.debug(f"First Row Headers Found: {header_texts}")
-
-        # Attempt to extract a second row of headers (commonly used for filters or alternate titles)
-        second_row_headers = self.table.locator(
-            "thead tr:nth-child(2) th"
-        ).evaluate_all("ths => ths.map(th => th.innerText.trim())")
-
-        # Use the second row only if it contains meaningful text (not filters, dropdowns, or placeholder values)
-        if second_row_headers and all(
-            h and not any(c in h.lower() for c in ("input", "all", "select"))
-            for h in second_row_headers
-        ):
-            header_texts = second_row_headers
-        logging.debug(f"Second Row Headers Found: {second_row_headers}")
-
-        for index, header in enumerate(header_texts):
-            if column_name.strip().lower() == header.strip().lower():
-                return index + 1  # Convert to 1-based index
-        return -1  # Column not found
+    def _get_cached_column_index(self, column_name: str) -> int:
+        """
+        Finds the column index from the cached headers. Callers must check the header version the
+        table had when they used the index against the cached one (as get_cell_values does).
+        """
+        was_cached = self._header_cache is not None
+        column_index = self.get_headers().column_index(column_name)
+        if column_index == -1 and was_cached:
+            # The columns may have changed since the headers were cached
+            column_index = self.get_headers(refresh=True).column_index(column_name)
+        return column_index
 
     def click_first_link_in_column(self, column_name: str):
         """
@@ -133,57 +387,19 @@ class TableUtils:
     def get_table_headers(self) -> dict:
         """
         Retrieves headers from a table, supporting both standard and legacy structures.
+        Strategy 1: <thead> with <tr><th><span class="dt-column-title">Header</span></th>
+        Strategy 2: Fallback to standard <thead> > tr > th inner text
+        Strategy 3: Last resort — the header row in <tbody> (some old tables use <tbody> only)
+
         Returns:
             dict: A mapping of column index (1-based) to header text.
         """
-        # Strategy 1: Try <thead> with <tr><th><span class="dt-column-title">Header</span></th>
-        header_spans = self.page.locator(
-            f"{self.table_id} > thead tr:first-child th span.dt-column-title"
-        )
-        if header_spans.count():
-            try:
-                header_texts = header_spans.evaluate_all(
-                    "els => els.map(el => el.textContent.trim())"
-                )
-                print("[DEBUG] Parsed header texts:", repr(header_texts))
-                return {idx + 1: text for idx, text in enumerate(header_texts)}
-            except Exception as e:
-                logging.warning(
-                    f"[get_table_headers] span.dt-column-title fallback failed: {e}"
-                )
-
-        # Strategy 2: Fallback to standard <thead> > tr > th inner text
-        header_cells = self.page.locator(f"{self.table_id} > thead tr").first.locator(
-            "th"
-        )
-        if header_cells.count():
-            try:
-                header_texts = header_cells.evaluate_all(
-                    "els => els.map(th => th.innerText.trim())"
-                )
-                return {idx + 1: text for idx, text in enumerate(header_texts)}
-            except Exception as e:
-                logging.warning(f"[get_table_headers] basic <th> fallback failed: {e}")
-
-        # Strategy 3: Last resort — try to find header from tbody row (some old tables use <tbody> only)
-        fallback_row = (
-            self.table.locator(self.tbody_tr_string)
-            .filter(has=self.page.locator("th"))
-            .first
-        )
-        if fallback_row.locator("th").count():
-            try:
-                header_texts = fallback_row.locator("th").evaluate_all(
-                    "els => els.map(th => th.innerText.trim())"
-                )
-                return {idx + 1: text for idx, text in enumerate(header_texts)}
-            except Exception as e:
-                logging.warning(f"[get_table_headers] tbody fallback failed: {e}")
-
-        logging.warning(
-            f"[get_table_headers] No headers found for table: {self.table_id}"
-        )
-        return {}
+        headers = self.get_headers(refresh=True).headers
+        if not headers:
+            logging.warning(
+                f"[get_table_headers] No headers found for table: {self.table_id}"
+            )
+        return {idx + 1: text for idx, text in enumerate(headers)}
 
     def get_row_count(self) -> int:
         """
@@ -236,18 +452,7 @@ class TableUtils:
         Returns:
             A dict object with keys representing the headers, and values representing the row contents.
         """
-        headers = self.get_table_headers()
-        row_data = self._format_inner_text(
-            self.page.locator(f"{self.table_id} > tbody tr")
-            .nth(row_number)
-            .inner_text()
-        )
-        results = {}
-
-        for key in headers:
-            results[headers[key]] = row_data[key]
-
-        return results
+        return self.get_table_snapshot().row_data(row_number)
 
     def get_full_table_with_headers(self) -> dict:
         """
@@ -257,10 +462,75 @@ class TableUtils:
         Returns:
             A dict object with keys representing the rows, with values being a dict representing a header key / column value pair.
         """
-        full_results = {}
-        for row in range(self.get_row_count()):
-            full_results[row + 1] = self.get_row_data_with_headers(row)
-        return full_results
+        snapshot = self.get_table_snapshot()
+        return {row + 1: snapshot.row_data(row) for row in range(len(snapshot.rows))}
+
+    def get_table_snapshot(self) -> TableSnapshot:
+        """
+        Reads the headers and every visible row of the table in a single call to the browser,
+        rather than one call per header strategy and per row.
+
+        Returns:
+            TableSnapshot: The headers and cell values of the table.
+        """
+        data = self.table.first.evaluate(TABLE_SNAPSHOT_SCRIPT)
+        # The headers are read anyway, so refresh the cached headers too
+        self._cache_headers(TableHeaders.from_script(data))
+        return TableSnapshot.from_script(data, rows=data["rows"], empty=data["empty"])
+
+    def get_table_data(self, all_pages: bool = False) -> list[dict[str, str]]:
+        """
+        Returns the table as a list of rows, each a dict of header / cell value pairs.
+
+        Args:
+            all_pages (bool): If True, every page of a DataTables table is read (leaving the table on its last page).
+                              If False, only the visible rows are read.
+
+        Returns:
+            list[dict[str, str]]: The rows of the table.
+        """
+        return list(self.iter_table_rows(all_pages))
+
+    def get_table_dataframe(self, all_pages: bool = False) -> pd.DataFrame:
+        """
+        Returns the table as a pandas DataFrame, with a column for each header.
+
+        Args:
+            all_pages (bool): If True, every page of a DataTables table is read (leaving the table on its last page).
+
+        Returns:
+            pd.DataFrame: The rows of the table.
+        """
+        return pd.DataFrame(self.get_table_data(all_pages))
+
+    def iter_table_rows(self, all_pages: bool = True) -> Iterator[dict[str, str]]:
+        """
+        Yields the rows of the table one page at a time, reading each page in a single call to the browser.
+        With all_pages, the DataTables "next" button is clicked after each page until the last page is reached,
+        so rows can be processed (or the loop stopped) without reading the whole table first.
+
+        Args:
+            all_pages (bool): If True, every page of a DataTables table is read. If False, only the visible rows are read.
+
+        Yields:
+            dict[str, str]: Each row as a dict of header / cell value pairs.
+        """
+        for _ in range(MAX_TABLE_PAGES):
+            yield from self.get_table_snapshot().row_dicts()
+            if not all_pages or not self._go_to_next_page():
+                return
+        logging.warning(
+            f"[iter_table_rows] Stopped reading {self.table_id} after {MAX_TABLE_PAGES} pages"
+        )
+
+    def _go_to_next_page(self) -> bool:
+        """
+        Moves a DataTables table on to its next page, and waits for it to be redrawn.
+
+        Returns:
+            bool: True if the table moved to the next page, False if it has no more pages.
+        """
+        return self.table.first.evaluate(TABLE_NEXT_PAGE_SCRIPT, PAGE_REDRAW_TIMEOUT_MS)
 
     def get_cell_value(self, column_name: str, row_index: int) -> str:
         """
@@ -268,26 +538,58 @@ class TableUtils:
 
         Args:
             column_name (str): The name of the column containing the cell.
-            row_index (int): The index of the row containing the cell.
+            row_index (int): The 1-based index of the row containing the cell.
 
         Returns:
             str: The text value of the cell.
+
+        Raises:
+            ValueError: If the column or the cell is not found.
         """
-        column_index = self.get_column_index(column_name)
-        if column_index == -1:
-            raise ValueError(f"Column '{column_name}' not found in table")
+        return self.get_cell_values(row_index, [column_name])[column_name]
 
-        # Locate all <td> elements in the specified row and column
-        cell_locator = f"{self.table_id} tbody tr:nth-child({row_index}) td:nth-child({column_index})"
+    def get_cell_values(
+        self, row_index: int, column_names: list[str]
+    ) -> dict[str, str]:
+        """
+        Retrieves the text values of several cells in a row, in a single call to the browser.
 
-        cell = self.page.locator(cell_locator).first
+        Args:
+            row_index (int): The 1-based index of the row containing the cells.
+            column_names (list[str]): The names of the columns containing the cells.
 
-        if cell:
-            return cell.inner_text()
-        else:
-            raise ValueError(
-                f"No cell found at column '{column_name}' and row index {row_index}"
+        Returns:
+            dict[str, str]: The text value of each cell, keyed by column name.
+
+        Raises:
+            ValueError: If a column or a cell is not found.
+        """
+        for _ in range(2):
+            column_indexes = []
+            for column_name in column_names:
+                column_index = self._get_cached_column_index(column_name)
+                if column_index == -1:
+                    raise ValueError(f"Column '{column_name}' not found in table")
+                column_indexes.append(column_index)
+
+            result = self.table.first.evaluate(
+                TABLE_ROW_CELLS_SCRIPT, [row_index, column_indexes]
             )
+            if (
+                self._header_cache is None
+                or result["header_version"] == self._header_cache.version
+            ):
+                break
+            # The header has changed since it was cached, so the columns may have moved
+            self.invalidate_header_cache()
+
+        cells = result["cells"] or [None] * len(column_names)
+        for column_name, cell in zip(column_names, cells):
+            if cell is None:
+                raise ValueError(
+                    f"No cell found at column '{column_name}' and row index {row_index}"
+                )
+        return dict(zip(column_names, cells))
 
     def assert_surname_in_table(self, surname_pattern: str) -> None:
         """
@@ -355,9 +657,9 @@ class TableUtils:
         Returns:
             Locator of the matching row or None if not found.
         """
-        row_count = self.get_row_count()
-        for i in range(row_count):
-            row_data = self.get_row_data_with_headers(i)
+        snapshot = self.get_table_snapshot()
+        for i in range(len(snapshot.rows)):
+            row_data = snapshot.row_data(i)
             if all(
                 row_data.get(key, "").strip() == value
                 for key, value in criteria.items()
@@ -403,21 +705,21 @@ class TableUtils:
             column_name (str): The name of the column to search in.
             row_value (str): The value to match in the specified column.
         Returns:
-            int: The 1-based index of the matching row, or -1 if not found.
+            int: The 1-based index of the matching row.
+        Raises:
+            ValueError: If the column is not found, or no row has the value.
         """
-        column_index = self.get_column_index(column_name)
+        snapshot = self.get_table_snapshot()
+        column_index = snapshot.column_index(column_name)
         if column_index == -1:
             raise ValueError(f"Column '{column_name}' not found in table")
 
-        row_count = self.get_row_count()
-        for row_index in range(row_count):
-            cell_locator = self.page.locator(
-                f"{self.table_id} > tbody tr:nth-child({row_index+1}) td:nth-child({column_index})"
-            )
-            if cell_locator.count() > 0:
-                cell_text = cell_locator.first.inner_text().strip()
-                if cell_text == row_value:
-                    return row_index + 1  # 1-based index
+        for row_index, cells in enumerate(snapshot.rows):
+            if (
+                column_index <= len(cells)
+                and cells[column_index - 1].strip() == row_value
+            ):
+                return row_index + 1  # 1-based index
         raise ValueError(
             f"No row found with the value '{row_value}' in the column '{column_name}'."
         )
@@ -4,18 +4,24 @@ import logging
 import os
 from pathlib import Path
 from dotenv import load_dotenv
-from playwright.sync_api import Page
+from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
 from pages.login.cognito_login_page import CognitoLoginPage
+from pages.login.login_failure_screen_page import LoginFailureScreenPage
+from pages.login.select_job_role_page import SelectJobRolePage
+from pages.organisations.organisations_page import OrganisationSwitchPage
 from classes.user.user import User
 from classes.organisation.organisation import Organisation
 from classes.user.user_role_type import UserRoleType
 from typing import Optional
 
 from pages.logout.log_out_page import LogoutPage
+from utils.storage_state_cache import get_storage_state_cache
 
 logger = logging.getLogger(__name__)
 USERS_FILE = Path(os.getcwd()) / "users.json"
+# How long to wait for BCSS to show the main menu (or the login, job role or organisation page) when checking a session
+STORAGE_STATE_CHECK_TIMEOUT_MS = 30000
 
 
 class UserTools:
@@ -42,16 +48,90 @@ class UserTools:
             ValueError: If the 'BCSS_PASS' environment variable is not set
         """
         logging.info(f"Logging in as {username}")
-        # Go to base url
-        page.goto("/")
         # Retrieve username from users.json
         user_details = UserTools.retrieve_user(username)
+        storage_states = get_storage_state_cache()
+        storage_state = storage_states.get(username)
+        if storage_state is not None:
+            # Reuse the session stored when this user last logged in
+            page.context.clear_cookies()
+            page.context.add_cookies(storage_state["cookies"])
+        # Go to base url
+        page.goto("/")
+        if storage_state is not None:
+            if UserTools._is_main_menu_displayed(page):
+                logging.info(f"Reused the stored session for {username}")
+                return UserTools._get_user_role_type(
+                    username, user_details, return_role_type
+                )
+            logging.info(f"The stored session for {username} was rejected")
+            storage_states.invalidate(username)
+            page.context.clear_cookies()
+            page.goto("/")
         # Login to bcss using retrieved username and a password stored in the .env file
         password = os.getenv("BCSS_PASS")
         if password is None:
             raise ValueError("Environment variable 'BCSS_PASS' is not set")
         CognitoLoginPage(page).login_as_user(user_details["username"], password)
+        if storage_states.enabled and UserTools._is_main_menu_displayed(
+            page, after_login=True
+        ):
+            storage_states.save(username, page.context.storage_state())
+        return UserTools._get_user_role_type(username, user_details, return_role_type)
 
+    @staticmethod
+    def _is_main_menu_displayed(page: Page, after_login: bool = False) -> bool:
+        """
+        Waits for BCSS to load, and checks whether it landed on the BCSS main menu.
+        Sessions are only stored and reused for users that land on the main menu, so that users
+        who need to select a job role or organisation after logging in always do so.
+
+        Args:
+            page (playwright.sync_api.Page): The Playwright page object to interact with.
+            after_login (bool): If True, waits for the Cognito login page to be left first.
+
+        Returns:
+            bool: True if the main menu is displayed, False otherwise (e.g. the Cognito login page,
+                  or the page to select a job role or organisation, is displayed)
+        """
+        base_page = BasePage(page)
+        cognito_login_page = CognitoLoginPage(page)
+        try:
+            if after_login:
+                expect(cognito_login_page.username).to_be_hidden(
+                    timeout=STORAGE_STATE_CHECK_TIMEOUT_MS
+                )
+            # Users with more than one job role or organisation land on a page to select one instead
+            expect(
+                base_page.main_menu_header.or_(cognito_login_page.username)
+                .or_(LoginFailureScreenPage(page).login_failure_msg)
+                .or_(SelectJobRolePage(page).select_job_dropdown)
+                .or_(OrganisationSwitchPage(page).radio_buttons)
+                .first
+            ).to_be_visible(timeout=STORAGE_STATE_CHECK_TIMEOUT_MS)
+        except AssertionError:
+            return False
+        if not base_page.main_menu_header.is_visible():
+            return False
+        return base_page.main_menu_string in (
+            base_page.main_menu_header.text_content() or ""
+        )
+
+    @staticmethod
+    def _get_user_role_type(
+        username: str, user_details: dict, return_role_type: bool
+    ) -> Optional[UserRoleType]:
+        """
+        Returns the UserRoleType of the user if requested.
+
+        Args:
+            username (str): The record key from users.json.
+            user_details (dict): The user details from users.json.
+            return_role_type (bool): If True, return a UserRoleType object.
+
+        Returns:
+            Optional[UserRoleType]: The user's UserRoleType if requested, otherwise None.
+        """
         if return_role_type:
             org_code = user_details.get("org_code")
             user_code = user_details.get("username")
@@ -114,6 +194,8 @@ class UserTools:
     ):
         """
         Logs out the current user, navigates to the login page, and logs in as the specified role.
+        If the storage state cache is enabled, the current user's cookies are cleared instead of logging out,
+        so that their session can be reused later on.
 
         Args:
             page: Playwright page object.
@@ -121,8 +203,12 @@ class UserTools:
             bcss_code (str): The BCSS code to use in the login string (default is "BCS001").
             remember_user (bool): Whether to remember the user session (default is False).
         """
-        LogoutPage(page).log_out(close_page=False)
-        BasePage(page).go_to_log_in_page()
+        if get_storage_state_cache().enabled:
+            # Keep the current user's session alive, so that it can be reused when switching back to them
+            page.context.clear_cookies()
+        else:
+            LogoutPage(page).log_out(close_page=False)
+            BasePage(page).go_to_log_in_page()
         return UserTools.user_login(page, f"{role} at {bcss_code}", remember_user)
 
 